@@ -0,0 +1,731 @@
+"""Native asyncio client for the Jobs and Clusters endpoints.
+
+A small HTTP/1.1 client on top of ``asyncio`` streams, so no extra dependency:
+every host gets a pool of keep-alive connections, and the number of requests in
+flight to a host is capped.
+
+``SyncApiClient`` runs an ``AsyncApiClient`` in a background event loop and
+exposes the same endpoints as blocking calls.
+It also has the ``perform_query`` of the ``databricks_cli`` ``ApiClient``,
+so it can be passed to ``JobsApi`` / ``ClusterApi`` as it is.
+"""
+
+import asyncio
+import json
+import ssl
+import threading
+import time
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, TypeVar
+from urllib.parse import urlencode, urlparse
+
+from loguru import logger as lg
+from requests.exceptions import HTTPError
+
+from databricks_models.validators import validate_run_now
+
+T = TypeVar("T")
+
+USER_AGENT = "databricks-api-sample-async"
+# the methods safe to send again when the connection dropped under them
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+
+class ApiError(HTTPError):
+    """An error response from the API.
+
+    It is a ``requests`` ``HTTPError``, like the ones raised by the
+    ``databricks_cli`` ``ApiClient``, so the same ``except`` catches both.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        method: str,
+        path: str,
+        body: bytes,
+    ) -> None:
+        self.status_code = status_code
+        self.error_code: Optional[str] = None
+        self.api_message: Optional[str] = None
+        try:
+            error = json.loads(body)
+            self.error_code = error.get("error_code")
+            self.api_message = error.get("message")
+        except ValueError:
+            pass
+        message = f"{status_code} error for {method} {path}"
+        if self.error_code is not None:
+            message += f": {self.error_code} {self.api_message}"
+        super().__init__(message)
+
+
+def translate_query(data: Dict[str, Any]) -> str:
+    """Build a query string, with the booleans as the API wants them."""
+    translated = {
+        k: ("true" if v else "false") if isinstance(v, bool) else v
+        for k, v in data.items()
+    }
+    return urlencode(translated, doseq=True)
+
+
+##################################################
+#    Connection pool
+##################################################
+
+
+class _Connection:
+    """A keep-alive connection to a host."""
+
+    __slots__ = ("reader", "writer", "last_used")
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class HostPool:
+    """Keep-alive connections to a single host, with a cap on concurrency."""
+
+    def __init__(
+        self,
+        scheme: str,
+        hostname: str,
+        port: int,
+        max_connections: int,
+        keepalive_timeout: float,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        self.scheme = scheme
+        self.hostname = hostname
+        self.port = port
+        self.keepalive_timeout = keepalive_timeout
+        self.ssl_context = ssl_context
+        self.semaphore = asyncio.Semaphore(max_connections)
+        # idle connections, the most recently used last
+        self.idle: List[_Connection] = []
+
+    async def acquire(self) -> Tuple[_Connection, bool]:
+        """Get an idle connection or open a new one.
+
+        Returns:
+            Tuple[_Connection, bool]: The connection, and whether it was reused.
+        """
+        now = time.monotonic()
+        while self.idle:
+            conn = self.idle.pop()
+            expired = now - conn.last_used >= self.keepalive_timeout
+            if not expired and not conn.reader.at_eof():
+                return conn, True
+            conn.close()
+        if self.scheme == "https":
+            context = self.ssl_context or ssl.create_default_context()
+            reader, writer = await asyncio.open_connection(
+                self.hostname, self.port, ssl=context
+            )
+        else:
+            reader, writer = await asyncio.open_connection(self.hostname, self.port)
+        return _Connection(reader, writer), False
+
+    def release(self, conn: _Connection, reusable: bool) -> None:
+        """Give back a connection, that is kept only if still usable."""
+        if reusable:
+            conn.last_used = time.monotonic()
+            self.idle.append(conn)
+        else:
+            conn.close()
+
+    def close(self) -> None:
+        """Close all the idle connections."""
+        for conn in self.idle:
+            conn.close()
+        self.idle.clear()
+
+
+async def _read_response(
+    reader: asyncio.StreamReader,
+    method: str,
+) -> Tuple[int, Dict[str, str], bytes, bool]:
+    """Read a response.
+
+    Returns:
+        Tuple[int, Dict[str, str], bytes, bool]:
+            The status, the headers (lower case names), the body,
+            and whether the connection can be reused.
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Connection closed before the response.")
+    _, status, *_ = status_line.decode("latin-1").split(" ", 2)
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    reusable = headers.get("connection", "").lower() != "close"
+    status_code = int(status)
+    if method == "HEAD" or status_code in (204, 304) or 100 <= status_code < 200:
+        body = b""
+    elif headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # skip the trailers
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+        reusable = False
+    return status_code, headers, body, reusable
+
+
+##################################################
+#    Async client
+##################################################
+
+
+class AsyncApiClient:
+    """Asyncio client for the Jobs and Clusters endpoints.
+
+    The connection pools are bound to the event loop of the first request,
+    use a client from a single loop.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        token: str,
+        max_connections_per_host: int = 8,
+        keepalive_timeout: float = 30.0,
+        timeout: float = 60.0,
+        api_version: str = "2.0",
+        default_headers: Optional[Dict[str, str]] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        """Create the client.
+
+        Args:
+            host (str): The workspace url, like ``https://adb-....net/``.
+            token (str): The personal access token.
+            max_connections_per_host (int):
+                Maximum number of requests in flight to the same host,
+                which is also the maximum number of open connections.
+            keepalive_timeout (float):
+                Seconds an idle connection is kept before being dropped.
+            timeout (float): Seconds before a request is abandoned.
+            api_version (str):
+                The version used when a request does not specify one,
+                like in the ``databricks_cli`` ``ApiClient``.
+            default_headers (Optional[Dict[str, str]]):
+                Headers added to every request.
+            ssl_context (Optional[ssl.SSLContext]):
+                The TLS context of the https connections.
+        """
+        parsed = urlparse(host)
+        self.scheme = parsed.scheme or "https"
+        self.hostname = parsed.hostname or ""
+        default_port = 443 if self.scheme == "https" else 80
+        self.port = parsed.port or default_port
+        # the Host header names the port only when it is not the default one
+        if self.port == default_port:
+            self.host_header = self.hostname
+        else:
+            self.host_header = f"{self.hostname}:{self.port}"
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.api_version = api_version
+        self.ssl_context = ssl_context
+        self.default_headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "User-Agent": USER_AGENT,
+        }
+        if default_headers is not None:
+            self.default_headers.update(default_headers)
+        self._pools: Dict[Tuple[str, str, int], HostPool] = {}
+
+    def _pool(self) -> HostPool:
+        key = (self.scheme, self.hostname, self.port)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = HostPool(
+                self.scheme,
+                self.hostname,
+                self.port,
+                self.max_connections_per_host,
+                self.keepalive_timeout,
+                self.ssl_context,
+            )
+            self._pools[key] = pool
+        return pool
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close all the pooled connections."""
+        for pool in self._pools.values():
+            pool.close()
+        self._pools.clear()
+
+    async def perform_query(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        version: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Perform a request and return the parsed json response.
+
+        Args:
+            method (str): ``GET`` sends ``data`` as query, the others as json.
+            path (str): The path after the version, like ``/jobs/get``.
+            data (Optional[Dict[str, Any]]): The query or the json body.
+            headers (Optional[Dict[str, str]]): Extra headers.
+            version (Optional[str]): The API version, like ``2.1``.
+
+        Raises:
+            ApiError: If the response is not a success.
+        """
+        if data is None:
+            data = {}
+        target = f"/api/{version or self.api_version}{path}"
+        if method == "GET":
+            if data:
+                target += "?" + translate_query(data)
+            body = b""
+        else:
+            body = json.dumps(data).encode()
+
+        all_headers = {**self.default_headers, **(headers or {})}
+        all_headers["Host"] = self.host_header
+        all_headers["Content-Length"] = str(len(body))
+        all_headers["Connection"] = "keep-alive"
+        head = f"{method} {target} HTTP/1.1\r\n" + "".join(
+            f"{k}: {v}\r\n" for k, v in all_headers.items()
+        )
+        request = head.encode("latin-1") + b"\r\n" + body
+
+        status, _, response_body = await asyncio.wait_for(
+            self._send(method, request), self.timeout
+        )
+        if not 200 <= status < 300:
+            raise ApiError(status, method, path, response_body)
+        if not response_body:
+            return {}
+        return json.loads(response_body)
+
+    async def _send(self, method: str, request: bytes) -> Tuple[int, Dict, bytes]:
+        """Send a request on a pooled connection.
+
+        A reused connection might have been closed by the server in the
+        meantime: in that case an idempotent request is sent again on a fresh
+        one. The other requests might have reached the server before the
+        connection dropped, like a ``jobs/create``, so they are not retried.
+        """
+        pool = self._pool()
+        async with pool.semaphore:
+            for _ in range(2):
+                conn, reused = await pool.acquire()
+                try:
+                    conn.writer.write(request)
+                    await conn.writer.drain()
+                    status, headers, body, reusable = await _read_response(
+                        conn.reader, method
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    pool.release(conn, reusable=False)
+                    if reused and method in IDEMPOTENT_METHODS:
+                        lg.debug("Stale pooled connection, retrying: {}", e)
+                        continue
+                    raise
+                except BaseException:
+                    pool.release(conn, reusable=False)
+                    raise
+                pool.release(conn, reusable)
+                return status, headers, body
+        raise ConnectionError("Could not send the request.")
+
+    ##################################################
+    #    Jobs
+    ##################################################
+
+    async def create_job(self, json: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a job, ``/2.1/jobs/create``."""
+        return await self.perform_query("POST", "/jobs/create", json, version="2.1")
+
+    async def get_job(self, job_id: int) -> Dict[str, Any]:
+        """Get a job, ``/2.1/jobs/get``."""
+        return await self.perform_query(
+            "GET", "/jobs/get", {"job_id": job_id}, version="2.1"
+        )
+
+    async def list_jobs(
+        self,
+        limit: int = 25,
+        offset: int = 0,
+        name: Optional[str] = None,
+        expand_tasks: bool = False,
+    ) -> Dict[str, Any]:
+        """List a page of jobs, ``/2.1/jobs/list``."""
+        query: Dict[str, Any] = {
+            "limit": limit,
+            "offset": offset,
+            "expand_tasks": expand_tasks,
+        }
+        if name is not None:
+            query["name"] = name
+        return await self.perform_query("GET", "/jobs/list", query, version="2.1")
+
+    async def update_job(
+        self,
+        job_id: int,
+        new_settings: Optional[Dict[str, Any]] = None,
+        fields_to_remove: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Update some settings of a job, ``/2.1/jobs/update``."""
+        body: Dict[str, Any] = {"job_id": job_id}
+        if new_settings is not None:
+            body["new_settings"] = new_settings
+        if fields_to_remove is not None:
+            body["fields_to_remove"] = fields_to_remove
+        return await self.perform_query("POST", "/jobs/update", body, version="2.1")
+
+    async def reset_job(
+        self,
+        job_id: int,
+        new_settings: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Overwrite all the settings of a job, ``/2.1/jobs/reset``."""
+        body = {"job_id": job_id, "new_settings": new_settings}
+        return await self.perform_query("POST", "/jobs/reset", body, version="2.1")
+
+    async def delete_job(self, job_id: int) -> Dict[str, Any]:
+        """Delete a job, ``/2.1/jobs/delete``."""
+        return await self.perform_query(
+            "POST", "/jobs/delete", {"job_id": job_id}, version="2.1"
+        )
+
+    async def run_now(
+        self,
+        job_id: int,
+        idempotency_token: Optional[str] = None,
+        **parameters: Any,
+    ) -> Dict[str, Any]:
+        """Run a job now, ``/2.1/jobs/run-now``.
+
+        Args:
+            job_id (int): The job to run.
+            idempotency_token (Optional[str]):
+                Guarantees a single run is started for the same token.
+            parameters: The ``RunParameters``, like ``notebook_params``.
+
+        Raises:
+            ValueError: If the request does not match the schema.
+        """
+        body: Dict[str, Any] = {"job_id": job_id, **parameters}
+        if idempotency_token is not None:
+            body["idempotency_token"] = idempotency_token
+        errors = validate_run_now(body)
+        if errors:
+            raise ValueError(f"Invalid run-now request: {'; '.join(errors)}")
+        return await self.perform_query("POST", "/jobs/run-now", body, version="2.1")
+
+    async def submit_run(self, json: Dict[str, Any]) -> Dict[str, Any]:
+        """Submit a one-time run, ``/2.1/jobs/runs/submit``."""
+        return await self.perform_query(
+            "POST", "/jobs/runs/submit", json, version="2.1"
+        )
+
+    async def get_run(
+        self,
+        run_id: int,
+        include_history: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Get a run, ``/2.1/jobs/runs/get``."""
+        query: Dict[str, Any] = {"run_id": run_id}
+        if include_history is not None:
+            query["include_history"] = include_history
+        return await self.perform_query("GET", "/jobs/runs/get", query, version="2.1")
+
+    async def list_runs(
+        self,
+        job_id: Optional[int] = None,
+        active_only: bool = False,
+        completed_only: bool = False,
+        offset: int = 0,
+        limit: int = 25,
+        start_time_from: Optional[int] = None,
+        start_time_to: Optional[int] = None,
+        expand_tasks: bool = False,
+    ) -> Dict[str, Any]:
+        """List a page of runs, ``/2.1/jobs/runs/list``."""
+        query: Dict[str, Any] = {
+            "active_only": active_only,
+            "completed_only": completed_only,
+            "offset": offset,
+            "limit": limit,
+            "expand_tasks": expand_tasks,
+        }
+        if job_id is not None:
+            query["job_id"] = job_id
+        if start_time_from is not None:
+            query["start_time_from"] = start_time_from
+        if start_time_to is not None:
+            query["start_time_to"] = start_time_to
+        return await self.perform_query("GET", "/jobs/runs/list", query, version="2.1")
+
+    async def cancel_run(self, run_id: int) -> Dict[str, Any]:
+        """Cancel a run, ``/2.1/jobs/runs/cancel``."""
+        return await self.perform_query(
+            "POST", "/jobs/runs/cancel", {"run_id": run_id}, version="2.1"
+        )
+
+    async def cancel_all_runs(self, job_id: int) -> Dict[str, Any]:
+        """Cancel all the active runs of a job, ``/2.1/jobs/runs/cancel-all``."""
+        return await self.perform_query(
+            "POST", "/jobs/runs/cancel-all", {"job_id": job_id}, version="2.1"
+        )
+
+    async def delete_run(self, run_id: int) -> Dict[str, Any]:
+        """Delete a non-active run, ``/2.1/jobs/runs/delete``."""
+        return await self.perform_query(
+            "POST", "/jobs/runs/delete", {"run_id": run_id}, version="2.1"
+        )
+
+    async def get_run_output(self, run_id: int) -> Dict[str, Any]:
+        """Get the output of a task run, ``/2.1/jobs/runs/get-output``."""
+        return await self.perform_query(
+            "GET", "/jobs/runs/get-output", {"run_id": run_id}, version="2.1"
+        )
+
+    async def export_run(
+        self,
+        run_id: int,
+        views_to_export: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Export the views of a task run, ``/2.0/jobs/runs/export``."""
+        query: Dict[str, Any] = {"run_id": run_id}
+        if views_to_export is not None:
+            query["views_to_export"] = views_to_export
+        return await self.perform_query(
+            "GET", "/jobs/runs/export", query, version="2.0"
+        )
+
+    async def repair_run(self, json: Dict[str, Any]) -> Dict[str, Any]:
+        """Re-run some tasks of a run, ``/2.1/jobs/runs/repair``."""
+        return await self.perform_query(
+            "POST", "/jobs/runs/repair", json, version="2.1"
+        )
+
+    ##################################################
+    #    Clusters
+    ##################################################
+
+    async def create_cluster(self, json: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a cluster, ``/2.0/clusters/create``."""
+        return await self.perform_query("POST", "/clusters/create", json, version="2.0")
+
+    async def get_cluster(self, cluster_id: str) -> Dict[str, Any]:
+        """Get a cluster, ``/2.0/clusters/get``."""
+        return await self.perform_query(
+            "GET", "/clusters/get", {"cluster_id": cluster_id}, version="2.0"
+        )
+
+    async def list_clusters(self) -> Dict[str, Any]:
+        """List the clusters, ``/2.0/clusters/list``."""
+        return await self.perform_query("GET", "/clusters/list", version="2.0")
+
+    async def get_cluster_ids_by_name(self, cluster_name: str) -> List[Dict[str, Any]]:
+        """Get the info of the clusters with this name.
+
+        Same as ``ClusterApi.get_cluster_ids_by_name``.
+        """
+        clusters = await self.list_clusters()
+        return [
+            c
+            for c in clusters.get("clusters", [])
+            if c.get("cluster_name") == cluster_name
+        ]
+
+    async def get_events(
+        self,
+        cluster_id: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        order: Optional[str] = None,
+        event_types: Optional[List[str]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Get a page of events of a cluster, ``/2.0/clusters/events``."""
+        body: Dict[str, Any] = {"cluster_id": cluster_id}
+        optionals = {
+            "start_time": start_time,
+            "end_time": end_time,
+            "order": order,
+            "event_types": event_types,
+            "offset": offset,
+            "limit": limit,
+        }
+        body.update({k: v for k, v in optionals.items() if v is not None})
+        return await self.perform_query("POST", "/clusters/events", body, version="2.0")
+
+
+# the endpoint methods that get a blocking version in SyncApiClient
+ENDPOINT_METHODS = [
+    "create_job",
+    "get_job",
+    "list_jobs",
+    "update_job",
+    "reset_job",
+    "delete_job",
+    "run_now",
+    "submit_run",
+    "get_run",
+    "list_runs",
+    "cancel_run",
+    "cancel_all_runs",
+    "delete_run",
+    "get_run_output",
+    "export_run",
+    "repair_run",
+    "create_cluster",
+    "get_cluster",
+    "list_clusters",
+    "get_cluster_ids_by_name",
+    "get_events",
+]
+
+
+##################################################
+#    Sync wrapper
+##################################################
+
+
+class SyncApiClient:
+    """Blocking facade over an ``AsyncApiClient``.
+
+    The async client runs in an event loop on a daemon thread, so requests
+    made from several threads share the same connection pool and concurrency
+    cap.
+
+    ``perform_query`` has the signature of the ``databricks_cli`` one,
+    so this can be used in place of an ``ApiClient``::
+
+        jobs_api = JobsApi(SyncApiClient(host, token))
+    """
+
+    def __init__(self, host: str, token: str, **kwargs: Any) -> None:
+        """Create the client.
+
+        Args:
+            host (str): The workspace url.
+            token (str): The personal access token.
+            kwargs: Forwarded to ``AsyncApiClient``.
+        """
+        self.async_client = AsyncApiClient(host, token, **kwargs)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="SyncApiClient",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop of the client and wait for the result."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        return future.result()
+
+    def perform_query(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        files: Any = None,
+        version: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Perform a request, like ``ApiClient.perform_query``.
+
+        The requests are sent as json, there are no multipart uploads: use the
+        ``databricks_cli`` ``ApiClient`` for ``dbfs/put`` with ``files``.
+
+        Raises:
+            ValueError: If ``files`` is given.
+            ApiError: If the response is not a success.
+        """
+        if files is not None:
+            raise ValueError("SyncApiClient sends json only, files are not sent.")
+        return self.run(
+            self.async_client.perform_query(method, path, data, headers, version)
+        )
+
+    def close(self) -> None:
+        """Close the pooled connections and stop the loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.async_client.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
+
+    def __enter__(self) -> "SyncApiClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _sync_method(name: str) -> Any:
+    """Build the blocking version of an endpoint method."""
+
+    def method(self: SyncApiClient, *args: Any, **kwargs: Any) -> Any:
+        return self.run(getattr(self.async_client, name)(*args, **kwargs))
+
+    method.__name__ = name
+    method.__qualname__ = f"SyncApiClient.{name}"
+    method.__doc__ = getattr(AsyncApiClient, name).__doc__
+    return method
+
+
+for _name in ENDPOINT_METHODS:
+    setattr(SyncApiClient, _name, _sync_method(_name))
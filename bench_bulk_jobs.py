@@ -0,0 +1,180 @@
+"""Benchmark the bulk job creation against the sequential loop.
+
+A stub server on localhost keeps the jobs in memory and answers jobs/create,
+jobs/list, jobs/reset, jobs/update and jobs/delete after a fixed latency.
+A share of the requests is throttled with 429, and a share of the creates
+fail with 503 after the job was stored, like a timeout on a real workspace.
+
+* ``sequential``: ``jobs/create`` one job after the other, like ``create_job``.
+* ``bulk``: ``BulkJobCreator`` with a pool of workers.
+* ``bulk again``: the same batch a second time, the jobs are updated in place.
+
+The stub must end up with exactly one job per name after the bulk runs.
+
+Run it with::
+
+    python bench_bulk_jobs.py --jobs 100 --workers 16 --latency 0.05
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import itertools
+import json
+import random
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from loguru import logger as lg
+
+from bench_serialize import build_job
+from bulk_jobs import BulkJobCreator
+from utils import close_pooled_clients, get_pooled_client
+
+STUB_TOKEN = "stub-token"
+
+
+class JobsStub:
+    """The jobs of the stub server, with its failure settings."""
+
+    def __init__(self, latency: float, throttle_rate: float, fail_rate: float) -> None:
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.fail_rate = fail_rate
+        self.jobs: Dict[int, Dict[str, Any]] = {}
+        self.ids = itertools.count(1000)
+        self.lock = threading.Lock()
+
+    def handle(self, method: str, path: str, query: Dict[str, Any], body: Any):
+        """Get the status and the payload of the response."""
+        time.sleep(self.latency)
+        if random.random() < self.throttle_rate:
+            return 429, {"error_code": "TOO_MANY_REQUESTS"}
+
+        if path == "/api/2.1/jobs/create":
+            with self.lock:
+                job_id = next(self.ids)
+                self.jobs[job_id] = {"job_id": job_id, "settings": body}
+            if random.random() < self.fail_rate:
+                return 503, {"error_code": "TEMPORARILY_UNAVAILABLE"}
+            return 200, {"job_id": job_id}
+
+        if path == "/api/2.1/jobs/reset":
+            with self.lock:
+                self.jobs[body["job_id"]]["settings"] = body["new_settings"]
+            return 200, {}
+
+        if path == "/api/2.1/jobs/update":
+            with self.lock:
+                settings = self.jobs[body["job_id"]]["settings"]
+                settings.update(body.get("new_settings", {}))
+                for field in body.get("fields_to_remove", []):
+                    settings.pop(field, None)
+            return 200, {}
+
+        if path == "/api/2.1/jobs/delete":
+            with self.lock:
+                self.jobs.pop(body["job_id"], None)
+            return 200, {}
+
+        if path == "/api/2.1/jobs/list":
+            name = query.get("name", [None])[0]
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", ["20"])[0])
+            with self.lock:
+                jobs = [
+                    j
+                    for j in self.jobs.values()
+                    if name is None or j["settings"]["name"].lower() == name.lower()
+                ]
+            page = jobs[offset : offset + limit]
+            return 200, {"jobs": page, "has_more": offset + limit < len(jobs)}
+
+        return 404, {"error_code": "ENDPOINT_NOT_FOUND"}
+
+
+def start_stub_server(stub: JobsStub) -> Tuple[ThreadingHTTPServer, str]:
+    """Start the stub server in a thread, return it with its url."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _answer(self) -> None:
+            url = urlparse(self.path)
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length)) if length else None
+            status, payload = stub.handle(
+                self.command, url.path, parse_qs(url.query), body
+            )
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = _answer
+        do_POST = _answer
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def create_sequential(host: str, payloads: List[Dict[str, Any]]) -> float:
+    """Create the jobs one after the other, return the elapsed seconds."""
+    api_client = get_pooled_client(host, STUB_TOKEN)
+    t_start = time.perf_counter()
+    for payload in payloads:
+        api_client.perform_query("POST", "/jobs/create", data=payload, version="2.1")
+    return time.perf_counter() - t_start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--throttle-rate", type=float, default=0.05)
+    parser.add_argument("--fail-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    jobs = []
+    for i in range(args.jobs):
+        job = build_job(args.tasks)
+        job.name = f"projection_{i:04}"
+        jobs.append(job)
+
+    # the sequential loop has no retries, run it without failures
+    stub = JobsStub(args.latency, 0.0, 0.0)
+    server, host = start_stub_server(stub)
+    elapsed = create_sequential(host, [job.to_dict() for job in jobs])
+    lg.info("sequential: {} jobs in {:.2f} s", args.jobs, elapsed)
+    server.shutdown()
+    close_pooled_clients()
+
+    stub = JobsStub(args.latency, args.throttle_rate, args.fail_rate)
+    server, host = start_stub_server(stub)
+    api_client = get_pooled_client(host, STUB_TOKEN, pool_maxsize=args.workers)
+    creator = BulkJobCreator(api_client, max_workers=args.workers, backoff=0.01)
+    try:
+        report = creator.run(jobs)
+        lg.info("bulk: {}", report.summary())
+        report = creator.run(jobs)
+        lg.info("bulk again: {}", report.summary())
+    finally:
+        close_pooled_clients()
+        server.shutdown()
+
+    names = [j["settings"]["name"] for j in stub.jobs.values()]
+    lg.info("{} jobs on the stub, {} distinct names", len(names), len(set(names)))
+    assert len(names) == len(set(names)) == args.jobs, "duplicated jobs"
@@ -0,0 +1,126 @@
+"""Benchmark the per-call latency of a new ApiClient against the pooled one.
+
+A stub server on localhost answers every request with a small json,
+so the time measured is the client overhead:
+
+* ``new``: a new ApiClient for every call, as ``get_databricks_client`` did,
+  paying the session setup and a new connection each time.
+* ``pooled``: the client shared by the process, from ``get_pooled_client``,
+  reusing the kept-alive connections.
+
+The stub is plain http: against a workspace every new connection also pays
+the TLS handshake, so the gap is larger.
+
+Run it with::
+
+    python bench_client_pool.py --calls 500 --threads 8
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import statistics
+import threading
+import time
+from typing import Callable, List, Tuple
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+
+from utils import close_pooled_clients, get_pooled_client, make_api_client
+
+STUB_TOKEN = "stub-token"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answer every request with the same small json, keeping the connection."""
+
+    protocol_version = "HTTP/1.1"
+    # the headers and the body are separate writes, do not wait for the ack
+    disable_nagle_algorithm = True
+    body = b'{"job_id": 11223344, "settings": {"name": "stub"}}'
+
+    def _answer(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    do_GET = _answer
+    do_POST = _answer
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server() -> Tuple[ThreadingHTTPServer, str]:
+    """Start the stub server in a thread, return it with its url."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def call_new(host: str) -> None:
+    """Get a job with a new client."""
+    api_client = make_api_client(host, STUB_TOKEN)
+    api_client.perform_query("GET", "/jobs/get", data={"job_id": 11223344})
+    api_client.session.close()
+
+
+def call_pooled(host: str) -> None:
+    """Get a job with the shared client."""
+    api_client: ApiClient = get_pooled_client(host, STUB_TOKEN)
+    api_client.perform_query("GET", "/jobs/get", data={"job_id": 11223344})
+
+
+def measure(
+    name: str, call: Callable[[str], None], host: str, calls: int, threads: int
+) -> List[float]:
+    """Measure the latency of each call, from a pool of threads."""
+
+    def timed(_: int) -> float:
+        t_start = time.perf_counter()
+        call(host)
+        return time.perf_counter() - t_start
+
+    # warm up
+    for i in range(threads):
+        timed(i)
+
+    t_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = list(executor.map(timed, range(calls)))
+    elapsed = time.perf_counter() - t_start
+
+    latencies.sort()
+    lg.info(
+        "{:>6}: mean {:.2f} ms, p50 {:.2f} ms, p99 {:.2f} ms, {:.0f} calls/s",
+        name,
+        statistics.mean(latencies) * 1000,
+        latencies[len(latencies) // 2] * 1000,
+        latencies[int(len(latencies) * 0.99)] * 1000,
+        calls / elapsed,
+    )
+    return latencies
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    server, host = start_stub_server()
+    lg.info("Stub server on {}, {} threads", host, args.threads)
+    try:
+        measure("new", call_new, host, args.calls, args.threads)
+        measure("pooled", call_pooled, host, args.calls, args.threads)
+    finally:
+        close_pooled_clients()
+        server.shutdown()
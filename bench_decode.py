@@ -0,0 +1,157 @@
+"""Benchmark the lazy decoding of Run responses against json.loads.
+
+Three ways of holding many runs/get responses and reading their state:
+
+* ``dict``: ``json.loads`` every response, read the state from the dicts.
+* ``eager``: ``json.loads`` and ``Run.from_dict`` on the whole payload.
+* ``lazy``: ``decode_run`` on the bytes, read the state, release the payload.
+
+Run it with::
+
+    python bench_decode.py --runs 200 --tasks 300
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from loguru import logger as lg
+
+import databricks_models
+from decode import decode_run
+
+
+def build_run_payload(run_id: int, n_tasks: int) -> Dict[str, Any]:
+    """Build a runs/get response for a multi task run."""
+    tasks = []
+    for i in range(n_tasks):
+        tasks.append(
+            {
+                "run_id": run_id * 1000 + i,
+                "task_key": f"task_{i:03}",
+                "state": {
+                    "life_cycle_state": "TERMINATED",
+                    "result_state": "SUCCESS",
+                    "state_message": "",
+                    "user_cancelled_or_timedout": False,
+                },
+                "depends_on": [{"task_key": f"task_{i - 1:03}"}] if i else [],
+                "existing_cluster_id": "0923-164208-meows279",
+                "notebook_task": {
+                    "notebook_path": "/the/path",
+                    "source": "WORKSPACE",
+                    "base_parameters": {"line": str(i), "gender": "W"},
+                },
+                "libraries": [{"pypi": {"package": "tqdm"}}],
+                "start_time": 1625060460483 + i * 1000,
+                "setup_duration": 1000,
+                "execution_duration": 60000,
+                "cleanup_duration": 0,
+                "end_time": 1625060521483 + i * 1000,
+                "attempt_number": 0,
+                "cluster_instance": {
+                    "cluster_id": "0923-164208-meows279",
+                    "spark_context_id": "4348585301701786719",
+                },
+            }
+        )
+    return {
+        "job_id": 11223344,
+        "run_id": run_id,
+        "creator_user_name": "user.name@databricks.com",
+        "state": {
+            "life_cycle_state": "TERMINATED",
+            "result_state": "SUCCESS",
+            "state_message": "",
+        },
+        "tasks": tasks,
+        "cluster_instance": {"cluster_id": "0923-164208-meows279"},
+        "start_time": 1625060460483,
+        "setup_duration": 0,
+        "execution_duration": 0,
+        "cleanup_duration": 0,
+        "end_time": 1625060863413,
+        "trigger": "PERIODIC",
+        "run_name": "A multitask job run",
+        "run_type": "JOB_RUN",
+        "attempt_number": 0,
+    }
+
+
+def hold_dicts(responses: List[bytes]) -> List[Any]:
+    """Parse every response into dicts."""
+    runs = [json.loads(r) for r in responses]
+    for run in runs:
+        run["state"]["life_cycle_state"]
+    return runs
+
+
+def hold_eager(responses: List[bytes]) -> List[Any]:
+    """Decode every response into the typed objects."""
+    run_cls = databricks_models.JobsRunsGetResponse
+    runs = [run_cls.from_dict(json.loads(r)) for r in responses]
+    for run in runs:
+        run.state.life_cycle_state
+    return runs
+
+
+def hold_lazy(responses: List[bytes]) -> List[Any]:
+    """Decode every response into a lazy view, released after use."""
+    runs = [decode_run(r) for r in responses]
+    for run in runs:
+        run.state.life_cycle_state
+        run.release()
+    return runs
+
+
+def measure(
+    name: str, hold: Callable[[List[bytes]], List[Any]], responses: List[bytes]
+):
+    """Measure the time to decode and the memory held by the decoded runs.
+
+    The memory is traced in a second pass, tracemalloc slows everything down.
+    """
+    gc.collect()
+    t_start = time.perf_counter()
+    runs = hold(responses)
+    elapsed = time.perf_counter() - t_start
+    del runs
+
+    gc.collect()
+    tracemalloc.start()
+    runs = hold(responses)
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del runs
+
+    lg.info(
+        "{:>5}: {:.3f} s, held {:.1f} MiB, peak {:.1f} MiB",
+        name,
+        elapsed,
+        held / 2**20,
+        peak / 2**20,
+    )
+    return elapsed, held, peak
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=300)
+    args = parser.parse_args()
+
+    responses = [
+        json.dumps(build_run_payload(i, args.tasks)).encode() for i in range(args.runs)
+    ]
+    lg.info(
+        "{} runs of {} tasks, {:.1f} MiB of json",
+        args.runs,
+        args.tasks,
+        sum(map(len, responses)) / 2**20,
+    )
+    measure("dict", hold_dicts, responses)
+    measure("eager", hold_eager, responses)
+    measure("lazy", hold_lazy, responses)
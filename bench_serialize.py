@@ -0,0 +1,97 @@
+"""Benchmark the compiled serializer against jsons.dump.
+
+Run it with::
+
+    python bench_serialize.py --tasks 10000
+"""
+import argparse
+import timeit
+
+import jsons
+from loguru import logger as lg
+
+from databricks_api import (
+    CronSchedule,
+    JobEmailNotifications,
+    JobSettings,
+    JobTaskSettings,
+    Library,
+    NotebookTask,
+    TaskDependency,
+)
+
+
+def build_job(n_tasks: int, tasks_per_cluster: int = 10) -> JobSettings:
+    """Build a job with chains of tasks on clusters, like the samples do."""
+    libraries = [
+        Library("pyarrow==8.0.0"),
+        Library("snowflake-sqlalchemy"),
+        Library("tqdm"),
+    ]
+    tasks = []
+    for i in range(n_tasks):
+        is_first_task_for_cluster = i % tasks_per_cluster == 0
+        tasks.append(
+            JobTaskSettings(
+                task_key=f"task_{i}",
+                depends_on=None
+                if is_first_task_for_cluster
+                else [TaskDependency(f"task_{i - 1}")],
+                notebook_task=NotebookTask(
+                    notebook_path="/the/path",
+                    source="WORKSPACE",
+                    base_parameters={"line": i, "gender": "W", "season": "2023-3"},
+                ),
+                existing_cluster_id=f"cluster_{i // tasks_per_cluster}",
+                libraries=libraries if is_first_task_for_cluster else None,
+            )
+        )
+    return JobSettings(
+        name="job_name",
+        email_notifications=JobEmailNotifications(
+            on_start=["mail@s1.com"],
+            on_success=["mail@s1.com", "mail@s2.com"],
+            on_failure=["mail@s1.com", "mail@s2.com"],
+        ),
+        schedule=CronSchedule(
+            quartz_cron_expression="0 0 7 * * ?",
+            timezone_id="Europe/Amsterdam",
+            pause_status="UNPAUSED",
+        ),
+        tasks=tasks,
+        max_concurrent_runs=1,
+    )
+
+
+def bench_serialize(n_tasks: int, repeat: int = 3) -> float:
+    """Time jsons.dump and to_dict on the same job, return the speedup."""
+    job = build_job(n_tasks)
+
+    # both serializers must produce the same payload
+    if jsons.dump(job, strip_privates=True, strip_nulls=True) != job.to_dict():
+        raise AssertionError("The compiled serializer differs from jsons.dump.")
+
+    t_jsons = min(
+        timeit.repeat(
+            lambda: jsons.dump(job, strip_privates=True, strip_nulls=True),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    t_compiled = min(timeit.repeat(job.to_dict, number=1, repeat=repeat))
+
+    speedup = t_jsons / t_compiled
+    lg.info("{} tasks, jsons.dump: {:.4f} s", n_tasks, t_jsons)
+    lg.info("{} tasks, to_dict:    {:.4f} s", n_tasks, t_compiled)
+    lg.info("{} tasks, speedup:    {:.1f}x", n_tasks, speedup)
+    return speedup
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    speedup = bench_serialize(args.tasks, args.repeat)
+    if speedup < 10:
+        lg.warning("Speedup {:.1f}x is below the 10x target.", speedup)
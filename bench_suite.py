@@ -0,0 +1,448 @@
+"""Benchmark suite of the model layer and the client, for comparison across commits.
+
+Each scenario runs at several sizes and is timed a few times, the results are
+written as json with the commit they were measured on:
+
+* ``build``: plan and build a ``JobSettings`` like ``sample_create_job_auto_task``,
+* ``graph``: check the task graph of the job with ``JobGraph``,
+* ``serialize``: ``to_dict`` of the job, and ``json.dumps`` of the payload,
+* ``decode_lazy`` / ``decode_eager``: decode a ``runs/get`` response of that
+  many tasks with ``decode_run`` or ``from_dict``,
+* ``client_get``: ``jobs/get`` of distinct jobs against the local mock server,
+  the size is the number of threads, with the latency percentiles and the
+  calls per second,
+* ``client_get_coalesced``: the same ``jobs/get`` from every thread, with the
+  share of the calls saved by the coalescing of the pooled client,
+* ``bulk_create`` / ``reconcile``: create 100 jobs on the mock server with
+  ``BulkJobCreator``, and reconcile 100 jobs that are up to date,
+* ``cron_year``: the load report of a year of fire times of 300 scheduled
+  jobs on 12 clusters, compiling the expressions from scratch.
+
+The sizes are 1, 100 and 10k tasks, 100 and 300 jobs. Run it with::
+
+    python bench_suite.py --output results.json
+    python bench_suite.py --output new.json --compare results.json
+    python bench_suite.py --only build serialize --repeat 10
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+
+import databricks_models
+from bench_decode import build_run_payload
+from bulk_jobs import BulkJobCreator
+from databricks_api import CronSchedule, JobEmailNotifications, JobSettings, Library
+from databricks_models.validators import validate_job_settings
+from decode import decode_run
+from job_graph import JobGraph
+from mock_server import MOCK_TOKEN, start_mock_process
+from quartz_cron import compile_cron, local_midnights
+from reconcile import JobReconciler
+from schedule_report import JobSchedule, load_report
+from single_flight import SingleFlight
+from task_planner import plan_tasks
+from utils import close_pooled_clients, get_pooled_client
+
+TASK_SIZES = (1, 100, 10_000)
+THREAD_SIZES = (1, 8)
+JOB_SIZES = (100,)
+SCHEDULE_SIZES = (300,)
+
+# the size -> the call to time
+Scenario = Callable[[int], Callable[[], Any]]
+SCENARIOS: Dict[str, Tuple[Scenario, Tuple[int, ...], str]] = {}
+
+
+def scenario(name: str, sizes: Tuple[int, ...], unit: str = "tasks"):
+    """Register a scenario: a function of the size returning the call to time."""
+
+    def register(setup: Scenario) -> Scenario:
+        SCENARIOS[name] = (setup, sizes, unit)
+        return setup
+
+    return register
+
+
+class Metrics(dict):
+    """More measures of a call, like percentiles, reported with its times."""
+
+
+##################################################
+#    Model layer
+##################################################
+
+
+def build_auto_task_job(n_tasks: int) -> JobSettings:
+    """Build a job the way ``sample_create_job_auto_task`` does, with n tasks."""
+    libraries = [
+        Library("pyarrow==8.0.0"),
+        Library("snowflake-sqlalchemy"),
+        Library("tqdm"),
+    ]
+    genders = ["W", "M", "G", "B"]
+    params = [{"line": i // 4, "gender": genders[i % 4]} for i in range(n_tasks)]
+    costs: Dict[str, float] = {
+        f"{p['line']}{p['gender']}": 300 + (i % 7) * 150 for i, p in enumerate(params)
+    }
+    cluster_ids = [f"cluster_{c}" for c in range(max(1, n_tasks // 50))]
+    plan = plan_tasks(
+        params,
+        cluster_ids,
+        costs,
+        lanes_per_cluster=2,
+        shared_params={"season": "2023-3"},
+        task_key=lambda p: f"{p['line']}{p['gender']}",
+    )
+    return JobSettings(
+        name="auto_task_job",
+        email_notifications=JobEmailNotifications(
+            on_start=["mail@s1.com"],
+            on_success=["mail@s1.com", "mail@s2.com"],
+            on_failure=["mail@s1.com", "mail@s2.com"],
+        ),
+        schedule=CronSchedule(
+            quartz_cron_expression="0 0 7 * * ?",
+            timezone_id="Europe/Amsterdam",
+            pause_status="UNPAUSED",
+        ),
+        tasks=plan.tasks(notebook_path="/the/path", libraries=libraries),
+        max_concurrent_runs=1,
+    )
+
+
+@scenario("build", TASK_SIZES)
+def setup_build(n_tasks: int) -> Callable[[], Any]:
+    return lambda: build_auto_task_job(n_tasks)
+
+
+@scenario("graph", TASK_SIZES)
+def setup_graph(n_tasks: int) -> Callable[[], Any]:
+    job = build_auto_task_job(n_tasks)
+    return lambda: JobGraph.from_job(job).check()
+
+
+@scenario("serialize", TASK_SIZES)
+def setup_serialize(n_tasks: int) -> Callable[[], Any]:
+    job = build_auto_task_job(n_tasks)
+    return job.to_dict
+
+
+@scenario("serialize_json", TASK_SIZES)
+def setup_serialize_json(n_tasks: int) -> Callable[[], Any]:
+    job = build_auto_task_job(n_tasks)
+    return lambda: json.dumps(job.to_dict())
+
+
+@scenario("validate", TASK_SIZES)
+def setup_validate(n_tasks: int) -> Callable[[], Any]:
+    payload = build_auto_task_job(n_tasks).to_dict()
+    return lambda: validate_job_settings(payload)
+
+
+@scenario("decode_lazy", TASK_SIZES)
+def setup_decode_lazy(n_tasks: int) -> Callable[[], Any]:
+    response = json.dumps(build_run_payload(1, n_tasks)).encode()
+
+    def decode() -> None:
+        run = decode_run(response)
+        run.state.life_cycle_state
+        run.release()
+
+    return decode
+
+
+@scenario("decode_eager", TASK_SIZES)
+def setup_decode_eager(n_tasks: int) -> Callable[[], Any]:
+    response = json.dumps(build_run_payload(1, n_tasks)).encode()
+    run_cls = databricks_models.JobsRunsGetResponse
+    return lambda: run_cls.from_dict(json.loads(response)).state.life_cycle_state
+
+
+def bench_schedules(n_jobs: int) -> List[JobSchedule]:
+    """Mostly daily jobs, some on weekdays, some hourly, in three timezones."""
+    timezones = ["Europe/Amsterdam", "UTC", "America/New_York"]
+    schedules = []
+    for i in range(n_jobs):
+        if i % 10 < 7:
+            expression = f"0 {15 * (i % 4)} {i % 24} * * ?"
+        elif i % 10 < 9:
+            expression = f"0 0 {5 + i % 5} ? * MON-FRI"
+        else:
+            expression = f"0 {i % 60} * * * ?"
+        schedules.append(
+            JobSchedule(i, f"job_{i}", expression, timezones[i % 3], [f"c{i % 12}"])
+        )
+    return schedules
+
+
+@scenario("cron_year", SCHEDULE_SIZES, unit="jobs")
+def setup_cron_year(n_jobs: int) -> Callable[[], Any]:
+    schedules = bench_schedules(n_jobs)
+    start = time.time()
+    durations = {i: 1800.0 for i in range(0, n_jobs, 2)}
+
+    def run() -> None:
+        compile_cron.cache_clear()
+        local_midnights.cache_clear()
+        load_report(schedules, start, start + 365 * 86400, durations=durations)
+
+    return run
+
+
+##################################################
+#    Client
+##################################################
+
+
+class ClientBench:
+    """The mock server shared by the client scenarios.
+
+    It runs in its own process, so it does not compete for the GIL
+    with the client threads.
+    """
+
+    process: Optional[subprocess.Popen] = None
+    url: str = ""
+    runs = itertools.count()
+
+    @classmethod
+    def client(cls) -> ApiClient:
+        if cls.process is None:
+            cls.process, cls.url = start_mock_process()
+        return get_pooled_client(cls.url, MOCK_TOKEN)
+
+    @classmethod
+    def stop(cls) -> None:
+        close_pooled_clients()
+        if cls.process is not None:
+            cls.process.terminate()
+            cls.process.wait()
+            cls.process = None
+
+
+def timed_gets(
+    api_client: ApiClient, job_ids: List[int], threads: int
+) -> Callable[[], Metrics]:
+    """Time a ``jobs/get`` of each job id, from a pool of threads."""
+
+    def timed(job_id: int) -> float:
+        t_start = time.perf_counter()
+        api_client.perform_query("GET", "/jobs/get", {"job_id": job_id}, version="2.1")
+        return time.perf_counter() - t_start
+
+    def run() -> Metrics:
+        t_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            latencies = sorted(executor.map(timed, job_ids))
+        elapsed = time.perf_counter() - t_start
+        return Metrics(
+            calls_per_s=len(job_ids) / elapsed,
+            p50_ms=latencies[len(latencies) // 2] * 1000,
+            p99_ms=latencies[int(len(latencies) * 0.99)] * 1000,
+        )
+
+    return run
+
+
+@scenario("client_get", THREAD_SIZES, unit="threads")
+def setup_client_get(threads: int, calls: int = 400) -> Callable[[], Any]:
+    api_client = ClientBench.client()
+    # a job per call, no two GETs in flight are the same, so none is coalesced
+    # and this is the throughput of the HTTP calls
+    job_ids = [
+        api_client.perform_query(
+            "POST", "/jobs/create", {"name": f"bench_{i}"}, version="2.1"
+        )["job_id"]
+        for i in range(calls)
+    ]
+    return timed_gets(api_client, job_ids, threads)
+
+
+@scenario("client_get_coalesced", THREAD_SIZES, unit="threads")
+def setup_client_get_coalesced(threads: int, calls: int = 400) -> Callable[[], Any]:
+    api_client = ClientBench.client()
+    job_id = api_client.perform_query(
+        "POST", "/jobs/create", {"name": "bench"}, version="2.1"
+    )["job_id"]
+    # the same GET from every thread, the identical ones in flight are sent once
+    run_gets = timed_gets(api_client, [job_id] * calls, threads)
+    flight: Optional[SingleFlight] = getattr(api_client, "single_flight", None)
+
+    def run() -> Metrics:
+        before = flight.stats()["saved"] if flight is not None else 0
+        metrics = run_gets()
+        saved = flight.stats()["saved"] - before if flight is not None else 0
+        metrics["saved_pct"] = 100 * saved / calls
+        return metrics
+
+    return run
+
+
+def bench_jobs(n_jobs: int, n_tasks: int = 20) -> List[JobSettings]:
+    jobs = []
+    for i in range(n_jobs):
+        job = build_auto_task_job(n_tasks)
+        job.name = f"bench_{i:04}"
+        jobs.append(job)
+    return jobs
+
+
+@scenario("bulk_create", JOB_SIZES, unit="jobs")
+def setup_bulk_create(n_jobs: int) -> Callable[[], Any]:
+    api_client = ClientBench.client()
+    jobs = bench_jobs(n_jobs)
+
+    def run() -> None:
+        # a new namespace changes the idempotency keys, the jobs are all created
+        namespace = f"bench_{next(ClientBench.runs)}"
+        BulkJobCreator(api_client, max_workers=16, namespace=namespace).run(jobs)
+
+    return run
+
+
+@scenario("reconcile", JOB_SIZES, unit="jobs")
+def setup_reconcile(n_jobs: int) -> Callable[[], Any]:
+    api_client = ClientBench.client()
+    jobs = bench_jobs(n_jobs)
+    namespace = f"bench_{next(ClientBench.runs)}"
+    reconciler = JobReconciler(api_client, max_workers=16, namespace=namespace)
+    reconciler.reconcile(jobs, prune=False)
+    # the jobs are all up to date, this is the cost of planning
+    return lambda: reconciler.reconcile(jobs, prune=False)
+
+
+##################################################
+#    Runner
+##################################################
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scenario(name: str, size: int, repeat: int) -> Dict[str, Any]:
+    """Time a scenario at a size, the ``Metrics`` it returns are averaged."""
+    setup, _, unit = SCENARIOS[name]
+    call = setup(size)
+    call()  # warm up
+    times = []
+    metrics: Dict[str, List[float]] = {}
+    for _ in range(repeat):
+        t_start = time.perf_counter()
+        out = call()
+        times.append(time.perf_counter() - t_start)
+        if isinstance(out, Metrics):
+            for key, value in out.items():
+                metrics.setdefault(key, []).append(value)
+    result = {
+        "name": name,
+        "size": size,
+        "unit": unit,
+        "repeat": repeat,
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "mean_s": statistics.mean(times),
+    }
+    result.update({key: statistics.mean(v) for key, v in metrics.items()})
+    return result
+
+
+def run_suite(
+    only: Optional[List[str]] = None, repeat: int = 5, max_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """Run the scenarios, return the results with the environment."""
+    results = []
+    # the reports of each job would drown the results
+    for module in ("bulk_jobs", "reconcile"):
+        lg.disable(module)
+    try:
+        for name, (_, sizes, _) in SCENARIOS.items():
+            if only and name not in only:
+                continue
+            for size in sizes:
+                if max_size is not None and size > max_size:
+                    continue
+                result = run_scenario(name, size, repeat)
+                lg.info(
+                    "{:>15} {:>6} {:<7} median {:9.3f} ms",
+                    name,
+                    size,
+                    result["unit"],
+                    result["median_s"] * 1000,
+                )
+                results.append(result)
+    finally:
+        ClientBench.stop()
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+
+
+def compare(new: Dict[str, Any], old: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Compare the median times of two runs of the suite.
+
+    Returns:
+        List[Dict[str, Any]]: Per scenario and size, the ratio new / old.
+    """
+    old_results = {(r["name"], r["size"]): r for r in old["results"]}
+    rows = []
+    for r in new["results"]:
+        before = old_results.get((r["name"], r["size"]))
+        if before is None:
+            continue
+        ratio = r["median_s"] / before["median_s"]
+        rows.append({"name": r["name"], "size": r["size"], "ratio": ratio})
+        lg.info(
+            "{:>15} {:>6}: {:9.3f} ms -> {:9.3f} ms, {:.2f}x{}",
+            r["name"],
+            r["size"],
+            before["median_s"] * 1000,
+            r["median_s"] * 1000,
+            ratio,
+            " slower" if ratio > 1.1 else "",
+        )
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="Write the results to this json file.")
+    parser.add_argument("--compare", help="Compare with the results of this file.")
+    parser.add_argument("--only", nargs="*", choices=sorted(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-size", type=int, help="Skip the larger sizes.")
+    args = parser.parse_args()
+
+    report = run_suite(args.only, args.repeat, args.max_size)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
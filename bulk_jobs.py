@@ -0,0 +1,408 @@
+"""Create or update many jobs at once.
+
+The jobs are submitted by a pool of workers, with a cap on the requests in
+flight, and the requests throttled with 429 or refused with 503 are retried
+with an exponential backoff.
+
+Every job gets a deterministic idempotency key, computed from its name,
+stored in its tags.
+Before creating a job, the jobs with the same name are searched for that key:
+if one is found it is reset to the new settings instead, so running a batch
+again, or retrying a create that failed midway, never duplicates a job::
+
+    creator = BulkJobCreator(max_workers=8)
+    report = creator.run(jobs)
+    lg.info(report.summary())
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import random
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError, Timeout
+
+from databricks_models.validators import validate_job_settings
+from job_graph import JobGraph, JobGraphError
+from metrics import METRICS, api_endpoint
+from schema import Schema
+from utils import get_databricks_client, http_status, iter_jobs
+
+# the tag holding the idempotency key of the job
+IDEMPOTENCY_TAG = "idempotency_key"
+# the status codes retried with a backoff
+RETRY_STATUSES = (429, 503)
+
+T = TypeVar("T")
+JobPayload = Union[Schema, Dict[str, Any]]
+
+
+def idempotency_key(name: str, namespace: str = "") -> str:
+    """Get the idempotency key of a job.
+
+    Args:
+        name (str): The name of the job.
+        namespace (str): Keep apart jobs with the same name from different batches.
+    """
+    return hashlib.sha256(f"{namespace}\0{name}".encode()).hexdigest()[:32]
+
+
+class JobResult:
+    """The outcome of a job of the batch."""
+
+    __slots__ = ("name", "key", "action", "job_id", "attempts", "elapsed", "error")
+
+    def __init__(
+        self,
+        name: Optional[str],
+        key: Optional[str],
+        action: str = "failed",
+        job_id: Optional[int] = None,
+        attempts: int = 0,
+        elapsed: float = 0.0,
+        error: Optional[str] = None,
+    ) -> None:
+        """Create a JobResult.
+
+        Args:
+            name (Optional[str]): The name of the job.
+            key (Optional[str]): The idempotency key of the job.
+            action (str):
+                ``created``, ``updated``, ``unchanged``, ``deleted``,
+                ``dry_run`` or ``failed``.
+            job_id (Optional[int]): The id of the created or updated job.
+            attempts (int): The number of requests sent, retries included.
+            elapsed (float): Seconds spent on the job.
+            error (Optional[str]): Why the job failed.
+        """
+        self.name = name
+        self.key = key
+        self.action = action
+        self.job_id = job_id
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.action != "failed"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"JobResult({self.name!r}, {self.action}, job_id={self.job_id})"
+
+
+class BulkReport:
+    """The results of a batch, in the order of the submitted jobs."""
+
+    def __init__(self, results: List[JobResult], elapsed: float) -> None:
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def failed(self) -> List[JobResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def counts(self) -> Dict[str, int]:
+        """Count the results by action."""
+        counts: Dict[str, int] = {}
+        for result in self.results:
+            counts[result.action] = counts.get(result.action, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        counts = ", ".join(
+            f"{n} {action}" for action, n in sorted(self.counts().items())
+        )
+        requests = sum(r.attempts for r in self.results)
+        return (
+            f"{len(self.results)} jobs in {self.elapsed:.2f} s: {counts}, "
+            f"{requests} requests"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "elapsed": self.elapsed,
+            "counts": self.counts(),
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
+class BulkJobCreator:
+    """Create or update jobs with a pool of workers."""
+
+    def __init__(
+        self,
+        api_client: Optional[ApiClient] = None,
+        max_workers: int = 8,
+        max_in_flight: Optional[int] = None,
+        max_retries: int = 6,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        namespace: str = "",
+    ) -> None:
+        """Create the engine.
+
+        Args:
+            api_client (Optional[ApiClient]):
+                The client to use, the default one if not provided.
+                It is shared by the workers, so its pool should hold
+                ``max_workers`` connections.
+            max_workers (int): The number of jobs handled at the same time.
+            max_in_flight (Optional[int]):
+                The maximum number of requests in flight, ``max_workers`` if None.
+            max_retries (int): How many times a throttled request is retried.
+            backoff (float): Seconds to wait before the first retry, doubled each time.
+            max_backoff (float): Maximum seconds to wait before a retry.
+            namespace (str): Namespace of the idempotency keys.
+        """
+        self.api_client = api_client
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.namespace = namespace
+        self._in_flight = threading.BoundedSemaphore(max_in_flight or max_workers)
+
+    def run(self, jobs: Iterable[JobPayload], dry_run: bool = False) -> BulkReport:
+        """Create or update the jobs.
+
+        A job that fails does not stop the others, check the report.
+
+        Args:
+            jobs (Iterable[JobPayload]): The ``JobSettings``, or their payloads.
+            dry_run (bool): Only log the payloads.
+        """
+        if self.api_client is None:
+            self.api_client = get_databricks_client()
+
+        payloads = [self.prepare(job) for job in jobs]
+        t_start = time.perf_counter()
+        results, todo = self.check(payloads)
+
+        if dry_run:
+            for i in todo:
+                lg.info("Will create or update job {}", payloads[i]["name"])
+                results[i] = JobResult(
+                    payloads[i]["name"], payloads[i]["tags"][IDEMPOTENCY_TAG], "dry_run"
+                )
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="BulkJobCreator"
+            ) as executor:
+                futures = {i: executor.submit(self.submit, payloads[i]) for i in todo}
+                for i, future in futures.items():
+                    results[i] = future.result()
+
+        report = BulkReport(results, time.perf_counter() - t_start)  # type: ignore[arg-type]
+        lg.info(report.summary())
+        return report
+
+    def check(
+        self, payloads: List[Dict[str, Any]]
+    ) -> Tuple[List[Optional[JobResult]], List[int]]:
+        """Find the payloads that cannot be sent.
+
+        The payloads are checked against the ``JobSettings`` schema,
+        then the graph of their tasks.
+
+        Returns:
+            Tuple[List[Optional[JobResult]], List[int]]:
+                The failed result of each invalid payload, None for the others,
+                and the indexes of the valid ones.
+        """
+        results: List[Optional[JobResult]] = [None] * len(payloads)
+        # two jobs with the same key would race, keep only the first one
+        seen: Dict[str, int] = {}
+        todo = []
+        for i, payload in enumerate(payloads):
+            name = payload.get("name")
+            key = payload["tags"].get(IDEMPOTENCY_TAG) if name else None
+            # a malformed job is refused before any job of the batch is sent
+            errors = validate_job_settings(payload)
+            issues = [] if errors else JobGraph.from_job(payload).issues
+            if key is None:
+                results[i] = JobResult(name, None, error="The job has no name.")
+            elif errors:
+                results[i] = JobResult(name, key, error="; ".join(errors))
+            elif issues:
+                results[i] = JobResult(name, key, error=str(JobGraphError(issues)))
+            elif key in seen:
+                results[i] = JobResult(
+                    name, key, error=f"Same name as the job #{seen[key]} of the batch."
+                )
+            else:
+                seen[key] = i
+                todo.append(i)
+        return results, todo
+
+    def prepare(self, job: JobPayload) -> Dict[str, Any]:
+        """Get the payload of a job, tagged with its idempotency key.
+
+        The job itself is left untouched.
+        """
+        payload = job.to_dict() if isinstance(job, Schema) else dict(job)
+        name = payload.get("name")
+        tags = dict(payload.get("tags") or {})
+        if name:
+            tags[IDEMPOTENCY_TAG] = idempotency_key(name, self.namespace)
+        payload["tags"] = tags
+        return payload
+
+    def submit(self, payload: Dict[str, Any]) -> JobResult:
+        """Create or update a single job, never raises."""
+        name = payload["name"]
+        key = payload["tags"][IDEMPOTENCY_TAG]
+        result = JobResult(name, key)
+        t_start = time.perf_counter()
+        try:
+            job_id = self.find_job(name, key, result)
+            if job_id is not None:
+                self._call(
+                    result,
+                    "POST",
+                    "/jobs/reset",
+                    {"job_id": job_id, "new_settings": payload},
+                )
+                result.action = "updated"
+            else:
+                job_id = self._create(payload, result)
+            result.job_id = job_id
+        except Exception as e:
+            result.action = "failed"
+            result.error = str(e)
+            lg.warning("Job {} failed: {}", name, e)
+        result.elapsed = time.perf_counter() - t_start
+        return result
+
+    def find_job(
+        self, name: str, key: str, result: Optional[JobResult] = None
+    ) -> Optional[int]:
+        """Find the id of the job with this name and idempotency key."""
+
+        def search() -> Optional[int]:
+            for job in iter_jobs(name=name, api_client=self.api_client, read_ahead=1):
+                tags = job.get("settings", {}).get("tags") or {}
+                if tags.get(IDEMPOTENCY_TAG) == key:
+                    return job["job_id"]
+            return None
+
+        if result is None:
+            result = JobResult(name, key)
+        return self._with_backoff(result, search)
+
+    def _create(self, payload: Dict[str, Any], result: JobResult) -> int:
+        """Create the job.
+
+        Only the throttled creates are sent again straight away:
+        if the create failed after being sent, with a 5xx or a lost connection,
+        the job might exist anyway, so it is searched for before trying again.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = self._call(
+                    result, "POST", "/jobs/create", payload, retry_statuses=(429,)
+                )
+                result.action = "created"
+                return response["job_id"]
+            except (HTTPError, RequestsConnectionError, Timeout) as e:
+                status = http_status(e)
+                if attempt >= self.max_retries or (status or 500) < 500:
+                    raise
+                attempt += 1
+                lg.debug("Create of {} failed ({}), checking it", payload["name"], e)
+                job_id = self.find_job(payload["name"], result.key, result)  # type: ignore[arg-type]
+                if job_id is not None:
+                    result.action = "created"
+                    return job_id
+                self._sleep(attempt, e)
+
+    def _call(
+        self,
+        result: JobResult,
+        method: str,
+        path: str,
+        data: Dict[str, Any],
+        retry_statuses: Tuple[int, ...] = RETRY_STATUSES,
+    ) -> Dict[str, Any]:
+        """Send a request, retrying when throttled."""
+        return self._with_backoff(
+            result,
+            lambda: self.api_client.perform_query(  # type: ignore[union-attr]
+                method, path, data=data, version="2.1"
+            ),
+            retry_statuses,
+        )
+
+    def _with_backoff(
+        self,
+        result: JobResult,
+        request: Callable[[], T],
+        retry_statuses: Tuple[int, ...] = RETRY_STATUSES,
+    ) -> T:
+        """Run the request under the in flight cap, retrying on 429 and 503."""
+        attempt = 0
+        while True:
+            result.attempts += 1
+            try:
+                with self._in_flight:
+                    return request()
+            except HTTPError as e:
+                if http_status(e) not in retry_statuses or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                self._sleep(attempt, e)
+
+    def _sleep(self, attempt: int, error: Exception) -> None:
+        """Wait before a retry, as asked by the server or with a jittered backoff."""
+        delay = None
+        response = getattr(error, "response", None)
+        retry_after = getattr(response, "headers", {}).get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        if delay is None:
+            delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+            delay *= random.uniform(0.5, 1.0)
+        request = getattr(response, "request", None)
+        if request is not None:
+            METRICS.record_retry(
+                "databricks", request.method, api_endpoint(request.url)
+            )
+        lg.debug("Retry {} in {:.2f} s after {}", attempt, delay, error)
+        time.sleep(min(delay, self.max_backoff))
+
+
+def create_jobs(
+    jobs: Iterable[JobPayload],
+    dry_run: bool = False,
+    api_client: Optional[ApiClient] = None,
+    max_workers: int = 8,
+) -> BulkReport:
+    """Create or update many jobs, see ``BulkJobCreator``."""
+    creator = BulkJobCreator(api_client=api_client, max_workers=max_workers)
+    return creator.run(jobs, dry_run=dry_run)
@@ -0,0 +1,373 @@
+"""Create many clusters at once, and wait for all of them to run.
+
+``ClusterFleet`` creates the clusters concurrently, then polls their states
+with one ``clusters/list`` per interval for the whole fleet instead of one
+``clusters/get`` per cluster:
+
+* each cluster has its own ``idempotency_token``, ``<batch id>-<index>``, so a
+  create failing after being sent is sent again without making a second
+  cluster, and provisioning again with the same batch id resumes the fleet,
+* the start latency of each cluster is the time from its create to the first
+  poll seeing it ``RUNNING``,
+* when some clusters fail or the timeout is reached, the stragglers, the
+  clusters created but not running, are terminated and the running ones kept.
+
+::
+
+    specs = [single_node_cluster(f"worker-{i}") for i in range(10)]
+    report = ClusterFleet(poll_interval=10).provision(specs)
+    lg.info(report.summary())
+    cluster_ids = [r.cluster_id for r in report.running]
+
+From the command line::
+
+    python cluster_fleet.py 10 --name-prefix worker --timeout 1200
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import uuid
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError, Timeout
+
+from databricks_api import CreateCluster, single_node_cluster
+from metrics import METRICS, api_endpoint
+from utils import NO_CACHE, get_databricks_client, http_status
+
+RETRY_STATUSES = (429, 503)
+# the states a cluster being created does not come back from
+FAILED_STATES = ("TERMINATING", "TERMINATED", "ERROR", "UNKNOWN")
+# the most characters of an idempotency token
+MAX_TOKEN_LENGTH = 64
+
+
+class ClusterResult:
+    """The outcome of the provisioning of a cluster."""
+
+    __slots__ = (
+        "name",
+        "token",
+        "cluster_id",
+        "state",
+        "created_at",
+        "start_seconds",
+        "attempts",
+        "error",
+        "terminated",
+    )
+
+    def __init__(self, name: str, token: str) -> None:
+        """Create a ClusterResult.
+
+        Args:
+            name (str): The name of the cluster.
+            token (str): The idempotency token of its create.
+        """
+        self.name = name
+        self.token = token
+        self.cluster_id: Optional[str] = None
+        # the last state seen, CREATE_FAILED if it was never created
+        self.state = "PENDING"
+        self.created_at: Optional[float] = None
+        self.start_seconds: Optional[float] = None
+        self.attempts = 0
+        self.error: Optional[str] = None
+        # terminated as a straggler
+        self.terminated = False
+
+    def __repr__(self) -> str:
+        return f"ClusterResult({self.name!r}, {self.cluster_id}, {self.state})"
+
+    @property
+    def running(self) -> bool:
+        return self.state == "RUNNING"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "token": self.token,
+            "cluster_id": self.cluster_id,
+            "state": self.state,
+            "start_seconds": self.start_seconds,
+            "attempts": self.attempts,
+            "error": self.error,
+            "terminated": self.terminated,
+        }
+
+
+class FleetReport:
+    """The clusters of a fleet, and the totals."""
+
+    def __init__(
+        self, batch_id: str, results: List[ClusterResult], elapsed: float
+    ) -> None:
+        self.batch_id = batch_id
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def running(self) -> List[ClusterResult]:
+        return [r for r in self.results if r.running]
+
+    @property
+    def failed(self) -> List[ClusterResult]:
+        return [r for r in self.results if not r.running]
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for result in self.results:
+            counts[result.state] = counts.get(result.state, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        counts = ", ".join(f"{n} {s}" for s, n in sorted(self.counts().items()))
+        latencies = sorted(
+            r.start_seconds for r in self.results if r.start_seconds is not None
+        )
+        started = (
+            f", started in {latencies[0]:.1f} to {latencies[-1]:.1f} s"
+            if latencies
+            else ""
+        )
+        terminated = sum(r.terminated for r in self.results)
+        return (
+            f"{len(self.results)} clusters of batch {self.batch_id} in "
+            f"{self.elapsed:.1f} s: {counts}{started}, {terminated} terminated"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "batch_id": self.batch_id,
+            "elapsed": self.elapsed,
+            "counts": self.counts(),
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
+class ClusterFleet:
+    """Create clusters concurrently and wait for them to run."""
+
+    def __init__(
+        self,
+        api_client: Optional[ApiClient] = None,
+        max_workers: int = 8,
+        poll_interval: float = 5.0,
+        timeout: float = 1200.0,
+        max_retries: int = 5,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Create a ClusterFleet.
+
+        Args:
+            api_client (Optional[ApiClient]):
+                The client to use, the default one if not provided.
+            max_workers (int): The creates sent at the same time.
+            poll_interval (float): Seconds between two polls of the states.
+            timeout (float): Seconds to wait for the clusters to run, from the
+                first create.
+            max_retries (int): The retries of a create throttled, failing with
+                a 5xx or a lost connection.
+            backoff (float): The first wait between retries, in seconds.
+            max_backoff (float): The longest wait between retries.
+            clock (Callable[[], float]): The time in seconds.
+            sleep (Callable[[float], None]): Waits between polls and retries.
+        """
+        self.api_client = api_client
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.sleep = sleep
+
+    def provision(
+        self,
+        specs: Sequence[CreateCluster],
+        batch_id: Optional[str] = None,
+        terminate_stragglers: bool = True,
+    ) -> FleetReport:
+        """Create the clusters and wait until they all run, fail or time out.
+
+        Args:
+            specs (Sequence[CreateCluster]): The clusters, their own
+                ``idempotency_token`` is replaced by the one of the batch.
+            batch_id (Optional[str]): The prefix of the tokens, a new one if
+                None. Give the batch id of a report to resume its fleet.
+            terminate_stragglers (bool): Terminate the clusters not running
+                when some failed or the timeout is reached.
+        """
+        if self.api_client is None:
+            self.api_client = get_databricks_client()
+        batch_id = batch_id or uuid.uuid4().hex
+        t_start = self.clock()
+        results = []
+        for i, spec in enumerate(specs):
+            token = f"{batch_id}-{i}"
+            if len(token) > MAX_TOKEN_LENGTH:
+                raise ValueError(f"The batch id {batch_id!r} is too long.")
+            results.append(ClusterResult(spec.cluster_name, token))
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ClusterFleet"
+        ) as executor:
+            list(executor.map(self._create, specs, results))
+
+        self._wait(results, t_start + self.timeout)
+        stragglers = [r for r in results if r.cluster_id and not r.running]
+        if terminate_stragglers:
+            # only the clusters not running, the running ones stay usable
+            for result in stragglers:
+                self._terminate(result)
+        report = FleetReport(batch_id, results, self.clock() - t_start)
+        lg.info(report.summary())
+        return report
+
+    def _create(self, spec: CreateCluster, result: ClusterResult) -> None:
+        """Create a cluster, never raises.
+
+        The token makes any retry safe: a create sent again returns the
+        cluster of the first one.
+        """
+        payload = spec.to_dict()
+        payload["idempotency_token"] = result.token
+        attempt = 0
+        while True:
+            result.attempts += 1
+            try:
+                response = self.api_client.perform_query(  # type: ignore[union-attr]
+                    "POST", "/clusters/create", data=payload, version="2.0"
+                )
+                result.cluster_id = response["cluster_id"]
+                result.created_at = self.clock()
+                lg.debug("Cluster {} created: {}", result.name, result.cluster_id)
+                return
+            except (HTTPError, RequestsConnectionError, Timeout) as e:
+                status = http_status(e)
+                retry = status is None or status in RETRY_STATUSES or status >= 500
+                if not retry or attempt >= self.max_retries:
+                    result.state = "CREATE_FAILED"
+                    result.error = str(e).split("\n")[0]
+                    lg.warning("Cluster {} not created: {}", result.name, result.error)
+                    return
+                attempt += 1
+                self._backoff(attempt, e)
+
+    def _backoff(self, attempt: int, error: Exception) -> None:
+        """Wait before a retry, as asked by the server or with a jittered backoff."""
+        delay = None
+        response = getattr(error, "response", None)
+        retry_after = getattr(response, "headers", {}).get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        if delay is None:
+            delay = self.backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.0)
+        request = getattr(response, "request", None)
+        if request is not None:
+            METRICS.record_retry(
+                "databricks", request.method, api_endpoint(request.url)
+            )
+        lg.debug("Retry {} in {:.2f} s after {}", attempt, delay, error)
+        self.sleep(min(delay, self.max_backoff))
+
+    def _wait(self, results: List[ClusterResult], deadline: float) -> None:
+        """Poll the states of all the clusters at once until none is pending."""
+        pending = {r.cluster_id: r for r in results if r.cluster_id}
+        while pending:
+            try:
+                listed = self.api_client.perform_query(  # type: ignore[union-attr]
+                    "GET", "/clusters/list", headers=NO_CACHE, version="2.0"
+                )
+            except (HTTPError, RequestsConnectionError, Timeout) as e:
+                lg.warning("Cannot list the clusters: {}", e)
+                listed = None
+            now = self.clock()
+            for cluster in (listed or {}).get("clusters", []):
+                cluster_id = cluster["cluster_id"]
+                result = pending.get(cluster_id)
+                if result is None:
+                    continue
+                result.state = cluster["state"]
+                if result.running:
+                    result.start_seconds = now - result.created_at  # type: ignore[operator]
+                    del pending[cluster_id]
+                elif result.state in FAILED_STATES:
+                    result.error = cluster.get("state_message") or result.state
+                    lg.warning("Cluster {} failed: {}", result.name, result.error)
+                    del pending[cluster_id]
+            if not pending:
+                return
+            if now >= deadline:
+                for result in pending.values():
+                    result.error = f"Not running after {self.timeout:g} s"
+                return
+            lg.debug("{} clusters not running yet", len(pending))
+            self.sleep(min(self.poll_interval, max(deadline - now, 0.0)))
+
+    def _terminate(self, result: ClusterResult) -> None:
+        """Terminate a straggler, never raises."""
+        try:
+            self.api_client.perform_query(  # type: ignore[union-attr]
+                "POST",
+                "/clusters/delete",
+                data={"cluster_id": result.cluster_id},
+                version="2.0",
+            )
+            result.terminated = True
+            lg.info("Terminated cluster {} ({})", result.name, result.cluster_id)
+        except (HTTPError, RequestsConnectionError, Timeout) as e:
+            lg.warning("Cannot terminate cluster {}: {}", result.cluster_id, e)
+
+
+def provision_clusters(
+    specs: Sequence[CreateCluster],
+    batch_id: Optional[str] = None,
+    timeout: float = 1200.0,
+    max_workers: int = 8,
+) -> FleetReport:
+    """Create clusters with the default client, see ``ClusterFleet``."""
+    fleet = ClusterFleet(timeout=timeout, max_workers=max_workers)
+    return fleet.provision(specs, batch_id=batch_id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("count", type=int)
+    parser.add_argument("--name-prefix", default="fleet")
+    parser.add_argument("--autotermination-minutes", type=int, default=10)
+    parser.add_argument("--batch-id", help="resume the fleet of this batch")
+    parser.add_argument("--timeout", type=float, default=1200.0)
+    parser.add_argument("--poll-interval", type=float, default=5.0)
+    parser.add_argument("--max-workers", type=int, default=8)
+    parser.add_argument("--keep-stragglers", action="store_true")
+    args = parser.parse_args()
+
+    cluster_specs = [
+        single_node_cluster(f"{args.name_prefix}-{i}", args.autotermination_minutes)
+        for i in range(args.count)
+    ]
+    cluster_fleet = ClusterFleet(
+        max_workers=args.max_workers,
+        poll_interval=args.poll_interval,
+        timeout=args.timeout,
+    )
+    fleet_report = cluster_fleet.provision(
+        cluster_specs,
+        batch_id=args.batch_id,
+        terminate_stragglers=not args.keep_stragglers,
+    )
+    print(json.dumps(fleet_report.to_dict(), indent=2))
@@ -0,0 +1,313 @@
+"""Cached index of the clusters of the workspace.
+
+``ClusterApi.get_cluster_ids_by_name`` lists all the clusters and scans them
+on every call. The index lists them once and keeps two maps:
+cluster name to cluster ids, and cluster id to a ``ClusterSummary``,
+so both lookups are a dict access::
+
+    index = get_cluster_index()
+    cluster_id = index.get_id("cluster_name")
+    index.get(cluster_id).state
+
+The index is refreshed when it is older than its TTL, or when a lookup misses.
+A refresh only touches the clusters that changed since the previous list,
+and a missing cluster id is fetched alone with ``clusters/get``.
+
+Several clusters can share a name: ``get_id`` raises a
+``DuplicateClusterNameError`` unless told how to pick one.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+from requests.exceptions import HTTPError
+
+from schema import Schema
+from utils import get_databricks_client, http_status
+
+# how to pick a cluster among the ones sharing a name
+ON_DUPLICATE = ("error", "first", "running", "newest")
+
+
+class DuplicateClusterNameError(LookupError):
+    """Several clusters have the requested name."""
+
+    def __init__(self, cluster_name: str, cluster_ids: List[str]) -> None:
+        self.cluster_name = cluster_name
+        self.cluster_ids = cluster_ids
+        super().__init__(
+            f"There are {len(cluster_ids)} clusters named {cluster_name}: "
+            f"{', '.join(cluster_ids)}."
+        )
+
+
+class ClusterSummary(Schema):
+    """The fields of ``ClusterInfo`` kept in the index."""
+
+    __slots__ = (
+        "cluster_id",
+        "cluster_name",
+        "state",
+        "state_message",
+        "spark_version",
+        "node_type_id",
+        "num_workers",
+        "autotermination_minutes",
+        "creator_user_name",
+        "start_time",
+        "terminated_time",
+        "last_activity_time",
+    )
+
+    def __init__(
+        self,
+        cluster_id: Optional[str] = None,
+        cluster_name: Optional[str] = None,
+        state: Optional[str] = None,
+        state_message: Optional[str] = None,
+        spark_version: Optional[str] = None,
+        node_type_id: Optional[str] = None,
+        num_workers: Optional[int] = None,
+        autotermination_minutes: Optional[int] = None,
+        creator_user_name: Optional[str] = None,
+        start_time: Optional[int] = None,
+        terminated_time: Optional[int] = None,
+        last_activity_time: Optional[int] = None,
+    ) -> None:
+        """Create a ClusterSummary, see ``ClusterInfo`` for the fields."""
+        self.cluster_id = cluster_id
+        self.cluster_name = cluster_name
+        self.state = state
+        self.state_message = state_message
+        self.spark_version = spark_version
+        self.node_type_id = node_type_id
+        self.num_workers = num_workers
+        self.autotermination_minutes = autotermination_minutes
+        self.creator_user_name = creator_user_name
+        self.start_time = start_time
+        self.terminated_time = terminated_time
+        self.last_activity_time = last_activity_time
+
+
+class ClusterIndex:
+    """Name to ids and id to summary maps of the clusters, thread safe."""
+
+    def __init__(
+        self,
+        api_client: Optional[ApiClient] = None,
+        ttl: float = 300.0,
+        min_refresh_interval: float = 5.0,
+    ) -> None:
+        """Create the index, loaded on the first lookup.
+
+        Args:
+            api_client (Optional[ApiClient]):
+                The client to use, the default one if not provided.
+            ttl (float): Seconds after which a lookup refreshes the index.
+            min_refresh_interval (float):
+                Seconds between two refreshes caused by a miss,
+                so that looking up missing names does not list the clusters
+                every time.
+        """
+        self.api_client = api_client
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._by_id: Dict[str, ClusterSummary] = {}
+        self._by_name: Dict[str, List[str]] = {}
+        # raw payload of each cluster, to find what changed on a refresh
+        self._payloads: Dict[str, Dict[str, Any]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, cluster_id: object) -> bool:
+        return cluster_id in self._by_id
+
+    def get(self, cluster_id: str) -> ClusterSummary:
+        """Get the summary of a cluster.
+
+        A cluster missing from the index is fetched with ``clusters/get``.
+
+        Raises:
+            KeyError: If there is no cluster with that id.
+        """
+        self._ensure_fresh()
+        summary = self._by_id.get(cluster_id)
+        if summary is not None:
+            return summary
+        try:
+            payload = self._client().perform_query(
+                "GET", "/clusters/get", data={"cluster_id": cluster_id}
+            )
+        except HTTPError as e:
+            if http_status(e) in (400, 404):
+                raise KeyError(f"There is no cluster {cluster_id}.") from e
+            raise
+        with self._lock:
+            self._upsert(payload)
+        return self._by_id[cluster_id]
+
+    def get_ids(self, cluster_name: str) -> List[str]:
+        """Get the ids of the clusters with this name, refreshing on a miss."""
+        self._ensure_fresh()
+        ids = self._by_name.get(cluster_name)
+        if not ids and self._may_refresh_on_miss():
+            lg.debug("Cluster {} not in the index, refreshing", cluster_name)
+            self.refresh()
+            ids = self._by_name.get(cluster_name)
+        return list(ids or [])
+
+    def get_id(self, cluster_name: str, on_duplicate: str = "error") -> str:
+        """Get the id of the cluster with this name.
+
+        Args:
+            cluster_name (str): The name of the cluster.
+            on_duplicate (str):
+                What to do if several clusters have the name:
+                ``error`` raises, ``first`` picks the first listed,
+                ``running`` picks the only running one or raises,
+                ``newest`` picks the last started.
+
+        Raises:
+            KeyError: If there is no cluster by that name.
+            DuplicateClusterNameError:
+                If several clusters have the name and none could be picked.
+        """
+        if on_duplicate not in ON_DUPLICATE:
+            raise ValueError(f"Unknown {on_duplicate=}, pick from {ON_DUPLICATE}.")
+        ids = self.get_ids(cluster_name)
+        if not ids:
+            raise KeyError(f"There are no cluster named {cluster_name}.")
+        if len(ids) == 1:
+            return ids[0]
+
+        if on_duplicate == "first":
+            return ids[0]
+        if on_duplicate == "newest":
+            return max(ids, key=lambda i: self._by_id[i].start_time or 0)
+        if on_duplicate == "running":
+            running = [i for i in ids if self._by_id[i].state == "RUNNING"]
+            if len(running) == 1:
+                return running[0]
+        raise DuplicateClusterNameError(cluster_name, ids)
+
+    def duplicates(self) -> Dict[str, List[str]]:
+        """Get the names shared by several clusters, with their ids."""
+        self._ensure_fresh()
+        with self._lock:
+            return {n: list(ids) for n, ids in self._by_name.items() if len(ids) > 1}
+
+    def summaries(self) -> List[ClusterSummary]:
+        """Get the summaries of all the clusters."""
+        self._ensure_fresh()
+        with self._lock:
+            return list(self._by_id.values())
+
+    def refresh(self) -> Tuple[int, int]:
+        """List the clusters, update the ones that changed.
+
+        Returns:
+            Tuple[int, int]: The number of clusters changed and removed.
+        """
+        clusters = self._client().perform_query("GET", "/clusters/list")
+        clusters = clusters.get("clusters", [])
+        with self._lock:
+            changed = 0
+            for payload in clusters:
+                if self._payloads.get(payload["cluster_id"]) != payload:
+                    self._upsert(payload)
+                    changed += 1
+            listed = {payload["cluster_id"] for payload in clusters}
+            removed = [i for i in self._by_id if i not in listed]
+            for cluster_id in removed:
+                self._remove(cluster_id)
+            self._loaded_at = time.monotonic()
+        lg.debug(
+            "Cluster index: {} clusters, {} changed, {} removed",
+            len(clusters),
+            changed,
+            len(removed),
+        )
+        return changed, len(removed)
+
+    def invalidate(self) -> None:
+        """Refresh the index on the next lookup."""
+        self._loaded_at = None
+
+    def _client(self) -> ApiClient:
+        # the default client is not kept, it changes when the token does
+        if self.api_client is None:
+            return get_databricks_client()
+        return self.api_client
+
+    def _ensure_fresh(self) -> None:
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.ttl:
+            with self._lock:
+                # another thread might have refreshed while we waited
+                loaded_at = self._loaded_at
+                if loaded_at is None or time.monotonic() - loaded_at > self.ttl:
+                    self.refresh()
+
+    def _may_refresh_on_miss(self) -> bool:
+        loaded_at = self._loaded_at
+        return (
+            loaded_at is None
+            or time.monotonic() - loaded_at > self.min_refresh_interval
+        )
+
+    def _upsert(self, payload: Dict[str, Any]) -> None:
+        """Add or update a cluster, the lock must be held."""
+        cluster_id = payload["cluster_id"]
+        old = self._by_id.get(cluster_id)
+        summary = ClusterSummary.from_dict(payload)
+        if old is not None and old.cluster_name != summary.cluster_name:
+            self._unlink_name(old.cluster_name, cluster_id)  # type: ignore[arg-type]
+        if old is None or old.cluster_name != summary.cluster_name:
+            self._by_name.setdefault(summary.cluster_name, []).append(cluster_id)  # type: ignore[arg-type]
+        self._by_id[cluster_id] = summary
+        self._payloads[cluster_id] = payload
+
+    def _remove(self, cluster_id: str) -> None:
+        """Drop a cluster, the lock must be held."""
+        summary = self._by_id.pop(cluster_id)
+        self._payloads.pop(cluster_id, None)
+        self._unlink_name(summary.cluster_name, cluster_id)  # type: ignore[arg-type]
+
+    def _unlink_name(self, cluster_name: str, cluster_id: str) -> None:
+        ids = self._by_name.get(cluster_name, [])
+        if cluster_id in ids:
+            ids.remove(cluster_id)
+        if not ids:
+            self._by_name.pop(cluster_name, None)
+
+
+# client -> index, the default client is keyed by None
+_INDEXES: "WeakKeyDictionary[ApiClient, ClusterIndex]" = WeakKeyDictionary()
+_DEFAULT_INDEX: Optional[ClusterIndex] = None
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_cluster_index(api_client: Optional[ApiClient] = None) -> ClusterIndex:
+    """Get the index shared by the process for this client.
+
+    Args:
+        api_client (Optional[ApiClient]):
+            The client to use, the default one if not provided.
+    """
+    global _DEFAULT_INDEX
+    with _INDEXES_LOCK:
+        if api_client is None:
+            if _DEFAULT_INDEX is None:
+                _DEFAULT_INDEX = ClusterIndex()
+            return _DEFAULT_INDEX
+        index = _INDEXES.get(api_client)
+        if index is None:
+            index = _INDEXES[api_client] = ClusterIndex(api_client)
+        return index
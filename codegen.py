@@ -0,0 +1,1131 @@
+"""Generate the typed model layer from the OpenAPI specification.
+
+Every schema in ``jobs-2.1-azure.yaml`` becomes a slotted ``Schema`` class,
+or a type alias for the enums and the plain types.
+Every endpoint gets a request and a response class.
+The schemas in ``VALIDATORS`` are also compiled into plain functions
+checking payloads, in the ``validators`` module of the package.
+
+The classes are split by schema group, one module per group,
+and the ``databricks_models`` package imports a group only when one of its
+names is first accessed.
+
+Run it with::
+
+    python codegen.py
+"""
+
+import argparse
+from pathlib import Path
+import re
+import textwrap
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger as lg
+import yaml
+
+SPEC_PATH = Path(__file__).parent / "jobs-2.1-azure.yaml"
+PACKAGE_PATH = Path(__file__).parent / "databricks_models"
+PACKAGE_NAME = "databricks_models"
+
+HEADER = f"# Generated by codegen.py from {SPEC_PATH.name}, do not edit."
+
+REF_PREFIX = "#/components/schemas/"
+
+# schema group -> (module docstring, schema names in the group)
+# the schemas not listed here end up in the common group
+GROUPS: Dict[str, Tuple[str, List[str]]] = {
+    "jobs": (
+        "Job settings, tasks and schedules.",
+        [
+            "ClusterSpec",
+            "CronSchedule",
+            "DbtTask",
+            "GitSnapshot",
+            "GitSource",
+            "Job",
+            "JobCluster",
+            "JobEmailNotifications",
+            "JobSettings",
+            "JobTask",
+            "JobTaskSettings",
+            "NotebookTask",
+            "PipelineTask",
+            "PythonWheelTask",
+            "SparkJarTask",
+            "SparkPythonTask",
+            "SparkSubmitTask",
+            "SqlTask",
+            "SqlTaskAlert",
+            "SqlTaskDashboard",
+            "SqlTaskQuery",
+            "TaskDependencies",
+            "TaskDescription",
+            "TaskKey",
+        ],
+    ),
+    "runs": (
+        "Runs, their state and their outputs.",
+        [
+            "ClusterInstance",
+            "DbtOutput",
+            "NotebookOutput",
+            "RepairHistory",
+            "RepairHistoryItem",
+            "RepairRunInput",
+            "Run",
+            "RunLifeCycleState",
+            "RunNowInput",
+            "RunParameters",
+            "RunResultState",
+            "RunState",
+            "RunSubmitSettings",
+            "RunSubmitTaskSettings",
+            "RunTask",
+            "RunType",
+            "SqlAlertOutput",
+            "SqlDashboardOutput",
+            "SqlDashboardWidgetOutput",
+            "SqlOutput",
+            "SqlOutputError",
+            "SqlQueryOutput",
+            "SqlStatementOutput",
+            "TriggerType",
+            "ViewItem",
+            "ViewType",
+            "ViewsToExport",
+        ],
+    ),
+    "libraries": (
+        "Libraries and their install status.",
+        [
+            "ClusterLibraryStatuses",
+            "Library",
+            "LibraryFullStatus",
+            "LibraryInstallStatus",
+            "MavenLibrary",
+            "PythonPyPiLibrary",
+            "RCranLibrary",
+        ],
+    ),
+    "permissions": (
+        "Access control lists and permission levels.",
+        [
+            "AccessControlList",
+            "AccessControlRequest",
+            "AccessControlRequestForGroup",
+            "AccessControlRequestForServicePrincipal",
+            "AccessControlRequestForUser",
+            "CanManage",
+            "CanManageRun",
+            "CanView",
+            "GroupName",
+            "IsOwner",
+            "PermissionLevel",
+            "PermissionLevelForGroup",
+            "ServicePrincipalName",
+            "UserName",
+        ],
+    ),
+}
+COMMON_GROUP = "clusters"
+COMMON_DOC = "Clusters, their attributes, state and events."
+ENDPOINTS_GROUP = "endpoints"
+
+# array schemas with inline object items, name of the class of the items
+ITEM_CLASS_NAMES = {"TaskDependencies": "TaskDependency"}
+
+JSON_TYPES = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+}
+
+
+##################################################
+#    Model of the generated code
+##################################################
+
+
+class Field:
+    """A field of a generated class."""
+
+    def __init__(
+        self,
+        name: str,
+        annotation: str,
+        doc: str,
+        required: bool = False,
+        obj: Optional[str] = None,
+        lst: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.annotation = annotation
+        self.doc = doc
+        self.required = required
+        # name of the schema held in the field, or in the list in the field
+        self.obj = obj
+        self.lst = lst
+
+
+class ClassDef:
+    """A generated class."""
+
+    def __init__(self, name: str, doc: str, fields: List[Field]) -> None:
+        self.name = name
+        self.doc = doc
+        self.fields = fields
+
+
+class AliasDef:
+    """A generated type alias."""
+
+    def __init__(self, name: str, annotation: str, doc: str) -> None:
+        self.name = name
+        self.annotation = annotation
+        self.doc = doc
+
+
+##################################################
+#    Spec parsing
+##################################################
+
+
+def first_sentence(text: Optional[str]) -> str:
+    """Get the first sentence of a description, on a single line."""
+    if not text:
+        return ""
+    text = " ".join(text.split())
+    match = re.match(r"(.+?[.!?])(\s|$)", text)
+    return match.group(1) if match else text
+
+
+def camel(name: str) -> str:
+    """Turn a snake_case field name into a CamelCase class name."""
+    return "".join(part[:1].upper() + part[1:] for part in name.split("_"))
+
+
+def ref_name(schema: Dict[str, Any]) -> Optional[str]:
+    """Get the name of the schema referenced, if any."""
+    ref = schema.get("$ref")
+    if ref is None:
+        return None
+    return ref[len(REF_PREFIX) :]
+
+
+class SpecParser:
+    """Turn the OpenAPI schemas into class and alias definitions."""
+
+    def __init__(self, spec: Dict[str, Any]) -> None:
+        self.spec = spec
+        self.schemas: Dict[str, Dict[str, Any]] = spec["components"]["schemas"]
+        # definitions by group, in spec order
+        self.defs: Dict[str, List[Any]] = {}
+        # group of every generated name
+        self.group_of: Dict[str, str] = {}
+
+    def schema_group(self, name: str) -> str:
+        """Get the group of a component schema."""
+        for group, (_, names) in GROUPS.items():
+            if name in names:
+                return group
+        return COMMON_GROUP
+
+    def add(self, group: str, definition: Any) -> None:
+        """Register a definition in a group."""
+        if definition.name in self.group_of:
+            raise ValueError(f"Duplicate generated name {definition.name}.")
+        self.defs.setdefault(group, []).append(definition)
+        self.group_of[definition.name] = group
+
+    def is_class(self, name: str) -> bool:
+        """Check if a component schema is generated as a class."""
+        return "properties" in self.schemas[name]
+
+    def parse_components(self) -> None:
+        """Parse all the component schemas."""
+        for name, schema in self.schemas.items():
+            group = self.schema_group(name)
+            doc = first_sentence(schema.get("description"))
+            if "properties" in schema:
+                fields = self.parse_properties(name, schema, group)
+                self.add(group, ClassDef(name, doc, fields))
+            else:
+                annotation = self.annotation(name, "", schema, group)
+                self.add(group, AliasDef(name, annotation, doc))
+
+    def parse_properties(
+        self,
+        owner: str,
+        schema: Dict[str, Any],
+        group: str,
+    ) -> List[Field]:
+        """Parse the properties of an object schema into fields."""
+        required = schema.get("required", [])
+        # NewCluster has a single name instead of a list
+        required = {required} if isinstance(required, str) else set(required)
+        fields = []
+        for prop_name, prop in schema.get("properties", {}).items():
+            annotation = self.annotation(owner, prop_name, prop, group)
+            doc = first_sentence(prop.get("description"))
+            ref = ref_name(prop)
+            if not doc and ref is not None:
+                doc = first_sentence(self.schemas[ref].get("description"))
+            field = Field(
+                prop_name,
+                annotation,
+                doc,
+                required=prop_name in required or prop.get("required") is True,
+            )
+            self.set_nested(field, prop, owner, group)
+            fields.append(field)
+        return fields
+
+    def set_nested(
+        self,
+        field: Field,
+        prop: Dict[str, Any],
+        owner: str,
+        group: str,
+    ) -> None:
+        """Mark the fields that hold a schema or a list of schemas."""
+        ref = ref_name(prop)
+        if ref is not None and self.is_class(ref):
+            field.obj = ref
+            return
+        if ref is not None:
+            # an alias to an array, like TaskDependencies
+            prop = self.schemas[ref]
+            owner = ref
+        if "properties" in prop:
+            field.obj = f"{owner}{camel(field.name)}"
+            return
+        if prop.get("type") != "array":
+            return
+        items = prop.get("items", {})
+        item_ref = ref_name(items)
+        if item_ref is not None and self.is_class(item_ref):
+            field.lst = item_ref
+        elif "properties" in items:
+            field.lst = self.item_class_name(owner, field.name if ref is None else "")
+
+    def item_class_name(self, owner: str, prop_name: str) -> str:
+        """Get the name of the class of inline array items."""
+        if not prop_name and owner in ITEM_CLASS_NAMES:
+            return ITEM_CLASS_NAMES[owner]
+        return f"{owner}{camel(prop_name)}Item"
+
+    def annotation(
+        self,
+        owner: str,
+        prop_name: str,
+        schema: Dict[str, Any],
+        group: str,
+    ) -> str:
+        """Get the type annotation of a schema.
+
+        Inline objects are generated as classes of their own on the way.
+        """
+        ref = ref_name(schema)
+        if ref is not None:
+            return ref
+        for combinator in ("oneOf", "anyOf"):
+            if combinator in schema and "properties" not in schema:
+                options = [
+                    self.annotation(owner, "", s, group) for s in schema[combinator]
+                ]
+                return f"Union[{', '.join(options)}]"
+        if "enum" in schema:
+            return f"Literal[{', '.join(repr(e) for e in schema['enum'])}]"
+        if "properties" in schema:
+            # inline object, generate it as a class
+            name = f"{owner}{camel(prop_name)}"
+            fields = self.parse_properties(name, schema, group)
+            self.add(
+                group, ClassDef(name, first_sentence(schema.get("description")), fields)
+            )
+            return name
+        kind = schema.get("type", "")
+        if kind == "array":
+            items = schema.get("items", {})
+            if "properties" in items:
+                name = self.item_class_name(owner, prop_name)
+                fields = self.parse_properties(name, items, group)
+                self.add(group, ClassDef(name, "", fields))
+                return f"List[{name}]"
+            if not items:
+                return "List[Any]"
+            return f"List[{self.annotation(owner, prop_name, items, group)}]"
+        if kind == "object":
+            values = schema.get("additionalProperties")
+            if isinstance(values, dict):
+                return f"Dict[str, {self.annotation(owner, prop_name, values, group)}]"
+            return "Dict[str, Any]"
+        return JSON_TYPES.get(kind, "Any")
+
+    def merged_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge an ``allOf`` / ``$ref`` schema into a single object schema."""
+        ref = ref_name(schema)
+        if ref is not None:
+            return self.merged_schema(self.schemas[ref])
+        if "allOf" not in schema:
+            return schema
+        merged: Dict[str, Any] = {"properties": {}, "required": []}
+        for part in schema["allOf"]:
+            part = self.merged_schema(part)
+            merged["properties"].update(part.get("properties", {}))
+            merged["required"].extend(part.get("required", []))
+        return merged
+
+    def parse_endpoints(self) -> List[Tuple[str, str, str, str, str]]:
+        """Parse the endpoints into request and response classes.
+
+        Returns:
+            List[Tuple[str, str, str, str, str]]:
+                The operation id, method, path, request and response class name
+                of each endpoint.
+        """
+        endpoints = []
+        for path, operations in self.spec["paths"].items():
+            for method, operation in operations.items():
+                op_id = operation["operationId"]
+                doc = first_sentence(operation.get("description"))
+
+                # the request is either the query parameters or the json body
+                if "requestBody" in operation:
+                    body = operation["requestBody"]["content"]["application/json"]
+                    request_schema = self.merged_schema(body["schema"])
+                else:
+                    request_schema = {
+                        "properties": {
+                            p["name"]: {
+                                **p["schema"],
+                                "description": p.get("description"),
+                            }
+                            for p in operation.get("parameters", [])
+                        },
+                        "required": [
+                            p["name"]
+                            for p in operation.get("parameters", [])
+                            if p.get("required")
+                        ],
+                    }
+                request_name = f"{op_id}Request"
+                fields = self.parse_properties(
+                    request_name, request_schema, ENDPOINTS_GROUP
+                )
+                self.add(
+                    ENDPOINTS_GROUP, ClassDef(request_name, f"Request of {doc}", fields)
+                )
+
+                response = operation["responses"]["200"]
+                response_schema = self.merged_schema(
+                    response.get("content", {})
+                    .get("application/json", {})
+                    .get("schema", {})
+                )
+                response_name = f"{op_id}Response"
+                fields = self.parse_properties(
+                    response_name, response_schema, ENDPOINTS_GROUP
+                )
+                self.add(
+                    ENDPOINTS_GROUP,
+                    ClassDef(response_name, f"Response of {doc}", fields),
+                )
+
+                endpoints.append(
+                    (op_id, method.upper(), path, request_name, response_name)
+                )
+        return endpoints
+
+
+##################################################
+#    Code rendering
+##################################################
+
+
+def wrap(text: str, indent: int, width: int = 88) -> List[str]:
+    """Wrap a text to fit in the line length at the given indent."""
+    return textwrap.wrap(
+        text,
+        width=width - indent,
+        break_long_words=False,
+        break_on_hyphens=False,
+    ) or [""]
+
+
+def render_class(cls: ClassDef) -> str:
+    """Render the source of a generated class."""
+    pad = " " * 4
+    lines = [f"class {cls.name}(Schema):"]
+    doc = f"Schema of {cls.name}."
+    if cls.doc:
+        lines.append(f'{pad}"""{doc}')
+        lines.append("")
+        lines.extend(pad + line for line in wrap(cls.doc.replace('"""', "'''"), 4))
+        lines.append(f'{pad}"""')
+    else:
+        lines.append(f'{pad}"""{doc}"""')
+    lines.append("")
+
+    slots = ", ".join(repr(f.name) for f in cls.fields)
+    lines.append(f"{pad}__slots__ = ({slots}{',' if len(cls.fields) == 1 else ''})")
+    objects = {f.name: f.obj for f in cls.fields if f.obj}
+    lists = {f.name: f.lst for f in cls.fields if f.lst}
+    if objects:
+        lines.append(f"{pad}_objects = {objects!r}")
+    if lists:
+        lines.append(f"{pad}_lists = {lists!r}")
+
+    if not cls.fields:
+        return "\n".join(lines) + "\n"
+
+    # required fields first, then the optional ones
+    ordered = [f for f in cls.fields if f.required] + [
+        f for f in cls.fields if not f.required
+    ]
+    lines.append("")
+    lines.append(f"{pad}def __init__(")
+    lines.append(f"{pad * 2}self,")
+    for f in ordered:
+        if f.required:
+            lines.append(f"{pad * 2}{f.name}: {f.annotation},")
+        else:
+            lines.append(f"{pad * 2}{f.name}: Optional[{f.annotation}] = None,")
+    lines.append(f"{pad}) -> None:")
+    documented = [f for f in ordered if f.doc]
+    if documented:
+        lines.append(f'{pad * 2}"""Build a {cls.name}.')
+        lines.append("")
+        lines.append(f"{pad * 2}Args:")
+        for f in documented:
+            lines.append(f"{pad * 3}{f.name}:")
+            lines.extend(
+                pad * 4 + line for line in wrap(f.doc.replace('"""', "'''"), 16)
+            )
+        lines.append(f'{pad * 2}"""')
+    for f in cls.fields:
+        lines.append(f"{pad * 2}self.{f.name} = {f.name}")
+    return "\n".join(lines) + "\n"
+
+
+def render_alias(alias: AliasDef, generated: Dict[str, str]) -> str:
+    """Render the source of a generated type alias.
+
+    The alias is evaluated at import time, so the generated names it uses are
+    quoted as forward references, they might be defined later or in another group.
+    """
+
+    def quote(match: "re.Match[str]") -> str:
+        token = match.group(0)
+        return repr(token) if token in generated else token
+
+    annotation = re.sub(r"'[^']*'|[A-Za-z_]\w*", quote, alias.annotation)
+    lines = [f"{alias.name} = {annotation}"]
+    if alias.doc:
+        lines.append(f'"""{alias.doc.replace(chr(34) * 3, chr(39) * 3)}"""')
+    return "\n".join(lines) + "\n"
+
+
+def referenced_names(definitions: List[Any]) -> List[str]:
+    """Get all the identifiers used in the annotations of the definitions."""
+    annotations = []
+    for d in definitions:
+        if isinstance(d, AliasDef):
+            annotations.append(d.annotation)
+        else:
+            annotations.extend(f.annotation for f in d.fields)
+    names = set()
+    for annotation in annotations:
+        # drop the literals, their content is not a name
+        annotation = re.sub(r"'[^']*'", "", annotation)
+        names.update(re.findall(r"[A-Za-z_]\w*", annotation))
+    return sorted(names)
+
+
+def render_module(
+    group: str,
+    doc: str,
+    definitions: List[Any],
+    group_of: Dict[str, str],
+    extra: str = "",
+    extra_typing: Tuple[str, ...] = (),
+) -> str:
+    """Render the source of the module of a group."""
+    local = {d.name for d in definitions}
+    used = set(referenced_names(definitions))
+    # Any is used by __getattr__, Optional by the optional fields
+    used.update(("Any", "Optional"), extra_typing)
+    typing_names: List[str] = [
+        n
+        for n in ("Any", "Dict", "List", "Literal", "Optional", "Tuple", "Union")
+        if n in used
+    ]
+    foreign: Dict[str, List[str]] = {}
+    for name in sorted(used):
+        if name in group_of and name not in local:
+            foreign.setdefault(group_of[name], []).append(name)
+
+    parts = [HEADER, f'"""{doc}"""']
+    imports = ["from __future__ import annotations", ""]
+    # TYPE_CHECKING guards the imports of the other groups
+    checking = ["TYPE_CHECKING"] if foreign else []
+    imports.append(f"from typing import {', '.join(checking + typing_names)}")
+    imports.append("")
+    imports.append("from schema import Schema")
+    if foreign:
+        imports.append("")
+        imports.append("if TYPE_CHECKING:")
+        for other in sorted(foreign):
+            names = ", ".join(foreign[other])
+            imports.append(f"    from {PACKAGE_NAME}.{other} import {names}")
+    parts.append("\n".join(imports))
+    parts.append(
+        "def __getattr__(name: str) -> Any:\n"
+        f'    """Resolve the schemas of the other groups through the package."""\n'
+        f"    import {PACKAGE_NAME}\n"
+        "\n"
+        f"    return getattr({PACKAGE_NAME}, name)"
+    )
+    for d in definitions:
+        if isinstance(d, ClassDef):
+            parts.append(render_class(d))
+        else:
+            parts.append(render_alias(d, group_of))
+    if extra:
+        parts.append(extra)
+    return "\n\n".join(p.rstrip("\n") for p in parts) + "\n"
+
+
+def render_endpoints_table(endpoints: List[Tuple[str, str, str, str, str]]) -> str:
+    """Render the table of the endpoints."""
+    lines = [
+        "# operation id -> (method, path, request class, response class)",
+        "ENDPOINTS: Dict[str, Tuple[str, str, str, str]] = {",
+    ]
+    for op_id, method, path, request, response in endpoints:
+        lines.append(
+            f"    {op_id!r}: ({method!r}, {path!r}, {request!r}, {response!r}),"
+        )
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def render_init(group_of: Dict[str, str], groups: List[str]) -> str:
+    """Render the source of the package, that imports the groups lazily."""
+    lines = [
+        HEADER,
+        '"""Typed model of the Databricks Jobs API.',
+        "",
+        "The schemas are split in groups, and a group is imported only when one",
+        "of its names is first accessed::",
+        "",
+        "    from databricks_models import JobSettings  # imports only the jobs group",
+        '"""',
+        "from importlib import import_module",
+        "from typing import Any, Dict, List",
+        "",
+        f"GROUPS = {groups!r}",
+        "",
+        "# name -> group of the module where it is defined",
+        "_GROUP_OF: Dict[str, str] = {",
+    ]
+    for name in sorted(group_of):
+        lines.append(f"    {name!r}: {group_of[name]!r},")
+    lines += [
+        "}",
+        "",
+        "__all__ = sorted(_GROUP_OF)",
+        "",
+        "",
+        "def __getattr__(name: str) -> Any:",
+        '    """Import the group of the requested name."""',
+        "    group = _GROUP_OF.get(name)",
+        "    if group is None:",
+        '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+        '    value = getattr(import_module(f"{__name__}.{group}"), name)',
+        "    globals()[name] = value",
+        "    return value",
+        "",
+        "",
+        "def __dir__() -> List[str]:",
+        "    return __all__",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+##################################################
+#    Validators
+##################################################
+
+
+# public validator -> the component schema, or the endpoint whose request, it checks
+VALIDATORS = {
+    "validate_job_settings": "JobSettings",
+    "validate_new_cluster": "NewCluster",
+    "validate_run_now": "JobsRunNow",
+}
+VALIDATORS_MODULE = "validators"
+
+INT_RANGES = {
+    "int32": (-(2**31), 2**31 - 1),
+    "int64": (-(2**63), 2**63 - 1),
+}
+SCALAR_CHECKS = {
+    "string": ("not isinstance({v}, str)", "a string"),
+    "integer": ("type({v}) is not int", "an integer"),
+    "number": ("type({v}) not in (int, float)", "a number"),
+    "boolean": ("type({v}) is not bool", "a boolean"),
+}
+
+
+class ValidatorCompiler:
+    """Compile schemas into plain functions that check payloads.
+
+    Every object schema becomes a ``_check_<name>(value, path, errors)``
+    function appending ``<JSON path>: <message>`` to ``errors``, the scalars,
+    arrays and maps are checked inline, and the enums and patterns are module
+    constants, so nothing of the schema is looked at when a payload is checked.
+    """
+
+    def __init__(self, parser: SpecParser) -> None:
+        self.parser = parser
+        self.schemas = parser.schemas
+        # function name -> source, in the order of the first use
+        self.functions: Dict[str, str] = {}
+        self._queue: List[Tuple[str, Dict[str, Any]]] = []
+        # constant source -> constant name
+        self.constants: Dict[str, str] = {}
+
+    def function(self, name: str, schema: Dict[str, Any]) -> str:
+        """Get the name of the function checking a schema, compiled later."""
+        function_name = f"_check_{name}"
+        if function_name not in self.functions:
+            self.functions[function_name] = ""
+            self._queue.append((function_name, schema))
+        return function_name
+
+    def constant(self, prefix: str, source: str) -> str:
+        """Get the name of a module constant, shared by the identical ones."""
+        if source not in self.constants:
+            n = sum(name.startswith(f"_{prefix}_") for name in self.constants.values())
+            self.constants[source] = f"_{prefix}_{n}"
+        return self.constants[source]
+
+    def compile(self) -> None:
+        """Compile the functions of the validators and all they use."""
+        for root in VALIDATORS.values():
+            self.root_function(root)
+        while self._queue:
+            function_name, schema = self._queue.pop(0)
+            self.functions[function_name] = self.render_function(function_name, schema)
+
+    def root_function(self, root: str) -> str:
+        """Get the function checking a component schema or an endpoint request."""
+        if root in self.schemas:
+            return self.function(root, self.schemas[root])
+        for operations in self.parser.spec["paths"].values():
+            for operation in operations.values():
+                if operation["operationId"] == root:
+                    body = operation["requestBody"]["content"]["application/json"]
+                    merged = self.parser.merged_schema(body["schema"])
+                    return self.function(f"{root}Request", merged)
+        raise ValueError(f"No schema or endpoint {root}.")
+
+    def render_function(self, function_name: str, schema: Dict[str, Any]) -> str:
+        """Render the source of a check function."""
+        lines = [
+            f"def {function_name}(value: Any, path: str, errors: List[str]) -> None:"
+        ]
+        body = self.check(schema, "value", "{path}", 1, function_name)
+        lines.extend(body or ["    pass"])
+        return "\n".join(lines)
+
+    def check(
+        self,
+        schema: Dict[str, Any],
+        var: str,
+        path: str,
+        depth: int,
+        owner: str,
+    ) -> List[str]:
+        """Get the lines checking the value in ``var`` against a schema.
+
+        Args:
+            schema (Dict[str, Any]): The schema.
+            var (str): The variable holding the value.
+            path (str): The f-string of the JSON path of the value.
+            depth (int): The indentation, and the suffix of the variables.
+            owner (str): Prefix of the functions of inline alternatives.
+        """
+        pad = " " * 4 * depth
+        ref = ref_name(schema)
+        if ref is not None:
+            target = self.schemas[ref]
+            if "properties" in target or "oneOf" in target or "anyOf" in target:
+                function_name = self.function(ref, target)
+                return [f"{pad}{function_name}({var}, {as_str(path)}, errors)"]
+            # a plain alias, like TaskKey, is checked inline
+            return self.check(target, var, path, depth, f"_check_{ref}")
+        if "allOf" in schema:
+            schema = self.parser.merged_schema(schema)
+
+        kind = schema.get("type")
+        if kind is None and ("properties" in schema or "required" in schema):
+            kind = "object"
+        if kind == "object":
+            return self.check_object(schema, var, path, depth, owner)
+        if kind == "array":
+            return self.check_array(schema, var, path, depth, owner)
+        if kind in SCALAR_CHECKS or "enum" in schema:
+            return self.check_scalar(schema, kind, var, path, depth)
+        return []
+
+    def check_object(
+        self,
+        schema: Dict[str, Any],
+        var: str,
+        path: str,
+        depth: int,
+        owner: str,
+    ) -> List[str]:
+        pad = " " * 4 * depth
+        lines = [
+            f"{pad}if not isinstance({var}, dict):",
+            f"{pad}    errors.append({error(path, 'expected an object')})",
+        ]
+        body = []
+        required = schema.get("required", [])
+        # NewCluster has a single name instead of a list
+        required = [required] if isinstance(required, str) else list(required)
+        v = f"v{depth}"
+        properties = dict(schema.get("properties", {}))
+        # the alternatives of a oneOf only list their required names
+        properties.update((name, {}) for name in required if name not in properties)
+        for name, prop in properties.items():
+            prop_path = path + member(name)
+            nested = self.check(prop, v, prop_path, depth + 2, f"{owner}_{name}")
+            if name in required or prop.get("required") is True:
+                missing = error(prop_path, "is required")
+                if nested:
+                    body += [
+                        f"{pad}    {v} = {var}.get({name!r})",
+                        f"{pad}    if {v} is None:",
+                        f"{pad}        errors.append({missing})",
+                        f"{pad}    else:",
+                        *nested,
+                    ]
+                else:
+                    body += [
+                        f"{pad}    if {var}.get({name!r}) is None:",
+                        f"{pad}        errors.append({missing})",
+                    ]
+            elif nested:
+                body += [
+                    f"{pad}    {v} = {var}.get({name!r})",
+                    f"{pad}    if {v} is not None:",
+                    *nested,
+                ]
+        values = schema.get("additionalProperties")
+        if isinstance(values, dict):
+            k = f"k{depth}"
+            nested = self.check(
+                values, v, path + f"[{{{k}!r}}]", depth + 2, f"{owner}_values"
+            )
+            if nested:
+                known = tuple(schema.get("properties", {}))
+                body.append(f"{pad}    for {k}, {v} in {var}.items():")
+                if known:
+                    body.append(f"{pad}        if {k} in {known!r}:")
+                    body.append(f"{pad}            continue")
+                body += nested
+        for combinator in ("oneOf", "anyOf"):
+            if combinator in schema:
+                body += self.check_alternatives(
+                    schema[combinator], combinator, var, path, depth + 1, owner
+                )
+        if body:
+            lines.append(f"{pad}else:")
+            lines += body
+        return lines
+
+    def check_array(
+        self,
+        schema: Dict[str, Any],
+        var: str,
+        path: str,
+        depth: int,
+        owner: str,
+    ) -> List[str]:
+        pad = " " * 4 * depth
+        lines = [
+            f"{pad}if not isinstance({var}, list):",
+            f"{pad}    errors.append({error(path, 'expected an array')})",
+        ]
+        body = []
+        if "minItems" in schema:
+            body += [
+                f"{pad}    if len({var}) < {schema['minItems']}:",
+                f"{pad}        errors.append("
+                f"{error(path, 'fewer than %d items' % schema['minItems'])})",
+            ]
+        if "maxItems" in schema:
+            body += [
+                f"{pad}    if len({var}) > {schema['maxItems']}:",
+                f"{pad}        errors.append("
+                f"{error(path, 'more than %d items, {len(%s)}' % (schema['maxItems'], var))})",
+            ]
+        i, v = f"i{depth}", f"v{depth}"
+        nested = self.check(
+            schema.get("items", {}), v, path + f"[{{{i}}}]", depth + 2, f"{owner}_item"
+        )
+        if nested:
+            body.append(f"{pad}    for {i}, {v} in enumerate({var}):")
+            body += nested
+        if body:
+            lines.append(f"{pad}else:")
+            lines += body
+        return lines
+
+    def check_scalar(
+        self,
+        schema: Dict[str, Any],
+        kind: Optional[str],
+        var: str,
+        path: str,
+        depth: int,
+    ) -> List[str]:
+        pad = " " * 4 * depth
+        # (condition of an error, message)
+        tests: List[Tuple[str, str]] = []
+        if kind == "string":
+            if "minLength" in schema:
+                tests.append(
+                    (
+                        f"len({var}) < {schema['minLength']}",
+                        f"shorter than {schema['minLength']} characters",
+                    )
+                )
+            if "maxLength" in schema:
+                tests.append(
+                    (
+                        f"len({var}) > {schema['maxLength']}",
+                        f"longer than {schema['maxLength']} characters",
+                    )
+                )
+            if "pattern" in schema:
+                pattern = self.constant("PATTERN", f"re.compile({schema['pattern']!r})")
+                tests.append(
+                    (
+                        f"{pattern}.search({var}) is None",
+                        f"{{{var}!r}} does not match {{{pattern}.pattern}}",
+                    )
+                )
+        if kind == "integer" and schema.get("format") in INT_RANGES:
+            low, high = INT_RANGES[schema["format"]]
+            tests.append(
+                (
+                    f"not {low} <= {var} <= {high}",
+                    f"out of the {schema['format']} range",
+                )
+            )
+        if "enum" in schema:
+            enum = self.constant("ENUM", repr(tuple(schema["enum"])))
+            tests.append(
+                (f"{var} not in {enum}", f"{{{var}!r}} is not one of {{{enum}}}")
+            )
+
+        lines = []
+        if kind in SCALAR_CHECKS:
+            condition, expected = SCALAR_CHECKS[kind]
+            lines += [
+                f"{pad}if {condition.format(v=var)}:",
+                f"{pad}    errors.append("
+                f"{error(path, 'expected %s, not {type(%s).__name__}' % (expected, var))})",
+            ]
+        for n, (condition, message) in enumerate(tests):
+            keyword = "elif" if lines and n == 0 and len(tests) == 1 else "if"
+            if keyword == "if" and lines and n == 0:
+                lines.append(f"{pad}else:")
+            indent = pad + ("    " if lines and keyword == "if" else "")
+            lines += [
+                f"{indent}{keyword} {condition}:",
+                f"{indent}    errors.append({error(path, message)})",
+            ]
+        return lines
+
+    def check_alternatives(
+        self,
+        alternatives: List[Dict[str, Any]],
+        combinator: str,
+        var: str,
+        path: str,
+        depth: int,
+        owner: str,
+    ) -> List[str]:
+        """Check the value matches one (``anyOf``) or exactly one (``oneOf``)."""
+        pad = " " * 4 * depth
+        names = []
+        described = []
+        for n, alternative in enumerate(alternatives):
+            names.append(self.function(f"{owner[len('_check_'):]}_{n}", alternative))
+            described.append(describe(alternative))
+        matched, found = f"matched{depth}", f"found{depth}"
+        if combinator == "oneOf":
+            test = f"{matched} != 1"
+            message = f"matches {{{matched}}} of the alternatives instead of one: "
+        else:
+            test = f"not {matched}"
+            message = "matches none of the alternatives: "
+        return [
+            f"{pad}{matched} = 0",
+            f"{pad}for check in ({', '.join(names)},):",
+            f"{pad}    {found}: List[str] = []",
+            f"{pad}    check({var}, {as_str(path)}, {found})",
+            f"{pad}    {matched} += not {found}",
+            f"{pad}if {test}:",
+            f"{pad}    errors.append({error(path, message + ' | '.join(described))})",
+        ]
+
+
+def member(name: str) -> str:
+    """Get the JSON path of a member, in the f-string of a path."""
+    if re.fullmatch(r"[A-Za-z_]\w*", name):
+        return f".{name}"
+    return f"[{name!r}]"
+
+
+def as_str(path: str) -> str:
+    """Get the expression of the path of an f-string."""
+    return "path" if path == "{path}" else f'f"{path}"'
+
+
+def error(path: str, message: str) -> str:
+    """Get the f-string of an error, ``<path>: <message>``."""
+    if '"' in message or "\\" in message:
+        raise ValueError(f"Cannot render the message {message!r}.")
+    return f'f"{path}: {message}"'
+
+
+def describe(schema: Dict[str, Any]) -> str:
+    """Describe an alternative of a ``oneOf`` in an error."""
+    ref = ref_name(schema)
+    if ref is not None:
+        return ref
+    required = schema.get("required")
+    if required and set(schema) <= {"required", "description"}:
+        return " + ".join(required)
+    return "an inline schema"
+
+
+def render_validators(parser: SpecParser) -> str:
+    """Render the source of the validators module."""
+    compiler = ValidatorCompiler(parser)
+    compiler.compile()
+    targets = {
+        name: compiler.root_function(root)[len("_check_") :]
+        for name, root in VALIDATORS.items()
+    }
+    parts = [
+        HEADER,
+        '"""Check payloads against the schemas, before sending them.\n\n'
+        "The schemas are compiled into plain functions by ``codegen.py``, every\n"
+        "error of a payload is returned with its JSON path::\n\n"
+        "    errors = validate_job_settings(payload)\n"
+        '    # ["$.tasks[3].task_key: is required", ...]\n"""',
+        "import re\nfrom typing import Any, Callable, Dict, List, Optional",
+    ]
+    constants = [f"{name} = {source}" for source, name in compiler.constants.items()]
+    if constants:
+        parts.append("\n".join(constants))
+    parts.extend(compiler.functions.values())
+    for name, target in targets.items():
+        parts.append(
+            f"def {name}(payload: Any) -> List[str]:\n"
+            f'    """Check a payload against the {target} schema.\n\n'
+            "    Returns:\n"
+            "        List[str]: The errors, ``<JSON path>: <message>``, none if valid.\n"
+            '    """\n'
+            "    errors: List[str] = []\n"
+            f'    _check_{target}(payload, "$", errors)\n'
+            "    return errors"
+        )
+    table = ", ".join(f"{t!r}: {n}" for n, t in targets.items())
+    parts.append(
+        "# name of the schema -> its validator\n"
+        "VALIDATORS: Dict[str, Callable[[Any], List[str]]] = {" + table + "}"
+    )
+    parts.append(
+        "def validate(value: Any, schema: Optional[str] = None) -> List[str]:\n"
+        '    """Check a ``Schema`` instance, or a payload against the named schema.\n\n'
+        "    Args:\n"
+        "        value (Any): The instance, or the payload.\n"
+        "        schema (Optional[str]):\n"
+        "            The name of the schema of the payload, the class of the\n"
+        "            instance if None.\n"
+        '    """\n'
+        "    if schema is None:\n"
+        "        schema = type(value).__name__\n"
+        "        value = value.to_dict()\n"
+        "    return VALIDATORS[schema](value)"
+    )
+    return "\n\n\n".join(p.rstrip("\n") for p in parts) + "\n"
+
+
+def format_source(source: str) -> str:
+    """Format the source with black, if it is available."""
+    try:
+        import black
+    except ImportError:
+        return source
+    return black.format_str(source, mode=black.Mode(line_length=88))
+
+
+def generate(spec_path: Path = SPEC_PATH, package_path: Path = PACKAGE_PATH) -> None:
+    """Generate the model package from the spec."""
+    with open(spec_path) as f:
+        spec = yaml.safe_load(f)
+
+    parser = SpecParser(spec)
+    parser.parse_components()
+    endpoints = parser.parse_endpoints()
+
+    docs = {group: doc for group, (doc, _) in GROUPS.items()}
+    docs[COMMON_GROUP] = COMMON_DOC
+    docs[ENDPOINTS_GROUP] = "Request and response of every endpoint."
+
+    package_path.mkdir(exist_ok=True)
+    groups = list(parser.defs)
+    for group, definitions in parser.defs.items():
+        if group == ENDPOINTS_GROUP:
+            extra = render_endpoints_table(endpoints)
+            extra_typing: Tuple[str, ...] = ("Dict", "Tuple")
+        else:
+            extra = ""
+            extra_typing = ()
+        source = render_module(
+            group,
+            docs[group],
+            definitions,
+            parser.group_of,
+            extra,
+            extra_typing,
+        )
+        (package_path / f"{group}.py").write_text(format_source(source))
+        lg.info("Generated {} definitions in group {}.", len(definitions), group)
+
+    init = render_init(parser.group_of, groups)
+    (package_path / "__init__.py").write_text(format_source(init))
+
+    validators = render_validators(parser)
+    (package_path / f"{VALIDATORS_MODULE}.py").write_text(format_source(validators))
+    lg.info("Generated {} validators.", len(VALIDATORS))
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--spec", type=Path, default=SPEC_PATH)
+    arg_parser.add_argument("--out", type=Path, default=PACKAGE_PATH)
+    args = arg_parser.parse_args()
+    generate(args.spec, args.out)
@@ -2,13 +2,41 @@
 
 Extracted from the
 [job API specification](https://learn.microsoft.com/en-us/azure/databricks/dev-tools/api/latest/jobs).
+
+The classes are slotted, unset optional fields are stored as ``None``.
+Use ``to_dict`` / ``to_json`` to get the API payload,
+unset fields are omitted from it.
+
+These are the hand written shortcuts used in the samples,
+the full model generated from the specification is in ``databricks_models``.
 """
-from typing import Any, Dict, List, Literal, Optional
 
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
+
+from schema import Schema
+
+if TYPE_CHECKING:
+    from databricks_models import AutoScale, AzureAttributes, NewCluster
+
+# the schemas of databricks_models used here, imported when first used so
+# that importing this module does not load their group
+_MODEL_NAMES = ("AutoScale", "AzureAttributes", "NewCluster")
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the schemas of ``databricks_models``, like ``CreateCluster``'s."""
+    if name in _MODEL_NAMES:
+        import databricks_models
+
+        return getattr(databricks_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-class CronSchedule:
+
+class CronSchedule(Schema):
     """Schema of CronSchedule."""
 
+    __slots__ = ("quartz_cron_expression", "timezone_id", "pause_status")
+
     def __init__(
         self,
         quartz_cron_expression: str,
@@ -31,13 +59,14 @@ class CronSchedule:
         """
         self.quartz_cron_expression = quartz_cron_expression
         self.timezone_id = timezone_id
-        if pause_status is not None:
-            self.pause_status = pause_status
+        self.pause_status = pause_status
 
 
-class JobEmailNotifications:
+class JobEmailNotifications(Schema):
     """Schema of JobEmailNotifications."""
 
+    __slots__ = ("on_start", "on_success", "on_failure", "no_alert_for_skipped_runs")
+
     def __init__(
         self,
         on_start: Optional[List[str]] = None,
@@ -45,22 +74,21 @@ class JobEmailNotifications:
         on_failure: Optional[List[str]] = None,
         no_alert_for_skipped_runs: Optional[bool] = None,
     ) -> None:
-        if on_start is not None:
-            self.on_start = on_start
-        if on_success is not None:
-            self.on_success = on_success
-        if on_failure is not None:
-            self.on_failure = on_failure
-        if no_alert_for_skipped_runs is not None:
-            self.no_alert_for_skipped_runs = no_alert_for_skipped_runs
+        self.on_start = on_start
+        self.on_success = on_success
+        self.on_failure = on_failure
+        self.no_alert_for_skipped_runs = no_alert_for_skipped_runs
 
 
-class Library:
-    """Schema of Library.
+class Library(Schema):
+    """Schema of Library, for a PyPI package.
 
-    Should be fancier, with pypi being a PythonPyPiLibrary.
+    The full schema, with pypi being a PythonPyPiLibrary,
+    is ``databricks_models.Library``.
     """
 
+    __slots__ = ("pypi",)
+
     def __init__(
         self,
         package: str,
@@ -68,9 +96,11 @@ class Library:
         self.pypi = {"package": package}
 
 
-class NotebookTask:
+class NotebookTask(Schema):
     """Schema of NotebookTask."""
 
+    __slots__ = ("notebook_path", "source", "base_parameters")
+
     def __init__(
         self,
         notebook_path: str,
@@ -113,13 +143,11 @@ class NotebookTask:
                 [dbutils.widgets.get](https://docs.microsoft.com/azure/databricks/dev-tools/databricks-utils#dbutils-widgets).
         """
         self.notebook_path = notebook_path
-        if source is not None:
-            self.source = source
-        if base_parameters is not None:
-            self.base_parameters = base_parameters
+        self.source = source
+        self.base_parameters = base_parameters
 
 
-class TaskDependency:
+class TaskDependency(Schema):
     """Schema of ``TaskDependencies``.
 
     ``TaskDependencies`` is actually an array of dependencies.
@@ -134,8 +162,13 @@ class TaskDependency:
     That is not part of the API, which wants, inside the ``JobTaskSettings``,
     directly the array at the key ``depends_on``.
     So we just pass a List[TaskDependency] to ``depends_on``.
+
+    In ``databricks_models`` the items are ``TaskDependency``
+    and ``TaskDependencies`` is an alias of the list.
     """
 
+    __slots__ = ("task_key",)
+
     def __init__(
         self,
         task_key: str,
@@ -143,9 +176,21 @@ class TaskDependency:
         self.task_key = task_key
 
 
-class JobTaskSettings:
+class JobTaskSettings(Schema):
     """Schema of JobTaskSettings."""
 
+    __slots__ = (
+        "task_key",
+        "depends_on",
+        "notebook_task",
+        "existing_cluster_id",
+        "libraries",
+        "max_retries",
+        "min_retry_interval_millis",
+    )
+    _objects = {"notebook_task": "NotebookTask"}
+    _lists = {"depends_on": "TaskDependency", "libraries": "Library"}
+
     def __init__(
         self,
         task_key: str,
@@ -175,29 +220,37 @@ class JobTaskSettings:
                 the `FAILED` result_state or `INTERNAL_ERROR` `life_cycle_state`.
                 The value -1 means to retry indefinitely and the value 0 means
                 to never retry. The default behavior is to never retry.
-            min_retry_interval_millis (Optional[int]): 
+            min_retry_interval_millis (Optional[int]):
                 An optional minimal interval in milliseconds between the start
                 of the failed run and the subsequent retry run. The default
                 behavior is that unsuccessful runs are immediately retried.
         """
         self.task_key = task_key
-        if depends_on is not None:
-            self.depends_on = depends_on
-        if notebook_task is not None:
-            self.notebook_task = notebook_task
-        if existing_cluster_id is not None:
-            self.existing_cluster_id = existing_cluster_id
-        if libraries is not None:
-            self.libraries = libraries
-        if max_retries is not None:
-            self.max_retries = max_retries
-        if min_retry_interval_millis is not None:
-            self.min_retry_interval_millis = min_retry_interval_millis
-
-
-class JobSettings:
+        self.depends_on = depends_on
+        self.notebook_task = notebook_task
+        self.existing_cluster_id = existing_cluster_id
+        self.libraries = libraries
+        self.max_retries = max_retries
+        self.min_retry_interval_millis = min_retry_interval_millis
+
+
+class JobSettings(Schema):
     """Schema of JobSettings."""
 
+    __slots__ = (
+        "name",
+        "email_notifications",
+        "timeout_seconds",
+        "schedule",
+        "max_concurrent_runs",
+        "tasks",
+    )
+    _objects = {
+        "email_notifications": "JobEmailNotifications",
+        "schedule": "CronSchedule",
+    }
+    _lists = {"tasks": "JobTaskSettings"}
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -224,15 +277,171 @@ class JobSettings:
             tasks (Optional[List[JobTaskSettings]]):
                 The list of tasks performed by the run.
         """
-        if name is not None:
-            self.name = name
-        if email_notifications is not None:
-            self.email_notifications = email_notifications
-        if timeout_seconds is not None:
-            self.timeout_seconds = timeout_seconds
-        if schedule is not None:
-            self.schedule = schedule
-        if max_concurrent_runs is not None:
-            self.max_concurrent_runs = max_concurrent_runs
-        if tasks is not None:
-            self.tasks = tasks
+        self.name = name
+        self.email_notifications = email_notifications
+        self.timeout_seconds = timeout_seconds
+        self.schedule = schedule
+        self.max_concurrent_runs = max_concurrent_runs
+        self.tasks = tasks
+
+
+class CreateCluster(Schema):
+    """Schema of the request of ``clusters/create``.
+
+    The ``ClusterAttributes`` with the size of the cluster, and the fields the
+    specification misses. ``new_cluster`` gives the ``NewCluster`` of a job
+    cluster with the same settings.
+    """
+
+    __slots__ = (
+        "num_workers",
+        "autoscale",
+        "cluster_name",
+        "spark_version",
+        "spark_conf",
+        "azure_attributes",
+        "node_type_id",
+        "driver_node_type_id",
+        "custom_tags",
+        "spark_env_vars",
+        "autotermination_minutes",
+        "enable_elastic_disk",
+        "instance_pool_id",
+        "policy_id",
+        "runtime_engine",
+        "data_security_mode",
+        "single_user_name",
+        "idempotency_token",
+    )
+    _objects = {"autoscale": "AutoScale", "azure_attributes": "AzureAttributes"}
+
+    def __init__(
+        self,
+        cluster_name: str,
+        spark_version: str,
+        node_type_id: str,
+        num_workers: Optional[int] = None,
+        autoscale: Optional["AutoScale"] = None,
+        spark_conf: Optional[Dict[str, str]] = None,
+        azure_attributes: Optional["AzureAttributes"] = None,
+        driver_node_type_id: Optional[str] = None,
+        custom_tags: Optional[Dict[str, str]] = None,
+        spark_env_vars: Optional[Dict[str, str]] = None,
+        autotermination_minutes: Optional[int] = None,
+        enable_elastic_disk: Optional[bool] = None,
+        instance_pool_id: Optional[str] = None,
+        policy_id: Optional[str] = None,
+        runtime_engine: Optional[Literal["STANDARD", "PHOTON"]] = None,
+        data_security_mode: Optional[str] = None,
+        single_user_name: Optional[str] = None,
+        idempotency_token: Optional[str] = None,
+    ) -> None:
+        """Create a CreateCluster.
+
+        Args:
+            cluster_name (str): Cluster name requested by the user.
+            spark_version (str): The runtime version, like ``10.4.x-scala2.12``.
+            node_type_id (str): The node type, like ``Standard_DS3_v2``.
+            num_workers (Optional[int]):
+                The number of workers, 0 for a single node cluster.
+            autoscale (Optional[AutoScale]):
+                The bounds of the workers, instead of ``num_workers``.
+            spark_conf (Optional[Dict[str, str]]): The Spark configuration.
+            azure_attributes (Optional[AzureAttributes]):
+                The on-demand and spot instances.
+            driver_node_type_id (Optional[str]):
+                The node type of the driver, ``node_type_id`` if None.
+            custom_tags (Optional[Dict[str, str]]): The tags of the resources.
+            spark_env_vars (Optional[Dict[str, str]]): The environment variables.
+            autotermination_minutes (Optional[int]):
+                Minutes of inactivity before the cluster terminates.
+            enable_elastic_disk (Optional[bool]): Autoscaling local storage.
+            instance_pool_id (Optional[str]): The pool of the nodes.
+            policy_id (Optional[str]): The cluster policy.
+            runtime_engine (Optional[Literal['STANDARD', 'PHOTON']]):
+                The runtime engine.
+            data_security_mode (Optional[str]):
+                Like ``LEGACY_SINGLE_USER_STANDARD``.
+            single_user_name (Optional[str]): The user of a single user cluster.
+            idempotency_token (Optional[str]):
+                At most one cluster not terminated is created with this token,
+                64 characters at most.
+        """
+        self.num_workers = num_workers
+        self.autoscale = autoscale
+        self.cluster_name = cluster_name
+        self.spark_version = spark_version
+        self.spark_conf = spark_conf
+        self.azure_attributes = azure_attributes
+        self.node_type_id = node_type_id
+        self.driver_node_type_id = driver_node_type_id
+        self.custom_tags = custom_tags
+        self.spark_env_vars = spark_env_vars
+        self.autotermination_minutes = autotermination_minutes
+        self.enable_elastic_disk = enable_elastic_disk
+        self.instance_pool_id = instance_pool_id
+        self.policy_id = policy_id
+        self.runtime_engine = runtime_engine
+        self.data_security_mode = data_security_mode
+        self.single_user_name = single_user_name
+        self.idempotency_token = idempotency_token
+
+    def new_cluster(self) -> "NewCluster":
+        """Get the ``NewCluster`` of a job cluster with the same settings."""
+        from databricks_models import NewCluster
+
+        return NewCluster(
+            num_workers=self.num_workers,
+            autoscale=self.autoscale,
+            spark_version=self.spark_version,
+            spark_conf=self.spark_conf,
+            azure_attributes=self.azure_attributes,
+            node_type_id=self.node_type_id,
+            driver_node_type_id=self.driver_node_type_id,
+            custom_tags=self.custom_tags,  # type: ignore[arg-type]
+            spark_env_vars=self.spark_env_vars,  # type: ignore[arg-type]
+            enable_elastic_disk=self.enable_elastic_disk,
+            instance_pool_id=self.instance_pool_id,
+            policy_id=self.policy_id,
+        )
+
+
+def single_node_cluster(
+    cluster_name: str,
+    autotermination_minutes: int = 10,
+    spark_version: str = "10.4.x-scala2.12",
+    node_type_id: str = "Standard_DS3_v2",
+    cores: str = "4",
+) -> CreateCluster:
+    """Build the single node cluster of the samples.
+
+    Args:
+        cluster_name (str): Cluster name requested by the user.
+        autotermination_minutes (int):
+            Minutes of inactivity before the cluster terminates.
+        spark_version (str): The runtime version.
+        node_type_id (str): The node type.
+        cores (str): The cores of the local Spark master.
+    """
+    from databricks_models import AzureAttributes
+
+    return CreateCluster(
+        num_workers=0,
+        cluster_name=cluster_name,
+        spark_version=spark_version,
+        spark_conf={
+            "spark.master": f"local[*, {cores}]",
+            "spark.databricks.cluster.profile": "singleNode",
+        },
+        azure_attributes=AzureAttributes(
+            first_on_demand=1,
+            availability="ON_DEMAND_AZURE",
+            spot_bid_max_price=-1,
+        ),
+        node_type_id=node_type_id,
+        custom_tags={"ResourceClass": "SingleNode"},
+        spark_env_vars={"PYSPARK_PYTHON": "/databricks/python3/bin/python3"},
+        autotermination_minutes=autotermination_minutes,
+        enable_elastic_disk=True,
+        runtime_engine="STANDARD",
+    )
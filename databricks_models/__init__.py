@@ -0,0 +1,176 @@
+# Generated by codegen.py from jobs-2.1-azure.yaml, do not edit.
+"""Typed model of the Databricks Jobs API.
+
+The schemas are split in groups, and a group is imported only when one
+of its names is first accessed::
+
+    from databricks_models import JobSettings  # imports only the jobs group
+"""
+
+from importlib import import_module
+from typing import Any, Dict, List
+
+GROUPS = ["runs", "jobs", "clusters", "libraries", "permissions", "endpoints"]
+
+# name -> group of the module where it is defined
+_GROUP_OF: Dict[str, str] = {
+    "AccessControlList": "permissions",
+    "AccessControlRequest": "permissions",
+    "AccessControlRequestForGroup": "permissions",
+    "AccessControlRequestForServicePrincipal": "permissions",
+    "AccessControlRequestForUser": "permissions",
+    "AutoScale": "clusters",
+    "AzureAttributes": "clusters",
+    "CanManage": "permissions",
+    "CanManageRun": "permissions",
+    "CanView": "permissions",
+    "ClusterAttributes": "clusters",
+    "ClusterCloudProviderNodeInfo": "clusters",
+    "ClusterCloudProviderNodeStatus": "clusters",
+    "ClusterEvent": "clusters",
+    "ClusterEventType": "clusters",
+    "ClusterInfo": "clusters",
+    "ClusterInstance": "runs",
+    "ClusterLibraryStatuses": "libraries",
+    "ClusterLogConf": "clusters",
+    "ClusterSize": "clusters",
+    "ClusterSource": "clusters",
+    "ClusterSpec": "jobs",
+    "ClusterState": "clusters",
+    "ClusterTag": "clusters",
+    "CronSchedule": "jobs",
+    "DbfsStorageInfo": "clusters",
+    "DbtOutput": "runs",
+    "DbtTask": "jobs",
+    "DockerBasicAuth": "clusters",
+    "DockerImage": "clusters",
+    "Error": "clusters",
+    "EventDetails": "clusters",
+    "FileStorageInfo": "clusters",
+    "GitSnapshot": "jobs",
+    "GitSource": "jobs",
+    "GroupName": "permissions",
+    "InitScriptInfo": "clusters",
+    "IsOwner": "permissions",
+    "Job": "jobs",
+    "JobCluster": "jobs",
+    "JobEmailNotifications": "jobs",
+    "JobSettings": "jobs",
+    "JobTask": "jobs",
+    "JobTaskSettings": "jobs",
+    "JobsCreateRequest": "endpoints",
+    "JobsCreateResponse": "endpoints",
+    "JobsDeleteRequest": "endpoints",
+    "JobsDeleteResponse": "endpoints",
+    "JobsGetRequest": "endpoints",
+    "JobsGetResponse": "endpoints",
+    "JobsListRequest": "endpoints",
+    "JobsListResponse": "endpoints",
+    "JobsResetRequest": "endpoints",
+    "JobsResetResponse": "endpoints",
+    "JobsRunNowRequest": "endpoints",
+    "JobsRunNowRequestPipelineParams": "endpoints",
+    "JobsRunNowResponse": "endpoints",
+    "JobsRunsCancelAllRequest": "endpoints",
+    "JobsRunsCancelAllResponse": "endpoints",
+    "JobsRunsCancelRequest": "endpoints",
+    "JobsRunsCancelResponse": "endpoints",
+    "JobsRunsDeleteRequest": "endpoints",
+    "JobsRunsDeleteResponse": "endpoints",
+    "JobsRunsExportRequest": "endpoints",
+    "JobsRunsExportResponse": "endpoints",
+    "JobsRunsGetOutputRequest": "endpoints",
+    "JobsRunsGetOutputResponse": "endpoints",
+    "JobsRunsGetRequest": "endpoints",
+    "JobsRunsGetResponse": "endpoints",
+    "JobsRunsListRequest": "endpoints",
+    "JobsRunsListResponse": "endpoints",
+    "JobsRunsRepairRequest": "endpoints",
+    "JobsRunsRepairRequestPipelineParams": "endpoints",
+    "JobsRunsRepairResponse": "endpoints",
+    "JobsRunsSubmitRequest": "endpoints",
+    "JobsRunsSubmitResponse": "endpoints",
+    "JobsUpdateRequest": "endpoints",
+    "JobsUpdateResponse": "endpoints",
+    "Library": "libraries",
+    "LibraryFullStatus": "libraries",
+    "LibraryInstallStatus": "libraries",
+    "ListOrder": "clusters",
+    "LogSyncStatus": "clusters",
+    "MavenLibrary": "libraries",
+    "NewCluster": "clusters",
+    "NodeType": "clusters",
+    "NotebookOutput": "runs",
+    "NotebookTask": "jobs",
+    "ParameterPair": "clusters",
+    "PermissionLevel": "permissions",
+    "PermissionLevelForGroup": "permissions",
+    "PipelineTask": "jobs",
+    "PoolClusterTerminationCode": "clusters",
+    "PythonPyPiLibrary": "libraries",
+    "PythonWheelTask": "jobs",
+    "RCranLibrary": "libraries",
+    "RepairHistory": "runs",
+    "RepairHistoryItem": "runs",
+    "RepairRunInput": "runs",
+    "ResizeCause": "clusters",
+    "Run": "runs",
+    "RunLifeCycleState": "runs",
+    "RunNowInput": "runs",
+    "RunParameters": "runs",
+    "RunParametersPipelineParams": "runs",
+    "RunResultState": "runs",
+    "RunState": "runs",
+    "RunSubmitSettings": "runs",
+    "RunSubmitTaskSettings": "runs",
+    "RunTask": "runs",
+    "RunType": "runs",
+    "ServicePrincipalName": "permissions",
+    "SparkConfPair": "clusters",
+    "SparkEnvPair": "clusters",
+    "SparkJarTask": "jobs",
+    "SparkNode": "clusters",
+    "SparkPythonTask": "jobs",
+    "SparkSubmitTask": "jobs",
+    "SparkVersion": "clusters",
+    "SqlAlertOutput": "runs",
+    "SqlDashboardOutput": "runs",
+    "SqlDashboardWidgetOutput": "runs",
+    "SqlOutput": "runs",
+    "SqlOutputError": "runs",
+    "SqlQueryOutput": "runs",
+    "SqlStatementOutput": "runs",
+    "SqlTask": "jobs",
+    "SqlTaskAlert": "jobs",
+    "SqlTaskDashboard": "jobs",
+    "SqlTaskQuery": "jobs",
+    "TaskDependencies": "jobs",
+    "TaskDependency": "jobs",
+    "TaskDescription": "jobs",
+    "TaskKey": "jobs",
+    "TerminationCode": "clusters",
+    "TerminationParameter": "clusters",
+    "TerminationReason": "clusters",
+    "TerminationType": "clusters",
+    "TriggerType": "runs",
+    "UserName": "permissions",
+    "ViewItem": "runs",
+    "ViewType": "runs",
+    "ViewsToExport": "runs",
+}
+
+__all__ = sorted(_GROUP_OF)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the group of the requested name."""
+    group = _GROUP_OF.get(name)
+    if group is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{group}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return __all__
@@ -0,0 +1,1129 @@
+# Generated by codegen.py from jobs-2.1-azure.yaml, do not edit.
+
+"""Clusters, their attributes, state and events."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Literal, Optional
+
+from schema import Schema
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the schemas of the other groups through the package."""
+    import databricks_models
+
+    return getattr(databricks_models, name)
+
+
+class NewCluster(Schema):
+    """Schema of NewCluster."""
+
+    __slots__ = (
+        "num_workers",
+        "autoscale",
+        "spark_version",
+        "spark_conf",
+        "azure_attributes",
+        "node_type_id",
+        "driver_node_type_id",
+        "custom_tags",
+        "cluster_log_conf",
+        "init_scripts",
+        "spark_env_vars",
+        "enable_elastic_disk",
+        "instance_pool_id",
+        "policy_id",
+    )
+    _objects = {
+        "autoscale": "AutoScale",
+        "azure_attributes": "AzureAttributes",
+        "cluster_log_conf": "ClusterLogConf",
+    }
+    _lists = {"init_scripts": "InitScriptInfo"}
+
+    def __init__(
+        self,
+        spark_version: str,
+        num_workers: Optional[int] = None,
+        autoscale: Optional[AutoScale] = None,
+        spark_conf: Optional[SparkConfPair] = None,
+        azure_attributes: Optional[AzureAttributes] = None,
+        node_type_id: Optional[str] = None,
+        driver_node_type_id: Optional[str] = None,
+        custom_tags: Optional[ClusterTag] = None,
+        cluster_log_conf: Optional[ClusterLogConf] = None,
+        init_scripts: Optional[List[InitScriptInfo]] = None,
+        spark_env_vars: Optional[SparkEnvPair] = None,
+        enable_elastic_disk: Optional[bool] = None,
+        instance_pool_id: Optional[str] = None,
+        policy_id: Optional[str] = None,
+    ) -> None:
+        """Build a NewCluster.
+
+        Args:
+            spark_version:
+                The Spark version of the cluster.
+            num_workers:
+                If num_workers, number of worker nodes that this cluster must have.
+            autoscale:
+                If autoscale, the required parameters to automatically scale clusters up
+                and down based on load.
+            spark_conf:
+                An object containing a set of optional, user-specified Spark
+                configuration key-value pairs.
+            azure_attributes:
+                Defines attributes such as the instance availability type, node
+                placement, and max bid price.
+            node_type_id:
+                This field encodes, through a single value, the resources available to
+                each of the Spark nodes in this cluster.
+            driver_node_type_id:
+                The node type of the Spark driver.
+            custom_tags:
+                An object containing a set of tags for cluster resources.
+            cluster_log_conf:
+                The configuration for delivering Spark logs to a long-term storage
+                destination.
+            init_scripts:
+                The configuration for storing init scripts.
+            spark_env_vars:
+                An object containing a set of optional, user-specified environment
+                variable key-value pairs.
+            enable_elastic_disk:
+                Autoscaling Local Storage: when enabled, this cluster dynamically
+                acquires additional disk space when its Spark workers are running low on
+                disk space.
+            instance_pool_id:
+                The optional ID of the instance pool to use for cluster nodes.
+            policy_id:
+                A [cluster
+                policy](https://docs.microsoft.com/azure/databricks/dev-tools/api/latest/policies)
+                ID.
+        """
+        self.num_workers = num_workers
+        self.autoscale = autoscale
+        self.spark_version = spark_version
+        self.spark_conf = spark_conf
+        self.azure_attributes = azure_attributes
+        self.node_type_id = node_type_id
+        self.driver_node_type_id = driver_node_type_id
+        self.custom_tags = custom_tags
+        self.cluster_log_conf = cluster_log_conf
+        self.init_scripts = init_scripts
+        self.spark_env_vars = spark_env_vars
+        self.enable_elastic_disk = enable_elastic_disk
+        self.instance_pool_id = instance_pool_id
+        self.policy_id = policy_id
+
+
+class AutoScale(Schema):
+    """Schema of AutoScale."""
+
+    __slots__ = ("min_workers", "max_workers")
+
+    def __init__(
+        self,
+        min_workers: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Build a AutoScale.
+
+        Args:
+            min_workers:
+                The minimum number of workers to which the cluster can scale down when
+                underutilized.
+            max_workers:
+                The maximum number of workers to which the cluster can scale up when
+                overloaded.
+        """
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+
+
+class ClusterInfo(Schema):
+    """Schema of ClusterInfo."""
+
+    __slots__ = (
+        "num_workers",
+        "autoscale",
+        "cluster_id",
+        "creator_user_name",
+        "driver",
+        "executors",
+        "spark_context_id",
+        "jdbc_port",
+        "cluster_name",
+        "spark_version",
+        "spark_conf",
+        "azure_attributes",
+        "node_type_id",
+        "driver_node_type_id",
+        "custom_tags",
+        "cluster_log_conf",
+        "init_scripts",
+        "docker_image",
+        "spark_env_vars",
+        "autotermination_minutes",
+        "enable_elastic_disk",
+        "instance_pool_id",
+        "state",
+        "state_message",
+        "start_time",
+        "terminated_time",
+        "last_state_loss_time",
+        "last_activity_time",
+        "cluster_memory_mb",
+        "cluster_cores",
+        "default_tags",
+        "cluster_log_status",
+        "termination_reason",
+    )
+    _objects = {
+        "autoscale": "AutoScale",
+        "driver": "SparkNode",
+        "azure_attributes": "AzureAttributes",
+        "cluster_log_conf": "ClusterLogConf",
+        "docker_image": "DockerImage",
+        "cluster_log_status": "LogSyncStatus",
+        "termination_reason": "TerminationReason",
+    }
+    _lists = {"executors": "SparkNode", "init_scripts": "InitScriptInfo"}
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        autoscale: Optional[AutoScale] = None,
+        cluster_id: Optional[str] = None,
+        creator_user_name: Optional[str] = None,
+        driver: Optional[SparkNode] = None,
+        executors: Optional[List[SparkNode]] = None,
+        spark_context_id: Optional[int] = None,
+        jdbc_port: Optional[int] = None,
+        cluster_name: Optional[str] = None,
+        spark_version: Optional[str] = None,
+        spark_conf: Optional[SparkConfPair] = None,
+        azure_attributes: Optional[AzureAttributes] = None,
+        node_type_id: Optional[str] = None,
+        driver_node_type_id: Optional[str] = None,
+        custom_tags: Optional[List[ClusterTag]] = None,
+        cluster_log_conf: Optional[ClusterLogConf] = None,
+        init_scripts: Optional[List[InitScriptInfo]] = None,
+        docker_image: Optional[DockerImage] = None,
+        spark_env_vars: Optional[SparkEnvPair] = None,
+        autotermination_minutes: Optional[int] = None,
+        enable_elastic_disk: Optional[bool] = None,
+        instance_pool_id: Optional[str] = None,
+        state: Optional[ClusterState] = None,
+        state_message: Optional[str] = None,
+        start_time: Optional[int] = None,
+        terminated_time: Optional[int] = None,
+        last_state_loss_time: Optional[int] = None,
+        last_activity_time: Optional[int] = None,
+        cluster_memory_mb: Optional[int] = None,
+        cluster_cores: Optional[float] = None,
+        default_tags: Optional[ClusterTag] = None,
+        cluster_log_status: Optional[LogSyncStatus] = None,
+        termination_reason: Optional[TerminationReason] = None,
+    ) -> None:
+        """Build a ClusterInfo.
+
+        Args:
+            num_workers:
+                If num_workers, number of worker nodes that this cluster must have.
+            autoscale:
+                If autoscale, parameters needed in order to automatically scale clusters
+                up and down based on load.
+            cluster_id:
+                Canonical identifier for the cluster.
+            creator_user_name:
+                Creator user name.
+            driver:
+                Node on which the Spark driver resides.
+            executors:
+                Nodes on which the Spark executors reside.
+            spark_context_id:
+                A canonical SparkContext identifier.
+            jdbc_port:
+                Port on which Spark JDBC server is listening in the driver node.
+            cluster_name:
+                Cluster name requested by the user.
+            spark_version:
+                The runtime version of the cluster.
+            spark_conf:
+                An object containing a set of optional, user-specified Spark
+                configuration key-value pairs.
+            azure_attributes:
+                Defines attributes such as the instance availability type, node
+                placement, and max bid price.
+            node_type_id:
+                This field encodes, through a single value, the resources available to
+                each of the Spark nodes in this cluster.
+            driver_node_type_id:
+                The node type of the Spark driver.
+            custom_tags:
+                An object containing a set of tags for cluster resources.
+            cluster_log_conf:
+                The configuration for delivering Spark logs to a long-term storage
+                destination.
+            init_scripts:
+                The configuration for storing init scripts.
+            docker_image:
+                Docker image for a [custom
+                container](https://docs.microsoft.com/azure/databricks/clusters/custom-containers).
+            spark_env_vars:
+                An object containing a set of optional, user-specified environment
+                variable key-value pairs.
+            autotermination_minutes:
+                Automatically terminates the cluster after it is inactive for this time
+                in minutes.
+            enable_elastic_disk:
+                Autoscaling Local Storage: when enabled, this cluster dynamically
+                acquires additional disk space when its Spark workers are running low on
+                disk space.
+            instance_pool_id:
+                The optional ID of the instance pool to which the cluster belongs.
+            state:
+                State of the cluster.
+            state_message:
+                A message associated with the most recent state transition (for example,
+                the reason why the cluster entered a `TERMINATED` state).
+            start_time:
+                Time (in epoch milliseconds) when the cluster creation request was
+                received (when the cluster entered a `PENDING` state).
+            terminated_time:
+                Time (in epoch milliseconds) when the cluster was terminated, if
+                applicable.
+            last_state_loss_time:
+                Time when the cluster driver last lost its state (due to a restart or
+                driver failure).
+            last_activity_time:
+                Time (in epoch milliseconds) when the cluster was last active.
+            cluster_memory_mb:
+                Total amount of cluster memory, in megabytes.
+            cluster_cores:
+                Number of CPU cores available for this cluster.
+            default_tags:
+                An object containing a set of tags that are added by Databricks
+                regardless of any custom_tags, including: * Vendor: Databricks *
+                Creator: <username-of-creator> * ClusterName: <name-of-cluster> *
+                ClusterId: <id-of-cluster> * Name: <Databricks internal use> On job
+                clusters: * RunName: <name-of-job> * JobId: <id-of-job> On resources
+                used by Databricks SQL: * SqlEndpointId: <id-of-endpoint>
+            cluster_log_status:
+                Cluster log delivery status.
+            termination_reason:
+                Information about why the cluster was terminated.
+        """
+        self.num_workers = num_workers
+        self.autoscale = autoscale
+        self.cluster_id = cluster_id
+        self.creator_user_name = creator_user_name
+        self.driver = driver
+        self.executors = executors
+        self.spark_context_id = spark_context_id
+        self.jdbc_port = jdbc_port
+        self.cluster_name = cluster_name
+        self.spark_version = spark_version
+        self.spark_conf = spark_conf
+        self.azure_attributes = azure_attributes
+        self.node_type_id = node_type_id
+        self.driver_node_type_id = driver_node_type_id
+        self.custom_tags = custom_tags
+        self.cluster_log_conf = cluster_log_conf
+        self.init_scripts = init_scripts
+        self.docker_image = docker_image
+        self.spark_env_vars = spark_env_vars
+        self.autotermination_minutes = autotermination_minutes
+        self.enable_elastic_disk = enable_elastic_disk
+        self.instance_pool_id = instance_pool_id
+        self.state = state
+        self.state_message = state_message
+        self.start_time = start_time
+        self.terminated_time = terminated_time
+        self.last_state_loss_time = last_state_loss_time
+        self.last_activity_time = last_activity_time
+        self.cluster_memory_mb = cluster_memory_mb
+        self.cluster_cores = cluster_cores
+        self.default_tags = default_tags
+        self.cluster_log_status = cluster_log_status
+        self.termination_reason = termination_reason
+
+
+class ClusterEvent(Schema):
+    """Schema of ClusterEvent."""
+
+    __slots__ = ("cluster_id", "timestamp", "type", "details")
+    _objects = {"details": "EventDetails"}
+
+    def __init__(
+        self,
+        cluster_id: str,
+        type: ClusterEventType,
+        details: EventDetails,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """Build a ClusterEvent.
+
+        Args:
+            cluster_id:
+                Canonical identifier for the cluster.
+            type:
+                The event type.
+            details:
+                The event details.
+            timestamp:
+                The timestamp when the event occurred, stored as the number of
+                milliseconds since the unix epoch.
+        """
+        self.cluster_id = cluster_id
+        self.timestamp = timestamp
+        self.type = type
+        self.details = details
+
+
+ClusterEventType = Literal[
+    "CREATING",
+    "DID_NOT_EXPAND_DISK",
+    "EXPANDED_DISK",
+    "FAILED_TO_EXPAND_DISK",
+    "INIT_SCRIPTS_STARTING",
+    "INIT_SCRIPTS_FINISHED",
+    "STARTING",
+    "RESTARTING",
+    "TERMINATING",
+    "EDITED",
+    "RUNNING",
+    "RESIZING",
+    "UPSIZE_COMPLETED",
+    "NODES_LOST",
+    "DRIVER_HEALTHY",
+    "DRIVER_UNAVAILABLE",
+    "SPARK_EXCEPTION",
+    "DRIVER_NOT_RESPONDING",
+    "DBFS_DOWN",
+    "METASTORE_DOWN",
+    "NODE_BLACKLISTED",
+    "PINNED",
+    "UNPINNED",
+]
+"""* `CREATING`: Indicates that the cluster is being created."""
+
+
+class EventDetails(Schema):
+    """Schema of EventDetails."""
+
+    __slots__ = (
+        "current_num_workers",
+        "target_num_workers",
+        "previous_attributes",
+        "attributes",
+        "previous_cluster_size",
+        "cluster_size",
+        "cause",
+        "reason",
+        "user",
+    )
+    _objects = {
+        "previous_attributes": "AzureAttributes",
+        "attributes": "AzureAttributes",
+        "previous_cluster_size": "ClusterSize",
+        "cluster_size": "ClusterSize",
+        "reason": "TerminationReason",
+    }
+
+    def __init__(
+        self,
+        current_num_workers: Optional[int] = None,
+        target_num_workers: Optional[int] = None,
+        previous_attributes: Optional[AzureAttributes] = None,
+        attributes: Optional[AzureAttributes] = None,
+        previous_cluster_size: Optional[ClusterSize] = None,
+        cluster_size: Optional[ClusterSize] = None,
+        cause: Optional[ResizeCause] = None,
+        reason: Optional[TerminationReason] = None,
+        user: Optional[str] = None,
+    ) -> None:
+        """Build a EventDetails.
+
+        Args:
+            current_num_workers:
+                The number of nodes in the cluster.
+            target_num_workers:
+                The targeted number of nodes in the cluster.
+            previous_attributes:
+                The cluster attributes before a cluster was edited.
+            attributes:
+                * For created clusters, the attributes of the cluster.
+            previous_cluster_size:
+                The size of the cluster before an edit or resize.
+            cluster_size:
+                The cluster size that was set in the cluster creation or edit.
+            cause:
+                The cause of a change in target size.
+            reason:
+                A termination reason: * On a `TERMINATED` event, the reason for the
+                termination.
+            user:
+                The user that caused the event to occur.
+        """
+        self.current_num_workers = current_num_workers
+        self.target_num_workers = target_num_workers
+        self.previous_attributes = previous_attributes
+        self.attributes = attributes
+        self.previous_cluster_size = previous_cluster_size
+        self.cluster_size = cluster_size
+        self.cause = cause
+        self.reason = reason
+        self.user = user
+
+
+class AzureAttributes(Schema):
+    """Schema of AzureAttributes."""
+
+    __slots__ = ("first_on_demand", "availability", "spot_bid_max_price")
+
+    def __init__(
+        self,
+        first_on_demand: Optional[int] = None,
+        availability: Optional[
+            Literal["SPOT_AZURE", "ON_DEMAND_AZURE", "SPOT_WITH_FALLBACK_AZURE"]
+        ] = None,
+        spot_bid_max_price: Optional[float] = None,
+    ) -> None:
+        """Build a AzureAttributes.
+
+        Args:
+            first_on_demand:
+                The first `first_on_demand` nodes of the cluster are placed on on-demand
+                instances.
+            availability:
+                Availability type used for all subsequent nodes past the
+                `first_on_demand` ones.
+            spot_bid_max_price:
+                The max bid price used for Azure spot instances.
+        """
+        self.first_on_demand = first_on_demand
+        self.availability = availability
+        self.spot_bid_max_price = spot_bid_max_price
+
+
+class ClusterAttributes(Schema):
+    """Schema of ClusterAttributes."""
+
+    __slots__ = (
+        "cluster_name",
+        "spark_version",
+        "spark_conf",
+        "azure_attributes",
+        "node_type_id",
+        "driver_node_type_id",
+        "ssh_public_keys",
+        "custom_tags",
+        "cluster_log_conf",
+        "init_scripts",
+        "docker_image",
+        "spark_env_vars",
+        "autotermination_minutes",
+        "enable_elastic_disk",
+        "instance_pool_id",
+        "cluster_source",
+        "policy_id",
+    )
+    _objects = {
+        "azure_attributes": "AzureAttributes",
+        "cluster_log_conf": "ClusterLogConf",
+        "docker_image": "DockerImage",
+    }
+    _lists = {"init_scripts": "InitScriptInfo"}
+
+    def __init__(
+        self,
+        cluster_name: Optional[str] = None,
+        spark_version: Optional[str] = None,
+        spark_conf: Optional[SparkConfPair] = None,
+        azure_attributes: Optional[AzureAttributes] = None,
+        node_type_id: Optional[str] = None,
+        driver_node_type_id: Optional[str] = None,
+        ssh_public_keys: Optional[List[str]] = None,
+        custom_tags: Optional[ClusterTag] = None,
+        cluster_log_conf: Optional[ClusterLogConf] = None,
+        init_scripts: Optional[List[InitScriptInfo]] = None,
+        docker_image: Optional[DockerImage] = None,
+        spark_env_vars: Optional[SparkEnvPair] = None,
+        autotermination_minutes: Optional[int] = None,
+        enable_elastic_disk: Optional[bool] = None,
+        instance_pool_id: Optional[str] = None,
+        cluster_source: Optional[ClusterSource] = None,
+        policy_id: Optional[str] = None,
+    ) -> None:
+        """Build a ClusterAttributes.
+
+        Args:
+            cluster_name:
+                Cluster name requested by the user.
+            spark_version:
+                The runtime version of the cluster, for example “5.0.x-scala2.11”.
+            spark_conf:
+                An object containing a set of optional, user-specified Spark
+                configuration key-value pairs.
+            azure_attributes:
+                Defines attributes such as the instance availability type, node
+                placement, and max bid price.
+            node_type_id:
+                This field encodes, through a single value, the resources available to
+                each of the Spark nodes in this cluster.
+            driver_node_type_id:
+                The node type of the Spark driver.
+            custom_tags:
+                An object with key value pairs.
+            cluster_log_conf:
+                The configuration for delivering Spark logs to a long-term storage
+                destination.
+            init_scripts:
+                The configuration for storing init scripts.
+            docker_image:
+                Docker image for a [custom
+                container](https://docs.microsoft.com/azure/databricks/clusters/custom-containers).
+            spark_env_vars:
+                An object containing a set of optional, user-specified environment
+                variable key-value pairs.
+            autotermination_minutes:
+                Automatically terminates the cluster after it is inactive for this time
+                in minutes.
+            enable_elastic_disk:
+                Autoscaling Local Storage: when enabled, this cluster dynamically
+                acquires additional disk space when its Spark workers are running low on
+                disk space.null Refer to [Autoscaling local
+                storage](https://docs.microsoft.com/azure/databricks/clusters/configure#autoscaling-local-storage)
+                for details.
+            instance_pool_id:
+                The optional ID of the instance pool to which the cluster belongs.
+            cluster_source:
+                Determines whether the cluster was created by a user through the UI,
+                created by the Databricks Jobs scheduler, or through an API request.
+            policy_id:
+                A [cluster
+                policy](https://docs.microsoft.com/azure/databricks/dev-tools/api/latest/policies)
+                ID.
+        """
+        self.cluster_name = cluster_name
+        self.spark_version = spark_version
+        self.spark_conf = spark_conf
+        self.azure_attributes = azure_attributes
+        self.node_type_id = node_type_id
+        self.driver_node_type_id = driver_node_type_id
+        self.ssh_public_keys = ssh_public_keys
+        self.custom_tags = custom_tags
+        self.cluster_log_conf = cluster_log_conf
+        self.init_scripts = init_scripts
+        self.docker_image = docker_image
+        self.spark_env_vars = spark_env_vars
+        self.autotermination_minutes = autotermination_minutes
+        self.enable_elastic_disk = enable_elastic_disk
+        self.instance_pool_id = instance_pool_id
+        self.cluster_source = cluster_source
+        self.policy_id = policy_id
+
+
+class ClusterSize(Schema):
+    """Schema of ClusterSize."""
+
+    __slots__ = ("num_workers", "autoscale")
+    _objects = {"autoscale": "AutoScale"}
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        autoscale: Optional[AutoScale] = None,
+    ) -> None:
+        """Build a ClusterSize.
+
+        Args:
+            num_workers:
+                If num_workers, number of worker nodes that this cluster must have.
+            autoscale:
+                If autoscale, parameters needed in order to automatically scale clusters
+                up and down based on load.
+        """
+        self.num_workers = num_workers
+        self.autoscale = autoscale
+
+
+ListOrder = Literal["DESC", "ASC"]
+"""* `DESC`: Descending order."""
+
+ResizeCause = Literal["AUTOSCALE", "USER_REQUEST", "AUTORECOVERY"]
+"""* `AUTOSCALE`: Automatically resized based on load."""
+
+
+class ClusterLogConf(Schema):
+    """Schema of ClusterLogConf."""
+
+    __slots__ = ("dbfs",)
+    _objects = {"dbfs": "DbfsStorageInfo"}
+
+    def __init__(
+        self,
+        dbfs: Optional[DbfsStorageInfo] = None,
+    ) -> None:
+        """Build a ClusterLogConf.
+
+        Args:
+            dbfs:
+                DBFS location of cluster log.
+        """
+        self.dbfs = dbfs
+
+
+class InitScriptInfo(Schema):
+    """Schema of InitScriptInfo."""
+
+    __slots__ = ("dbfs", "file")
+    _objects = {"dbfs": "DbfsStorageInfo", "file": "FileStorageInfo"}
+
+    def __init__(
+        self,
+        dbfs: Optional[DbfsStorageInfo] = None,
+        file: Optional[FileStorageInfo] = None,
+    ) -> None:
+        """Build a InitScriptInfo.
+
+        Args:
+            dbfs:
+                DBFS location of init script.
+            file:
+                File location of init script.
+        """
+        self.dbfs = dbfs
+        self.file = file
+
+
+ClusterTag = Dict[str, str]
+"""An object with key value pairs."""
+
+
+class DbfsStorageInfo(Schema):
+    """Schema of DbfsStorageInfo."""
+
+    __slots__ = ("destination",)
+
+    def __init__(
+        self,
+        destination: Optional[str] = None,
+    ) -> None:
+        """Build a DbfsStorageInfo.
+
+        Args:
+            destination:
+                DBFS destination.
+        """
+        self.destination = destination
+
+
+class FileStorageInfo(Schema):
+    """Schema of FileStorageInfo."""
+
+    __slots__ = ("destination",)
+
+    def __init__(
+        self,
+        destination: Optional[str] = None,
+    ) -> None:
+        """Build a FileStorageInfo.
+
+        Args:
+            destination:
+                File destination.
+        """
+        self.destination = destination
+
+
+class DockerImage(Schema):
+    """Schema of DockerImage."""
+
+    __slots__ = ("url", "basic_auth")
+    _objects = {"basic_auth": "DockerBasicAuth"}
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        basic_auth: Optional[DockerBasicAuth] = None,
+    ) -> None:
+        """Build a DockerImage.
+
+        Args:
+            url:
+                URL for the Docker image.
+            basic_auth:
+                Basic authentication information for Docker repository.
+        """
+        self.url = url
+        self.basic_auth = basic_auth
+
+
+class DockerBasicAuth(Schema):
+    """Schema of DockerBasicAuth."""
+
+    __slots__ = ("username", "password")
+
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> None:
+        """Build a DockerBasicAuth.
+
+        Args:
+            username:
+                User name for the Docker repository.
+            password:
+                Password for the Docker repository.
+        """
+        self.username = username
+        self.password = password
+
+
+class LogSyncStatus(Schema):
+    """Schema of LogSyncStatus."""
+
+    __slots__ = ("last_attempted", "last_exception")
+
+    def __init__(
+        self,
+        last_attempted: Optional[int] = None,
+        last_exception: Optional[str] = None,
+    ) -> None:
+        """Build a LogSyncStatus.
+
+        Args:
+            last_attempted:
+                The timestamp of last attempt.
+            last_exception:
+                The exception thrown in the last attempt, it would be null (omitted in
+                the response) if there is no exception in last attempted.
+        """
+        self.last_attempted = last_attempted
+        self.last_exception = last_exception
+
+
+class NodeType(Schema):
+    """Schema of NodeType."""
+
+    __slots__ = (
+        "node_type_id",
+        "memory_mb",
+        "num_cores",
+        "description",
+        "instance_type_id",
+        "is_deprecated",
+        "node_info",
+    )
+    _objects = {"node_info": "ClusterCloudProviderNodeInfo"}
+
+    def __init__(
+        self,
+        node_type_id: str,
+        memory_mb: int,
+        description: str,
+        instance_type_id: str,
+        num_cores: Optional[float] = None,
+        is_deprecated: Optional[bool] = None,
+        node_info: Optional[ClusterCloudProviderNodeInfo] = None,
+    ) -> None:
+        """Build a NodeType.
+
+        Args:
+            node_type_id:
+                Unique identifier for this node type.
+            memory_mb:
+                Memory (in MB) available for this node type.
+            description:
+                A string description associated with this node type.
+            instance_type_id:
+                An identifier for the type of hardware that this node runs on.
+            num_cores:
+                Number of CPU cores available for this node type.
+            is_deprecated:
+                Whether the node type is deprecated.
+            node_info:
+                Node type info reported by the cloud provider.
+        """
+        self.node_type_id = node_type_id
+        self.memory_mb = memory_mb
+        self.num_cores = num_cores
+        self.description = description
+        self.instance_type_id = instance_type_id
+        self.is_deprecated = is_deprecated
+        self.node_info = node_info
+
+
+class ClusterCloudProviderNodeInfo(Schema):
+    """Schema of ClusterCloudProviderNodeInfo."""
+
+    __slots__ = ("status", "available_core_quota", "total_core_quota")
+
+    def __init__(
+        self,
+        status: Optional[ClusterCloudProviderNodeStatus] = None,
+        available_core_quota: Optional[int] = None,
+        total_core_quota: Optional[int] = None,
+    ) -> None:
+        """Build a ClusterCloudProviderNodeInfo.
+
+        Args:
+            status:
+                Status as reported by the cloud provider.
+            available_core_quota:
+                Available CPU core quota.
+            total_core_quota:
+                Total CPU core quota.
+        """
+        self.status = status
+        self.available_core_quota = available_core_quota
+        self.total_core_quota = total_core_quota
+
+
+ClusterCloudProviderNodeStatus = Literal[
+    "NotEnabledOnSubscription", "NotAvailableInRegion"
+]
+"""* NotEnabledOnSubscription: Node type not available for subscription."""
+
+ParameterPair = Dict[str, Any]
+"""An object with additional information about why a cluster was terminated."""
+
+SparkConfPair = Dict[str, Any]
+"""An arbitrary object where the object key is a configuration propery name and the value is a configuration property value."""
+
+SparkEnvPair = Dict[str, Any]
+"""An arbitrary object where the object key is an environment variable name and the value is an environment variable value."""
+
+
+class SparkNode(Schema):
+    """Schema of SparkNode."""
+
+    __slots__ = (
+        "private_ip",
+        "public_dns",
+        "node_id",
+        "instance_id",
+        "start_timestamp",
+        "host_private_ip",
+    )
+
+    def __init__(
+        self,
+        private_ip: Optional[str] = None,
+        public_dns: Optional[str] = None,
+        node_id: Optional[str] = None,
+        instance_id: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        host_private_ip: Optional[str] = None,
+    ) -> None:
+        """Build a SparkNode.
+
+        Args:
+            private_ip:
+                Private IP address (typically a 10.x.x.x address) of the Spark node.
+            public_dns:
+                Public DNS address of this node.
+            node_id:
+                Globally unique identifier for this node.
+            instance_id:
+                Globally unique identifier for the host instance from the cloud
+                provider.
+            start_timestamp:
+                The timestamp (in millisecond) when the Spark node is launched.
+            host_private_ip:
+                The private IP address of the host instance.
+        """
+        self.private_ip = private_ip
+        self.public_dns = public_dns
+        self.node_id = node_id
+        self.instance_id = instance_id
+        self.start_timestamp = start_timestamp
+        self.host_private_ip = host_private_ip
+
+
+class SparkVersion(Schema):
+    """Schema of SparkVersion."""
+
+    __slots__ = ("key", "name")
+
+    def __init__(
+        self,
+        key: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        """Build a SparkVersion.
+
+        Args:
+            key:
+                [Databricks Runtime
+                version](https://docs.microsoft.com/azure/databricks/dev-tools/api/latest/index#programmatic-version)
+                key, for example `7.3.x-scala2.12`.
+            name:
+                A descriptive name for the runtime version, for example “Databricks
+                Runtime 7.3 LTS”.
+        """
+        self.key = key
+        self.name = name
+
+
+class TerminationReason(Schema):
+    """Schema of TerminationReason."""
+
+    __slots__ = ("code", "type", "parameters")
+
+    def __init__(
+        self,
+        code: Optional[TerminationCode] = None,
+        type: Optional[TerminationType] = None,
+        parameters: Optional[ParameterPair] = None,
+    ) -> None:
+        """Build a TerminationReason.
+
+        Args:
+            code:
+                Status code indicating why a cluster was terminated.
+            type:
+                Reason indicating why a cluster was terminated.
+            parameters:
+                Object containing a set of parameters that provide information about why
+                a cluster was terminated.
+        """
+        self.code = code
+        self.type = type
+        self.parameters = parameters
+
+
+PoolClusterTerminationCode = Literal[
+    "INSTANCE_POOL_MAX_CAPACITY_FAILURE", "INSTANCE_POOL_NOT_FOUND_FAILURE"
+]
+"""* INSTANCE_POOL_MAX_CAPACITY_FAILURE: The pool max capacity has been reached."""
+
+ClusterSource = Literal["UI", "JOB", "API"]
+"""* UI: Cluster created through the UI."""
+
+ClusterState = Literal[
+    "PENDING",
+    "RUNNING",
+    "RESTARTING",
+    "RESIZING",
+    "TERMINATING",
+    "TERMINATED",
+    "ERROR",
+    "UNKNOWN",
+]
+"""* PENDING: Indicates that a cluster is in the process of being created."""
+
+TerminationCode = Literal[
+    "USER_REQUEST",
+    "JOB_FINISHED",
+    "INACTIVITY",
+    "CLOUD_PROVIDER_SHUTDOWN",
+    "COMMUNICATION_LOST",
+    "CLOUD_PROVIDER_LAUNCH_FAILURE",
+    "SPARK_STARTUP_FAILURE",
+    "INVALID_ARGUMENT",
+    "UNEXPECTED_LAUNCH_FAILURE",
+    "INTERNAL_ERROR",
+    "SPARK_ERROR",
+    "METASTORE_COMPONENT_UNHEALTHY",
+    "DBFS_COMPONENT_UNHEALTHY",
+    "AZURE_RESOURCE_PROVIDER_THROTTLING",
+    "AZURE_RESOURCE_MANAGER_THROTTLING",
+    "NETWORK_CONFIGURATION_FAILURE",
+    "DRIVER_UNREACHABLE",
+    "DRIVER_UNRESPONSIVE",
+    "INSTANCE_UNREACHABLE",
+    "CONTAINER_LAUNCH_FAILURE",
+    "INSTANCE_POOL_CLUSTER_FAILURE",
+    "REQUEST_REJECTED",
+    "INIT_SCRIPT_FAILURE",
+    "TRIAL_EXPIRED",
+]
+"""* USER_REQUEST: A user terminated the cluster directly."""
+
+TerminationType = Literal["SUCCESS", "CLIENT_ERROR", "SERVICE_FAULT", "CLOUD_FAILURE"]
+"""* SUCCESS: Termination succeeded."""
+
+
+class TerminationParameter(Schema):
+    """Schema of TerminationParameter."""
+
+    __slots__ = (
+        "username",
+        "azure_error_code",
+        "azure_error_message",
+        "databricks_error_message",
+        "inactivity_duration_min",
+        "instance_id",
+        "instance_pool_id",
+        "instance_pool_error_code",
+    )
+
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        azure_error_code: Optional[str] = None,
+        azure_error_message: Optional[str] = None,
+        databricks_error_message: Optional[str] = None,
+        inactivity_duration_min: Optional[str] = None,
+        instance_id: Optional[str] = None,
+        instance_pool_id: Optional[str] = None,
+        instance_pool_error_code: Optional[str] = None,
+    ) -> None:
+        """Build a TerminationParameter.
+
+        Args:
+            username:
+                The username of the user who terminated the cluster.
+            azure_error_code:
+                The Azure provided error code describing why cluster nodes could not be
+                provisioned.
+            azure_error_message:
+                Human-readable context of various failures from Azure.
+            databricks_error_message:
+                Additional context that may explain the reason for cluster termination.
+            inactivity_duration_min:
+                An idle cluster was shut down after being inactive for this duration.
+            instance_id:
+                The ID of the instance that was hosting the Spark driver.
+            instance_pool_id:
+                The ID of the instance pool the cluster is using.
+            instance_pool_error_code:
+                The [error
+                code](https://docs.microsoft.com/azure/databricks/dev-tools/api/latest/clusters#clusterterminationreasonpoolclusterterminationcode)
+                for cluster failures specific to a pool.
+        """
+        self.username = username
+        self.azure_error_code = azure_error_code
+        self.azure_error_message = azure_error_message
+        self.databricks_error_message = databricks_error_message
+        self.inactivity_duration_min = inactivity_duration_min
+        self.instance_id = instance_id
+        self.instance_pool_id = instance_pool_id
+        self.instance_pool_error_code = instance_pool_error_code
+
+
+class Error(Schema):
+    """Schema of Error."""
+
+    __slots__ = ("error_code", "message")
+
+    def __init__(
+        self,
+        error_code: Optional[str] = None,
+        message: Optional[str] = None,
+    ) -> None:
+        """Build a Error.
+
+        Args:
+            error_code:
+                Error code
+            message:
+                Human-readable error message that describes the cause of the error.
+        """
+        self.error_code = error_code
+        self.message = message
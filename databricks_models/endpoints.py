@@ -0,0 +1,1279 @@
+# Generated by codegen.py from jobs-2.1-azure.yaml, do not edit.
+
+"""Request and response of every endpoint."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
+
+from schema import Schema
+
+if TYPE_CHECKING:
+    from databricks_models.jobs import (
+        ClusterSpec,
+        CronSchedule,
+        GitSource,
+        Job,
+        JobCluster,
+        JobEmailNotifications,
+        JobSettings,
+        JobTaskSettings,
+    )
+    from databricks_models.permissions import AccessControlRequest
+    from databricks_models.runs import (
+        ClusterInstance,
+        DbtOutput,
+        NotebookOutput,
+        RepairHistoryItem,
+        Run,
+        RunParameters,
+        RunState,
+        RunSubmitTaskSettings,
+        RunTask,
+        RunType,
+        SqlOutput,
+        TriggerType,
+        ViewItem,
+        ViewsToExport,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the schemas of the other groups through the package."""
+    import databricks_models
+
+    return getattr(databricks_models, name)
+
+
+class JobsCreateRequest(Schema):
+    """Schema of JobsCreateRequest.
+
+    Request of Create a new job.
+    """
+
+    __slots__ = (
+        "name",
+        "tags",
+        "tasks",
+        "job_clusters",
+        "email_notifications",
+        "timeout_seconds",
+        "schedule",
+        "max_concurrent_runs",
+        "git_source",
+        "format",
+        "access_control_list",
+    )
+    _objects = {
+        "email_notifications": "JobEmailNotifications",
+        "schedule": "CronSchedule",
+        "git_source": "GitSource",
+    }
+    _lists = {"tasks": "JobTaskSettings", "job_clusters": "JobCluster"}
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        tags: Optional[Dict[str, Any]] = None,
+        tasks: Optional[List[JobTaskSettings]] = None,
+        job_clusters: Optional[List[JobCluster]] = None,
+        email_notifications: Optional[JobEmailNotifications] = None,
+        timeout_seconds: Optional[int] = None,
+        schedule: Optional[CronSchedule] = None,
+        max_concurrent_runs: Optional[int] = None,
+        git_source: Optional[GitSource] = None,
+        format: Optional[Literal["SINGLE_TASK", "MULTI_TASK"]] = None,
+        access_control_list: Optional[List[AccessControlRequest]] = None,
+    ) -> None:
+        """Build a JobsCreateRequest.
+
+        Args:
+            name:
+                An optional name for the job.
+            tags:
+                A map of tags associated with the job.
+            tasks:
+                A list of task specifications to be executed by this job.
+            job_clusters:
+                A list of job cluster specifications that can be shared and reused by
+                tasks of this job.
+            email_notifications:
+                An optional set of email addresses that is notified when runs of this
+                job begin or complete as well as when this job is deleted.
+            timeout_seconds:
+                An optional timeout applied to each run of this job.
+            schedule:
+                An optional periodic schedule for this job.
+            max_concurrent_runs:
+                An optional maximum allowed number of concurrent runs of the job.
+            git_source:
+                This functionality is in Public Preview.
+            format:
+                Used to tell what is the format of the job.
+            access_control_list:
+                List of permissions to set on the job.
+        """
+        self.name = name
+        self.tags = tags
+        self.tasks = tasks
+        self.job_clusters = job_clusters
+        self.email_notifications = email_notifications
+        self.timeout_seconds = timeout_seconds
+        self.schedule = schedule
+        self.max_concurrent_runs = max_concurrent_runs
+        self.git_source = git_source
+        self.format = format
+        self.access_control_list = access_control_list
+
+
+class JobsCreateResponse(Schema):
+    """Schema of JobsCreateResponse.
+
+    Response of Create a new job.
+    """
+
+    __slots__ = ("job_id",)
+
+    def __init__(
+        self,
+        job_id: Optional[int] = None,
+    ) -> None:
+        """Build a JobsCreateResponse.
+
+        Args:
+            job_id:
+                The canonical identifier for the newly created job.
+        """
+        self.job_id = job_id
+
+
+class JobsListRequest(Schema):
+    """Schema of JobsListRequest.
+
+    Request of Retrieves a list of jobs.
+    """
+
+    __slots__ = ("limit", "offset", "name", "expand_tasks")
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        name: Optional[str] = None,
+        expand_tasks: Optional[bool] = None,
+    ) -> None:
+        """Build a JobsListRequest.
+
+        Args:
+            limit:
+                The number of jobs to return.
+            offset:
+                The offset of the first job to return, relative to the most recently
+                created job.
+            name:
+                A filter on the list based on the exact (case insensitive) job name.
+            expand_tasks:
+                Whether to include task and cluster details in the response.
+        """
+        self.limit = limit
+        self.offset = offset
+        self.name = name
+        self.expand_tasks = expand_tasks
+
+
+class JobsListResponse(Schema):
+    """Schema of JobsListResponse.
+
+    Response of Retrieves a list of jobs.
+    """
+
+    __slots__ = ("jobs", "has_more")
+    _lists = {"jobs": "Job"}
+
+    def __init__(
+        self,
+        jobs: Optional[List[Job]] = None,
+        has_more: Optional[bool] = None,
+    ) -> None:
+        """Build a JobsListResponse.
+
+        Args:
+            jobs:
+                The list of jobs.
+        """
+        self.jobs = jobs
+        self.has_more = has_more
+
+
+class JobsGetRequest(Schema):
+    """Schema of JobsGetRequest.
+
+    Request of Retrieves the details for a single job.
+    """
+
+    __slots__ = ("job_id",)
+
+    def __init__(
+        self,
+        job_id: int,
+    ) -> None:
+        """Build a JobsGetRequest.
+
+        Args:
+            job_id:
+                The canonical identifier of the job to retrieve information about.
+        """
+        self.job_id = job_id
+
+
+class JobsGetResponse(Schema):
+    """Schema of JobsGetResponse.
+
+    Response of Retrieves the details for a single job.
+    """
+
+    __slots__ = (
+        "job_id",
+        "creator_user_name",
+        "run_as_user_name",
+        "settings",
+        "created_time",
+    )
+    _objects = {"settings": "JobSettings"}
+
+    def __init__(
+        self,
+        job_id: Optional[int] = None,
+        creator_user_name: Optional[str] = None,
+        run_as_user_name: Optional[str] = None,
+        settings: Optional[JobSettings] = None,
+        created_time: Optional[int] = None,
+    ) -> None:
+        """Build a JobsGetResponse.
+
+        Args:
+            job_id:
+                The canonical identifier for this job.
+            creator_user_name:
+                The creator user name.
+            run_as_user_name:
+                The user name that the job runs as.
+            settings:
+                Settings for this job and all of its runs.
+            created_time:
+                The time at which this job was created in epoch milliseconds
+                (milliseconds since 1/1/1970 UTC).
+        """
+        self.job_id = job_id
+        self.creator_user_name = creator_user_name
+        self.run_as_user_name = run_as_user_name
+        self.settings = settings
+        self.created_time = created_time
+
+
+class JobsResetRequest(Schema):
+    """Schema of JobsResetRequest.
+
+    Request of Overwrites all the settings for a specific job.
+    """
+
+    __slots__ = ("job_id", "new_settings")
+    _objects = {"new_settings": "JobSettings"}
+
+    def __init__(
+        self,
+        job_id: int,
+        new_settings: Optional[JobSettings] = None,
+    ) -> None:
+        """Build a JobsResetRequest.
+
+        Args:
+            job_id:
+                The canonical identifier of the job to reset.
+            new_settings:
+                The new settings of the job.
+        """
+        self.job_id = job_id
+        self.new_settings = new_settings
+
+
+class JobsResetResponse(Schema):
+    """Schema of JobsResetResponse.
+
+    Response of Overwrites all the settings for a specific job.
+    """
+
+    __slots__ = ()
+
+
+class JobsUpdateRequest(Schema):
+    """Schema of JobsUpdateRequest.
+
+    Request of Add, update, or remove specific settings of an existing job.
+    """
+
+    __slots__ = ("job_id", "new_settings", "fields_to_remove")
+    _objects = {"new_settings": "JobSettings"}
+
+    def __init__(
+        self,
+        job_id: int,
+        new_settings: Optional[JobSettings] = None,
+        fields_to_remove: Optional[List[str]] = None,
+    ) -> None:
+        """Build a JobsUpdateRequest.
+
+        Args:
+            job_id:
+                The canonical identifier of the job to update.
+            new_settings:
+                The new settings for the job.
+            fields_to_remove:
+                Remove top-level fields in the job settings.
+        """
+        self.job_id = job_id
+        self.new_settings = new_settings
+        self.fields_to_remove = fields_to_remove
+
+
+class JobsUpdateResponse(Schema):
+    """Schema of JobsUpdateResponse.
+
+    Response of Add, update, or remove specific settings of an existing job.
+    """
+
+    __slots__ = ()
+
+
+class JobsDeleteRequest(Schema):
+    """Schema of JobsDeleteRequest.
+
+    Request of Deletes a job.
+    """
+
+    __slots__ = ("job_id",)
+
+    def __init__(
+        self,
+        job_id: int,
+    ) -> None:
+        """Build a JobsDeleteRequest.
+
+        Args:
+            job_id:
+                The canonical identifier of the job to delete.
+        """
+        self.job_id = job_id
+
+
+class JobsDeleteResponse(Schema):
+    """Schema of JobsDeleteResponse.
+
+    Response of Deletes a job.
+    """
+
+    __slots__ = ()
+
+
+class JobsRunNowRequestPipelineParams(Schema):
+    """Schema of JobsRunNowRequestPipelineParams."""
+
+    __slots__ = ("full_refresh",)
+
+    def __init__(
+        self,
+        full_refresh: Optional[bool] = None,
+    ) -> None:
+        """Build a JobsRunNowRequestPipelineParams.
+
+        Args:
+            full_refresh:
+                If true, triggers a full refresh on the delta live table.
+        """
+        self.full_refresh = full_refresh
+
+
+class JobsRunNowRequest(Schema):
+    """Schema of JobsRunNowRequest.
+
+    Request of Run a job and return the `run_id` of the triggered run.
+    """
+
+    __slots__ = (
+        "job_id",
+        "idempotency_token",
+        "jar_params",
+        "notebook_params",
+        "python_params",
+        "spark_submit_params",
+        "python_named_params",
+        "pipeline_params",
+        "sql_params",
+        "dbt_commands",
+    )
+    _objects = {"pipeline_params": "JobsRunNowRequestPipelineParams"}
+
+    def __init__(
+        self,
+        job_id: Optional[int] = None,
+        idempotency_token: Optional[str] = None,
+        jar_params: Optional[List[str]] = None,
+        notebook_params: Optional[Dict[str, Any]] = None,
+        python_params: Optional[List[str]] = None,
+        spark_submit_params: Optional[List[str]] = None,
+        python_named_params: Optional[Dict[str, Any]] = None,
+        pipeline_params: Optional[JobsRunNowRequestPipelineParams] = None,
+        sql_params: Optional[Dict[str, Any]] = None,
+        dbt_commands: Optional[List[Any]] = None,
+    ) -> None:
+        """Build a JobsRunNowRequest.
+
+        Args:
+            job_id:
+                The ID of the job to be executed
+            idempotency_token:
+                An optional token to guarantee the idempotency of job run requests.
+            jar_params:
+                A list of parameters for jobs with Spark JAR tasks, for example
+                `"jar_params": ["john doe", "35"]`.
+            notebook_params:
+                A map from keys to values for jobs with notebook task, for example
+                `"notebook_params": {"name": "john doe", "age": "35"}`.
+            python_params:
+                A list of parameters for jobs with Python tasks, for example
+                `"python_params": ["john doe", "35"]`.
+            spark_submit_params:
+                A list of parameters for jobs with spark submit task, for example
+                `"spark_submit_params": ["--class",
+                "org.apache.spark.examples.SparkPi"]`.
+            python_named_params:
+                A map from keys to values for jobs with Python wheel task, for example
+                `"python_named_params": {"name": "task", "data":
+                "dbfs:/path/to/data.json"}`.
+            sql_params:
+                A map from keys to values for SQL tasks, for example `"sql_params":
+                {"name": "john doe", "age": "35"}`.
+            dbt_commands:
+                An array of commands to execute for jobs with the dbt task, for example
+                `"dbt_commands": ["dbt deps", "dbt seed", "dbt run"]`
+        """
+        self.job_id = job_id
+        self.idempotency_token = idempotency_token
+        self.jar_params = jar_params
+        self.notebook_params = notebook_params
+        self.python_params = python_params
+        self.spark_submit_params = spark_submit_params
+        self.python_named_params = python_named_params
+        self.pipeline_params = pipeline_params
+        self.sql_params = sql_params
+        self.dbt_commands = dbt_commands
+
+
+class JobsRunNowResponse(Schema):
+    """Schema of JobsRunNowResponse.
+
+    Response of Run a job and return the `run_id` of the triggered run.
+    """
+
+    __slots__ = ("run_id", "number_in_job")
+
+    def __init__(
+        self,
+        run_id: Optional[int] = None,
+        number_in_job: Optional[int] = None,
+    ) -> None:
+        """Build a JobsRunNowResponse.
+
+        Args:
+            run_id:
+                The globally unique ID of the newly triggered run.
+            number_in_job:
+                A unique identifier for this job run.
+        """
+        self.run_id = run_id
+        self.number_in_job = number_in_job
+
+
+class JobsRunsSubmitRequest(Schema):
+    """Schema of JobsRunsSubmitRequest.
+
+    Request of Submit a one-time run.
+    """
+
+    __slots__ = (
+        "tasks",
+        "run_name",
+        "git_source",
+        "timeout_seconds",
+        "idempotency_token",
+        "access_control_list",
+    )
+    _objects = {"git_source": "GitSource"}
+    _lists = {"tasks": "RunSubmitTaskSettings"}
+
+    def __init__(
+        self,
+        tasks: Optional[List[RunSubmitTaskSettings]] = None,
+        run_name: Optional[str] = None,
+        git_source: Optional[GitSource] = None,
+        timeout_seconds: Optional[int] = None,
+        idempotency_token: Optional[str] = None,
+        access_control_list: Optional[List[AccessControlRequest]] = None,
+    ) -> None:
+        """Build a JobsRunsSubmitRequest.
+
+        Args:
+            run_name:
+                An optional name for the run.
+            git_source:
+                This functionality is in Public Preview.
+            timeout_seconds:
+                An optional timeout applied to each run of this job.
+            idempotency_token:
+                An optional token that can be used to guarantee the idempotency of job
+                run requests.
+            access_control_list:
+                List of permissions to set on the job.
+        """
+        self.tasks = tasks
+        self.run_name = run_name
+        self.git_source = git_source
+        self.timeout_seconds = timeout_seconds
+        self.idempotency_token = idempotency_token
+        self.access_control_list = access_control_list
+
+
+class JobsRunsSubmitResponse(Schema):
+    """Schema of JobsRunsSubmitResponse.
+
+    Response of Submit a one-time run.
+    """
+
+    __slots__ = ("run_id",)
+
+    def __init__(
+        self,
+        run_id: Optional[int] = None,
+    ) -> None:
+        """Build a JobsRunsSubmitResponse.
+
+        Args:
+            run_id:
+                The canonical identifier for the newly submitted run.
+        """
+        self.run_id = run_id
+
+
+class JobsRunsListRequest(Schema):
+    """Schema of JobsRunsListRequest.
+
+    Request of List runs in descending order by start time.
+    """
+
+    __slots__ = (
+        "active_only",
+        "completed_only",
+        "job_id",
+        "offset",
+        "limit",
+        "run_type",
+        "expand_tasks",
+        "start_time_from",
+        "start_time_to",
+    )
+
+    def __init__(
+        self,
+        active_only: Optional[bool] = None,
+        completed_only: Optional[bool] = None,
+        job_id: Optional[int] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        run_type: Optional[Literal["JOB_RUN", "WORKFLOW_RUN", "SUBMIT_RUN"]] = None,
+        expand_tasks: Optional[bool] = None,
+        start_time_from: Optional[int] = None,
+        start_time_to: Optional[int] = None,
+    ) -> None:
+        """Build a JobsRunsListRequest.
+
+        Args:
+            active_only:
+                If active_only is `true`, only active runs are included in the results;
+                otherwise, lists both active and completed runs.
+            completed_only:
+                If completed_only is `true`, only completed runs are included in the
+                results; otherwise, lists both active and completed runs.
+            job_id:
+                The job for which to list runs.
+            offset:
+                The offset of the first run to return, relative to the most recent run.
+            limit:
+                The number of runs to return.
+            run_type:
+                The type of runs to return.
+            expand_tasks:
+                Whether to include task and cluster details in the response.
+            start_time_from:
+                Show runs that started _at or after_ this value.
+            start_time_to:
+                Show runs that started _at or before_ this value.
+        """
+        self.active_only = active_only
+        self.completed_only = completed_only
+        self.job_id = job_id
+        self.offset = offset
+        self.limit = limit
+        self.run_type = run_type
+        self.expand_tasks = expand_tasks
+        self.start_time_from = start_time_from
+        self.start_time_to = start_time_to
+
+
+class JobsRunsListResponse(Schema):
+    """Schema of JobsRunsListResponse.
+
+    Response of List runs in descending order by start time.
+    """
+
+    __slots__ = ("runs", "has_more")
+    _lists = {"runs": "Run"}
+
+    def __init__(
+        self,
+        runs: Optional[List[Run]] = None,
+        has_more: Optional[bool] = None,
+    ) -> None:
+        """Build a JobsRunsListResponse.
+
+        Args:
+            runs:
+                A list of runs, from most recently started to least.
+            has_more:
+                If true, additional runs matching the provided filter are available for
+                listing.
+        """
+        self.runs = runs
+        self.has_more = has_more
+
+
+class JobsRunsGetRequest(Schema):
+    """Schema of JobsRunsGetRequest.
+
+    Request of Retrieve the metadata of a run.
+    """
+
+    __slots__ = ("run_id", "include_history")
+
+    def __init__(
+        self,
+        run_id: int,
+        include_history: Optional[bool] = None,
+    ) -> None:
+        """Build a JobsRunsGetRequest.
+
+        Args:
+            run_id:
+                The canonical identifier of the run for which to retrieve the metadata.
+            include_history:
+                Whether to include the repair history in the response.
+        """
+        self.run_id = run_id
+        self.include_history = include_history
+
+
+class JobsRunsGetResponse(Schema):
+    """Schema of JobsRunsGetResponse.
+
+    Response of Retrieve the metadata of a run.
+    """
+
+    __slots__ = (
+        "job_id",
+        "run_id",
+        "number_in_job",
+        "creator_user_name",
+        "original_attempt_run_id",
+        "state",
+        "schedule",
+        "tasks",
+        "job_clusters",
+        "cluster_spec",
+        "cluster_instance",
+        "git_source",
+        "overriding_parameters",
+        "start_time",
+        "setup_duration",
+        "execution_duration",
+        "cleanup_duration",
+        "end_time",
+        "trigger",
+        "run_name",
+        "run_page_url",
+        "run_type",
+        "attempt_number",
+        "repair_history",
+    )
+    _objects = {
+        "state": "RunState",
+        "schedule": "CronSchedule",
+        "cluster_spec": "ClusterSpec",
+        "cluster_instance": "ClusterInstance",
+        "git_source": "GitSource",
+        "overriding_parameters": "RunParameters",
+    }
+    _lists = {
+        "tasks": "RunTask",
+        "job_clusters": "JobCluster",
+        "repair_history": "RepairHistoryItem",
+    }
+
+    def __init__(
+        self,
+        job_id: Optional[int] = None,
+        run_id: Optional[int] = None,
+        number_in_job: Optional[int] = None,
+        creator_user_name: Optional[str] = None,
+        original_attempt_run_id: Optional[int] = None,
+        state: Optional[RunState] = None,
+        schedule: Optional[CronSchedule] = None,
+        tasks: Optional[List[RunTask]] = None,
+        job_clusters: Optional[List[JobCluster]] = None,
+        cluster_spec: Optional[ClusterSpec] = None,
+        cluster_instance: Optional[ClusterInstance] = None,
+        git_source: Optional[GitSource] = None,
+        overriding_parameters: Optional[RunParameters] = None,
+        start_time: Optional[int] = None,
+        setup_duration: Optional[int] = None,
+        execution_duration: Optional[int] = None,
+        cleanup_duration: Optional[int] = None,
+        end_time: Optional[int] = None,
+        trigger: Optional[TriggerType] = None,
+        run_name: Optional[str] = None,
+        run_page_url: Optional[str] = None,
+        run_type: Optional[RunType] = None,
+        attempt_number: Optional[int] = None,
+        repair_history: Optional[List[RepairHistoryItem]] = None,
+    ) -> None:
+        """Build a JobsRunsGetResponse.
+
+        Args:
+            job_id:
+                The canonical identifier of the job that contains this run.
+            run_id:
+                The canonical identifier of the run.
+            number_in_job:
+                A unique identifier for this job run.
+            creator_user_name:
+                The creator user name.
+            original_attempt_run_id:
+                If this run is a retry of a prior run attempt, this field contains the
+                run_id of the original attempt; otherwise, it is the same as the run_id.
+            state:
+                The result and lifecycle states of the run.
+            schedule:
+                The cron schedule that triggered this run if it was triggered by the
+                periodic scheduler.
+            tasks:
+                The list of tasks performed by the run.
+            job_clusters:
+                A list of job cluster specifications that can be shared and reused by
+                tasks of this job.
+            cluster_spec:
+                A snapshot of the job’s cluster specification when this run was created.
+            cluster_instance:
+                The cluster used for this run.
+            git_source:
+                This functionality is in Public Preview.
+            overriding_parameters:
+                The parameters used for this run.
+            start_time:
+                The time at which this run was started in epoch milliseconds
+                (milliseconds since 1/1/1970 UTC).
+            setup_duration:
+                The time it took to set up the cluster in milliseconds.
+            execution_duration:
+                The time in milliseconds it took to execute the commands in the JAR or
+                notebook until they completed, failed, timed out, were cancelled, or
+                encountered an unexpected error.
+            cleanup_duration:
+                The time in milliseconds it took to terminate the cluster and clean up
+                any associated artifacts.
+            end_time:
+                The time at which this run ended in epoch milliseconds (milliseconds
+                since 1/1/1970 UTC).
+            trigger:
+                The type of trigger that fired this run.
+            run_name:
+                An optional name for the run.
+            run_page_url:
+                The URL to the detail page of the run.
+            run_type:
+                The type of the run.
+            attempt_number:
+                The sequence number of this run attempt for a triggered job run.
+            repair_history:
+                The repair history of the run.
+        """
+        self.job_id = job_id
+        self.run_id = run_id
+        self.number_in_job = number_in_job
+        self.creator_user_name = creator_user_name
+        self.original_attempt_run_id = original_attempt_run_id
+        self.state = state
+        self.schedule = schedule
+        self.tasks = tasks
+        self.job_clusters = job_clusters
+        self.cluster_spec = cluster_spec
+        self.cluster_instance = cluster_instance
+        self.git_source = git_source
+        self.overriding_parameters = overriding_parameters
+        self.start_time = start_time
+        self.setup_duration = setup_duration
+        self.execution_duration = execution_duration
+        self.cleanup_duration = cleanup_duration
+        self.end_time = end_time
+        self.trigger = trigger
+        self.run_name = run_name
+        self.run_page_url = run_page_url
+        self.run_type = run_type
+        self.attempt_number = attempt_number
+        self.repair_history = repair_history
+
+
+class JobsRunsExportRequest(Schema):
+    """Schema of JobsRunsExportRequest.
+
+    Request of Export and retrieve the job run task.
+    """
+
+    __slots__ = ("run_id", "views_to_export")
+
+    def __init__(
+        self,
+        run_id: int,
+        views_to_export: Optional[ViewsToExport] = None,
+    ) -> None:
+        """Build a JobsRunsExportRequest.
+
+        Args:
+            run_id:
+                The canonical identifier for the run.
+            views_to_export:
+                Which views to export (CODE, DASHBOARDS, or ALL).
+        """
+        self.run_id = run_id
+        self.views_to_export = views_to_export
+
+
+class JobsRunsExportResponse(Schema):
+    """Schema of JobsRunsExportResponse.
+
+    Response of Export and retrieve the job run task.
+    """
+
+    __slots__ = ("views",)
+    _lists = {"views": "ViewItem"}
+
+    def __init__(
+        self,
+        views: Optional[List[ViewItem]] = None,
+    ) -> None:
+        """Build a JobsRunsExportResponse.
+
+        Args:
+            views:
+                The exported content in HTML format (one for every view item).
+        """
+        self.views = views
+
+
+class JobsRunsCancelRequest(Schema):
+    """Schema of JobsRunsCancelRequest.
+
+    Request of Cancels a job run.
+    """
+
+    __slots__ = ("run_id",)
+
+    def __init__(
+        self,
+        run_id: int,
+    ) -> None:
+        """Build a JobsRunsCancelRequest.
+
+        Args:
+            run_id:
+                This field is required.
+        """
+        self.run_id = run_id
+
+
+class JobsRunsCancelResponse(Schema):
+    """Schema of JobsRunsCancelResponse.
+
+    Response of Cancels a job run.
+    """
+
+    __slots__ = ()
+
+
+class JobsRunsCancelAllRequest(Schema):
+    """Schema of JobsRunsCancelAllRequest.
+
+    Request of Cancels all active runs of a job.
+    """
+
+    __slots__ = ("job_id",)
+
+    def __init__(
+        self,
+        job_id: int,
+    ) -> None:
+        """Build a JobsRunsCancelAllRequest.
+
+        Args:
+            job_id:
+                The canonical identifier of the job to cancel all runs of.
+        """
+        self.job_id = job_id
+
+
+class JobsRunsCancelAllResponse(Schema):
+    """Schema of JobsRunsCancelAllResponse.
+
+    Response of Cancels all active runs of a job.
+    """
+
+    __slots__ = ()
+
+
+class JobsRunsGetOutputRequest(Schema):
+    """Schema of JobsRunsGetOutputRequest.
+
+    Request of Retrieve the output and metadata of a single task run.
+    """
+
+    __slots__ = ("run_id",)
+
+    def __init__(
+        self,
+        run_id: int,
+    ) -> None:
+        """Build a JobsRunsGetOutputRequest.
+
+        Args:
+            run_id:
+                The canonical identifier for the run.
+        """
+        self.run_id = run_id
+
+
+class JobsRunsGetOutputResponse(Schema):
+    """Schema of JobsRunsGetOutputResponse.
+
+    Response of Retrieve the output and metadata of a single task run.
+    """
+
+    __slots__ = (
+        "notebook_output",
+        "sql_output",
+        "dbt_output",
+        "logs",
+        "logs_truncated",
+        "error",
+        "error_trace",
+        "metadata",
+    )
+    _objects = {
+        "notebook_output": "NotebookOutput",
+        "sql_output": "SqlOutput",
+        "dbt_output": "DbtOutput",
+        "metadata": "Run",
+    }
+
+    def __init__(
+        self,
+        notebook_output: Optional[NotebookOutput] = None,
+        sql_output: Optional[SqlOutput] = None,
+        dbt_output: Optional[DbtOutput] = None,
+        logs: Optional[str] = None,
+        logs_truncated: Optional[bool] = None,
+        error: Optional[str] = None,
+        error_trace: Optional[str] = None,
+        metadata: Optional[Run] = None,
+    ) -> None:
+        """Build a JobsRunsGetOutputResponse.
+
+        Args:
+            notebook_output:
+                The output of a notebook task, if available.
+            sql_output:
+                The output of a SQL task, if available.
+            dbt_output:
+                The output of a dbt task, if available.
+            logs:
+                The output from tasks that write to standard streams (stdout/stderr)
+                such as
+                [SparkJarTask](https://docs.microsoft.com/azure/databricks/dev-tools/api/latest/jobs#/components/schemas/SparkJarTask),
+                [SparkPythonTask](https://docs.microsoft.com/azure/databricks/dev-tools/api/latest/jobs#/components/schemas/SparkPythonTask,
+                [PythonWheelTask](https://docs.microsoft.com/azure/databricks/dev-tools/api/latest/jobs#/components/schemas/PythonWheelTask.
+            logs_truncated:
+                Whether the logs are truncated.
+            error:
+                An error message indicating why a task failed or why output is not
+                available.
+            error_trace:
+                If there was an error executing the run, this field contains any
+                available stack traces.
+            metadata:
+                All details of the run except for its output.
+        """
+        self.notebook_output = notebook_output
+        self.sql_output = sql_output
+        self.dbt_output = dbt_output
+        self.logs = logs
+        self.logs_truncated = logs_truncated
+        self.error = error
+        self.error_trace = error_trace
+        self.metadata = metadata
+
+
+class JobsRunsDeleteRequest(Schema):
+    """Schema of JobsRunsDeleteRequest.
+
+    Request of Deletes a non-active run.
+    """
+
+    __slots__ = ("run_id",)
+
+    def __init__(
+        self,
+        run_id: Optional[int] = None,
+    ) -> None:
+        """Build a JobsRunsDeleteRequest.
+
+        Args:
+            run_id:
+                The canonical identifier of the run for which to retrieve the metadata.
+        """
+        self.run_id = run_id
+
+
+class JobsRunsDeleteResponse(Schema):
+    """Schema of JobsRunsDeleteResponse.
+
+    Response of Deletes a non-active run.
+    """
+
+    __slots__ = ()
+
+
+class JobsRunsRepairRequestPipelineParams(Schema):
+    """Schema of JobsRunsRepairRequestPipelineParams."""
+
+    __slots__ = ("full_refresh",)
+
+    def __init__(
+        self,
+        full_refresh: Optional[bool] = None,
+    ) -> None:
+        """Build a JobsRunsRepairRequestPipelineParams.
+
+        Args:
+            full_refresh:
+                If true, triggers a full refresh on the delta live table.
+        """
+        self.full_refresh = full_refresh
+
+
+class JobsRunsRepairRequest(Schema):
+    """Schema of JobsRunsRepairRequest.
+
+    Request of Re-run one or more tasks.
+    """
+
+    __slots__ = (
+        "run_id",
+        "rerun_tasks",
+        "latest_repair_id",
+        "rerun_all_failed_tasks",
+        "jar_params",
+        "notebook_params",
+        "python_params",
+        "spark_submit_params",
+        "python_named_params",
+        "pipeline_params",
+        "sql_params",
+        "dbt_commands",
+    )
+    _objects = {"pipeline_params": "JobsRunsRepairRequestPipelineParams"}
+
+    def __init__(
+        self,
+        run_id: Optional[int] = None,
+        rerun_tasks: Optional[List[str]] = None,
+        latest_repair_id: Optional[int] = None,
+        rerun_all_failed_tasks: Optional[bool] = None,
+        jar_params: Optional[List[str]] = None,
+        notebook_params: Optional[Dict[str, Any]] = None,
+        python_params: Optional[List[str]] = None,
+        spark_submit_params: Optional[List[str]] = None,
+        python_named_params: Optional[Dict[str, Any]] = None,
+        pipeline_params: Optional[JobsRunsRepairRequestPipelineParams] = None,
+        sql_params: Optional[Dict[str, Any]] = None,
+        dbt_commands: Optional[List[Any]] = None,
+    ) -> None:
+        """Build a JobsRunsRepairRequest.
+
+        Args:
+            run_id:
+                The job run ID of the run to repair.
+            rerun_tasks:
+                The task keys of the task runs to repair.
+            latest_repair_id:
+                The ID of the latest repair.
+            rerun_all_failed_tasks:
+                If true, repair all failed tasks.
+            jar_params:
+                A list of parameters for jobs with Spark JAR tasks, for example
+                `"jar_params": ["john doe", "35"]`.
+            notebook_params:
+                A map from keys to values for jobs with notebook task, for example
+                `"notebook_params": {"name": "john doe", "age": "35"}`.
+            python_params:
+                A list of parameters for jobs with Python tasks, for example
+                `"python_params": ["john doe", "35"]`.
+            spark_submit_params:
+                A list of parameters for jobs with spark submit task, for example
+                `"spark_submit_params": ["--class",
+                "org.apache.spark.examples.SparkPi"]`.
+            python_named_params:
+                A map from keys to values for jobs with Python wheel task, for example
+                `"python_named_params": {"name": "task", "data":
+                "dbfs:/path/to/data.json"}`.
+            sql_params:
+                A map from keys to values for SQL tasks, for example `"sql_params":
+                {"name": "john doe", "age": "35"}`.
+            dbt_commands:
+                An array of commands to execute for jobs with the dbt task, for example
+                `"dbt_commands": ["dbt deps", "dbt seed", "dbt run"]`
+        """
+        self.run_id = run_id
+        self.rerun_tasks = rerun_tasks
+        self.latest_repair_id = latest_repair_id
+        self.rerun_all_failed_tasks = rerun_all_failed_tasks
+        self.jar_params = jar_params
+        self.notebook_params = notebook_params
+        self.python_params = python_params
+        self.spark_submit_params = spark_submit_params
+        self.python_named_params = python_named_params
+        self.pipeline_params = pipeline_params
+        self.sql_params = sql_params
+        self.dbt_commands = dbt_commands
+
+
+class JobsRunsRepairResponse(Schema):
+    """Schema of JobsRunsRepairResponse.
+
+    Response of Re-run one or more tasks.
+    """
+
+    __slots__ = ("repair_id",)
+
+    def __init__(
+        self,
+        repair_id: Optional[int] = None,
+    ) -> None:
+        """Build a JobsRunsRepairResponse.
+
+        Args:
+            repair_id:
+                The ID of the repair.
+        """
+        self.repair_id = repair_id
+
+
+# operation id -> (method, path, request class, response class)
+ENDPOINTS: Dict[str, Tuple[str, str, str, str]] = {
+    "JobsCreate": (
+        "POST",
+        "/2.1/jobs/create",
+        "JobsCreateRequest",
+        "JobsCreateResponse",
+    ),
+    "JobsList": ("GET", "/2.1/jobs/list", "JobsListRequest", "JobsListResponse"),
+    "JobsGet": ("GET", "/2.1/jobs/get", "JobsGetRequest", "JobsGetResponse"),
+    "JobsReset": ("POST", "/2.1/jobs/reset", "JobsResetRequest", "JobsResetResponse"),
+    "JobsUpdate": (
+        "POST",
+        "/2.1/jobs/update",
+        "JobsUpdateRequest",
+        "JobsUpdateResponse",
+    ),
+    "JobsDelete": (
+        "POST",
+        "/2.1/jobs/delete",
+        "JobsDeleteRequest",
+        "JobsDeleteResponse",
+    ),
+    "JobsRunNow": (
+        "POST",
+        "/2.1/jobs/run-now",
+        "JobsRunNowRequest",
+        "JobsRunNowResponse",
+    ),
+    "JobsRunsSubmit": (
+        "POST",
+        "/2.1/jobs/runs/submit",
+        "JobsRunsSubmitRequest",
+        "JobsRunsSubmitResponse",
+    ),
+    "JobsRunsList": (
+        "GET",
+        "/2.1/jobs/runs/list",
+        "JobsRunsListRequest",
+        "JobsRunsListResponse",
+    ),
+    "JobsRunsGet": (
+        "GET",
+        "/2.1/jobs/runs/get",
+        "JobsRunsGetRequest",
+        "JobsRunsGetResponse",
+    ),
+    "JobsRunsExport": (
+        "GET",
+        "/2.0/jobs/runs/export",
+        "JobsRunsExportRequest",
+        "JobsRunsExportResponse",
+    ),
+    "JobsRunsCancel": (
+        "POST",
+        "/2.1/jobs/runs/cancel",
+        "JobsRunsCancelRequest",
+        "JobsRunsCancelResponse",
+    ),
+    "JobsRunsCancelAll": (
+        "POST",
+        "/2.1/jobs/runs/cancel-all",
+        "JobsRunsCancelAllRequest",
+        "JobsRunsCancelAllResponse",
+    ),
+    "JobsRunsGetOutput": (
+        "GET",
+        "/2.1/jobs/runs/get-output",
+        "JobsRunsGetOutputRequest",
+        "JobsRunsGetOutputResponse",
+    ),
+    "JobsRunsDelete": (
+        "POST",
+        "/2.1/jobs/runs/delete",
+        "JobsRunsDeleteRequest",
+        "JobsRunsDeleteResponse",
+    ),
+    "JobsRunsRepair": (
+        "POST",
+        "/2.1/jobs/runs/repair",
+        "JobsRunsRepairRequest",
+        "JobsRunsRepairResponse",
+    ),
+}
@@ -0,0 +1,822 @@
+# Generated by codegen.py from jobs-2.1-azure.yaml, do not edit.
+
+"""Job settings, tasks and schedules."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
+
+from schema import Schema
+
+if TYPE_CHECKING:
+    from databricks_models.clusters import NewCluster
+    from databricks_models.libraries import Library
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the schemas of the other groups through the package."""
+    import databricks_models
+
+    return getattr(databricks_models, name)
+
+
+class ClusterSpec(Schema):
+    """Schema of ClusterSpec."""
+
+    __slots__ = ("existing_cluster_id", "new_cluster", "libraries")
+    _objects = {"new_cluster": "NewCluster"}
+    _lists = {"libraries": "Library"}
+
+    def __init__(
+        self,
+        existing_cluster_id: Optional[str] = None,
+        new_cluster: Optional[NewCluster] = None,
+        libraries: Optional[List[Library]] = None,
+    ) -> None:
+        """Build a ClusterSpec.
+
+        Args:
+            existing_cluster_id:
+                If existing_cluster_id, the ID of an existing cluster that is used for
+                all runs of this job.
+            new_cluster:
+                If new_cluster, a description of a cluster that is created for each run.
+            libraries:
+                An optional list of libraries to be installed on the cluster that
+                executes the job.
+        """
+        self.existing_cluster_id = existing_cluster_id
+        self.new_cluster = new_cluster
+        self.libraries = libraries
+
+
+class CronSchedule(Schema):
+    """Schema of CronSchedule."""
+
+    __slots__ = ("quartz_cron_expression", "timezone_id", "pause_status")
+
+    def __init__(
+        self,
+        quartz_cron_expression: str,
+        timezone_id: str,
+        pause_status: Optional[Literal["PAUSED", "UNPAUSED"]] = None,
+    ) -> None:
+        """Build a CronSchedule.
+
+        Args:
+            quartz_cron_expression:
+                A Cron expression using Quartz syntax that describes the schedule for a
+                job.
+            timezone_id:
+                A Java timezone ID.
+            pause_status:
+                Indicate whether this schedule is paused or not.
+        """
+        self.quartz_cron_expression = quartz_cron_expression
+        self.timezone_id = timezone_id
+        self.pause_status = pause_status
+
+
+class GitSource(Schema):
+    """Schema of GitSource.
+
+    This functionality is in Public Preview.
+    """
+
+    __slots__ = (
+        "git_url",
+        "git_provider",
+        "git_branch",
+        "git_tag",
+        "git_commit",
+        "git_snapshot",
+    )
+    _objects = {"git_snapshot": "GitSnapshot"}
+
+    def __init__(
+        self,
+        git_url: str,
+        git_provider: Literal[
+            "gitHub",
+            "bitbucketCloud",
+            "azureDevOpsServices",
+            "gitHubEnterprise",
+            "bitbucketServer",
+            "gitLab",
+            "gitLabEnterpriseEdition",
+            "awsCodeCommit",
+        ],
+        git_branch: Optional[str] = None,
+        git_tag: Optional[str] = None,
+        git_commit: Optional[str] = None,
+        git_snapshot: Optional[GitSnapshot] = None,
+    ) -> None:
+        """Build a GitSource.
+
+        Args:
+            git_url:
+                URL of the repository to be cloned by this job.
+            git_provider:
+                Unique identifier of the service used to host the Git repository.
+            git_branch:
+                Name of the branch to be checked out and used by this job.
+            git_tag:
+                Name of the tag to be checked out and used by this job.
+            git_commit:
+                Commit to be checked out and used by this job.
+            git_snapshot:
+                Read-only state of the remote repository at the time the job was run.
+        """
+        self.git_url = git_url
+        self.git_provider = git_provider
+        self.git_branch = git_branch
+        self.git_tag = git_tag
+        self.git_commit = git_commit
+        self.git_snapshot = git_snapshot
+
+
+class GitSnapshot(Schema):
+    """Schema of GitSnapshot.
+
+    Read-only state of the remote repository at the time the job was run.
+    """
+
+    __slots__ = ("used_commit",)
+
+    def __init__(
+        self,
+        used_commit: Optional[str] = None,
+    ) -> None:
+        """Build a GitSnapshot.
+
+        Args:
+            used_commit:
+                Commit that was used to execute the run.
+        """
+        self.used_commit = used_commit
+
+
+class Job(Schema):
+    """Schema of Job."""
+
+    __slots__ = ("job_id", "creator_user_name", "settings", "created_time")
+    _objects = {"settings": "JobSettings"}
+
+    def __init__(
+        self,
+        job_id: Optional[int] = None,
+        creator_user_name: Optional[str] = None,
+        settings: Optional[JobSettings] = None,
+        created_time: Optional[int] = None,
+    ) -> None:
+        """Build a Job.
+
+        Args:
+            job_id:
+                The canonical identifier for this job.
+            creator_user_name:
+                The creator user name.
+            settings:
+                Settings for this job and all of its runs.
+            created_time:
+                The time at which this job was created in epoch milliseconds
+                (milliseconds since 1/1/1970 UTC).
+        """
+        self.job_id = job_id
+        self.creator_user_name = creator_user_name
+        self.settings = settings
+        self.created_time = created_time
+
+
+class JobEmailNotifications(Schema):
+    """Schema of JobEmailNotifications."""
+
+    __slots__ = ("on_start", "on_success", "on_failure", "no_alert_for_skipped_runs")
+
+    def __init__(
+        self,
+        on_start: Optional[List[str]] = None,
+        on_success: Optional[List[str]] = None,
+        on_failure: Optional[List[str]] = None,
+        no_alert_for_skipped_runs: Optional[bool] = None,
+    ) -> None:
+        """Build a JobEmailNotifications.
+
+        Args:
+            on_start:
+                A list of email addresses to be notified when a run begins.
+            on_success:
+                A list of email addresses to be notified when a run successfully
+                completes.
+            on_failure:
+                A list of email addresses to notify when a run completes unsuccessfully.
+            no_alert_for_skipped_runs:
+                If true, do not send email to recipients specified in `on_failure` if
+                the run is skipped.
+        """
+        self.on_start = on_start
+        self.on_success = on_success
+        self.on_failure = on_failure
+        self.no_alert_for_skipped_runs = no_alert_for_skipped_runs
+
+
+class JobSettings(Schema):
+    """Schema of JobSettings."""
+
+    __slots__ = (
+        "name",
+        "tags",
+        "tasks",
+        "job_clusters",
+        "email_notifications",
+        "timeout_seconds",
+        "schedule",
+        "max_concurrent_runs",
+        "git_source",
+        "format",
+    )
+    _objects = {
+        "email_notifications": "JobEmailNotifications",
+        "schedule": "CronSchedule",
+        "git_source": "GitSource",
+    }
+    _lists = {"tasks": "JobTaskSettings", "job_clusters": "JobCluster"}
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        tags: Optional[Dict[str, Any]] = None,
+        tasks: Optional[List[JobTaskSettings]] = None,
+        job_clusters: Optional[List[JobCluster]] = None,
+        email_notifications: Optional[JobEmailNotifications] = None,
+        timeout_seconds: Optional[int] = None,
+        schedule: Optional[CronSchedule] = None,
+        max_concurrent_runs: Optional[int] = None,
+        git_source: Optional[GitSource] = None,
+        format: Optional[Literal["SINGLE_TASK", "MULTI_TASK"]] = None,
+    ) -> None:
+        """Build a JobSettings.
+
+        Args:
+            name:
+                An optional name for the job.
+            tags:
+                A map of tags associated with the job.
+            tasks:
+                A list of task specifications to be executed by this job.
+            job_clusters:
+                A list of job cluster specifications that can be shared and reused by
+                tasks of this job.
+            email_notifications:
+                An optional set of email addresses that is notified when runs of this
+                job begin or complete as well as when this job is deleted.
+            timeout_seconds:
+                An optional timeout applied to each run of this job.
+            schedule:
+                An optional periodic schedule for this job.
+            max_concurrent_runs:
+                An optional maximum allowed number of concurrent runs of the job.
+            git_source:
+                This functionality is in Public Preview.
+            format:
+                Used to tell what is the format of the job.
+        """
+        self.name = name
+        self.tags = tags
+        self.tasks = tasks
+        self.job_clusters = job_clusters
+        self.email_notifications = email_notifications
+        self.timeout_seconds = timeout_seconds
+        self.schedule = schedule
+        self.max_concurrent_runs = max_concurrent_runs
+        self.git_source = git_source
+        self.format = format
+
+
+class JobTask(Schema):
+    """Schema of JobTask."""
+
+    __slots__ = (
+        "notebook_task",
+        "spark_jar_task",
+        "spark_python_task",
+        "spark_submit_task",
+        "pipeline_task",
+        "python_wheel_task",
+        "sql_task",
+        "dbt_task",
+    )
+    _objects = {
+        "notebook_task": "NotebookTask",
+        "spark_jar_task": "SparkJarTask",
+        "spark_python_task": "SparkPythonTask",
+        "spark_submit_task": "SparkSubmitTask",
+        "pipeline_task": "PipelineTask",
+        "python_wheel_task": "PythonWheelTask",
+        "sql_task": "SqlTask",
+        "dbt_task": "DbtTask",
+    }
+
+    def __init__(
+        self,
+        notebook_task: Optional[NotebookTask] = None,
+        spark_jar_task: Optional[SparkJarTask] = None,
+        spark_python_task: Optional[SparkPythonTask] = None,
+        spark_submit_task: Optional[SparkSubmitTask] = None,
+        pipeline_task: Optional[PipelineTask] = None,
+        python_wheel_task: Optional[PythonWheelTask] = None,
+        sql_task: Optional[SqlTask] = None,
+        dbt_task: Optional[DbtTask] = None,
+    ) -> None:
+        """Build a JobTask.
+
+        Args:
+            notebook_task:
+                If notebook_task, indicates that this job must run a notebook.
+            spark_jar_task:
+                If spark_jar_task, indicates that this job must run a JAR.
+            spark_python_task:
+                If spark_python_task, indicates that this job must run a Python file.
+            spark_submit_task:
+                If spark_submit_task, indicates that this job must be launched by the
+                spark submit script.
+            pipeline_task:
+                If pipeline_task, indicates that this job must execute a Pipeline.
+            python_wheel_task:
+                If python_wheel_task, indicates that this job must execute a
+                PythonWheel.
+            sql_task:
+                If sql_task, indicates that this job must execute a SQL task.
+            dbt_task:
+                If dbt_task, indicates that this must execute a dbt task.
+        """
+        self.notebook_task = notebook_task
+        self.spark_jar_task = spark_jar_task
+        self.spark_python_task = spark_python_task
+        self.spark_submit_task = spark_submit_task
+        self.pipeline_task = pipeline_task
+        self.python_wheel_task = python_wheel_task
+        self.sql_task = sql_task
+        self.dbt_task = dbt_task
+
+
+TaskKey = str
+"""A unique name for the task."""
+
+
+class TaskDependency(Schema):
+    """Schema of TaskDependency."""
+
+    __slots__ = ("task_key",)
+
+    def __init__(
+        self,
+        task_key: Optional[str] = None,
+    ) -> None:
+        self.task_key = task_key
+
+
+TaskDependencies = List["TaskDependency"]
+"""An optional array of objects specifying the dependency graph of the task."""
+
+TaskDescription = str
+"""An optional description for this task."""
+
+
+class JobTaskSettings(Schema):
+    """Schema of JobTaskSettings."""
+
+    __slots__ = (
+        "task_key",
+        "description",
+        "depends_on",
+        "existing_cluster_id",
+        "new_cluster",
+        "job_cluster_key",
+        "notebook_task",
+        "spark_jar_task",
+        "spark_python_task",
+        "spark_submit_task",
+        "pipeline_task",
+        "python_wheel_task",
+        "sql_task",
+        "dbt_task",
+        "libraries",
+        "email_notifications",
+        "timeout_seconds",
+        "max_retries",
+        "min_retry_interval_millis",
+        "retry_on_timeout",
+    )
+    _objects = {
+        "new_cluster": "NewCluster",
+        "notebook_task": "NotebookTask",
+        "spark_jar_task": "SparkJarTask",
+        "spark_python_task": "SparkPythonTask",
+        "spark_submit_task": "SparkSubmitTask",
+        "pipeline_task": "PipelineTask",
+        "python_wheel_task": "PythonWheelTask",
+        "sql_task": "SqlTask",
+        "dbt_task": "DbtTask",
+        "email_notifications": "JobEmailNotifications",
+    }
+    _lists = {"depends_on": "TaskDependency", "libraries": "Library"}
+
+    def __init__(
+        self,
+        task_key: TaskKey,
+        description: Optional[TaskDescription] = None,
+        depends_on: Optional[TaskDependencies] = None,
+        existing_cluster_id: Optional[str] = None,
+        new_cluster: Optional[NewCluster] = None,
+        job_cluster_key: Optional[str] = None,
+        notebook_task: Optional[NotebookTask] = None,
+        spark_jar_task: Optional[SparkJarTask] = None,
+        spark_python_task: Optional[SparkPythonTask] = None,
+        spark_submit_task: Optional[SparkSubmitTask] = None,
+        pipeline_task: Optional[PipelineTask] = None,
+        python_wheel_task: Optional[PythonWheelTask] = None,
+        sql_task: Optional[SqlTask] = None,
+        dbt_task: Optional[DbtTask] = None,
+        libraries: Optional[List[Library]] = None,
+        email_notifications: Optional[JobEmailNotifications] = None,
+        timeout_seconds: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        min_retry_interval_millis: Optional[int] = None,
+        retry_on_timeout: Optional[bool] = None,
+    ) -> None:
+        """Build a JobTaskSettings.
+
+        Args:
+            task_key:
+                A unique name for the task.
+            description:
+                An optional description for this task.
+            depends_on:
+                An optional array of objects specifying the dependency graph of the
+                task.
+            existing_cluster_id:
+                If existing_cluster_id, the ID of an existing cluster that is used for
+                all runs of this task.
+            new_cluster:
+                If new_cluster, a description of a cluster that is created for each run.
+            job_cluster_key:
+                If job_cluster_key, this task is executed reusing the cluster specified
+                in `job.settings.job_clusters`.
+            notebook_task:
+                If notebook_task, indicates that this task must run a notebook.
+            spark_jar_task:
+                If spark_jar_task, indicates that this task must run a JAR.
+            spark_python_task:
+                If spark_python_task, indicates that this task must run a Python file.
+            spark_submit_task:
+                If spark_submit_task, indicates that this task must be launched by the
+                spark submit script.
+            pipeline_task:
+                If pipeline_task, indicates that this task must execute a Pipeline.
+            python_wheel_task:
+                If python_wheel_task, indicates that this job must execute a
+                PythonWheel.
+            sql_task:
+                If sql_task, indicates that this job must execute a SQL task.
+            dbt_task:
+                If dbt_task, indicates that this must execute a dbt task.
+            libraries:
+                An optional list of libraries to be installed on the cluster that
+                executes the task.
+            email_notifications:
+                An optional set of email addresses that is notified when runs of this
+                task begin or complete as well as when this task is deleted.
+            timeout_seconds:
+                An optional timeout applied to each run of this job task.
+            max_retries:
+                An optional maximum number of times to retry an unsuccessful run.
+            min_retry_interval_millis:
+                An optional minimal interval in milliseconds between the start of the
+                failed run and the subsequent retry run.
+            retry_on_timeout:
+                An optional policy to specify whether to retry a task when it times out.
+        """
+        self.task_key = task_key
+        self.description = description
+        self.depends_on = depends_on
+        self.existing_cluster_id = existing_cluster_id
+        self.new_cluster = new_cluster
+        self.job_cluster_key = job_cluster_key
+        self.notebook_task = notebook_task
+        self.spark_jar_task = spark_jar_task
+        self.spark_python_task = spark_python_task
+        self.spark_submit_task = spark_submit_task
+        self.pipeline_task = pipeline_task
+        self.python_wheel_task = python_wheel_task
+        self.sql_task = sql_task
+        self.dbt_task = dbt_task
+        self.libraries = libraries
+        self.email_notifications = email_notifications
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
+        self.min_retry_interval_millis = min_retry_interval_millis
+        self.retry_on_timeout = retry_on_timeout
+
+
+class JobCluster(Schema):
+    """Schema of JobCluster."""
+
+    __slots__ = ("job_cluster_key", "new_cluster")
+    _objects = {"new_cluster": "NewCluster"}
+
+    def __init__(
+        self,
+        job_cluster_key: str,
+        new_cluster: Optional[NewCluster] = None,
+    ) -> None:
+        """Build a JobCluster.
+
+        Args:
+            job_cluster_key:
+                A unique name for the job cluster.
+        """
+        self.job_cluster_key = job_cluster_key
+        self.new_cluster = new_cluster
+
+
+class NotebookTask(Schema):
+    """Schema of NotebookTask."""
+
+    __slots__ = ("notebook_path", "source", "base_parameters")
+
+    def __init__(
+        self,
+        notebook_path: str,
+        source: Optional[Literal["WORKSPACE", "GIT"]] = None,
+        base_parameters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Build a NotebookTask.
+
+        Args:
+            notebook_path:
+                The path of the notebook to be run in the Azure Databricks workspace or
+                remote repository.
+            source:
+                Optional location type of the notebook.
+            base_parameters:
+                Base parameters to be used for each run of this job.
+        """
+        self.notebook_path = notebook_path
+        self.source = source
+        self.base_parameters = base_parameters
+
+
+class SparkJarTask(Schema):
+    """Schema of SparkJarTask."""
+
+    __slots__ = ("main_class_name", "parameters", "jar_uri")
+
+    def __init__(
+        self,
+        main_class_name: Optional[str] = None,
+        parameters: Optional[List[str]] = None,
+        jar_uri: Optional[str] = None,
+    ) -> None:
+        """Build a SparkJarTask.
+
+        Args:
+            main_class_name:
+                The full name of the class containing the main method to be executed.
+            parameters:
+                Parameters passed to the main method.
+            jar_uri:
+                Deprecated since 04/2016\.
+        """
+        self.main_class_name = main_class_name
+        self.parameters = parameters
+        self.jar_uri = jar_uri
+
+
+class SparkPythonTask(Schema):
+    """Schema of SparkPythonTask."""
+
+    __slots__ = ("python_file", "parameters")
+
+    def __init__(
+        self,
+        python_file: str,
+        parameters: Optional[List[str]] = None,
+    ) -> None:
+        """Build a SparkPythonTask.
+
+        Args:
+            python_file:
+                The Python file to be executed.
+            parameters:
+                Command line parameters passed to the Python file.
+        """
+        self.python_file = python_file
+        self.parameters = parameters
+
+
+class SparkSubmitTask(Schema):
+    """Schema of SparkSubmitTask."""
+
+    __slots__ = ("parameters",)
+
+    def __init__(
+        self,
+        parameters: Optional[List[str]] = None,
+    ) -> None:
+        """Build a SparkSubmitTask.
+
+        Args:
+            parameters:
+                Command-line parameters passed to spark submit.
+        """
+        self.parameters = parameters
+
+
+class PipelineTask(Schema):
+    """Schema of PipelineTask."""
+
+    __slots__ = ("pipeline_id", "full_refresh")
+
+    def __init__(
+        self,
+        pipeline_id: Optional[str] = None,
+        full_refresh: Optional[bool] = None,
+    ) -> None:
+        """Build a PipelineTask.
+
+        Args:
+            pipeline_id:
+                The full name of the pipeline task to execute.
+            full_refresh:
+                If true, a full refresh will be triggered on the delta live table.
+        """
+        self.pipeline_id = pipeline_id
+        self.full_refresh = full_refresh
+
+
+class PythonWheelTask(Schema):
+    """Schema of PythonWheelTask."""
+
+    __slots__ = ("package_name", "entry_point", "parameters", "named_parameters")
+
+    def __init__(
+        self,
+        package_name: Optional[str] = None,
+        entry_point: Optional[str] = None,
+        parameters: Optional[List[str]] = None,
+        named_parameters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Build a PythonWheelTask.
+
+        Args:
+            package_name:
+                Name of the package to execute
+            entry_point:
+                Named entry point to use, if it does not exist in the metadata of the
+                package it executes the function from the package directly using
+                `$packageName.$entryPoint()`
+            parameters:
+                Command-line parameters passed to Python wheel task.
+            named_parameters:
+                Command-line parameters passed to Python wheel task in the form of
+                `["--name=task", "--data=dbfs:/path/to/data.json"]`.
+        """
+        self.package_name = package_name
+        self.entry_point = entry_point
+        self.parameters = parameters
+        self.named_parameters = named_parameters
+
+
+class SqlTask(Schema):
+    """Schema of SqlTask."""
+
+    __slots__ = ("query", "dashboard", "alert", "parameters", "warehouse_id")
+    _objects = {
+        "query": "SqlTaskQuery",
+        "dashboard": "SqlTaskDashboard",
+        "alert": "SqlTaskAlert",
+    }
+
+    def __init__(
+        self,
+        warehouse_id: str,
+        query: Optional[SqlTaskQuery] = None,
+        dashboard: Optional[SqlTaskDashboard] = None,
+        alert: Optional[SqlTaskAlert] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Build a SqlTask.
+
+        Args:
+            warehouse_id:
+                The canonical identifier of the SQL warehouse.
+            query:
+                If query, indicates that this job must execute a SQL query.
+            dashboard:
+                If dashboard, indicates that this job must refresh a SQL dashboard.
+            alert:
+                If alert, indicates that this job must refresh a SQL alert.
+            parameters:
+                Parameters to be used for each run of this job.
+        """
+        self.query = query
+        self.dashboard = dashboard
+        self.alert = alert
+        self.parameters = parameters
+        self.warehouse_id = warehouse_id
+
+
+class SqlTaskQuery(Schema):
+    """Schema of SqlTaskQuery."""
+
+    __slots__ = ("query_id",)
+
+    def __init__(
+        self,
+        query_id: str,
+    ) -> None:
+        """Build a SqlTaskQuery.
+
+        Args:
+            query_id:
+                The canonical identifier of the SQL query.
+        """
+        self.query_id = query_id
+
+
+class SqlTaskDashboard(Schema):
+    """Schema of SqlTaskDashboard."""
+
+    __slots__ = ("dashboard_id",)
+
+    def __init__(
+        self,
+        dashboard_id: str,
+    ) -> None:
+        """Build a SqlTaskDashboard.
+
+        Args:
+            dashboard_id:
+                The canonical identifier of the SQL dashboard.
+        """
+        self.dashboard_id = dashboard_id
+
+
+class SqlTaskAlert(Schema):
+    """Schema of SqlTaskAlert."""
+
+    __slots__ = ("alert_id",)
+
+    def __init__(
+        self,
+        alert_id: str,
+    ) -> None:
+        """Build a SqlTaskAlert.
+
+        Args:
+            alert_id:
+                The canonical identifier of the SQL alert.
+        """
+        self.alert_id = alert_id
+
+
+class DbtTask(Schema):
+    """Schema of DbtTask."""
+
+    __slots__ = (
+        "project_directory",
+        "commands",
+        "schema",
+        "warehouse_id",
+        "profiles_directory",
+    )
+
+    def __init__(
+        self,
+        commands: List[Any],
+        project_directory: Optional[str] = None,
+        schema: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        profiles_directory: Optional[str] = None,
+    ) -> None:
+        """Build a DbtTask.
+
+        Args:
+            commands:
+                A list of dbt commands to execute.
+            project_directory:
+                Optional (relative) path to the project directory, if no value is
+                provided, the root of the git repository is used.
+            schema:
+                Optional schema to write to.
+            warehouse_id:
+                ID of the SQL warehouse to connect to.
+            profiles_directory:
+                Optional (relative) path to the profiles directory.
+        """
+        self.project_directory = project_directory
+        self.commands = commands
+        self.schema = schema
+        self.warehouse_id = warehouse_id
+        self.profiles_directory = profiles_directory
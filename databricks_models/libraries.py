@@ -0,0 +1,197 @@
+# Generated by codegen.py from jobs-2.1-azure.yaml, do not edit.
+
+"""Libraries and their install status."""
+
+from __future__ import annotations
+
+from typing import Any, List, Literal, Optional
+
+from schema import Schema
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the schemas of the other groups through the package."""
+    import databricks_models
+
+    return getattr(databricks_models, name)
+
+
+class ClusterLibraryStatuses(Schema):
+    """Schema of ClusterLibraryStatuses."""
+
+    __slots__ = ("cluster_id", "library_statuses")
+    _lists = {"library_statuses": "LibraryFullStatus"}
+
+    def __init__(
+        self,
+        cluster_id: Optional[str] = None,
+        library_statuses: Optional[List[LibraryFullStatus]] = None,
+    ) -> None:
+        """Build a ClusterLibraryStatuses.
+
+        Args:
+            cluster_id:
+                Unique identifier for the cluster.
+            library_statuses:
+                Status of all libraries on the cluster.
+        """
+        self.cluster_id = cluster_id
+        self.library_statuses = library_statuses
+
+
+class Library(Schema):
+    """Schema of Library."""
+
+    __slots__ = ("jar", "egg", "whl", "pypi", "maven", "cran")
+    _objects = {
+        "pypi": "PythonPyPiLibrary",
+        "maven": "MavenLibrary",
+        "cran": "RCranLibrary",
+    }
+
+    def __init__(
+        self,
+        jar: Optional[str] = None,
+        egg: Optional[str] = None,
+        whl: Optional[str] = None,
+        pypi: Optional[PythonPyPiLibrary] = None,
+        maven: Optional[MavenLibrary] = None,
+        cran: Optional[RCranLibrary] = None,
+    ) -> None:
+        """Build a Library.
+
+        Args:
+            jar:
+                If jar, URI of the JAR to be installed.
+            egg:
+                If egg, URI of the egg to be installed.
+            whl:
+                If whl, URI of the wheel or zipped wheels to be installed.
+            pypi:
+                If pypi, specification of a PyPI library to be installed.
+            maven:
+                If maven, specification of a Maven library to be installed.
+            cran:
+                If cran, specification of a CRAN library to be installed.
+        """
+        self.jar = jar
+        self.egg = egg
+        self.whl = whl
+        self.pypi = pypi
+        self.maven = maven
+        self.cran = cran
+
+
+class LibraryFullStatus(Schema):
+    """Schema of LibraryFullStatus."""
+
+    __slots__ = ("library", "status", "messages", "is_library_for_all_clusters")
+    _objects = {"library": "Library"}
+
+    def __init__(
+        self,
+        library: Optional[Library] = None,
+        status: Optional[LibraryInstallStatus] = None,
+        messages: Optional[List[str]] = None,
+        is_library_for_all_clusters: Optional[bool] = None,
+    ) -> None:
+        """Build a LibraryFullStatus.
+
+        Args:
+            library:
+                Unique identifier for the library.
+            status:
+                Status of installing the library on the cluster.
+            messages:
+                All the info and warning messages that have occurred so far for this
+                library.
+            is_library_for_all_clusters:
+                Whether the library was set to be installed on all clusters via the
+                libraries UI.
+        """
+        self.library = library
+        self.status = status
+        self.messages = messages
+        self.is_library_for_all_clusters = is_library_for_all_clusters
+
+
+class MavenLibrary(Schema):
+    """Schema of MavenLibrary."""
+
+    __slots__ = ("coordinates", "repo", "exclusions")
+
+    def __init__(
+        self,
+        coordinates: str,
+        repo: Optional[str] = None,
+        exclusions: Optional[List[str]] = None,
+    ) -> None:
+        """Build a MavenLibrary.
+
+        Args:
+            coordinates:
+                Gradle-style Maven coordinates.
+            repo:
+                Maven repo to install the Maven package from.
+            exclusions:
+                List of dependences to exclude.
+        """
+        self.coordinates = coordinates
+        self.repo = repo
+        self.exclusions = exclusions
+
+
+class PythonPyPiLibrary(Schema):
+    """Schema of PythonPyPiLibrary."""
+
+    __slots__ = ("package", "repo")
+
+    def __init__(
+        self,
+        package: str,
+        repo: Optional[str] = None,
+    ) -> None:
+        """Build a PythonPyPiLibrary.
+
+        Args:
+            package:
+                The name of the PyPI package to install.
+            repo:
+                The repository where the package can be found.
+        """
+        self.package = package
+        self.repo = repo
+
+
+class RCranLibrary(Schema):
+    """Schema of RCranLibrary."""
+
+    __slots__ = ("package", "repo")
+
+    def __init__(
+        self,
+        package: str,
+        repo: Optional[str] = None,
+    ) -> None:
+        """Build a RCranLibrary.
+
+        Args:
+            package:
+                The name of the CRAN package to install.
+            repo:
+                The repository where the package can be found.
+        """
+        self.package = package
+        self.repo = repo
+
+
+LibraryInstallStatus = Literal[
+    "PENDING",
+    "RESOLVING",
+    "INSTALLING",
+    "INSTALLED",
+    "SKIPPED",
+    "FAILED",
+    "UNINSTALL_ON_RESTART",
+]
+"""* `PENDING`: No action has yet been taken to install the library."""
@@ -0,0 +1,135 @@
+# Generated by codegen.py from jobs-2.1-azure.yaml, do not edit.
+
+"""Access control lists and permission levels."""
+
+from __future__ import annotations
+
+from typing import Any, List, Literal, Optional, Union
+
+from schema import Schema
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the schemas of the other groups through the package."""
+    import databricks_models
+
+    return getattr(databricks_models, name)
+
+
+class AccessControlList(Schema):
+    """Schema of AccessControlList."""
+
+    __slots__ = ("access_control_list",)
+
+    def __init__(
+        self,
+        access_control_list: Optional[List[AccessControlRequest]] = None,
+    ) -> None:
+        """Build a AccessControlList.
+
+        Args:
+            access_control_list:
+                List of permissions to set on the job.
+        """
+        self.access_control_list = access_control_list
+
+
+AccessControlRequest = Union[
+    "AccessControlRequestForUser",
+    "AccessControlRequestForGroup",
+    "AccessControlRequestForServicePrincipal",
+]
+
+
+class AccessControlRequestForUser(Schema):
+    """Schema of AccessControlRequestForUser."""
+
+    __slots__ = ("user_name", "permission_level")
+
+    def __init__(
+        self,
+        user_name: Optional[UserName] = None,
+        permission_level: Optional[PermissionLevel] = None,
+    ) -> None:
+        """Build a AccessControlRequestForUser.
+
+        Args:
+            user_name:
+                Email address for the user.
+            permission_level:
+                Permission level to grant.
+        """
+        self.user_name = user_name
+        self.permission_level = permission_level
+
+
+class AccessControlRequestForGroup(Schema):
+    """Schema of AccessControlRequestForGroup."""
+
+    __slots__ = ("group_name", "permission_level")
+
+    def __init__(
+        self,
+        group_name: Optional[GroupName] = None,
+        permission_level: Optional[PermissionLevelForGroup] = None,
+    ) -> None:
+        """Build a AccessControlRequestForGroup.
+
+        Args:
+            group_name:
+                Group name.
+            permission_level:
+                Permission level to grant.
+        """
+        self.group_name = group_name
+        self.permission_level = permission_level
+
+
+class AccessControlRequestForServicePrincipal(Schema):
+    """Schema of AccessControlRequestForServicePrincipal."""
+
+    __slots__ = ("service_principal_name", "permission_level")
+
+    def __init__(
+        self,
+        service_principal_name: Optional[ServicePrincipalName] = None,
+        permission_level: Optional[PermissionLevel] = None,
+    ) -> None:
+        """Build a AccessControlRequestForServicePrincipal.
+
+        Args:
+            service_principal_name:
+                Name of an Azure service principal.
+            permission_level:
+                Permission level to grant.
+        """
+        self.service_principal_name = service_principal_name
+        self.permission_level = permission_level
+
+
+UserName = str
+"""Email address for the user."""
+
+GroupName = str
+"""Group name."""
+
+ServicePrincipalName = str
+"""Name of an Azure service principal."""
+
+PermissionLevel = Union["CanManage", "CanManageRun", "CanView", "IsOwner"]
+"""Permission level to grant."""
+
+PermissionLevelForGroup = Union["CanManage", "CanManageRun", "CanView"]
+"""Permission level to grant."""
+
+CanManage = Literal["CAN_MANAGE"]
+"""Permission to manage the job."""
+
+CanManageRun = Literal["CAN_MANAGE_RUN"]
+"""Permission to run and/or manage runs for the job."""
+
+CanView = Literal["CAN_VIEW"]
+"""Permission to view the settings of the job."""
+
+IsOwner = Literal["IS_OWNER"]
+"""Perimssion that represents ownership of the job."""
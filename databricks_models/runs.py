@@ -0,0 +1,1035 @@
+# Generated by codegen.py from jobs-2.1-azure.yaml, do not edit.
+
+"""Runs, their state and their outputs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
+
+from schema import Schema
+
+if TYPE_CHECKING:
+    from databricks_models.clusters import NewCluster
+    from databricks_models.jobs import (
+        ClusterSpec,
+        CronSchedule,
+        DbtTask,
+        GitSource,
+        JobCluster,
+        NotebookTask,
+        PipelineTask,
+        PythonWheelTask,
+        SparkJarTask,
+        SparkPythonTask,
+        SparkSubmitTask,
+        SqlTask,
+        TaskDependencies,
+        TaskDescription,
+        TaskKey,
+    )
+    from databricks_models.libraries import Library
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the schemas of the other groups through the package."""
+    import databricks_models
+
+    return getattr(databricks_models, name)
+
+
+class ClusterInstance(Schema):
+    """Schema of ClusterInstance."""
+
+    __slots__ = ("cluster_id", "spark_context_id")
+
+    def __init__(
+        self,
+        cluster_id: Optional[str] = None,
+        spark_context_id: Optional[str] = None,
+    ) -> None:
+        """Build a ClusterInstance.
+
+        Args:
+            cluster_id:
+                The canonical identifier for the cluster used by a run.
+            spark_context_id:
+                The canonical identifier for the Spark context used by a run.
+        """
+        self.cluster_id = cluster_id
+        self.spark_context_id = spark_context_id
+
+
+class NotebookOutput(Schema):
+    """Schema of NotebookOutput."""
+
+    __slots__ = ("result", "truncated")
+
+    def __init__(
+        self,
+        result: Optional[str] = None,
+        truncated: Optional[bool] = None,
+    ) -> None:
+        """Build a NotebookOutput.
+
+        Args:
+            result:
+                The value passed to
+                [dbutils.notebook.exit()](https://docs.microsoft.com/azure/databricks/notebooks/notebook-workflows#notebook-workflows-exit).
+            truncated:
+                Whether or not the result was truncated.
+        """
+        self.result = result
+        self.truncated = truncated
+
+
+class RunTask(Schema):
+    """Schema of RunTask."""
+
+    __slots__ = (
+        "run_id",
+        "task_key",
+        "description",
+        "state",
+        "depends_on",
+        "existing_cluster_id",
+        "new_cluster",
+        "libraries",
+        "notebook_task",
+        "spark_jar_task",
+        "spark_python_task",
+        "spark_submit_task",
+        "pipeline_task",
+        "python_wheel_task",
+        "sql_task",
+        "dbt_task",
+        "start_time",
+        "setup_duration",
+        "execution_duration",
+        "cleanup_duration",
+        "end_time",
+        "attempt_number",
+        "cluster_instance",
+        "git_source",
+    )
+    _objects = {
+        "state": "RunState",
+        "new_cluster": "NewCluster",
+        "notebook_task": "NotebookTask",
+        "spark_jar_task": "SparkJarTask",
+        "spark_python_task": "SparkPythonTask",
+        "spark_submit_task": "SparkSubmitTask",
+        "pipeline_task": "PipelineTask",
+        "python_wheel_task": "PythonWheelTask",
+        "sql_task": "SqlTask",
+        "dbt_task": "DbtTask",
+        "cluster_instance": "ClusterInstance",
+        "git_source": "GitSource",
+    }
+    _lists = {"depends_on": "TaskDependency", "libraries": "Library"}
+
+    def __init__(
+        self,
+        run_id: Optional[int] = None,
+        task_key: Optional[TaskKey] = None,
+        description: Optional[TaskDescription] = None,
+        state: Optional[RunState] = None,
+        depends_on: Optional[TaskDependencies] = None,
+        existing_cluster_id: Optional[str] = None,
+        new_cluster: Optional[NewCluster] = None,
+        libraries: Optional[List[Library]] = None,
+        notebook_task: Optional[NotebookTask] = None,
+        spark_jar_task: Optional[SparkJarTask] = None,
+        spark_python_task: Optional[SparkPythonTask] = None,
+        spark_submit_task: Optional[SparkSubmitTask] = None,
+        pipeline_task: Optional[PipelineTask] = None,
+        python_wheel_task: Optional[PythonWheelTask] = None,
+        sql_task: Optional[SqlTask] = None,
+        dbt_task: Optional[DbtTask] = None,
+        start_time: Optional[int] = None,
+        setup_duration: Optional[int] = None,
+        execution_duration: Optional[int] = None,
+        cleanup_duration: Optional[int] = None,
+        end_time: Optional[int] = None,
+        attempt_number: Optional[int] = None,
+        cluster_instance: Optional[ClusterInstance] = None,
+        git_source: Optional[GitSource] = None,
+    ) -> None:
+        """Build a RunTask.
+
+        Args:
+            run_id:
+                The ID of the task run.
+            task_key:
+                A unique name for the task.
+            description:
+                An optional description for this task.
+            state:
+                The result and lifecycle states of the run.
+            depends_on:
+                An optional array of objects specifying the dependency graph of the
+                task.
+            existing_cluster_id:
+                If existing_cluster_id, the ID of an existing cluster that is used for
+                all runs of this job.
+            new_cluster:
+                If new_cluster, a description of a cluster that is created for each run.
+            libraries:
+                An optional list of libraries to be installed on the cluster that
+                executes the job.
+            notebook_task:
+                If notebook_task, indicates that this job must run a notebook.
+            spark_jar_task:
+                If spark_jar_task, indicates that this job must run a JAR.
+            spark_python_task:
+                If spark_python_task, indicates that this job must run a Python file.
+            spark_submit_task:
+                If spark_submit_task, indicates that this job must be launched by the
+                spark submit script.
+            pipeline_task:
+                If pipeline_task, indicates that this job must execute a Pipeline.
+            python_wheel_task:
+                If python_wheel_task, indicates that this job must execute a
+                PythonWheel.
+            sql_task:
+                If sql_task, indicates that this job must execute a SQL task.
+            dbt_task:
+                If dbt_task, indicates that this must execute a dbt task.
+            start_time:
+                The time at which this run was started in epoch milliseconds
+                (milliseconds since 1/1/1970 UTC).
+            setup_duration:
+                The time it took to set up the cluster in milliseconds.
+            execution_duration:
+                The time in milliseconds it took to execute the commands in the JAR or
+                notebook until they completed, failed, timed out, were cancelled, or
+                encountered an unexpected error.
+            cleanup_duration:
+                The time in milliseconds it took to terminate the cluster and clean up
+                any associated artifacts.
+            end_time:
+                The time at which this run ended in epoch milliseconds (milliseconds
+                since 1/1/1970 UTC).
+            attempt_number:
+                The sequence number of this run attempt for a triggered job run.
+            cluster_instance:
+                The cluster used for this run.
+            git_source:
+                This functionality is in Public Preview.
+        """
+        self.run_id = run_id
+        self.task_key = task_key
+        self.description = description
+        self.state = state
+        self.depends_on = depends_on
+        self.existing_cluster_id = existing_cluster_id
+        self.new_cluster = new_cluster
+        self.libraries = libraries
+        self.notebook_task = notebook_task
+        self.spark_jar_task = spark_jar_task
+        self.spark_python_task = spark_python_task
+        self.spark_submit_task = spark_submit_task
+        self.pipeline_task = pipeline_task
+        self.python_wheel_task = python_wheel_task
+        self.sql_task = sql_task
+        self.dbt_task = dbt_task
+        self.start_time = start_time
+        self.setup_duration = setup_duration
+        self.execution_duration = execution_duration
+        self.cleanup_duration = cleanup_duration
+        self.end_time = end_time
+        self.attempt_number = attempt_number
+        self.cluster_instance = cluster_instance
+        self.git_source = git_source
+
+
+class Run(Schema):
+    """Schema of Run."""
+
+    __slots__ = (
+        "job_id",
+        "run_id",
+        "number_in_job",
+        "creator_user_name",
+        "original_attempt_run_id",
+        "state",
+        "schedule",
+        "tasks",
+        "job_clusters",
+        "cluster_spec",
+        "cluster_instance",
+        "git_source",
+        "overriding_parameters",
+        "start_time",
+        "setup_duration",
+        "execution_duration",
+        "cleanup_duration",
+        "end_time",
+        "trigger",
+        "run_name",
+        "run_page_url",
+        "run_type",
+        "attempt_number",
+    )
+    _objects = {
+        "state": "RunState",
+        "schedule": "CronSchedule",
+        "cluster_spec": "ClusterSpec",
+        "cluster_instance": "ClusterInstance",
+        "git_source": "GitSource",
+        "overriding_parameters": "RunParameters",
+    }
+    _lists = {"tasks": "RunTask", "job_clusters": "JobCluster"}
+
+    def __init__(
+        self,
+        job_id: Optional[int] = None,
+        run_id: Optional[int] = None,
+        number_in_job: Optional[int] = None,
+        creator_user_name: Optional[str] = None,
+        original_attempt_run_id: Optional[int] = None,
+        state: Optional[RunState] = None,
+        schedule: Optional[CronSchedule] = None,
+        tasks: Optional[List[RunTask]] = None,
+        job_clusters: Optional[List[JobCluster]] = None,
+        cluster_spec: Optional[ClusterSpec] = None,
+        cluster_instance: Optional[ClusterInstance] = None,
+        git_source: Optional[GitSource] = None,
+        overriding_parameters: Optional[RunParameters] = None,
+        start_time: Optional[int] = None,
+        setup_duration: Optional[int] = None,
+        execution_duration: Optional[int] = None,
+        cleanup_duration: Optional[int] = None,
+        end_time: Optional[int] = None,
+        trigger: Optional[TriggerType] = None,
+        run_name: Optional[str] = None,
+        run_page_url: Optional[str] = None,
+        run_type: Optional[RunType] = None,
+        attempt_number: Optional[int] = None,
+    ) -> None:
+        """Build a Run.
+
+        Args:
+            job_id:
+                The canonical identifier of the job that contains this run.
+            run_id:
+                The canonical identifier of the run.
+            number_in_job:
+                A unique identifier for this job run.
+            creator_user_name:
+                The creator user name.
+            original_attempt_run_id:
+                If this run is a retry of a prior run attempt, this field contains the
+                run_id of the original attempt; otherwise, it is the same as the run_id.
+            state:
+                The result and lifecycle states of the run.
+            schedule:
+                The cron schedule that triggered this run if it was triggered by the
+                periodic scheduler.
+            tasks:
+                The list of tasks performed by the run.
+            job_clusters:
+                A list of job cluster specifications that can be shared and reused by
+                tasks of this job.
+            cluster_spec:
+                A snapshot of the job’s cluster specification when this run was created.
+            cluster_instance:
+                The cluster used for this run.
+            git_source:
+                This functionality is in Public Preview.
+            overriding_parameters:
+                The parameters used for this run.
+            start_time:
+                The time at which this run was started in epoch milliseconds
+                (milliseconds since 1/1/1970 UTC).
+            setup_duration:
+                The time it took to set up the cluster in milliseconds.
+            execution_duration:
+                The time in milliseconds it took to execute the commands in the JAR or
+                notebook until they completed, failed, timed out, were cancelled, or
+                encountered an unexpected error.
+            cleanup_duration:
+                The time in milliseconds it took to terminate the cluster and clean up
+                any associated artifacts.
+            end_time:
+                The time at which this run ended in epoch milliseconds (milliseconds
+                since 1/1/1970 UTC).
+            trigger:
+                The type of trigger that fired this run.
+            run_name:
+                An optional name for the run.
+            run_page_url:
+                The URL to the detail page of the run.
+            run_type:
+                The type of the run.
+            attempt_number:
+                The sequence number of this run attempt for a triggered job run.
+        """
+        self.job_id = job_id
+        self.run_id = run_id
+        self.number_in_job = number_in_job
+        self.creator_user_name = creator_user_name
+        self.original_attempt_run_id = original_attempt_run_id
+        self.state = state
+        self.schedule = schedule
+        self.tasks = tasks
+        self.job_clusters = job_clusters
+        self.cluster_spec = cluster_spec
+        self.cluster_instance = cluster_instance
+        self.git_source = git_source
+        self.overriding_parameters = overriding_parameters
+        self.start_time = start_time
+        self.setup_duration = setup_duration
+        self.execution_duration = execution_duration
+        self.cleanup_duration = cleanup_duration
+        self.end_time = end_time
+        self.trigger = trigger
+        self.run_name = run_name
+        self.run_page_url = run_page_url
+        self.run_type = run_type
+        self.attempt_number = attempt_number
+
+
+RunType = Literal["JOB_RUN", "WORKFLOW_RUN", "SUBMIT_RUN"]
+"""The type of the run."""
+
+
+class RunParametersPipelineParams(Schema):
+    """Schema of RunParametersPipelineParams."""
+
+    __slots__ = ("full_refresh",)
+
+    def __init__(
+        self,
+        full_refresh: Optional[bool] = None,
+    ) -> None:
+        """Build a RunParametersPipelineParams.
+
+        Args:
+            full_refresh:
+                If true, triggers a full refresh on the delta live table.
+        """
+        self.full_refresh = full_refresh
+
+
+class RunParameters(Schema):
+    """Schema of RunParameters."""
+
+    __slots__ = (
+        "jar_params",
+        "notebook_params",
+        "python_params",
+        "spark_submit_params",
+        "python_named_params",
+        "pipeline_params",
+        "sql_params",
+        "dbt_commands",
+    )
+    _objects = {"pipeline_params": "RunParametersPipelineParams"}
+
+    def __init__(
+        self,
+        jar_params: Optional[List[str]] = None,
+        notebook_params: Optional[Dict[str, Any]] = None,
+        python_params: Optional[List[str]] = None,
+        spark_submit_params: Optional[List[str]] = None,
+        python_named_params: Optional[Dict[str, Any]] = None,
+        pipeline_params: Optional[RunParametersPipelineParams] = None,
+        sql_params: Optional[Dict[str, Any]] = None,
+        dbt_commands: Optional[List[Any]] = None,
+    ) -> None:
+        """Build a RunParameters.
+
+        Args:
+            jar_params:
+                A list of parameters for jobs with Spark JAR tasks, for example
+                `"jar_params": ["john doe", "35"]`.
+            notebook_params:
+                A map from keys to values for jobs with notebook task, for example
+                `"notebook_params": {"name": "john doe", "age": "35"}`.
+            python_params:
+                A list of parameters for jobs with Python tasks, for example
+                `"python_params": ["john doe", "35"]`.
+            spark_submit_params:
+                A list of parameters for jobs with spark submit task, for example
+                `"spark_submit_params": ["--class",
+                "org.apache.spark.examples.SparkPi"]`.
+            python_named_params:
+                A map from keys to values for jobs with Python wheel task, for example
+                `"python_named_params": {"name": "task", "data":
+                "dbfs:/path/to/data.json"}`.
+            sql_params:
+                A map from keys to values for SQL tasks, for example `"sql_params":
+                {"name": "john doe", "age": "35"}`.
+            dbt_commands:
+                An array of commands to execute for jobs with the dbt task, for example
+                `"dbt_commands": ["dbt deps", "dbt seed", "dbt run"]`
+        """
+        self.jar_params = jar_params
+        self.notebook_params = notebook_params
+        self.python_params = python_params
+        self.spark_submit_params = spark_submit_params
+        self.python_named_params = python_named_params
+        self.pipeline_params = pipeline_params
+        self.sql_params = sql_params
+        self.dbt_commands = dbt_commands
+
+
+class RunState(Schema):
+    """Schema of RunState.
+
+    The result and lifecycle state of the run.
+    """
+
+    __slots__ = (
+        "life_cycle_state",
+        "result_state",
+        "user_cancelled_or_timedout",
+        "state_message",
+    )
+
+    def __init__(
+        self,
+        life_cycle_state: Optional[RunLifeCycleState] = None,
+        result_state: Optional[RunResultState] = None,
+        user_cancelled_or_timedout: Optional[bool] = None,
+        state_message: Optional[str] = None,
+    ) -> None:
+        """Build a RunState.
+
+        Args:
+            life_cycle_state:
+                A description of a run’s current location in the run lifecycle.
+            result_state:
+                * `SUCCESS`: The task completed successfully.
+            user_cancelled_or_timedout:
+                Whether a run was canceled manually by a user or by the scheduler
+                because the run timed out.
+            state_message:
+                A descriptive message for the current state.
+        """
+        self.life_cycle_state = life_cycle_state
+        self.result_state = result_state
+        self.user_cancelled_or_timedout = user_cancelled_or_timedout
+        self.state_message = state_message
+
+
+class SqlOutput(Schema):
+    """Schema of SqlOutput."""
+
+    __slots__ = ("query_output", "dashboard_output", "alert_output")
+    _objects = {
+        "query_output": "SqlQueryOutput",
+        "dashboard_output": "SqlDashboardOutput",
+        "alert_output": "SqlAlertOutput",
+    }
+
+    def __init__(
+        self,
+        query_output: Optional[SqlQueryOutput] = None,
+        dashboard_output: Optional[SqlDashboardOutput] = None,
+        alert_output: Optional[SqlAlertOutput] = None,
+    ) -> None:
+        """Build a SqlOutput.
+
+        Args:
+            query_output:
+                The output of a SQL query task, if available.
+            dashboard_output:
+                The output of a SQL dashboard task, if available.
+            alert_output:
+                The output of a SQL alert task, if available.
+        """
+        self.query_output = query_output
+        self.dashboard_output = dashboard_output
+        self.alert_output = alert_output
+
+
+class SqlQueryOutput(Schema):
+    """Schema of SqlQueryOutput."""
+
+    __slots__ = ("query_text", "warehouse_id", "sql_statements", "output_link")
+    _objects = {"sql_statements": "SqlStatementOutput"}
+
+    def __init__(
+        self,
+        query_text: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        sql_statements: Optional[SqlStatementOutput] = None,
+        output_link: Optional[str] = None,
+    ) -> None:
+        """Build a SqlQueryOutput.
+
+        Args:
+            query_text:
+                The text of the SQL query.
+            warehouse_id:
+                The canonical identifier of the SQL warehouse.
+            sql_statements:
+                Information about SQL statements executed in the run.
+            output_link:
+                The link to find the output results.
+        """
+        self.query_text = query_text
+        self.warehouse_id = warehouse_id
+        self.sql_statements = sql_statements
+        self.output_link = output_link
+
+
+class SqlDashboardOutput(Schema):
+    """Schema of SqlDashboardOutput."""
+
+    __slots__ = ("widgets",)
+    _objects = {"widgets": "SqlDashboardWidgetOutput"}
+
+    def __init__(
+        self,
+        widgets: Optional[SqlDashboardWidgetOutput] = None,
+    ) -> None:
+        """Build a SqlDashboardOutput.
+
+        Args:
+            widgets:
+                Widgets executed in the run.
+        """
+        self.widgets = widgets
+
+
+class SqlAlertOutput(Schema):
+    """Schema of SqlAlertOutput."""
+
+    __slots__ = ("query_text", "warehouse_id", "sql_statements", "output_link")
+    _objects = {"sql_statements": "SqlStatementOutput"}
+
+    def __init__(
+        self,
+        query_text: Optional[str] = None,
+        warehouse_id: Optional[str] = None,
+        sql_statements: Optional[SqlStatementOutput] = None,
+        output_link: Optional[str] = None,
+    ) -> None:
+        """Build a SqlAlertOutput.
+
+        Args:
+            query_text:
+                The text of the SQL query.
+            warehouse_id:
+                The canonical identifier of the SQL warehouse.
+            sql_statements:
+                Information about SQL statements executed in the run.
+            output_link:
+                The link to find the output results.
+        """
+        self.query_text = query_text
+        self.warehouse_id = warehouse_id
+        self.sql_statements = sql_statements
+        self.output_link = output_link
+
+
+class SqlStatementOutput(Schema):
+    """Schema of SqlStatementOutput."""
+
+    __slots__ = ("lookup_key",)
+
+    def __init__(
+        self,
+        lookup_key: Optional[str] = None,
+    ) -> None:
+        """Build a SqlStatementOutput.
+
+        Args:
+            lookup_key:
+                A key that can be used to look up query details.
+        """
+        self.lookup_key = lookup_key
+
+
+class SqlDashboardWidgetOutput(Schema):
+    """Schema of SqlDashboardWidgetOutput."""
+
+    __slots__ = (
+        "widget_id",
+        "widget_title",
+        "output_link",
+        "status",
+        "error",
+        "start_time",
+        "end_time",
+    )
+    _objects = {"error": "SqlOutputError"}
+
+    def __init__(
+        self,
+        widget_id: Optional[str] = None,
+        widget_title: Optional[str] = None,
+        output_link: Optional[str] = None,
+        status: Optional[
+            Literal["PENDING", "RUNNING", "SUCCESS", "FAILED", "CANCELLED"]
+        ] = None,
+        error: Optional[SqlOutputError] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> None:
+        """Build a SqlDashboardWidgetOutput.
+
+        Args:
+            widget_id:
+                The canonical identifier of the SQL widget.
+            widget_title:
+                The title of the SQL widget.
+            output_link:
+                The link to find the output results.
+            status:
+                The execution status of the SQL widget.
+            error:
+                The information about the error when execution fails.
+            start_time:
+                Time (in epoch milliseconds) when execution of the SQL widget starts.
+            end_time:
+                Time (in epoch milliseconds) when execution of the SQL widget ends.
+        """
+        self.widget_id = widget_id
+        self.widget_title = widget_title
+        self.output_link = output_link
+        self.status = status
+        self.error = error
+        self.start_time = start_time
+        self.end_time = end_time
+
+
+class SqlOutputError(Schema):
+    """Schema of SqlOutputError."""
+
+    __slots__ = ("message",)
+
+    def __init__(
+        self,
+        message: Optional[str] = None,
+    ) -> None:
+        """Build a SqlOutputError.
+
+        Args:
+            message:
+                The error message when execution fails.
+        """
+        self.message = message
+
+
+class DbtOutput(Schema):
+    """Schema of DbtOutput."""
+
+    __slots__ = ("artifacts_link", "artifacts_headers")
+
+    def __init__(
+        self,
+        artifacts_link: Optional[str] = None,
+        artifacts_headers: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Build a DbtOutput.
+
+        Args:
+            artifacts_link:
+                A pre-signed URL to download the (compressed) dbt artifacts.
+            artifacts_headers:
+                An optional map of headers to send when retrieving the artifact from the
+                `artifacts_link`.
+        """
+        self.artifacts_link = artifacts_link
+        self.artifacts_headers = artifacts_headers
+
+
+class ViewItem(Schema):
+    """Schema of ViewItem."""
+
+    __slots__ = ("content", "name", "type")
+
+    def __init__(
+        self,
+        content: Optional[str] = None,
+        name: Optional[str] = None,
+        type: Optional[ViewType] = None,
+    ) -> None:
+        """Build a ViewItem.
+
+        Args:
+            content:
+                Content of the view.
+            name:
+                Name of the view item.
+            type:
+                Type of the view item.
+        """
+        self.content = content
+        self.name = name
+        self.type = type
+
+
+RunLifeCycleState = Literal[
+    "TERMINATED", "PENDING", "RUNNING", "TERMINATING", "SKIPPED", "INTERNAL_ERROR"
+]
+"""* `PENDING`: The run has been triggered."""
+
+RunResultState = Literal["SUCCESS", "FAILED", "TIMEDOUT", "CANCELED"]
+"""* `SUCCESS`: The task completed successfully."""
+
+TriggerType = Literal["PERIODIC", "ONE_TIME", "RETRY"]
+"""* `PERIODIC`: Schedules that periodically trigger runs, such as a cron scheduler."""
+
+ViewType = Literal["NOTEBOOK", "DASHBOARD"]
+"""* `NOTEBOOK`: Notebook view item."""
+
+ViewsToExport = Literal["CODE", "DASHBOARDS", "ALL"]
+"""* `CODE`: Code view of the notebook."""
+
+
+class RunSubmitTaskSettings(Schema):
+    """Schema of RunSubmitTaskSettings."""
+
+    __slots__ = (
+        "task_key",
+        "depends_on",
+        "existing_cluster_id",
+        "new_cluster",
+        "notebook_task",
+        "spark_jar_task",
+        "spark_python_task",
+        "spark_submit_task",
+        "pipeline_task",
+        "python_wheel_task",
+        "sql_task",
+        "dbt_task",
+        "libraries",
+        "timeout_seconds",
+    )
+    _objects = {
+        "new_cluster": "NewCluster",
+        "notebook_task": "NotebookTask",
+        "spark_jar_task": "SparkJarTask",
+        "spark_python_task": "SparkPythonTask",
+        "spark_submit_task": "SparkSubmitTask",
+        "pipeline_task": "PipelineTask",
+        "python_wheel_task": "PythonWheelTask",
+        "sql_task": "SqlTask",
+        "dbt_task": "DbtTask",
+    }
+    _lists = {"depends_on": "TaskDependency", "libraries": "Library"}
+
+    def __init__(
+        self,
+        task_key: TaskKey,
+        depends_on: Optional[TaskDependencies] = None,
+        existing_cluster_id: Optional[str] = None,
+        new_cluster: Optional[NewCluster] = None,
+        notebook_task: Optional[NotebookTask] = None,
+        spark_jar_task: Optional[SparkJarTask] = None,
+        spark_python_task: Optional[SparkPythonTask] = None,
+        spark_submit_task: Optional[SparkSubmitTask] = None,
+        pipeline_task: Optional[PipelineTask] = None,
+        python_wheel_task: Optional[PythonWheelTask] = None,
+        sql_task: Optional[SqlTask] = None,
+        dbt_task: Optional[DbtTask] = None,
+        libraries: Optional[List[Library]] = None,
+        timeout_seconds: Optional[int] = None,
+    ) -> None:
+        """Build a RunSubmitTaskSettings.
+
+        Args:
+            task_key:
+                A unique name for the task.
+            depends_on:
+                An optional array of objects specifying the dependency graph of the
+                task.
+            existing_cluster_id:
+                If existing_cluster_id, the ID of an existing cluster that is used for
+                all runs of this task.
+            new_cluster:
+                If new_cluster, a description of a cluster that is created for each run.
+            notebook_task:
+                If notebook_task, indicates that this task must run a notebook.
+            spark_jar_task:
+                If spark_jar_task, indicates that this task must run a JAR.
+            spark_python_task:
+                If spark_python_task, indicates that this task must run a Python file.
+            spark_submit_task:
+                If spark_submit_task, indicates that this task must be launched by the
+                spark submit script.
+            pipeline_task:
+                If pipeline_task, indicates that this task must execute a Pipeline.
+            python_wheel_task:
+                If python_wheel_task, indicates that this job must execute a
+                PythonWheel.
+            sql_task:
+                If sql_task, indicates that this job must execute a SQL task.
+            dbt_task:
+                If dbt_task, indicates that this must execute a dbt task.
+            libraries:
+                An optional list of libraries to be installed on the cluster that
+                executes the task.
+            timeout_seconds:
+                An optional timeout applied to each run of this job task.
+        """
+        self.task_key = task_key
+        self.depends_on = depends_on
+        self.existing_cluster_id = existing_cluster_id
+        self.new_cluster = new_cluster
+        self.notebook_task = notebook_task
+        self.spark_jar_task = spark_jar_task
+        self.spark_python_task = spark_python_task
+        self.spark_submit_task = spark_submit_task
+        self.pipeline_task = pipeline_task
+        self.python_wheel_task = python_wheel_task
+        self.sql_task = sql_task
+        self.dbt_task = dbt_task
+        self.libraries = libraries
+        self.timeout_seconds = timeout_seconds
+
+
+class RunSubmitSettings(Schema):
+    """Schema of RunSubmitSettings."""
+
+    __slots__ = (
+        "tasks",
+        "run_name",
+        "git_source",
+        "timeout_seconds",
+        "idempotency_token",
+    )
+    _objects = {"git_source": "GitSource"}
+    _lists = {"tasks": "RunSubmitTaskSettings"}
+
+    def __init__(
+        self,
+        tasks: Optional[List[RunSubmitTaskSettings]] = None,
+        run_name: Optional[str] = None,
+        git_source: Optional[GitSource] = None,
+        timeout_seconds: Optional[int] = None,
+        idempotency_token: Optional[str] = None,
+    ) -> None:
+        """Build a RunSubmitSettings.
+
+        Args:
+            run_name:
+                An optional name for the run.
+            git_source:
+                This functionality is in Public Preview.
+            timeout_seconds:
+                An optional timeout applied to each run of this job.
+            idempotency_token:
+                An optional token that can be used to guarantee the idempotency of job
+                run requests.
+        """
+        self.tasks = tasks
+        self.run_name = run_name
+        self.git_source = git_source
+        self.timeout_seconds = timeout_seconds
+        self.idempotency_token = idempotency_token
+
+
+class RunNowInput(Schema):
+    """Schema of RunNowInput."""
+
+    __slots__ = ("job_id", "idempotency_token")
+
+    def __init__(
+        self,
+        job_id: Optional[int] = None,
+        idempotency_token: Optional[str] = None,
+    ) -> None:
+        """Build a RunNowInput.
+
+        Args:
+            job_id:
+                The ID of the job to be executed
+            idempotency_token:
+                An optional token to guarantee the idempotency of job run requests.
+        """
+        self.job_id = job_id
+        self.idempotency_token = idempotency_token
+
+
+class RepairRunInput(Schema):
+    """Schema of RepairRunInput."""
+
+    __slots__ = ("run_id", "rerun_tasks", "latest_repair_id", "rerun_all_failed_tasks")
+
+    def __init__(
+        self,
+        run_id: Optional[int] = None,
+        rerun_tasks: Optional[List[str]] = None,
+        latest_repair_id: Optional[int] = None,
+        rerun_all_failed_tasks: Optional[bool] = None,
+    ) -> None:
+        """Build a RepairRunInput.
+
+        Args:
+            run_id:
+                The job run ID of the run to repair.
+            rerun_tasks:
+                The task keys of the task runs to repair.
+            latest_repair_id:
+                The ID of the latest repair.
+            rerun_all_failed_tasks:
+                If true, repair all failed tasks.
+        """
+        self.run_id = run_id
+        self.rerun_tasks = rerun_tasks
+        self.latest_repair_id = latest_repair_id
+        self.rerun_all_failed_tasks = rerun_all_failed_tasks
+
+
+class RepairHistory(Schema):
+    """Schema of RepairHistory."""
+
+    __slots__ = ("repair_history",)
+    _lists = {"repair_history": "RepairHistoryItem"}
+
+    def __init__(
+        self,
+        repair_history: Optional[List[RepairHistoryItem]] = None,
+    ) -> None:
+        """Build a RepairHistory.
+
+        Args:
+            repair_history:
+                The repair history of the run.
+        """
+        self.repair_history = repair_history
+
+
+class RepairHistoryItem(Schema):
+    """Schema of RepairHistoryItem."""
+
+    __slots__ = ("type", "start_time", "end_time", "state", "id", "task_run_ids")
+    _objects = {"state": "RunState"}
+
+    def __init__(
+        self,
+        type: Optional[Literal["ORIGINAL", "REPAIR"]] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        state: Optional[RunState] = None,
+        id: Optional[int] = None,
+        task_run_ids: Optional[List[int]] = None,
+    ) -> None:
+        """Build a RepairHistoryItem.
+
+        Args:
+            type:
+                The repair history item type.
+            start_time:
+                The start time of the (repaired) run.
+            end_time:
+                The end time of the (repaired) run.
+            state:
+                The result and lifecycle state of the run.
+            id:
+                The ID of the repair.
+            task_run_ids:
+                The run IDs of the task runs that ran as part of this repair history
+                item.
+        """
+        self.type = type
+        self.start_time = start_time
+        self.end_time = end_time
+        self.state = state
+        self.id = id
+        self.task_run_ids = task_run_ids
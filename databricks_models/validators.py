@@ -0,0 +1,1099 @@
+# Generated by codegen.py from jobs-2.1-azure.yaml, do not edit.
+
+
+"""Check payloads against the schemas, before sending them.
+
+The schemas are compiled into plain functions by ``codegen.py``, every
+error of a payload is returned with its JSON path::
+
+    errors = validate_job_settings(payload)
+    # ["$.tasks[3].task_key: is required", ...]
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+_ENUM_0 = ("SINGLE_TASK", "MULTI_TASK")
+_PATTERN_0 = re.compile("^[\\w\\-]+$")
+_ENUM_1 = ("PAUSED", "UNPAUSED")
+_ENUM_2 = (
+    "gitHub",
+    "bitbucketCloud",
+    "azureDevOpsServices",
+    "gitHubEnterprise",
+    "bitbucketServer",
+    "gitLab",
+    "gitLabEnterpriseEdition",
+    "awsCodeCommit",
+)
+_ENUM_3 = ("SPOT_AZURE", "ON_DEMAND_AZURE", "SPOT_WITH_FALLBACK_AZURE")
+_ENUM_4 = ("WORKSPACE", "GIT")
+
+
+def _check_JobSettings(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("name")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.name: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("tags")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.tags: expected an object")
+        v1 = value.get("tasks")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.tasks: expected an array")
+            else:
+                if len(v1) > 100:
+                    errors.append(f"{path}.tasks: more than 100 items, {len(v1)}")
+                for i3, v3 in enumerate(v1):
+                    _check_JobTaskSettings(v3, f"{path}.tasks[{i3}]", errors)
+        v1 = value.get("job_clusters")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.job_clusters: expected an array")
+            else:
+                if len(v1) > 100:
+                    errors.append(
+                        f"{path}.job_clusters: more than 100 items, {len(v1)}"
+                    )
+                for i3, v3 in enumerate(v1):
+                    _check_JobCluster(v3, f"{path}.job_clusters[{i3}]", errors)
+        v1 = value.get("email_notifications")
+        if v1 is not None:
+            _check_JobEmailNotifications(v1, f"{path}.email_notifications", errors)
+        v1 = value.get("timeout_seconds")
+        if v1 is not None:
+            if type(v1) is not int:
+                errors.append(
+                    f"{path}.timeout_seconds: expected an integer, not {type(v1).__name__}"
+                )
+            elif not -2147483648 <= v1 <= 2147483647:
+                errors.append(f"{path}.timeout_seconds: out of the int32 range")
+        v1 = value.get("schedule")
+        if v1 is not None:
+            _check_CronSchedule(v1, f"{path}.schedule", errors)
+        v1 = value.get("max_concurrent_runs")
+        if v1 is not None:
+            if type(v1) is not int:
+                errors.append(
+                    f"{path}.max_concurrent_runs: expected an integer, not {type(v1).__name__}"
+                )
+            elif not -2147483648 <= v1 <= 2147483647:
+                errors.append(f"{path}.max_concurrent_runs: out of the int32 range")
+        v1 = value.get("git_source")
+        if v1 is not None:
+            _check_GitSource(v1, f"{path}.git_source", errors)
+        v1 = value.get("format")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.format: expected a string, not {type(v1).__name__}"
+                )
+            elif v1 not in _ENUM_0:
+                errors.append(f"{path}.format: {v1!r} is not one of {_ENUM_0}")
+
+
+def _check_NewCluster(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("num_workers")
+        if v1 is not None:
+            if type(v1) is not int:
+                errors.append(
+                    f"{path}.num_workers: expected an integer, not {type(v1).__name__}"
+                )
+            elif not -2147483648 <= v1 <= 2147483647:
+                errors.append(f"{path}.num_workers: out of the int32 range")
+        v1 = value.get("autoscale")
+        if v1 is not None:
+            _check_AutoScale(v1, f"{path}.autoscale", errors)
+        v1 = value.get("spark_version")
+        if v1 is None:
+            errors.append(f"{path}.spark_version: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.spark_version: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("spark_conf")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.spark_conf: expected an object")
+        v1 = value.get("azure_attributes")
+        if v1 is not None:
+            _check_AzureAttributes(v1, f"{path}.azure_attributes", errors)
+        v1 = value.get("node_type_id")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.node_type_id: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("driver_node_type_id")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.driver_node_type_id: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("custom_tags")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.custom_tags: expected an object")
+            else:
+                for k3, v3 in v1.items():
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.custom_tags[{k3!r}]: expected a string, not {type(v3).__name__}"
+                        )
+        v1 = value.get("cluster_log_conf")
+        if v1 is not None:
+            _check_ClusterLogConf(v1, f"{path}.cluster_log_conf", errors)
+        v1 = value.get("init_scripts")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.init_scripts: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    _check_InitScriptInfo(v3, f"{path}.init_scripts[{i3}]", errors)
+        v1 = value.get("spark_env_vars")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.spark_env_vars: expected an object")
+        v1 = value.get("enable_elastic_disk")
+        if v1 is not None:
+            if type(v1) is not bool:
+                errors.append(
+                    f"{path}.enable_elastic_disk: expected a boolean, not {type(v1).__name__}"
+                )
+        v1 = value.get("instance_pool_id")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.instance_pool_id: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("policy_id")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.policy_id: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_JobsRunNowRequest(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("job_id")
+        if v1 is not None:
+            if type(v1) is not int:
+                errors.append(
+                    f"{path}.job_id: expected an integer, not {type(v1).__name__}"
+                )
+            elif not -9223372036854775808 <= v1 <= 9223372036854775807:
+                errors.append(f"{path}.job_id: out of the int64 range")
+        v1 = value.get("idempotency_token")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.idempotency_token: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("jar_params")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.jar_params: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.jar_params[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+        v1 = value.get("notebook_params")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.notebook_params: expected an object")
+        v1 = value.get("python_params")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.python_params: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.python_params[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+        v1 = value.get("spark_submit_params")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.spark_submit_params: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.spark_submit_params[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+        v1 = value.get("python_named_params")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.python_named_params: expected an object")
+        v1 = value.get("pipeline_params")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.pipeline_params: expected an object")
+            else:
+                v3 = v1.get("full_refresh")
+                if v3 is not None:
+                    if type(v3) is not bool:
+                        errors.append(
+                            f"{path}.pipeline_params.full_refresh: expected a boolean, not {type(v3).__name__}"
+                        )
+        v1 = value.get("sql_params")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.sql_params: expected an object")
+        v1 = value.get("dbt_commands")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.dbt_commands: expected an array")
+
+
+def _check_JobTaskSettings(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("task_key")
+        if v1 is None:
+            errors.append(f"{path}.task_key: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.task_key: expected a string, not {type(v1).__name__}"
+                )
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{path}.task_key: shorter than 1 characters")
+                if len(v1) > 100:
+                    errors.append(f"{path}.task_key: longer than 100 characters")
+                if _PATTERN_0.search(v1) is None:
+                    errors.append(
+                        f"{path}.task_key: {v1!r} does not match {_PATTERN_0.pattern}"
+                    )
+        v1 = value.get("description")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.description: expected a string, not {type(v1).__name__}"
+                )
+            elif len(v1) > 4096:
+                errors.append(f"{path}.description: longer than 4096 characters")
+        v1 = value.get("depends_on")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.depends_on: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, dict):
+                        errors.append(f"{path}.depends_on[{i3}]: expected an object")
+                    else:
+                        v5 = v3.get("task_key")
+                        if v5 is not None:
+                            if not isinstance(v5, str):
+                                errors.append(
+                                    f"{path}.depends_on[{i3}].task_key: expected a string, not {type(v5).__name__}"
+                                )
+        v1 = value.get("existing_cluster_id")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.existing_cluster_id: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("new_cluster")
+        if v1 is not None:
+            _check_NewCluster(v1, f"{path}.new_cluster", errors)
+        v1 = value.get("job_cluster_key")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.job_cluster_key: expected a string, not {type(v1).__name__}"
+                )
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{path}.job_cluster_key: shorter than 1 characters")
+                if len(v1) > 100:
+                    errors.append(f"{path}.job_cluster_key: longer than 100 characters")
+                if _PATTERN_0.search(v1) is None:
+                    errors.append(
+                        f"{path}.job_cluster_key: {v1!r} does not match {_PATTERN_0.pattern}"
+                    )
+        v1 = value.get("notebook_task")
+        if v1 is not None:
+            _check_NotebookTask(v1, f"{path}.notebook_task", errors)
+        v1 = value.get("spark_jar_task")
+        if v1 is not None:
+            _check_SparkJarTask(v1, f"{path}.spark_jar_task", errors)
+        v1 = value.get("spark_python_task")
+        if v1 is not None:
+            _check_SparkPythonTask(v1, f"{path}.spark_python_task", errors)
+        v1 = value.get("spark_submit_task")
+        if v1 is not None:
+            _check_SparkSubmitTask(v1, f"{path}.spark_submit_task", errors)
+        v1 = value.get("pipeline_task")
+        if v1 is not None:
+            _check_PipelineTask(v1, f"{path}.pipeline_task", errors)
+        v1 = value.get("python_wheel_task")
+        if v1 is not None:
+            _check_PythonWheelTask(v1, f"{path}.python_wheel_task", errors)
+        v1 = value.get("sql_task")
+        if v1 is not None:
+            _check_SqlTask(v1, f"{path}.sql_task", errors)
+        v1 = value.get("dbt_task")
+        if v1 is not None:
+            _check_DbtTask(v1, f"{path}.dbt_task", errors)
+        v1 = value.get("libraries")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.libraries: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    _check_Library(v3, f"{path}.libraries[{i3}]", errors)
+        v1 = value.get("email_notifications")
+        if v1 is not None:
+            _check_JobEmailNotifications(v1, f"{path}.email_notifications", errors)
+        v1 = value.get("timeout_seconds")
+        if v1 is not None:
+            if type(v1) is not int:
+                errors.append(
+                    f"{path}.timeout_seconds: expected an integer, not {type(v1).__name__}"
+                )
+            elif not -2147483648 <= v1 <= 2147483647:
+                errors.append(f"{path}.timeout_seconds: out of the int32 range")
+        v1 = value.get("max_retries")
+        if v1 is not None:
+            if type(v1) is not int:
+                errors.append(
+                    f"{path}.max_retries: expected an integer, not {type(v1).__name__}"
+                )
+            elif not -2147483648 <= v1 <= 2147483647:
+                errors.append(f"{path}.max_retries: out of the int32 range")
+        v1 = value.get("min_retry_interval_millis")
+        if v1 is not None:
+            if type(v1) is not int:
+                errors.append(
+                    f"{path}.min_retry_interval_millis: expected an integer, not {type(v1).__name__}"
+                )
+            elif not -2147483648 <= v1 <= 2147483647:
+                errors.append(
+                    f"{path}.min_retry_interval_millis: out of the int32 range"
+                )
+        v1 = value.get("retry_on_timeout")
+        if v1 is not None:
+            if type(v1) is not bool:
+                errors.append(
+                    f"{path}.retry_on_timeout: expected a boolean, not {type(v1).__name__}"
+                )
+
+
+def _check_JobCluster(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("job_cluster_key")
+        if v1 is None:
+            errors.append(f"{path}.job_cluster_key: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.job_cluster_key: expected a string, not {type(v1).__name__}"
+                )
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{path}.job_cluster_key: shorter than 1 characters")
+                if len(v1) > 100:
+                    errors.append(f"{path}.job_cluster_key: longer than 100 characters")
+                if _PATTERN_0.search(v1) is None:
+                    errors.append(
+                        f"{path}.job_cluster_key: {v1!r} does not match {_PATTERN_0.pattern}"
+                    )
+        v1 = value.get("new_cluster")
+        if v1 is not None:
+            _check_NewCluster(v1, f"{path}.new_cluster", errors)
+
+
+def _check_JobEmailNotifications(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("on_start")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.on_start: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.on_start[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+        v1 = value.get("on_success")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.on_success: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.on_success[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+        v1 = value.get("on_failure")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.on_failure: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.on_failure[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+        v1 = value.get("no_alert_for_skipped_runs")
+        if v1 is not None:
+            if type(v1) is not bool:
+                errors.append(
+                    f"{path}.no_alert_for_skipped_runs: expected a boolean, not {type(v1).__name__}"
+                )
+
+
+def _check_CronSchedule(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("quartz_cron_expression")
+        if v1 is None:
+            errors.append(f"{path}.quartz_cron_expression: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.quartz_cron_expression: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("timezone_id")
+        if v1 is None:
+            errors.append(f"{path}.timezone_id: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.timezone_id: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("pause_status")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.pause_status: expected a string, not {type(v1).__name__}"
+                )
+            elif v1 not in _ENUM_1:
+                errors.append(f"{path}.pause_status: {v1!r} is not one of {_ENUM_1}")
+
+
+def _check_GitSource(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("git_url")
+        if v1 is None:
+            errors.append(f"{path}.git_url: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.git_url: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("git_provider")
+        if v1 is None:
+            errors.append(f"{path}.git_provider: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.git_provider: expected a string, not {type(v1).__name__}"
+                )
+            elif v1 not in _ENUM_2:
+                errors.append(f"{path}.git_provider: {v1!r} is not one of {_ENUM_2}")
+        v1 = value.get("git_branch")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.git_branch: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("git_tag")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.git_tag: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("git_commit")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.git_commit: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("git_snapshot")
+        if v1 is not None:
+            _check_GitSnapshot(v1, f"{path}.git_snapshot", errors)
+        matched2 = 0
+        for check in (
+            _check_GitSource_0,
+            _check_GitSource_1,
+            _check_GitSource_2,
+        ):
+            found2: List[str] = []
+            check(value, path, found2)
+            matched2 += not found2
+        if matched2 != 1:
+            errors.append(
+                f"{path}: matches {matched2} of the alternatives instead of one: git_url + git_provider + git_branch | git_url + git_provider + git_tag | git_url + git_provider + git_commit"
+            )
+
+
+def _check_AutoScale(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("min_workers")
+        if v1 is not None:
+            if type(v1) is not int:
+                errors.append(
+                    f"{path}.min_workers: expected an integer, not {type(v1).__name__}"
+                )
+            elif not -2147483648 <= v1 <= 2147483647:
+                errors.append(f"{path}.min_workers: out of the int32 range")
+        v1 = value.get("max_workers")
+        if v1 is not None:
+            if type(v1) is not int:
+                errors.append(
+                    f"{path}.max_workers: expected an integer, not {type(v1).__name__}"
+                )
+            elif not -2147483648 <= v1 <= 2147483647:
+                errors.append(f"{path}.max_workers: out of the int32 range")
+
+
+def _check_AzureAttributes(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("first_on_demand")
+        if v1 is not None:
+            if type(v1) is not int:
+                errors.append(
+                    f"{path}.first_on_demand: expected an integer, not {type(v1).__name__}"
+                )
+            elif not -2147483648 <= v1 <= 2147483647:
+                errors.append(f"{path}.first_on_demand: out of the int32 range")
+        v1 = value.get("availability")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.availability: expected a string, not {type(v1).__name__}"
+                )
+            elif v1 not in _ENUM_3:
+                errors.append(f"{path}.availability: {v1!r} is not one of {_ENUM_3}")
+        v1 = value.get("spot_bid_max_price")
+        if v1 is not None:
+            if type(v1) not in (int, float):
+                errors.append(
+                    f"{path}.spot_bid_max_price: expected a number, not {type(v1).__name__}"
+                )
+
+
+def _check_ClusterLogConf(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("dbfs")
+        if v1 is not None:
+            _check_DbfsStorageInfo(v1, f"{path}.dbfs", errors)
+
+
+def _check_InitScriptInfo(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("dbfs")
+        if v1 is not None:
+            _check_DbfsStorageInfo(v1, f"{path}.dbfs", errors)
+        v1 = value.get("file")
+        if v1 is not None:
+            _check_FileStorageInfo(v1, f"{path}.file", errors)
+
+
+def _check_NotebookTask(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("notebook_path")
+        if v1 is None:
+            errors.append(f"{path}.notebook_path: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.notebook_path: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("source")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.source: expected a string, not {type(v1).__name__}"
+                )
+            elif v1 not in _ENUM_4:
+                errors.append(f"{path}.source: {v1!r} is not one of {_ENUM_4}")
+        v1 = value.get("base_parameters")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.base_parameters: expected an object")
+
+
+def _check_SparkJarTask(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("main_class_name")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.main_class_name: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("parameters")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.parameters: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.parameters[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+        v1 = value.get("jar_uri")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.jar_uri: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_SparkPythonTask(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("python_file")
+        if v1 is None:
+            errors.append(f"{path}.python_file: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.python_file: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("parameters")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.parameters: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.parameters[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+
+
+def _check_SparkSubmitTask(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("parameters")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.parameters: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.parameters[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+
+
+def _check_PipelineTask(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("pipeline_id")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.pipeline_id: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("full_refresh")
+        if v1 is not None:
+            if type(v1) is not bool:
+                errors.append(
+                    f"{path}.full_refresh: expected a boolean, not {type(v1).__name__}"
+                )
+
+
+def _check_PythonWheelTask(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("package_name")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.package_name: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("entry_point")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.entry_point: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("parameters")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.parameters: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.parameters[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+        v1 = value.get("named_parameters")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.named_parameters: expected an object")
+
+
+def _check_SqlTask(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("query")
+        if v1 is not None:
+            _check_SqlTaskQuery(v1, f"{path}.query", errors)
+        v1 = value.get("dashboard")
+        if v1 is not None:
+            _check_SqlTaskDashboard(v1, f"{path}.dashboard", errors)
+        v1 = value.get("alert")
+        if v1 is not None:
+            _check_SqlTaskAlert(v1, f"{path}.alert", errors)
+        v1 = value.get("parameters")
+        if v1 is not None:
+            if not isinstance(v1, dict):
+                errors.append(f"{path}.parameters: expected an object")
+        v1 = value.get("warehouse_id")
+        if v1 is None:
+            errors.append(f"{path}.warehouse_id: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.warehouse_id: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_DbtTask(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("project_directory")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.project_directory: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("commands")
+        if v1 is None:
+            errors.append(f"{path}.commands: is required")
+        else:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.commands: expected an array")
+        v1 = value.get("schema")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.schema: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("warehouse_id")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.warehouse_id: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("profiles_directory")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.profiles_directory: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_Library(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("jar")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(f"{path}.jar: expected a string, not {type(v1).__name__}")
+        v1 = value.get("egg")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(f"{path}.egg: expected a string, not {type(v1).__name__}")
+        v1 = value.get("whl")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(f"{path}.whl: expected a string, not {type(v1).__name__}")
+        v1 = value.get("pypi")
+        if v1 is not None:
+            _check_PythonPyPiLibrary(v1, f"{path}.pypi", errors)
+        v1 = value.get("maven")
+        if v1 is not None:
+            _check_MavenLibrary(v1, f"{path}.maven", errors)
+        v1 = value.get("cran")
+        if v1 is not None:
+            _check_RCranLibrary(v1, f"{path}.cran", errors)
+
+
+def _check_GitSnapshot(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("used_commit")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.used_commit: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_GitSource_0(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        if value.get("git_url") is None:
+            errors.append(f"{path}.git_url: is required")
+        if value.get("git_provider") is None:
+            errors.append(f"{path}.git_provider: is required")
+        if value.get("git_branch") is None:
+            errors.append(f"{path}.git_branch: is required")
+
+
+def _check_GitSource_1(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        if value.get("git_url") is None:
+            errors.append(f"{path}.git_url: is required")
+        if value.get("git_provider") is None:
+            errors.append(f"{path}.git_provider: is required")
+        if value.get("git_tag") is None:
+            errors.append(f"{path}.git_tag: is required")
+
+
+def _check_GitSource_2(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        if value.get("git_url") is None:
+            errors.append(f"{path}.git_url: is required")
+        if value.get("git_provider") is None:
+            errors.append(f"{path}.git_provider: is required")
+        if value.get("git_commit") is None:
+            errors.append(f"{path}.git_commit: is required")
+
+
+def _check_DbfsStorageInfo(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("destination")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.destination: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_FileStorageInfo(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("destination")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.destination: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_SqlTaskQuery(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("query_id")
+        if v1 is None:
+            errors.append(f"{path}.query_id: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.query_id: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_SqlTaskDashboard(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("dashboard_id")
+        if v1 is None:
+            errors.append(f"{path}.dashboard_id: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.dashboard_id: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_SqlTaskAlert(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("alert_id")
+        if v1 is None:
+            errors.append(f"{path}.alert_id: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.alert_id: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_PythonPyPiLibrary(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("package")
+        if v1 is None:
+            errors.append(f"{path}.package: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.package: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("repo")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.repo: expected a string, not {type(v1).__name__}"
+                )
+
+
+def _check_MavenLibrary(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("coordinates")
+        if v1 is None:
+            errors.append(f"{path}.coordinates: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.coordinates: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("repo")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.repo: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("exclusions")
+        if v1 is not None:
+            if not isinstance(v1, list):
+                errors.append(f"{path}.exclusions: expected an array")
+            else:
+                for i3, v3 in enumerate(v1):
+                    if not isinstance(v3, str):
+                        errors.append(
+                            f"{path}.exclusions[{i3}]: expected a string, not {type(v3).__name__}"
+                        )
+
+
+def _check_RCranLibrary(value: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(value, dict):
+        errors.append(f"{path}: expected an object")
+    else:
+        v1 = value.get("package")
+        if v1 is None:
+            errors.append(f"{path}.package: is required")
+        else:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.package: expected a string, not {type(v1).__name__}"
+                )
+        v1 = value.get("repo")
+        if v1 is not None:
+            if not isinstance(v1, str):
+                errors.append(
+                    f"{path}.repo: expected a string, not {type(v1).__name__}"
+                )
+
+
+def validate_job_settings(payload: Any) -> List[str]:
+    """Check a payload against the JobSettings schema.
+
+    Returns:
+        List[str]: The errors, ``<JSON path>: <message>``, none if valid.
+    """
+    errors: List[str] = []
+    _check_JobSettings(payload, "$", errors)
+    return errors
+
+
+def validate_new_cluster(payload: Any) -> List[str]:
+    """Check a payload against the NewCluster schema.
+
+    Returns:
+        List[str]: The errors, ``<JSON path>: <message>``, none if valid.
+    """
+    errors: List[str] = []
+    _check_NewCluster(payload, "$", errors)
+    return errors
+
+
+def validate_run_now(payload: Any) -> List[str]:
+    """Check a payload against the JobsRunNowRequest schema.
+
+    Returns:
+        List[str]: The errors, ``<JSON path>: <message>``, none if valid.
+    """
+    errors: List[str] = []
+    _check_JobsRunNowRequest(payload, "$", errors)
+    return errors
+
+
+# name of the schema -> its validator
+VALIDATORS: Dict[str, Callable[[Any], List[str]]] = {
+    "JobSettings": validate_job_settings,
+    "NewCluster": validate_new_cluster,
+    "JobsRunNowRequest": validate_run_now,
+}
+
+
+def validate(value: Any, schema: Optional[str] = None) -> List[str]:
+    """Check a ``Schema`` instance, or a payload against the named schema.
+
+    Args:
+        value (Any): The instance, or the payload.
+        schema (Optional[str]):
+            The name of the schema of the payload, the class of the
+            instance if None.
+    """
+    if schema is None:
+        schema = type(value).__name__
+        value = value.to_dict()
+    return VALIDATORS[schema](value)
@@ -0,0 +1,230 @@
+"""Lazy decoding of API responses into the typed model.
+
+A ``LazyView`` wraps the payload of a schema and decodes a field only when it
+is first accessed: nested schemas become views of their own,
+lists of schemas become ``LazyList`` that decode an item when it is indexed.
+Scalars are read straight from the payload.
+
+A view can also be built from the raw json bytes, that are parsed only when a
+field is first accessed, and can be released back to the bytes, which are
+several times smaller than the parsed dicts::
+
+    run = decode_run(response_bytes)
+    run.state.life_cycle_state  # parses the payload, decodes only state
+    run.release()  # drop the parsed payload, keep the bytes
+"""
+
+import json
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+
+import databricks_models
+from schema import Schema, resolve_schema
+
+RawPayload = Union[bytes, str, Dict[str, Any]]
+
+# kind of the fields, as in the plans
+_SCALAR = 0
+_OBJECT = 1
+_LIST = 2
+
+# schema -> field -> (kind, schema of the nested field)
+_plans: Dict[type, Dict[str, Tuple[int, Optional[Type[Schema]]]]] = {}
+
+
+def _plan(schema: Type[Schema]) -> Dict[str, Tuple[int, Optional[Type[Schema]]]]:
+    """Get how to decode each field of the schema, resolving the nested ones."""
+    plan = _plans.get(schema)
+    if plan is None:
+        plan = {}
+        fields: Tuple[str, ...] = schema.__slots__
+        for field in fields:
+            if field in schema._objects:
+                plan[field] = (_OBJECT, resolve_schema(schema, schema._objects[field]))
+            elif field in schema._lists:
+                plan[field] = (_LIST, resolve_schema(schema, schema._lists[field]))
+            else:
+                plan[field] = (_SCALAR, None)
+        _plans[schema] = plan
+    return plan
+
+
+class LazyList(Sequence):
+    """A list of schemas, each item is decoded into a view when first indexed."""
+
+    __slots__ = ("_schema", "_items", "_views")
+
+    def __init__(self, schema: Type[Schema], items: List[Dict[str, Any]]) -> None:
+        self._schema = schema
+        self._items = items
+        self._views: Optional[List[Optional["LazyView"]]] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> "LazyView": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List["LazyView"]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        if self._views is None:
+            self._views = [None] * len(self._items)
+        view = self._views[index]
+        if view is None:
+            view = LazyView(self._schema, self._items[index])
+            self._views[index] = view
+        return view
+
+    def __iter__(self) -> Iterator["LazyView"]:
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"LazyList[{self._schema.__name__}]({len(self._items)} items)"
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Get the payload of the list."""
+        return self._items
+
+    def materialize(self) -> List[Schema]:
+        """Decode all the items into the typed objects."""
+        return [self._schema.from_dict(item) for item in self._items]
+
+
+class LazyView:
+    """A view over the payload of a schema, decoding the fields on access.
+
+    Missing fields read as ``None``, like unset fields of the typed objects.
+    """
+
+    __slots__ = ("_schema", "_data", "_raw", "_cache")
+
+    def __init__(self, schema: Type[Schema], data: RawPayload) -> None:
+        """Build a view.
+
+        Args:
+            schema (Type[Schema]): The schema of the payload.
+            data (RawPayload):
+                The payload, either already parsed or as json bytes / string.
+                The json is parsed when a field is first accessed.
+        """
+        self._schema = schema
+        self._cache: Optional[Dict[str, Any]] = None
+        if isinstance(data, dict):
+            self._data: Optional[Dict[str, Any]] = data
+            self._raw: Optional[Union[bytes, str]] = None
+        else:
+            self._data = None
+            self._raw = data
+
+    def _payload(self) -> Dict[str, Any]:
+        data = self._data
+        if data is None:
+            data = json.loads(self._raw)  # type: ignore[arg-type]
+            self._data = data
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for the fields, the slots of the view are found before
+        field = _plan(self._schema).get(name)
+        if field is None:
+            raise AttributeError(
+                f"{self._schema.__name__} view has no attribute {name!r}"
+            )
+        kind, nested = field
+        if kind == _SCALAR:
+            return self._payload().get(name)
+
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = {}
+        elif name in cache:
+            return cache[name]
+        value = self._payload().get(name)
+        if value is not None:
+            if kind == _OBJECT:
+                value = LazyView(nested, value)  # type: ignore[arg-type]
+            else:
+                value = LazyList(nested, value)  # type: ignore[arg-type]
+        cache[name] = value
+        return value
+
+    def __dir__(self) -> List[str]:
+        return list(self._schema.__slots__) + ["materialize", "release", "to_dict"]
+
+    def __repr__(self) -> str:
+        state = "parsed" if self._data is not None else "raw"
+        return f"LazyView[{self._schema.__name__}]({state})"
+
+    @property
+    def schema(self) -> Type[Schema]:
+        """The schema of the payload."""
+        return self._schema
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the payload of the view."""
+        return self._payload()
+
+    def materialize(self) -> Schema:
+        """Decode the whole payload into the typed object."""
+        return self._schema.from_dict(self._payload())
+
+    def release(self) -> None:
+        """Drop the parsed payload and the decoded fields, keep the raw json.
+
+        Views built from an already parsed payload have nothing to go back to,
+        and are left as they are.
+        """
+        if self._raw is not None:
+            self._data = None
+            self._cache = None
+
+
+def decode(schema: Union[str, Type[Schema]], payload: RawPayload) -> LazyView:
+    """Build a lazy view of a payload.
+
+    Args:
+        schema (Union[str, Type[Schema]]):
+            The schema of the payload, or its name in ``databricks_models``.
+        payload (RawPayload): The parsed payload, or the json bytes / string.
+    """
+    if isinstance(schema, str):
+        schema = getattr(databricks_models, schema)
+    return LazyView(schema, payload)  # type: ignore[arg-type]
+
+
+def decode_job(payload: RawPayload) -> LazyView:
+    """Decode the response of ``/2.1/jobs/get``."""
+    return decode("JobsGetResponse", payload)
+
+
+def decode_run(payload: RawPayload) -> LazyView:
+    """Decode the response of ``/2.1/jobs/runs/get``."""
+    return decode("JobsRunsGetResponse", payload)
+
+
+def decode_runs_list(payload: RawPayload) -> LazyView:
+    """Decode the response of ``/2.1/jobs/runs/list``."""
+    return decode("JobsRunsListResponse", payload)
+
+
+def load_json_file(
+    path: Union[str, Path], schema: Union[str, Type[Schema]]
+) -> LazyView:
+    """Decode a json file, like ``sample_task_01.json``, without parsing it yet."""
+    return decode(schema, Path(path).read_bytes())
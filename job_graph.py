@@ -0,0 +1,351 @@
+"""Checks and timing of the task graph of a job.
+
+The ``depends_on`` of the tasks form a graph that Databricks only checks on
+``jobs/create``. ``JobGraph`` finds the problems beforehand, in linear time:
+
+* tasks depending on a task key that does not exist,
+* task keys used by several tasks,
+* cycles, reported with the path of task keys around the cycle,
+* tasks that can never run, because they are downstream of a cycle or of a
+  missing task.
+
+With an expected duration per task it also computes the critical path,
+the number of tasks that can run in parallel at each level and the minimum
+duration of a run::
+
+    graph = JobGraph.from_job(job)
+    graph.check()
+    timing = graph.analyze({"10W": 1200, "10M": 900})
+    lg.info(timing.summary())
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Union
+
+from schema import Schema
+
+# task_key -> expected seconds
+Durations = Union[Dict[str, float], Callable[[str], float]]
+
+
+def _get(obj: Any, field: str) -> Any:
+    """Read a field of a schema object, a lazy view or a payload dict."""
+    if isinstance(obj, dict):
+        return obj.get(field)
+    return getattr(obj, field, None)
+
+
+class GraphIssue:
+    """A problem in the task graph."""
+
+    __slots__ = ("kind", "task_key", "message", "path")
+
+    def __init__(
+        self, kind: str, task_key: str, message: str, path: Optional[List[str]] = None
+    ) -> None:
+        """Create a GraphIssue.
+
+        Args:
+            kind (str): ``unknown_dependency``, ``duplicate_key``, ``cycle``
+                or ``unreachable``.
+            task_key (str): The task with the problem.
+            message (str): What is wrong.
+            path (Optional[List[str]]): The task keys around the cycle.
+        """
+        self.kind = kind
+        self.task_key = task_key
+        self.message = message
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f"GraphIssue({self.kind}, {self.message!r})"
+
+
+class JobGraphError(ValueError):
+    """The task graph of the job is not valid."""
+
+    def __init__(self, issues: List[GraphIssue]) -> None:
+        self.issues = issues
+        lines = [issue.message for issue in issues[:20]]
+        if len(issues) > 20:
+            lines.append(f"... and {len(issues) - 20} more")
+        super().__init__(
+            f"The job has {len(issues)} task graph issues:\n" + "\n".join(lines)
+        )
+
+
+class GraphTiming:
+    """The expected timing of a run of the job."""
+
+    def __init__(
+        self,
+        critical_path: List[str],
+        min_run_time: float,
+        levels: List[List[str]],
+        earliest_start: Dict[str, float],
+    ) -> None:
+        """Create a GraphTiming.
+
+        Args:
+            critical_path (List[str]): The longest chain of tasks, in order.
+            min_run_time (float):
+                Seconds of the critical path, no run can be faster.
+            levels (List[List[str]]):
+                The tasks by level: a task is one level after its last
+                dependency, the tasks of a level can all run at the same time.
+            earliest_start (Dict[str, float]):
+                Seconds after the run start each task can start at the earliest.
+        """
+        self.critical_path = critical_path
+        self.min_run_time = min_run_time
+        self.levels = levels
+        self.earliest_start = earliest_start
+
+    @property
+    def parallelism(self) -> List[int]:
+        """The number of tasks of each level."""
+        return [len(level) for level in self.levels]
+
+    def summary(self) -> str:
+        return (
+            f"{sum(self.parallelism)} tasks in {len(self.levels)} levels, "
+            f"max parallelism {max(self.parallelism, default=0)}, "
+            f"minimum run time {self.min_run_time:.0f} s, "
+            f"critical path of {len(self.critical_path)} tasks: "
+            f"{' -> '.join(self.critical_path[:10])}"
+            f"{' -> ...' if len(self.critical_path) > 10 else ''}"
+        )
+
+
+class JobGraph:
+    """The graph of the tasks of a job, the edges go from a task to its dependents."""
+
+    def __init__(self, tasks: Iterable[Any]) -> None:
+        """Build the graph.
+
+        Args:
+            tasks (Iterable[Any]):
+                The tasks, as ``JobTaskSettings``, lazy views or payload dicts.
+        """
+        self.keys: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.issues: List[GraphIssue] = []
+        depends_on: List[List[str]] = []
+        for task in tasks:
+            key = _get(task, "task_key")
+            if key in self.index:
+                self.issues.append(
+                    GraphIssue("duplicate_key", key, f"Task key {key} is used twice.")
+                )
+                continue
+            self.index[key] = len(self.keys)
+            self.keys.append(key)
+            depends_on.append(
+                [_get(d, "task_key") for d in _get(task, "depends_on") or []]
+            )
+
+        # parents[i]: the tasks i waits for, children[i]: the tasks waiting for i
+        n = len(self.keys)
+        self.parents: List[List[int]] = [[] for _ in range(n)]
+        self.children: List[List[int]] = [[] for _ in range(n)]
+        # tasks that depend on a missing task
+        self._broken: Set[int] = set()
+        for i, deps in enumerate(depends_on):
+            for dep in deps:
+                j = self.index.get(dep)
+                if j is None:
+                    self.issues.append(
+                        GraphIssue(
+                            "unknown_dependency",
+                            self.keys[i],
+                            f"Task {self.keys[i]} depends on unknown task {dep}.",
+                        )
+                    )
+                    self._broken.add(i)
+                else:
+                    self.parents[i].append(j)
+                    self.children[j].append(i)
+        self._order: Optional[List[int]] = None
+        self._find_cycles_and_unreachable()
+
+    @classmethod
+    def from_job(cls, job: Union[Schema, Dict[str, Any], Any]) -> "JobGraph":
+        """Build the graph of a ``JobSettings``, its payload or a lazy view."""
+        return cls(_get(job, "tasks") or [])
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def valid(self) -> bool:
+        return not self.issues
+
+    def check(self) -> None:
+        """Raise if the graph has issues.
+
+        Raises:
+            JobGraphError: With all the issues found.
+        """
+        if self.issues:
+            raise JobGraphError(self.issues)
+
+    def _find_cycles_and_unreachable(self) -> None:
+        """Topological sort, then look for cycles among the tasks left out."""
+        n = len(self.keys)
+        waiting = [len(parents) for parents in self.parents]
+        queue: Deque[int] = deque(i for i in range(n) if not waiting[i])
+        order = []
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            for child in self.children[i]:
+                waiting[child] -= 1
+                if not waiting[child]:
+                    queue.append(child)
+        if len(order) == n:
+            self._order = order
+        else:
+            self._report_cycles([i for i in range(n) if waiting[i]])
+
+        # the tasks downstream of a missing task never run either
+        blocked = [False] * n
+        stack = list(self._broken)
+        for i in stack:
+            blocked[i] = True
+        while stack:
+            for child in self.children[stack.pop()]:
+                if not blocked[child]:
+                    blocked[child] = True
+                    stack.append(child)
+        in_cycle = {
+            i
+            for issue in self.issues
+            if issue.path
+            for i in map(self.index.get, issue.path)
+        }
+        for i in range(n):
+            if (
+                (blocked[i] or waiting[i])
+                and i not in in_cycle
+                and i not in self._broken
+            ):
+                self.issues.append(
+                    GraphIssue(
+                        "unreachable",
+                        self.keys[i],
+                        f"Task {self.keys[i]} can never run, it waits for a task "
+                        "in a cycle or depending on an unknown task.",
+                    )
+                )
+
+    def _report_cycles(self, left: List[int]) -> None:
+        """Find the cycles among the tasks the topological sort left out.
+
+        Iterative depth first search on the parents, each task visited once,
+        a cycle is reported when the search gets back to a task on its path.
+        """
+        left_set = set(left)
+        state = dict.fromkeys(left, 0)  # 0 new, 1 on the path, 2 done
+        for root in left:
+            if state[root]:
+                continue
+            path = [root]
+            iters = [iter(self.parents[root])]
+            state[root] = 1
+            while path:
+                for parent in iters[-1]:
+                    if parent not in left_set:
+                        continue
+                    if state[parent] == 1:
+                        cycle = path[path.index(parent) :] + [parent]
+                        # the path follows the dependencies, show it in run order
+                        keys = [self.keys[i] for i in reversed(cycle)]
+                        self.issues.append(
+                            GraphIssue(
+                                "cycle",
+                                keys[0],
+                                f"Cycle between tasks: {' -> '.join(keys)}.",
+                                keys,
+                            )
+                        )
+                    elif state[parent] == 0:
+                        state[parent] = 1
+                        path.append(parent)
+                        iters.append(iter(self.parents[parent]))
+                        break
+                else:
+                    state[path.pop()] = 2
+                    iters.pop()
+
+    def topological_order(self) -> List[str]:
+        """Get the task keys in an order where each task comes after its dependencies.
+
+        Raises:
+            JobGraphError: If the graph has a cycle.
+        """
+        if self._order is None:
+            raise JobGraphError([i for i in self.issues if i.kind == "cycle"])
+        return [self.keys[i] for i in self._order]
+
+    def analyze(self, durations: Durations, default: float = 0.0) -> GraphTiming:
+        """Compute the critical path, the levels and the minimum run time.
+
+        Args:
+            durations (Durations):
+                The expected seconds of each task, by task key or as a function.
+            default (float): The seconds of the tasks missing from the dict.
+
+        Raises:
+            JobGraphError: If the graph has a cycle.
+        """
+        if self._order is None:
+            self.topological_order()
+        if isinstance(durations, dict):
+            cost = [durations.get(key, default) for key in self.keys]
+        else:
+            cost = [durations(key) for key in self.keys]
+
+        n = len(self.keys)
+        start = [0.0] * n
+        level = [0] * n
+        # the parent that finishes last, to walk back the critical path
+        last_parent = [-1] * n
+        for i in self._order:  # type: ignore[union-attr]
+            for p in self.parents[i]:
+                end = start[p] + cost[p]
+                if last_parent[i] < 0 or end > start[i]:
+                    start[i] = end
+                    last_parent[i] = p
+                if level[p] + 1 > level[i]:
+                    level[i] = level[p] + 1
+
+        levels: List[List[str]] = [[] for _ in range(max(level, default=-1) + 1)]
+        for i in self._order:  # type: ignore[union-attr]
+            levels[level[i]].append(self.keys[i])
+
+        if not n:
+            return GraphTiming([], 0.0, [], {})
+        last = max(range(n), key=lambda i: start[i] + cost[i])
+        path = []
+        i = last
+        while i >= 0:
+            path.append(self.keys[i])
+            i = last_parent[i]
+        path.reverse()
+        return GraphTiming(
+            path,
+            start[last] + cost[last],
+            levels,
+            dict(zip(self.keys, start)),
+        )
+
+
+def check_job_graph(job: Union[Schema, Dict[str, Any], Any]) -> JobGraph:
+    """Build the task graph of a job and raise if it has issues.
+
+    Raises:
+        JobGraphError: With all the issues found.
+    """
+    graph = JobGraph.from_job(job)
+    graph.check()
+    return graph
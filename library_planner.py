@@ -0,0 +1,480 @@
+"""Install the libraries of the tasks of a job on their clusters before it runs.
+
+The samples attach the whole list of libraries to the first task of each
+cluster, and the other tasks count on them being installed by then.
+``LibraryPlanner`` looks at all the tasks instead:
+
+* the ``Library`` specs of the tasks on each existing cluster are merged into
+  a set without duplicates,
+* the ``ClusterLibraryStatuses`` of each cluster is read once, through a
+  ``LibraryStatusView`` cached for ``ttl`` seconds and shared by the waiters,
+* only the libraries not on the cluster yet are installed, with a single
+  ``libraries/install`` per cluster,
+* a task is ready as soon as its own libraries are ``INSTALLED``, it does not
+  wait for the other libraries of its cluster.
+
+::
+
+    planner = LibraryPlanner()
+    plan = planner.plan(job.tasks)
+    planner.install(plan)
+    for task_key, error in planner.iter_ready(plan):
+        lg.info("{} ready", task_key) if error is None else lg.error("{}", error)
+
+The tasks on a new or job cluster get their libraries with the cluster, they
+are left out of the plan. From the command line::
+
+    python library_planner.py 11223344 --wait
+"""
+
+import argparse
+import json
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+from requests.exceptions import HTTPError
+
+from schema import Schema
+from single_flight import SingleFlight
+from utils import get_databricks_client, jd
+
+LibrarySpec = Union[Schema, Dict[str, Any]]
+TaskPayload = Union[Schema, Dict[str, Any]]
+
+INSTALLED = "INSTALLED"
+# the statuses of a library on its way to be installed
+IN_PROGRESS = ("PENDING", "RESOLVING", "INSTALLING")
+# the statuses of a library that will not be installed
+FAILED_STATUSES = ("FAILED", "SKIPPED")
+# the statuses of a library to install again
+REMOVED_STATUSES = ("UNINSTALL_ON_RESTART",)
+
+
+def library_key(library: LibrarySpec) -> str:
+    """Get a key of a library spec, the same for equal specs."""
+    payload = library.to_dict() if isinstance(library, Schema) else library
+    return json.dumps(payload, sort_keys=True)
+
+
+class LibraryInstallError(RuntimeError):
+    """A library of a task did not reach ``INSTALLED``."""
+
+    def __init__(
+        self,
+        task_key: str,
+        cluster_id: str,
+        library: Dict[str, Any],
+        status: Optional[str],
+        messages: Optional[List[str]] = None,
+    ) -> None:
+        self.task_key = task_key
+        self.cluster_id = cluster_id
+        self.library = library
+        self.status = status
+        self.messages = messages or []
+        detail = f": {' '.join(self.messages)}" if self.messages else ""
+        super().__init__(
+            f"Library {json.dumps(library)} of task {task_key} is {status} "
+            f"on cluster {cluster_id}{detail}"
+        )
+
+
+class LibraryStatusView:
+    """Cached ``ClusterLibraryStatuses`` of the clusters, thread safe.
+
+    The concurrent refreshes of a cluster are merged into a single call.
+    """
+
+    def __init__(self, api_client: Optional[ApiClient] = None, ttl: float = 30.0):
+        """Create the view, a cluster is read on its first lookup.
+
+        Args:
+            api_client (Optional[ApiClient]):
+                The client to use, the default one if not provided.
+            ttl (float): Seconds after which a lookup reads the cluster again.
+        """
+        self.api_client = api_client
+        self.ttl = ttl
+        # cluster id -> library key -> (status, messages)
+        self._statuses: Dict[str, Dict[str, Tuple[str, List[str]]]] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._flight = SingleFlight(copy_result=False)
+
+    def statuses(
+        self, cluster_id: str, max_age: Optional[float] = None
+    ) -> Dict[str, Tuple[str, List[str]]]:
+        """Get the status and messages of the libraries of a cluster, by key.
+
+        Args:
+            cluster_id (str): The cluster.
+            max_age (Optional[float]): Read the cluster again if the statuses
+                are older than this, ``ttl`` if None.
+        """
+        max_age = self.ttl if max_age is None else max_age
+        loaded_at = self._loaded_at.get(cluster_id)
+        if loaded_at is None or time.monotonic() - loaded_at > max_age:
+            self._flight.do(
+                ("cluster-status", cluster_id), lambda: self.refresh(cluster_id)
+            )
+        with self._lock:
+            return dict(self._statuses.get(cluster_id, {}))
+
+    def status(self, cluster_id: str, library: LibrarySpec) -> Optional[str]:
+        """Get the status of a library on a cluster, None if it is not there."""
+        found = self.statuses(cluster_id).get(library_key(library))
+        return None if found is None else found[0]
+
+    def refresh(self, cluster_id: str) -> None:
+        """Read the statuses of the libraries of a cluster."""
+        api_client = self.api_client or get_databricks_client()
+        payload = api_client.perform_query(
+            "GET",
+            "/libraries/cluster-status",
+            data={"cluster_id": cluster_id},
+            version="2.0",
+        )
+        statuses = {
+            library_key(s["library"]): (s["status"], s.get("messages", []))
+            for s in payload.get("library_statuses", [])
+        }
+        with self._lock:
+            self._statuses[cluster_id] = statuses
+            self._loaded_at[cluster_id] = time.monotonic()
+
+    def mark(self, cluster_id: str, keys: Iterable[str], status: str) -> None:
+        """Record a status without reading it, like the libraries just installed."""
+        with self._lock:
+            statuses = self._statuses.setdefault(cluster_id, {})
+            for key in keys:
+                statuses[key] = (status, [])
+
+    def invalidate(self, cluster_id: Optional[str] = None) -> None:
+        """Read a cluster, all of them if None, again on the next lookup."""
+        with self._lock:
+            if cluster_id is None:
+                self._loaded_at.clear()
+            else:
+                self._loaded_at.pop(cluster_id, None)
+
+
+class ClusterLibraries:
+    """The libraries the tasks of a job need on a cluster."""
+
+    __slots__ = ("cluster_id", "libraries", "statuses", "missing", "installed")
+
+    def __init__(self, cluster_id: str) -> None:
+        self.cluster_id = cluster_id
+        # library key -> spec, in the order of the tasks
+        self.libraries: Dict[str, Dict[str, Any]] = {}
+        # library key -> status when planned, None if not on the cluster
+        self.statuses: Dict[str, Optional[str]] = {}
+        # the keys to install
+        self.missing: List[str] = []
+        # the keys installed by the planner
+        self.installed: List[str] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"ClusterLibraries({self.cluster_id}: {len(self.libraries)} libraries, "
+            f"{len(self.missing)} missing)"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cluster_id": self.cluster_id,
+            "libraries": [
+                {"library": spec, "status": self.statuses.get(key)}
+                for key, spec in self.libraries.items()
+            ],
+            "missing": [self.libraries[key] for key in self.missing],
+            "installed": [self.libraries[key] for key in self.installed],
+        }
+
+
+class LibraryPlan:
+    """The libraries of the tasks of a job, by cluster and by task."""
+
+    def __init__(
+        self,
+        clusters: Dict[str, ClusterLibraries],
+        tasks: Dict[str, Tuple[str, List[str]]],
+        unplanned: List[str],
+    ) -> None:
+        """Create a LibraryPlan.
+
+        Args:
+            clusters (Dict[str, ClusterLibraries]): By cluster id.
+            tasks (Dict[str, Tuple[str, List[str]]]):
+                Task key -> its cluster and the keys of its libraries.
+            unplanned (List[str]):
+                The tasks with libraries on a new or job cluster.
+        """
+        self.clusters = clusters
+        self.tasks = tasks
+        self.unplanned = unplanned
+
+    @property
+    def missing(self) -> int:
+        return sum(len(c.missing) for c in self.clusters.values())
+
+    def libraries_of(self, task_key: str) -> List[Dict[str, Any]]:
+        """Get the libraries a task needs."""
+        cluster_id, keys = self.tasks[task_key]
+        return [self.clusters[cluster_id].libraries[key] for key in keys]
+
+    def summary(self) -> str:
+        libraries = sum(len(c.libraries) for c in self.clusters.values())
+        return (
+            f"{len(self.tasks)} tasks need {libraries} libraries on "
+            f"{len(self.clusters)} clusters, {self.missing} missing, "
+            f"{len(self.unplanned)} tasks on new clusters"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "clusters": [c.to_dict() for c in self.clusters.values()],
+            "tasks": {
+                task_key: {"cluster_id": cluster_id, "libraries": len(keys)}
+                for task_key, (cluster_id, keys) in self.tasks.items()
+            },
+            "unplanned": self.unplanned,
+        }
+
+
+class LibraryPlanner:
+    """Install only the missing libraries, and tell when each task is ready."""
+
+    def __init__(
+        self,
+        api_client: Optional[ApiClient] = None,
+        status_view: Optional[LibraryStatusView] = None,
+        poll_interval: float = 5.0,
+        timeout: float = 1800.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Create a LibraryPlanner.
+
+        Args:
+            api_client (Optional[ApiClient]):
+                The client to use, the default one if not provided.
+            status_view (Optional[LibraryStatusView]):
+                The cached statuses, shared with other planners, a new one
+                if None.
+            poll_interval (float): Seconds between two reads of a cluster
+                while its tasks wait.
+            timeout (float): Seconds to wait for the libraries of a task.
+            clock (Callable[[], float]): The time in seconds.
+            sleep (Callable[[float], None]): Waits between the polls.
+        """
+        self.api_client = api_client
+        self.status_view = status_view or LibraryStatusView(api_client)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.clock = clock
+        self.sleep = sleep
+
+    def _client(self) -> ApiClient:
+        if self.api_client is None:
+            return get_databricks_client()
+        return self.api_client
+
+    def plan(self, tasks: Iterable[TaskPayload]) -> LibraryPlan:
+        """Merge the libraries of the tasks by cluster, and find the missing ones.
+
+        Args:
+            tasks (Iterable[TaskPayload]):
+                The ``JobTaskSettings``, or their payloads.
+        """
+        clusters: Dict[str, ClusterLibraries] = {}
+        task_libraries: Dict[str, Tuple[str, List[str]]] = {}
+        unplanned = []
+        for task in tasks:
+            payload = task.to_dict() if isinstance(task, Schema) else task
+            libraries = payload.get("libraries") or []
+            cluster_id = payload.get("existing_cluster_id")
+            if not cluster_id:
+                if libraries:
+                    unplanned.append(payload["task_key"])
+                continue
+            cluster = clusters.get(cluster_id)
+            if cluster is None:
+                cluster = clusters[cluster_id] = ClusterLibraries(cluster_id)
+            keys = []
+            for library in libraries:
+                key = library_key(library)
+                if key not in keys:
+                    keys.append(key)
+                cluster.libraries.setdefault(key, library)
+            task_libraries[payload["task_key"]] = (cluster_id, keys)
+
+        for cluster in clusters.values():
+            if not cluster.libraries:
+                continue
+            statuses = self.status_view.statuses(cluster.cluster_id)
+            for key in cluster.libraries:
+                status = statuses.get(key, (None, []))[0]
+                cluster.statuses[key] = status
+                if status is None or status in REMOVED_STATUSES:
+                    cluster.missing.append(key)
+        plan = LibraryPlan(clusters, task_libraries, unplanned)
+        lg.info(plan.summary())
+        return plan
+
+    def install(self, plan: LibraryPlan) -> int:
+        """Install the missing libraries, one request per cluster.
+
+        Returns:
+            int: The number of libraries installed.
+        """
+        count = 0
+        for cluster in plan.clusters.values():
+            todo = [key for key in cluster.missing if key not in cluster.installed]
+            if not todo:
+                continue
+            self._client().perform_query(
+                "POST",
+                "/libraries/install",
+                data={
+                    "cluster_id": cluster.cluster_id,
+                    "libraries": [cluster.libraries[key] for key in todo],
+                },
+                version="2.0",
+            )
+            # another plan within the ttl will not install them again
+            self.status_view.mark(cluster.cluster_id, todo, "PENDING")
+            cluster.installed.extend(todo)
+            count += len(todo)
+            lg.info(
+                "Installing {} libraries on cluster {}", len(todo), cluster.cluster_id
+            )
+        return count
+
+    def iter_ready(
+        self,
+        plan: LibraryPlan,
+        task_keys: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[str, Optional[LibraryInstallError]]]:
+        """Yield the tasks as soon as their own libraries are installed.
+
+        Each cluster with waiting tasks is read once per ``poll_interval``,
+        whatever its number of tasks.
+
+        Args:
+            plan (LibraryPlan): The plan of the tasks.
+            task_keys (Optional[Iterable[str]]): The tasks, all of them if None.
+
+        Yields:
+            Tuple[str, Optional[LibraryInstallError]]: A task, and the error
+                if one of its libraries failed or was not installed in time.
+        """
+        waiting: Set[str] = set(plan.tasks if task_keys is None else task_keys)
+        deadline = self.clock() + self.timeout
+        first = True
+        while waiting:
+            now = self.clock()
+            expired = now >= deadline
+            by_cluster: Dict[str, List[str]] = {}
+            for task_key in sorted(waiting):
+                by_cluster.setdefault(plan.tasks[task_key][0], []).append(task_key)
+            for cluster_id, cluster_tasks in by_cluster.items():
+                # the statuses of the plan are fresh for the first round
+                max_age = self.status_view.ttl if first else self.poll_interval
+                try:
+                    statuses = self.status_view.statuses(cluster_id, max_age)
+                except HTTPError as e:
+                    lg.warning("Cannot read the libraries of {}: {}", cluster_id, e)
+                    continue
+                for task_key in cluster_tasks:
+                    outcome = self._readiness(plan, task_key, statuses, expired)
+                    if outcome is not False:
+                        waiting.discard(task_key)
+                        yield task_key, outcome  # type: ignore[misc]
+            first = False
+            if waiting:
+                self.sleep(min(self.poll_interval, max(deadline - now, 0.0)))
+
+    def _readiness(
+        self,
+        plan: LibraryPlan,
+        task_key: str,
+        statuses: Dict[str, Tuple[str, List[str]]],
+        expired: bool,
+    ) -> Union[None, bool, LibraryInstallError]:
+        """None if the task is ready, its error, or False if it must wait."""
+        cluster_id, keys = plan.tasks[task_key]
+        cluster = plan.clusters[cluster_id]
+        for key in keys:
+            status, messages = statuses.get(key, (None, []))
+            if status == INSTALLED:
+                continue
+            if status in FAILED_STATUSES or expired:
+                return LibraryInstallError(
+                    task_key, cluster_id, cluster.libraries[key], status, messages
+                )
+            return False
+        return None
+
+    def wait_for_task(self, plan: LibraryPlan, task_key: str) -> None:
+        """Block until the libraries of a task are installed.
+
+        Raises:
+            LibraryInstallError: If one of them failed or took too long.
+        """
+        for _, error in self.iter_ready(plan, [task_key]):
+            if error is not None:
+                raise error
+
+
+def prepare_job(
+    job_id: int,
+    api_client: Optional[ApiClient] = None,
+    wait: bool = False,
+) -> LibraryPlan:
+    """Install the missing libraries of the tasks of a job.
+
+    Args:
+        job_id (int): The job.
+        api_client (Optional[ApiClient]):
+            The client to use, the default one if not provided.
+        wait (bool): Wait for all the libraries, logging the tasks once ready.
+    """
+    api_client = api_client or get_databricks_client()
+    job = api_client.perform_query(
+        "GET", "/jobs/get", data={"job_id": job_id}, version="2.1"
+    )
+    planner = LibraryPlanner(api_client)
+    plan = planner.plan(job["settings"].get("tasks", []))
+    planner.install(plan)
+    if wait:
+        for task_key, error in planner.iter_ready(plan):
+            if error is None:
+                lg.info("Libraries of task {} installed", task_key)
+            else:
+                lg.error("{}", error)
+    return plan
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("job_id", type=int)
+    parser.add_argument("--wait", action="store_true")
+    args = parser.parse_args()
+
+    library_plan = prepare_job(args.job_id, wait=args.wait)
+    lg.info("Plan:\n{}", jd(library_plan.to_dict()))
@@ -0,0 +1,361 @@
+"""Latency histograms and counters of the Databricks and Vault calls.
+
+Each endpoint, like ``GET /2.1/jobs/get`` or the vault ``read_secret`` of a
+path, gets:
+
+* a histogram of the latency in seconds,
+* a counter of the responses by status code, or by exception name,
+* a counter of the retries,
+* a counter of the calls saved by merging identical calls in flight,
+* histograms of the request and response sizes in bytes,
+* a gauge of the calls in flight.
+
+The calls of the pooled clients of ``utils.py`` and the vault reads are
+recorded once the metrics are enabled, with ``DATABRICKS_METRICS=1`` or
+``enable_metrics()``. Disabled, a call pays a single attribute check.
+The metrics are exported as Prometheus text or as a json snapshot::
+
+    enable_metrics()
+    deploy()
+    lg.info(METRICS.summary())
+    Path("metrics.prom").write_text(METRICS.to_prometheus())
+"""
+
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+# name of the environment variable enabling the metrics
+ENV_METRICS = "DATABRICKS_METRICS"
+
+# upper bounds of the buckets, in seconds and in bytes
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = tuple(256 * 4**i for i in range(10))  # 256 B to 64 MiB
+
+# (service, method, endpoint)
+EndpointKey = Tuple[str, str, str]
+
+
+class Histogram:
+    """Counts of the observations in fixed buckets, like a Prometheus histogram."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """Create a Histogram.
+
+        Args:
+            bounds (Sequence[float]): The sorted upper bounds of the buckets,
+                the last bucket, ``+Inf``, is added.
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile, interpolating inside its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                if i == len(self.bounds):
+                    # no upper bound, the last bound is all we know
+                    return float(self.bounds[-1])
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / n
+            seen += n
+        return float(self.bounds[-1])
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """The ``le`` label and the cumulative count of each bucket."""
+        total = 0
+        out = []
+        for bound, n in zip(list(self.bounds) + ["+Inf"], self.counts):
+            total += n
+            out.append((bound if isinstance(bound, str) else f"{bound:g}", total))
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class EndpointMetrics:
+    """The metrics of one endpoint."""
+
+    __slots__ = (
+        "latency",
+        "statuses",
+        "retries",
+        "request_bytes",
+        "response_bytes",
+        "in_flight",
+        "coalesced",
+    )
+
+    def __init__(self) -> None:
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.statuses: Dict[str, int] = {}
+        self.retries = 0
+        self.request_bytes = Histogram(SIZE_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+        self.in_flight = 0
+        self.coalesced = 0
+
+
+class MetricsRegistry:
+    """The metrics of all the endpoints, safe to update from many threads."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Create a MetricsRegistry.
+
+        Args:
+            enabled (bool): Record the calls, a disabled registry ignores them.
+        """
+        self.enabled = enabled
+        self._endpoints: Dict[EndpointKey, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: EndpointKey) -> EndpointMetrics:
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = self._endpoints.setdefault(key, EndpointMetrics())
+        return metrics
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    ##################################################
+    #    Recording
+    ##################################################
+
+    def start(self, service: str, method: str, endpoint: str) -> None:
+        """Count a call in flight, ``finish`` must follow."""
+        with self._lock:
+            self._get((service, method, endpoint)).in_flight += 1
+
+    def finish(
+        self,
+        service: str,
+        method: str,
+        endpoint: str,
+        seconds: float,
+        status: Any,
+        request_bytes: Optional[int] = None,
+        response_bytes: Optional[int] = None,
+        retries: int = 0,
+    ) -> None:
+        """Record a call that is over.
+
+        Args:
+            service (str): ``databricks`` or ``vault``.
+            method (str): The HTTP method, or the vault operation.
+            endpoint (str): The path, without the query.
+            seconds (float): The duration of the call.
+            status (Any): The status code, or the name of the exception.
+            request_bytes (Optional[int]): The size of the request body.
+            response_bytes (Optional[int]): The size of the response body.
+            retries (int): The retries made inside the call.
+        """
+        status = str(status)
+        with self._lock:
+            metrics = self._get((service, method, endpoint))
+            metrics.in_flight -= 1
+            metrics.latency.observe(seconds)
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            metrics.retries += retries
+            if request_bytes is not None:
+                metrics.request_bytes.observe(request_bytes)
+            if response_bytes is not None:
+                metrics.response_bytes.observe(response_bytes)
+
+    def record_retry(self, service: str, method: str, endpoint: str) -> None:
+        """Count a retry made by the caller, like the backoff of ``bulk_jobs``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._get((service, method, endpoint)).retries += 1
+
+    def record_coalesced(self, service: str, method: str, endpoint: str) -> None:
+        """Count a call saved by waiting for the same call in flight."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._get((service, method, endpoint)).coalesced += 1
+
+    @contextmanager
+    def _timed(self, service: str, method: str, endpoint: str) -> Iterator[None]:
+        self.start(service, method, endpoint)
+        status = "ok"
+        t_start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            status = type(e).__name__
+            raise
+        finally:
+            self.finish(
+                service, method, endpoint, time.perf_counter() - t_start, status
+            )
+
+    def timed(self, service: str, method: str, endpoint: str):
+        """Time the calls of a ``with`` block, the status is ``ok`` or the error.
+
+        Disabled, it returns a shared no-op context.
+        """
+        if not self.enabled:
+            return _NO_OP
+        return self._timed(service, method, endpoint)
+
+    ##################################################
+    #    Export
+    ##################################################
+
+    def _copy(self) -> List[Tuple[EndpointKey, Dict[str, Any]]]:
+        with self._lock:
+            return [
+                (
+                    key,
+                    {
+                        "count": m.latency.count,
+                        "statuses": dict(m.statuses),
+                        "retries": m.retries,
+                        "in_flight": m.in_flight,
+                        "coalesced": m.coalesced,
+                        "latency_seconds": m.latency.to_dict(),
+                        "request_bytes": m.request_bytes.to_dict(),
+                        "response_bytes": m.response_bytes.to_dict(),
+                    },
+                )
+                for key, m in sorted(self._endpoints.items())
+            ]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get all the metrics, ready for ``json.dumps``."""
+        return {
+            "enabled": self.enabled,
+            "time": time.time(),
+            "endpoints": [
+                {"service": s, "method": m, "endpoint": e, **values}
+                for (s, m, e), values in self._copy()
+            ],
+        }
+
+    def to_prometheus(self) -> str:
+        """Get all the metrics in the Prometheus text format."""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines = []
+
+            def header(name: str, kind: str, help_text: str) -> None:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+
+            def histogram(name: str, attr: str) -> None:
+                for key, m in endpoints:
+                    h = getattr(m, attr)
+                    labels = _labels(key)
+                    for le, count in h.cumulative():
+                        lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+                    lines.append(f"{name}_sum{{{labels}}} {h.sum:g}")
+                    lines.append(f"{name}_count{{{labels}}} {h.count}")
+
+            header(
+                "api_request_duration_seconds",
+                "histogram",
+                "Duration of the API calls.",
+            )
+            histogram("api_request_duration_seconds", "latency")
+            header("api_requests_total", "counter", "API calls by status.")
+            for key, m in endpoints:
+                for status, count in sorted(m.statuses.items()):
+                    lines.append(
+                        f'api_requests_total{{{_labels(key)},status="{status}"}} {count}'
+                    )
+            header("api_retries_total", "counter", "Retries of the API calls.")
+            for key, m in endpoints:
+                lines.append(f"api_retries_total{{{_labels(key)}}} {m.retries}")
+            header(
+                "api_coalesced_total",
+                "counter",
+                "API calls saved by waiting for the same call in flight.",
+            )
+            for key, m in endpoints:
+                lines.append(f"api_coalesced_total{{{_labels(key)}}} {m.coalesced}")
+            header("api_request_size_bytes", "histogram", "Size of the request bodies.")
+            histogram("api_request_size_bytes", "request_bytes")
+            header(
+                "api_response_size_bytes", "histogram", "Size of the response bodies."
+            )
+            histogram("api_response_size_bytes", "response_bytes")
+            header("api_requests_in_flight", "gauge", "API calls in progress.")
+            for key, m in endpoints:
+                lines.append(f"api_requests_in_flight{{{_labels(key)}}} {m.in_flight}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self, top: int = 10) -> str:
+        """Describe the endpoints that took the most time in total."""
+        rows = sorted(self._copy(), key=lambda kv: -kv[1]["latency_seconds"]["sum"])
+        lines = ["Time spent by endpoint:"]
+        for (service, method, endpoint), m in rows[:top]:
+            latency = m["latency_seconds"]
+            errors = sum(
+                n
+                for s, n in m["statuses"].items()
+                if s != "ok" and not s.startswith("2")
+            )
+            lines.append(
+                f"  {service} {method} {endpoint}: {latency['sum']:.2f} s "
+                f"in {m['count']} calls, p50 {(latency['p50'] or 0) * 1000:.0f} ms, "
+                f"p99 {(latency['p99'] or 0) * 1000:.0f} ms, "
+                f"{errors} errors, {m['retries']} retries, "
+                f"{m['coalesced']} saved"
+            )
+        return "\n".join(lines)
+
+
+def api_endpoint(url: str) -> str:
+    """Get the endpoint of a url, like ``/2.1/jobs/get``."""
+    path = urlparse(url).path
+    return path[len("/api") :] if path.startswith("/api/") else path
+
+
+def _labels(key: EndpointKey) -> str:
+    service, method, endpoint = key
+    return f'service="{service}",method="{method}",endpoint="{endpoint}"'
+
+
+_NO_OP = nullcontext()
+
+# the metrics of the process
+METRICS = MetricsRegistry(enabled=os.getenv(ENV_METRICS) == "1")
+
+
+def enable_metrics() -> MetricsRegistry:
+    """Start recording the calls, return the registry."""
+    METRICS.enabled = True
+    return METRICS
+
+
+def disable_metrics() -> None:
+    """Stop recording the calls, the metrics recorded so far are kept."""
+    METRICS.enabled = False
@@ -0,0 +1,1262 @@
+"""A local stand-in for the Databricks Jobs and Clusters API.
+
+The jobs routes are read from ``jobs-2.1-azure.yaml``: the required body
+fields and query parameters of each operation are checked, the query
+parameters are converted to their spec types, and each operation is served
+by the ``MockDatabricks`` method named after its ``operationId``, like
+``jobs_runs_get_output`` for ``JobsRunsGetOutput``.
+The spec has no clusters nor libraries endpoints, their routes are listed in
+``CLUSTER_ROUTES``.
+
+The state lives in memory, the life cycles follow the clock:
+
+* a new or started cluster is ``PENDING`` for ``cluster_start_seconds``, then
+  ``RUNNING``, with the matching events on ``clusters/events``,
+* a run is ``PENDING`` for ``run_pending_seconds``, then each task waits for
+  its dependencies and its cluster, runs for ``task_seconds`` and ends with
+  ``SUCCESS``, or ``FAILED`` with ``task_failure_rate``,
+* a library installed on a cluster is ``PENDING`` until the cluster runs,
+  then ``INSTALLING`` for ``library_install_seconds``, then ``INSTALLED``,
+  or ``FAILED`` if its name is in ``failing_libraries``,
+* ``idempotency_token`` is honored by ``run-now``, ``runs/submit`` and
+  ``clusters/create``.
+
+Every request waits ``latency`` seconds, a share of them is throttled with
+429 or fails with 503, and ``fail_next`` fails the next calls of an endpoint.
+
+In the same process, for the tests::
+
+    with MockServer(latency=0.01, cluster_start_seconds=2) as server:
+        with server.as_default():
+            api_client = get_databricks_client()
+            job_id = create_job(job, api_client=api_client)
+
+As a separate process::
+
+    python mock_server.py --port 8765 --throttle-rate 0.05
+    export DATABRICKS_HOST=http://127.0.0.1:8765 DATABRICKS_TOKEN=mock-token
+"""
+
+import argparse
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import itertools
+import json
+import os
+from pathlib import Path
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+from loguru import logger as lg
+import yaml
+
+from job_graph import JobGraph
+from utils import ENV_DATABRICKS_HOST, ENV_DATABRICKS_TOKEN, close_pooled_clients
+
+SPEC_PATH = Path(__file__).parent / "jobs-2.1-azure.yaml"
+REF_PREFIX = "#/components/schemas/"
+
+# the token the server accepts by default
+MOCK_TOKEN = "mock-token"
+MOCK_USER = "mock@example.com"
+
+# (method, path, operation id, required body fields, query parameter types)
+CLUSTER_ROUTES = [
+    ("POST", "/2.0/clusters/create", "ClustersCreate", ["spark_version"], {}),
+    ("POST", "/2.0/clusters/start", "ClustersStart", ["cluster_id"], {}),
+    ("POST", "/2.0/clusters/restart", "ClustersRestart", ["cluster_id"], {}),
+    ("POST", "/2.0/clusters/delete", "ClustersDelete", ["cluster_id"], {}),
+    (
+        "POST",
+        "/2.0/clusters/permanent-delete",
+        "ClustersPermanentDelete",
+        ["cluster_id"],
+        {},
+    ),
+    ("GET", "/2.0/clusters/get", "ClustersGet", [], {"cluster_id": "string"}),
+    ("GET", "/2.0/clusters/list", "ClustersList", [], {}),
+    ("POST", "/2.0/clusters/events", "ClustersEvents", ["cluster_id"], {}),
+    (
+        "GET",
+        "/2.0/libraries/cluster-status",
+        "LibrariesClusterStatus",
+        [],
+        {"cluster_id": "string"},
+    ),
+    ("POST", "/2.0/libraries/install", "LibrariesInstall", ["cluster_id"], {}),
+]
+
+# a task run time, as a number of seconds or a function of the task key
+Seconds = Union[float, Callable[[str], float]]
+
+ACTIVE_STATES = ("PENDING", "RUNNING", "TERMINATING")
+
+
+class MockApiError(Exception):
+    """An error response of the mock server."""
+
+    def __init__(self, status: int, error_code: str, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.error_code = error_code
+        self.message = message
+
+    def payload(self) -> Dict[str, str]:
+        return {"error_code": self.error_code, "message": self.message}
+
+
+def invalid(message: str) -> MockApiError:
+    return MockApiError(400, "INVALID_PARAMETER_VALUE", message)
+
+
+def invalid_state(message: str) -> MockApiError:
+    return MockApiError(400, "INVALID_STATE", message)
+
+
+##################################################
+#    Routes from the spec
+##################################################
+
+
+class Route:
+    """An endpoint of the mock server."""
+
+    __slots__ = ("method", "path", "operation_id", "required", "query_types")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        operation_id: str,
+        required: List[str],
+        query_types: Dict[str, str],
+    ) -> None:
+        """Create a Route.
+
+        Args:
+            method (str): ``GET`` or ``POST``.
+            path (str): The path after ``/api``, like ``/2.1/jobs/create``.
+            operation_id (str): The operation, like ``JobsCreate``.
+            required (List[str]): The required body fields or query parameters.
+            query_types (Dict[str, str]): The spec type of each query parameter.
+        """
+        self.method = method
+        self.path = path
+        self.operation_id = operation_id
+        self.required = required
+        self.query_types = query_types
+
+    @property
+    def handler_name(self) -> str:
+        """The ``MockDatabricks`` method serving the route."""
+        return re.sub(r"(?<!^)(?=[A-Z])", "_", self.operation_id).lower()
+
+
+def _required_fields(spec: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
+    """Get the required fields of a schema, following ``$ref`` and ``allOf``."""
+    if "$ref" in schema:
+        schema = spec["components"]["schemas"][schema["$ref"][len(REF_PREFIX) :]]
+    required = list(schema.get("required", []))
+    for part in schema.get("allOf", []):
+        required.extend(_required_fields(spec, part))
+    return required
+
+
+def load_routes(spec_path: Path = SPEC_PATH) -> Dict[Tuple[str, str], Route]:
+    """Build the routes of the jobs endpoints of the spec, and the cluster ones.
+
+    Returns:
+        Dict[Tuple[str, str], Route]: (method, path after ``/api``) -> route.
+    """
+    with open(spec_path) as f:
+        spec = yaml.safe_load(f)
+    routes = {}
+    for path, operations in spec["paths"].items():
+        for method, operation in operations.items():
+            body = operation.get("requestBody", {}).get("content", {})
+            schema = body.get("application/json", {}).get("schema", {})
+            query_types = {
+                p["name"]: p.get("schema", {}).get("type", "string")
+                for p in operation.get("parameters", [])
+                if p.get("in") == "query"
+            }
+            required = _required_fields(spec, schema) + [
+                p["name"]
+                for p in operation.get("parameters", [])
+                if p.get("in") == "query" and p.get("required")
+            ]
+            route = Route(
+                method.upper(), path, operation["operationId"], required, query_types
+            )
+            routes[route.method, path] = route
+    for method, path, operation_id, required, query_types in CLUSTER_ROUTES:
+        routes[method, path] = Route(method, path, operation_id, required, query_types)
+    return routes
+
+
+def convert_query(
+    query: Dict[str, List[str]], query_types: Dict[str, str]
+) -> Dict[str, Any]:
+    """Convert the query parameters to their spec types.
+
+    Raises:
+        MockApiError: If a value does not match its type.
+    """
+    params: Dict[str, Any] = {}
+    for name, values in query.items():
+        value = values[-1]
+        kind = query_types.get(name, "string")
+        try:
+            if kind == "integer":
+                params[name] = int(value)
+            elif kind == "boolean":
+                if value.lower() not in ("true", "false"):
+                    raise ValueError(value)
+                params[name] = value.lower() == "true"
+            elif kind == "array":
+                params[name] = values
+            else:
+                params[name] = value
+        except ValueError:
+            raise invalid(f"Invalid {kind} value {value!r} for parameter {name}.")
+    return params
+
+
+##################################################
+#    In-memory workspace
+##################################################
+
+
+class MockDatabricks:
+    """The jobs, runs and clusters of the mock workspace."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 0,
+        cluster_start_seconds: float = 5.0,
+        cluster_stop_seconds: float = 1.0,
+        run_pending_seconds: float = 1.0,
+        task_seconds: Seconds = 5.0,
+        task_failure_rate: float = 0.0,
+        export_bytes: int = 0,
+        library_install_seconds: float = 2.0,
+        failing_libraries: Tuple[str, ...] = (),
+        token: Optional[str] = MOCK_TOKEN,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+        spec_path: Path = SPEC_PATH,
+    ) -> None:
+        """Create the workspace.
+
+        Args:
+            latency (float): Seconds each request waits.
+            jitter (float): Up to this many more seconds, at random.
+            error_rate (float): Share of the requests failing with 503.
+            throttle_rate (float): Share of the requests throttled with 429.
+            retry_after (int): The ``Retry-After`` of the throttled requests.
+            cluster_start_seconds (float): Seconds a cluster is ``PENDING``.
+            cluster_stop_seconds (float): Seconds a cluster is ``TERMINATING``.
+            run_pending_seconds (float): Seconds a run is ``PENDING``.
+            task_seconds (Seconds):
+                Seconds a task runs, or a function of the task key.
+            task_failure_rate (float): Share of the tasks ending with ``FAILED``.
+            export_bytes (int): Pad the html of ``runs/export`` to this size.
+            library_install_seconds (float):
+                Seconds a library is ``INSTALLING`` on a running cluster.
+            failing_libraries (Tuple[str, ...]):
+                The packages, coordinates or files ending ``FAILED``.
+            token (Optional[str]): The accepted token, None to accept any.
+            seed (Optional[int]): Seed of the random failures.
+            clock (Callable[[], float]): The time in seconds, like ``time.time``.
+            spec_path (Path): The OpenAPI spec of the jobs endpoints.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.cluster_start_seconds = cluster_start_seconds
+        self.cluster_stop_seconds = cluster_stop_seconds
+        self.run_pending_seconds = run_pending_seconds
+        self.task_seconds = task_seconds
+        self.task_failure_rate = task_failure_rate
+        self.export_bytes = export_bytes
+        self.library_install_seconds = library_install_seconds
+        self.failing_libraries = failing_libraries
+        self.token = token
+        self.clock = clock
+        self.routes = load_routes(spec_path)
+
+        self.random = random.Random(seed)
+        self.lock = threading.RLock()
+        self.ids = itertools.count(1000)
+        # the calls received, by path
+        self.calls: Counter = Counter()
+        # path -> [(status, times left, apply the call before failing)]
+        self._faults: Dict[str, List[List[Any]]] = {}
+
+        self.jobs: Dict[int, Dict[str, Any]] = {}
+        self.runs: Dict[int, Dict[str, Any]] = {}
+        # task run id -> (run id, index of the task)
+        self.task_runs: Dict[int, Tuple[int, int]] = {}
+        self.run_numbers: Counter = Counter()
+        self.clusters: Dict[str, Dict[str, Any]] = {}
+        self.cluster_events: Dict[str, List[Dict[str, Any]]] = {}
+        # cluster id -> library key -> the library and when it was requested
+        self.libraries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # cluster id -> (time, next state, event type) of the pending transition
+        self._transitions: Dict[str, Tuple[float, str, str]] = {}
+        # (kind, token) -> id
+        self._idempotency: Dict[Tuple[str, str], Any] = {}
+
+    def configure(self, **options: Any) -> None:
+        """Change the latency, failure or life cycle settings."""
+        with self.lock:
+            for name, value in options.items():
+                if not hasattr(self, name):
+                    raise AttributeError(f"Unknown option {name}.")
+                setattr(self, name, value)
+
+    def fail_next(
+        self, path: str, status: int = 503, times: int = 1, applied: bool = False
+    ) -> None:
+        """Fail the next calls of an endpoint.
+
+        Args:
+            path (str): The endpoint, like ``/2.1/jobs/create``.
+            status (int): The status of the failures.
+            times (int): How many calls fail.
+            applied (bool):
+                Apply the call before failing, like a timeout after the
+                workspace got the request.
+        """
+        with self.lock:
+            self._faults.setdefault(path, []).append([status, times, applied])
+
+    ##################################################
+    #    Requests
+    ##################################################
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, List[str]],
+        body: Any,
+        authorization: Optional[str] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Serve a request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The url path, like ``/api/2.1/jobs/get``.
+            query (Dict[str, List[str]]): The parsed query string.
+            body (Any): The decoded json body, or None.
+            authorization (Optional[str]): The ``Authorization`` header.
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: The status and the payload.
+        """
+        delay = self.latency + (
+            self.random.uniform(0, self.jitter) if self.jitter else 0
+        )
+        if delay:
+            time.sleep(delay)
+        api_path = path[len("/api") :] if path.startswith("/api/") else path
+        self.calls[api_path] += 1
+        try:
+            if self.token is not None and authorization != f"Bearer {self.token}":
+                raise MockApiError(401, "UNAUTHENTICATED", "Invalid access token.")
+            route = self.routes.get((method, api_path))
+            if route is None:
+                raise MockApiError(
+                    404, "ENDPOINT_NOT_FOUND", f"No API found for '{method} {path}'."
+                )
+            if self.throttle_rate and self.random.random() < self.throttle_rate:
+                raise MockApiError(
+                    429, "REQUEST_LIMIT_EXCEEDED", "Too many requests, retry later."
+                )
+            if self.error_rate and self.random.random() < self.error_rate:
+                raise MockApiError(
+                    503, "TEMPORARILY_UNAVAILABLE", "The service is unavailable."
+                )
+            fault = self._take_fault(api_path)
+            if fault is not None and not fault[2]:
+                raise MockApiError(fault[0], "MOCK_FAULT", "Injected failure.")
+
+            if method == "GET":
+                params = convert_query(query, route.query_types)
+            else:
+                params = body if isinstance(body, dict) else {}
+            missing = [f for f in route.required if params.get(f) is None]
+            if missing:
+                raise invalid(f"Missing required field: {', '.join(missing)}.")
+            handler = getattr(self, route.handler_name, None)
+            if handler is None:
+                raise MockApiError(
+                    501, "NOT_IMPLEMENTED", f"{route.operation_id} is not mocked."
+                )
+            with self.lock:
+                payload = handler(params)
+            if fault is not None:
+                raise MockApiError(fault[0], "MOCK_FAULT", "Injected failure.")
+            return 200, payload
+        except MockApiError as e:
+            return e.status, e.payload()
+
+    def _take_fault(self, path: str) -> Optional[List[Any]]:
+        with self.lock:
+            faults = self._faults.get(path)
+            if not faults:
+                return None
+            fault = faults[0]
+            fault[1] -= 1
+            if fault[1] <= 0:
+                faults.pop(0)
+            return fault
+
+    def _idempotent(self, kind: str, token: Optional[str], create: Callable[[], Any]):
+        """Create the resource once per idempotency token."""
+        if token is None:
+            return create()
+        if len(token) > 64:
+            raise invalid("The idempotency token must have at most 64 characters.")
+        key = (kind, token)
+        if key not in self._idempotency:
+            self._idempotency[key] = create()
+        return self._idempotency[key]
+
+    def _now_ms(self) -> int:
+        return int(self.clock() * 1000)
+
+    ##################################################
+    #    Jobs
+    ##################################################
+
+    def _get_job(self, job_id: Any) -> Dict[str, Any]:
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise invalid(f"Job {job_id} does not exist.")
+        return job
+
+    @staticmethod
+    def _check_tasks(settings: Dict[str, Any]) -> None:
+        graph = JobGraph.from_job(settings)
+        if not graph.valid:
+            raise invalid(" ".join(issue.message for issue in graph.issues[:5]))
+
+    def jobs_create(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        settings = {k: v for k, v in params.items() if k != "access_control_list"}
+        self._check_tasks(settings)
+        job_id = next(self.ids)
+        self.jobs[job_id] = {
+            "job_id": job_id,
+            "creator_user_name": MOCK_USER,
+            "created_time": self._now_ms(),
+            "settings": settings,
+        }
+        return {"job_id": job_id}
+
+    def jobs_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        offset, limit = self._page(params, default_limit=20)
+        name = params.get("name")
+        jobs = [
+            job
+            for job in self.jobs.values()
+            if name is None or job["settings"].get("name", "").lower() == name.lower()
+        ]
+        page = []
+        for job in jobs[offset : offset + limit]:
+            if not params.get("expand_tasks"):
+                settings = {k: v for k, v in job["settings"].items() if k != "tasks"}
+                job = {**job, "settings": settings}
+            page.append(job)
+        return self._page_payload("jobs", page, offset + limit < len(jobs))
+
+    def jobs_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._get_job(params.get("job_id"))
+
+    def jobs_reset(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        job = self._get_job(params["job_id"])
+        settings = params.get("new_settings") or {}
+        self._check_tasks(settings)
+        job["settings"] = settings
+        return {}
+
+    def jobs_update(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        job = self._get_job(params["job_id"])
+        settings = {**job["settings"], **(params.get("new_settings") or {})}
+        for field in params.get("fields_to_remove") or []:
+            settings.pop(field, None)
+        self._check_tasks(settings)
+        job["settings"] = settings
+        return {}
+
+    def jobs_delete(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._get_job(params["job_id"])
+        del self.jobs[params["job_id"]]
+        return {}
+
+    @staticmethod
+    def _page(params: Dict[str, Any], default_limit: int) -> Tuple[int, int]:
+        offset = params.get("offset", 0)
+        limit = params.get("limit", default_limit)
+        if not 1 <= limit <= 25:
+            raise invalid(f"Invalid limit {limit}, it must be between 1 and 25.")
+        if offset < 0:
+            raise invalid(f"Invalid offset {offset}.")
+        return offset, limit
+
+    @staticmethod
+    def _page_payload(
+        key: str, items: List[Dict[str, Any]], has_more: bool
+    ) -> Dict[str, Any]:
+        # like the API, the key is left out of the empty pages
+        payload: Dict[str, Any] = {"has_more": has_more}
+        if items:
+            payload[key] = items
+        return payload
+
+    ##################################################
+    #    Runs
+    ##################################################
+
+    def _task_seconds(self, task_key: str) -> float:
+        if callable(self.task_seconds):
+            return self.task_seconds(task_key)
+        return self.task_seconds
+
+    def _new_run(
+        self,
+        tasks: List[Dict[str, Any]],
+        run_type: str,
+        run_name: Optional[str],
+        job_id: Optional[int] = None,
+        job_clusters: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        run_id = next(self.ids)
+        now = self.clock()
+        run: Dict[str, Any] = {
+            "run_id": run_id,
+            "job_id": job_id,
+            "run_name": run_name or "Untitled",
+            "run_type": run_type,
+            "submitted": now,
+            "canceled_at": None,
+            "tasks": [],
+            "repair_ids": [],
+        }
+        if job_id is not None:
+            self.run_numbers[job_id] += 1
+            run["number_in_job"] = self.run_numbers[job_id]
+        for index, settings in enumerate(tasks):
+            task_run_id = next(self.ids)
+            self.task_runs[task_run_id] = (run_id, index)
+            run["tasks"].append(
+                {"run_id": task_run_id, "settings": settings, "attempt_number": 0}
+            )
+        self.runs[run_id] = run
+        self._schedule(run, now + self.run_pending_seconds, range(len(tasks)))
+        return run_id
+
+    def _cluster_ready_at(self, settings: Dict[str, Any], ready: float) -> float:
+        """When the cluster of a task can run it, starting it if needed.
+
+        A new cluster is created when the task is ready,
+        an existing cluster that is terminated is started right away.
+        """
+        if settings.get("new_cluster") or settings.get("job_cluster_key"):
+            return ready + self.cluster_start_seconds
+        cluster_id = settings.get("existing_cluster_id")
+        cluster = self.clusters.get(cluster_id)  # type: ignore[arg-type]
+        if cluster is None:
+            return ready
+        now = self.clock()
+        self._advance_cluster(cluster_id, now)  # type: ignore[arg-type]
+        if cluster["state"] in ("TERMINATED", "TERMINATING"):
+            self._start_cluster(cluster_id, "STARTING", now)  # type: ignore[arg-type]
+        transition = self._transitions.get(cluster_id)  # type: ignore[arg-type]
+        return transition[0] if transition else ready
+
+    def _schedule(self, run: Dict[str, Any], start: float, indexes: Any) -> None:
+        """Set the start, end and outcome of the tasks to (re)run.
+
+        A task starts after its dependencies and once its cluster is running,
+        the tasks downstream of a failure end with ``UPSTREAM_FAILED``.
+        """
+        tasks = run["tasks"]
+        graph = JobGraph(task["settings"] for task in tasks)
+        todo = set(indexes)
+        for key in graph.topological_order():
+            task = tasks[graph.index[key]]
+            if graph.index[key] not in todo:
+                continue
+            settings = task["settings"]
+            parents = [tasks[p] for p in graph.parents[graph.index[key]]]
+            ready = max([start] + [p["end"] for p in parents])
+            task["attempt_number"] += 1 if "outcome" in task else 0
+            if any(p["outcome"] != "SUCCESS" for p in parents):
+                task.update(start=ready, end=ready, setup=0.0)
+                task["outcome"] = "UPSTREAM_FAILED"
+                continue
+            cluster_ready = self._cluster_ready_at(settings, ready)
+            task_start = max(ready, cluster_ready)
+            task.update(
+                start=task_start,
+                end=task_start + self._task_seconds(key),
+                setup=task_start - ready,
+            )
+            failed = self.random.random() < self.task_failure_rate
+            task["outcome"] = "FAILED" if failed else "SUCCESS"
+
+    def _task_payload(self, run: Dict[str, Any], task: Dict[str, Any], now: float):
+        settings = task["settings"]
+        canceled_at = run["canceled_at"]
+        state: Dict[str, Any]
+        end = task["end"]
+        if canceled_at is not None and canceled_at < end:
+            state = {"life_cycle_state": "TERMINATED", "result_state": "CANCELED"}
+            end = max(canceled_at, task["start"])
+        elif now < task["start"]:
+            state = {"life_cycle_state": "PENDING"}
+        elif now < end:
+            state = {"life_cycle_state": "RUNNING"}
+        else:
+            state = {"life_cycle_state": "TERMINATED", "result_state": task["outcome"]}
+        state["state_message"] = ""
+        state["user_cancelled_or_timedout"] = canceled_at is not None
+
+        payload: Dict[str, Any] = {
+            "run_id": task["run_id"],
+            "task_key": settings.get("task_key"),
+            "state": state,
+            "attempt_number": task["attempt_number"],
+            "start_time": int(run["submitted"] * 1000),
+            "setup_duration": 0,
+            "execution_duration": 0,
+            "cleanup_duration": 0,
+        }
+        for field in (
+            "description",
+            "depends_on",
+            "existing_cluster_id",
+            "new_cluster",
+            "libraries",
+            "notebook_task",
+            "spark_python_task",
+            "python_wheel_task",
+            "spark_jar_task",
+        ):
+            if field in settings:
+                payload[field] = settings[field]
+        cluster_id = settings.get("existing_cluster_id")
+        if cluster_id is not None:
+            payload["cluster_instance"] = {"cluster_id": cluster_id}
+        if state["life_cycle_state"] != "PENDING":
+            payload["start_time"] = int((task["start"] - task["setup"]) * 1000)
+            payload["setup_duration"] = int(task["setup"] * 1000)
+            execution = max(min(now, end) - task["start"], 0)
+            payload["execution_duration"] = int(execution * 1000)
+        if state["life_cycle_state"] == "TERMINATED":
+            payload["end_time"] = int(end * 1000)
+        return payload
+
+    def _run_payload(self, run: Dict[str, Any], expand_tasks: bool = True):
+        now = self.clock()
+        tasks = [self._task_payload(run, task, now) for task in run["tasks"]]
+        states = [task["state"] for task in tasks]
+        payload: Dict[str, Any] = {
+            "run_id": run["run_id"],
+            "run_name": run["run_name"],
+            "run_type": run["run_type"],
+            "creator_user_name": MOCK_USER,
+            "number_in_job": run.get("number_in_job", 1),
+            "start_time": int(run["submitted"] * 1000),
+            "setup_duration": 0,
+            "execution_duration": 0,
+            "cleanup_duration": 0,
+            "trigger": "ONE_TIME",
+            "format": "MULTI_TASK",
+            "run_page_url": f"https://mock/#job/{run['job_id']}/run/{run['run_id']}",
+        }
+        if run["job_id"] is not None:
+            payload["job_id"] = run["job_id"]
+        if run["repair_ids"]:
+            payload["repair_history"] = [{"id": i} for i in run["repair_ids"]]
+
+        state: Dict[str, Any]
+        if all(s["life_cycle_state"] == "TERMINATED" for s in states):
+            results = [s["result_state"] for s in states]
+            if run["canceled_at"] is not None:
+                result = "CANCELED"
+            elif all(r == "SUCCESS" for r in results):
+                result = "SUCCESS"
+            else:
+                result = "FAILED"
+            state = {"life_cycle_state": "TERMINATED", "result_state": result}
+            end = max([t["end_time"] for t in tasks], default=payload["start_time"])
+            payload["end_time"] = end
+            payload["run_duration"] = end - payload["start_time"]
+        elif all(s["life_cycle_state"] == "PENDING" for s in states):
+            state = {"life_cycle_state": "PENDING"}
+        else:
+            state = {"life_cycle_state": "RUNNING"}
+        state["state_message"] = ""
+        state["user_cancelled_or_timedout"] = run["canceled_at"] is not None
+        payload["state"] = state
+        if expand_tasks:
+            payload["tasks"] = tasks
+        return payload
+
+    def _get_run(self, run_id: Any) -> Dict[str, Any]:
+        run = self.runs.get(run_id)
+        if run is None:
+            raise invalid(f"Run {run_id} does not exist.")
+        return run
+
+    def _is_active(self, run: Dict[str, Any]) -> bool:
+        payload = self._run_payload(run, expand_tasks=False)
+        return payload["state"]["life_cycle_state"] in ACTIVE_STATES
+
+    def jobs_run_now(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if params.get("job_id") is None:
+            raise invalid("Missing required field: job_id.")
+        job = self._get_job(params["job_id"])
+        settings = job["settings"]
+
+        def create() -> int:
+            tasks = [dict(task) for task in settings.get("tasks", [])]
+            notebook_params = params.get("notebook_params")
+            for task in tasks:
+                if notebook_params and "notebook_task" in task:
+                    notebook_task = dict(task["notebook_task"])
+                    notebook_task["base_parameters"] = {
+                        **notebook_task.get("base_parameters", {}),
+                        **notebook_params,
+                    }
+                    task["notebook_task"] = notebook_task
+            return self._new_run(
+                tasks, "JOB_RUN", settings.get("name"), job_id=job["job_id"]
+            )
+
+        run_id = self._idempotent("run", params.get("idempotency_token"), create)
+        if run_id not in self.runs:
+            raise invalid_state(f"The run {run_id} of this token was deleted.")
+        run = self.runs[run_id]
+        return {"run_id": run_id, "number_in_job": run.get("number_in_job")}
+
+    def jobs_runs_submit(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        tasks = params.get("tasks") or []
+        self._check_tasks(params)
+
+        def create() -> int:
+            return self._new_run(tasks, "SUBMIT_RUN", params.get("run_name"))
+
+        run_id = self._idempotent("run", params.get("idempotency_token"), create)
+        if run_id not in self.runs:
+            raise invalid_state(f"The run {run_id} of this token was deleted.")
+        return {"run_id": run_id}
+
+    def jobs_runs_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if params.get("active_only") and params.get("completed_only"):
+            raise invalid("active_only and completed_only cannot both be true.")
+        offset, limit = self._page(params, default_limit=25)
+        runs = []
+        for run in self.runs.values():
+            if "job_id" in params and run["job_id"] != params["job_id"]:
+                continue
+            if "run_type" in params and run["run_type"] != params["run_type"]:
+                continue
+            start = int(run["submitted"] * 1000)
+            if start < params.get("start_time_from", 0):
+                continue
+            if "start_time_to" in params and start > params["start_time_to"]:
+                continue
+            payload = self._run_payload(run, params.get("expand_tasks", False))
+            active = payload["state"]["life_cycle_state"] in ACTIVE_STATES
+            if params.get("active_only") and not active:
+                continue
+            if params.get("completed_only") and active:
+                continue
+            runs.append(payload)
+        # the most recent first
+        runs.sort(key=lambda r: (r["start_time"], r["run_id"]), reverse=True)
+        page = runs[offset : offset + limit]
+        return self._page_payload("runs", page, offset + limit < len(runs))
+
+    def jobs_runs_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if params.get("run_id") is None:
+            raise invalid("Missing required field: run_id.")
+        if params["run_id"] in self.task_runs:
+            run_id, index = self.task_runs[params["run_id"]]
+            run = self.runs[run_id]
+            return self._task_payload(run, run["tasks"][index], self.clock())
+        return self._run_payload(self._get_run(params["run_id"]))
+
+    def _get_task_run(self, run_id: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Get the run and the task of a task run id, or of a single task run."""
+        if run_id in self.task_runs:
+            parent_id, index = self.task_runs[run_id]
+            run = self.runs[parent_id]
+            return run, run["tasks"][index]
+        run = self._get_run(run_id)
+        if len(run["tasks"]) != 1:
+            raise invalid(
+                "Retrieving the output of runs with multiple tasks is not supported. "
+                "Please retrieve the output of each individual task run instead."
+            )
+        return run, run["tasks"][0]
+
+    def jobs_runs_get_output(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if params.get("run_id") is None:
+            raise invalid("Missing required field: run_id.")
+        run, task = self._get_task_run(params["run_id"])
+        metadata = self._task_payload(run, task, self.clock())
+        payload: Dict[str, Any] = {"metadata": metadata}
+        result_state = metadata["state"].get("result_state")
+        if result_state == "FAILED":
+            payload["error"] = f"Task {metadata['task_key']} failed."
+            payload["error_trace"] = "Traceback (most recent call last): ..."
+        elif result_state == "SUCCESS":
+            payload["notebook_output"] = {
+                "result": f"Output of {metadata['task_key']}",
+                "truncated": False,
+            }
+        return payload
+
+    def jobs_runs_export(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if params.get("run_id") is None:
+            raise invalid("Missing required field: run_id.")
+        run, task = self._get_task_run(params["run_id"])
+        task_key = task["settings"].get("task_key")
+        content = f"<html><body><h1>{task_key}</h1></body></html>"
+        if len(content) < self.export_bytes:
+            padding = "<!--" + "x" * (self.export_bytes - len(content) - 7) + "-->"
+            content = content.replace("</body>", padding + "</body>")
+        return {"views": [{"content": content, "name": task_key, "type": "NOTEBOOK"}]}
+
+    def jobs_runs_cancel(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        run = self._get_run(params["run_id"])
+        if self._is_active(run):
+            run["canceled_at"] = self.clock()
+        return {}
+
+    def jobs_runs_cancel_all(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._get_job(params["job_id"])
+        now = self.clock()
+        for run in self.runs.values():
+            if run["job_id"] == params["job_id"] and self._is_active(run):
+                run["canceled_at"] = now
+        return {}
+
+    def jobs_runs_delete(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        run = self._get_run(params.get("run_id"))
+        if self._is_active(run):
+            raise invalid_state(f"Run {run['run_id']} is active, cancel it first.")
+        for task in run["tasks"]:
+            self.task_runs.pop(task["run_id"], None)
+        del self.runs[run["run_id"]]
+        return {}
+
+    def jobs_runs_repair(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        run = self._get_run(params.get("run_id"))
+        if self._is_active(run):
+            raise invalid_state(f"Run {run['run_id']} is still active.")
+        keys = [task["settings"].get("task_key") for task in run["tasks"]]
+        if params.get("rerun_all_failed_tasks"):
+            rerun = [
+                i for i, task in enumerate(run["tasks"]) if task["outcome"] != "SUCCESS"
+            ]
+        else:
+            unknown = set(params.get("rerun_tasks") or []) - set(keys)
+            if unknown:
+                raise invalid(f"Unknown tasks to rerun: {', '.join(sorted(unknown))}.")
+            rerun = [keys.index(key) for key in params.get("rerun_tasks") or []]
+        if not rerun:
+            raise invalid("There are no tasks to rerun.")
+        repair_id = next(self.ids)
+        run["repair_ids"].append(repair_id)
+        run["canceled_at"] = None
+        self._schedule(run, self.clock(), rerun)
+        return {"repair_id": repair_id}
+
+    ##################################################
+    #    Clusters
+    ##################################################
+
+    def _get_cluster(self, cluster_id: Any) -> Dict[str, Any]:
+        cluster = self.clusters.get(cluster_id)
+        if cluster is None:
+            raise invalid(f"Cluster {cluster_id} does not exist")
+        self._advance_cluster(cluster_id, self.clock())
+        return cluster
+
+    def _event(self, cluster_id: str, event_type: str, at: float) -> None:
+        self.cluster_events[cluster_id].append(
+            {"cluster_id": cluster_id, "timestamp": int(at * 1000), "type": event_type}
+        )
+
+    def _advance_cluster(self, cluster_id: str, now: float) -> None:
+        """Apply the pending transition of a cluster, if it is due."""
+        transition = self._transitions.get(cluster_id)
+        if transition is None or now < transition[0]:
+            return
+        at, state, event_type = self._transitions.pop(cluster_id)
+        cluster = self.clusters[cluster_id]
+        cluster["state"] = state
+        cluster["state_message"] = ""
+        if state == "RUNNING":
+            cluster["last_restarted_time"] = int(at * 1000)
+        else:
+            cluster["terminated_time"] = int(at * 1000)
+        self._event(cluster_id, event_type, at)
+
+    def _start_cluster(self, cluster_id: str, event_type: str, now: float) -> None:
+        cluster = self.clusters[cluster_id]
+        cluster["state"] = "RESTARTING" if event_type == "RESTARTING" else "PENDING"
+        cluster["state_message"] = "Finding instances for new nodes"
+        cluster["start_time"] = cluster.get("start_time") or int(now * 1000)
+        cluster.pop("terminated_time", None)
+        self._event(cluster_id, event_type, now)
+        self._transitions[cluster_id] = (
+            now + self.cluster_start_seconds,
+            "RUNNING",
+            "RUNNING",
+        )
+
+    def clusters_create(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if params.get("num_workers") is None and params.get("autoscale") is None:
+            raise invalid("Missing required field: num_workers or autoscale.")
+
+        def create() -> str:
+            cluster_id = f"mock-{next(self.ids):06}"
+            cluster = {k: v for k, v in params.items() if k != "idempotency_token"}
+            cluster.update(
+                cluster_id=cluster_id,
+                creator_user_name=MOCK_USER,
+                cluster_source="API",
+                default_tags={"Vendor": "Databricks", "ClusterId": cluster_id},
+            )
+            self.clusters[cluster_id] = cluster
+            self.cluster_events[cluster_id] = []
+            self._start_cluster(cluster_id, "CREATING", self.clock())
+            return cluster_id
+
+        cluster_id = self._idempotent(
+            "cluster", params.get("idempotency_token"), create
+        )
+        if cluster_id not in self.clusters:
+            raise invalid_state(f"The cluster {cluster_id} of this token was deleted.")
+        return {"cluster_id": cluster_id}
+
+    def clusters_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(self._get_cluster(params.get("cluster_id")))
+
+    def clusters_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        clusters = [self.clusters_get({"cluster_id": c}) for c in self.clusters]
+        return {"clusters": clusters} if clusters else {}
+
+    def clusters_start(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        cluster = self._get_cluster(params["cluster_id"])
+        if cluster["state"] != "TERMINATED":
+            raise invalid_state(
+                f"Cluster {params['cluster_id']} is in unexpected state "
+                f"{cluster['state'].title()}."
+            )
+        self._start_cluster(params["cluster_id"], "STARTING", self.clock())
+        return {}
+
+    def clusters_restart(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        cluster = self._get_cluster(params["cluster_id"])
+        if cluster["state"] != "RUNNING":
+            raise invalid_state(
+                f"Cluster {params['cluster_id']} is in unexpected state "
+                f"{cluster['state'].title()}."
+            )
+        self._start_cluster(params["cluster_id"], "RESTARTING", self.clock())
+        return {}
+
+    def clusters_delete(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        cluster = self._get_cluster(params["cluster_id"])
+        if cluster["state"] in ("TERMINATING", "TERMINATED"):
+            return {}
+        now = self.clock()
+        cluster["state"] = "TERMINATING"
+        cluster["state_message"] = "Terminating the cluster"
+        self._event(params["cluster_id"], "TERMINATING", now)
+        self._transitions[params["cluster_id"]] = (
+            now + self.cluster_stop_seconds,
+            "TERMINATED",
+            "TERMINATED",
+        )
+        return {}
+
+    def clusters_permanent_delete(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._get_cluster(params["cluster_id"])
+        del self.clusters[params["cluster_id"]]
+        self.libraries.pop(params["cluster_id"], None)
+        self.cluster_events.pop(params["cluster_id"], None)
+        self._transitions.pop(params["cluster_id"], None)
+        return {}
+
+    def clusters_events(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._get_cluster(params["cluster_id"])
+        events = [
+            e
+            for e in self.cluster_events[params["cluster_id"]]
+            if params.get("start_time", 0) <= e["timestamp"]
+            and e["timestamp"] <= params.get("end_time", e["timestamp"])
+            and e["type"] in params.get("event_types", [e["type"]])
+        ]
+        if params.get("order", "DESC") == "DESC":
+            events.reverse()
+        offset = params.get("offset", 0)
+        limit = params.get("limit", 50)
+        payload: Dict[str, Any] = {
+            "events": events[offset : offset + limit],
+            "total_count": len(events),
+        }
+        if offset + limit < len(events):
+            payload["next_page"] = {**params, "offset": offset + limit, "limit": limit}
+        return payload
+
+    ##################################################
+    #    Libraries
+    ##################################################
+
+    def libraries_cluster_status(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        cluster = self._get_cluster(params.get("cluster_id"))
+        now = self.clock()
+        statuses = []
+        for entry in self.libraries.get(params["cluster_id"], {}).values():
+            status, messages = self._library_status(cluster, entry, now)
+            library_status: Dict[str, Any] = {
+                "library": entry["library"],
+                "status": status,
+                "is_library_for_all_clusters": False,
+            }
+            if messages:
+                library_status["messages"] = messages
+            statuses.append(library_status)
+        payload: Dict[str, Any] = {"cluster_id": params["cluster_id"]}
+        if statuses:
+            payload["library_statuses"] = statuses
+        return payload
+
+    def libraries_install(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._get_cluster(params["cluster_id"])
+        libraries = params.get("libraries")
+        if not libraries:
+            raise invalid("Missing required field: libraries.")
+        installed = self.libraries.setdefault(params["cluster_id"], {})
+        now = self.clock()
+        for library in libraries:
+            key = json.dumps(library, sort_keys=True)
+            # a library already requested is left as it is
+            installed.setdefault(key, {"library": library, "requested_at": now})
+        return {}
+
+    def _library_status(
+        self, cluster: Dict[str, Any], entry: Dict[str, Any], now: float
+    ) -> Tuple[str, List[str]]:
+        """The status of a library, installed once the cluster runs."""
+        if cluster["state"] != "RUNNING":
+            return "PENDING", []
+        restarted = cluster.get("last_restarted_time", 0) / 1000
+        started = max(entry["requested_at"], restarted)
+        if now < started + self.library_install_seconds:
+            return "INSTALLING", []
+        name = library_name(entry["library"])
+        if name in self.failing_libraries:
+            return "FAILED", [f"Library installation failed for library {name}."]
+        return "INSTALLED", []
+
+
+def library_name(library: Dict[str, Any]) -> str:
+    """Get the package, coordinates or file of a library."""
+    for kind, spec in library.items():
+        if isinstance(spec, dict):
+            return spec.get("package") or spec.get("coordinates") or kind
+        return spec
+    return ""
+
+
+##################################################
+#    HTTP server
+##################################################
+
+
+class MockServer:
+    """The HTTP server of a ``MockDatabricks``, in a background thread."""
+
+    def __init__(
+        self,
+        workspace: Optional[MockDatabricks] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        **options: Any,
+    ) -> None:
+        """Create the server, ``start`` it or use it as a context manager.
+
+        Args:
+            workspace (Optional[MockDatabricks]):
+                The state to serve, a new one built with ``options`` if None.
+            host (str): The interface to listen on.
+            port (int): The port to listen on, a free one if 0.
+            options: Forwarded to ``MockDatabricks``.
+        """
+        self.workspace = workspace or MockDatabricks(**options)
+        self.address = (host, port)
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("The mock server is not started.")
+        return f"http://{self.address[0]}:{self._server.server_port}"
+
+    @property
+    def token(self) -> str:
+        return self.workspace.token or MOCK_TOKEN
+
+    def start(self) -> "MockServer":
+        workspace = self.workspace
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _answer(self) -> None:
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    body = json.loads(self.rfile.read(length)) if length else None
+                except ValueError:
+                    body = None
+                status, payload = workspace.handle(
+                    self.command,
+                    url.path,
+                    parse_qs(url.query),
+                    body,
+                    self.headers.get("Authorization"),
+                )
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", str(workspace.retry_after))
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _answer
+            do_POST = _answer
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(self.address, Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name="MockServer", daemon=True
+        ).start()
+        lg.debug("Mock Databricks listening on {}", self.url)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def environ(self) -> Dict[str, str]:
+        """The environment variables pointing the default clients at the server."""
+        return {ENV_DATABRICKS_HOST: self.url, ENV_DATABRICKS_TOKEN: self.token}
+
+    @contextmanager
+    def as_default(self) -> Iterator["MockServer"]:
+        """Point ``get_databricks_client()`` and friends at the server."""
+        saved = {name: os.environ.get(name) for name in self.environ()}
+        os.environ.update(self.environ())
+        close_pooled_clients()
+        try:
+            yield self
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            close_pooled_clients()
+
+
+def start_mock_process(port: int = 0, **options: Any) -> Tuple[subprocess.Popen, str]:
+    """Run the mock server in a separate process.
+
+    Args:
+        port (int): The port to listen on, a free one if 0.
+        options: The numeric options of ``MockDatabricks``, like ``latency``.
+
+    Returns:
+        Tuple[subprocess.Popen, str]: The process, to terminate, and the url.
+    """
+    command = [sys.executable, str(Path(__file__)), "--port", str(port)]
+    for name, value in options.items():
+        command += [f"--{name.replace('_', '-')}", str(value)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    # the first line is the url, once the server listens
+    url = process.stdout.readline().strip()  # type: ignore[union-attr]
+    if not url:
+        process.kill()
+        raise RuntimeError("The mock server process did not start.")
+    return process, url
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--token", default=MOCK_TOKEN)
+    parser.add_argument("--seed", type=int)
+    for name in (
+        "latency",
+        "jitter",
+        "error_rate",
+        "throttle_rate",
+        "cluster_start_seconds",
+        "cluster_stop_seconds",
+        "run_pending_seconds",
+        "task_seconds",
+        "task_failure_rate",
+        "library_install_seconds",
+    ):
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float)
+    parser.add_argument("--retry-after", type=int)
+    parser.add_argument("--export-bytes", type=int)
+    args = vars(parser.parse_args())
+    host, port = args.pop("host"), args.pop("port")
+    options = {k: v for k, v in args.items() if v is not None}
+
+    server = MockServer(host=host, port=port, **options).start()
+    print(server.url, flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,315 @@
+"""Start the clusters of the scheduled jobs before the jobs fire.
+
+The tasks of a scheduled job on an ``existing_cluster_id`` wait for the
+cluster to start when it has auto-terminated. ``PrewarmScheduler`` reads the
+``CronSchedule`` of every job, finds the next fire time of each cluster the
+jobs run on, and starts the cluster ahead of it:
+
+* the lead time is the measured start-up time of the cluster, a percentile
+  of the ``STARTING`` / ``RESTARTING`` to ``RUNNING`` delays of its events,
+  plus a margin,
+* a cluster shared by several jobs is started once, for the earliest one,
+* only a ``TERMINATED`` cluster is started, a running one is left alone.
+
+Run it as a service, or call ``tick`` from an existing loop::
+
+    scheduler = PrewarmScheduler(lead_margin=120)
+    for warmup in scheduler.plan():
+        lg.info("{}", warmup)
+    scheduler.run()  # until interrupted
+
+From the command line::
+
+    python prewarm.py plan
+    python prewarm.py run --lead-margin 120
+"""
+
+import argparse
+from datetime import datetime, timezone
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+from requests.exceptions import HTTPError
+
+from quartz_cron import CronExpression, compile_cron
+from run_history import percentile
+from schedule_report import read_schedules
+from utils import get_databricks_client, jd
+
+# the events opening and closing a start of a cluster
+START_EVENTS = ("CREATING", "STARTING", "RESTARTING")
+RUNNING_EVENT = "RUNNING"
+
+
+class Warmup:
+    """The next start of a cluster, ahead of the jobs running on it."""
+
+    __slots__ = ("cluster_id", "fire_time", "start_at", "lead_seconds", "job_ids")
+
+    def __init__(
+        self,
+        cluster_id: str,
+        fire_time: float,
+        lead_seconds: float,
+        job_ids: List[int],
+    ) -> None:
+        """Create a Warmup.
+
+        Args:
+            cluster_id (str): The cluster to start.
+            fire_time (float): The first fire time of the jobs, epoch seconds.
+            lead_seconds (float): How long before the fire time to start it.
+            job_ids (List[int]): The jobs firing at that time on the cluster.
+        """
+        self.cluster_id = cluster_id
+        self.fire_time = fire_time
+        self.lead_seconds = lead_seconds
+        self.start_at = fire_time - lead_seconds
+        self.job_ids = job_ids
+
+    def __repr__(self) -> str:
+        return (
+            f"Warmup({self.cluster_id}, start at {_iso(self.start_at)} "
+            f"for {_iso(self.fire_time)}, jobs {self.job_ids})"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cluster_id": self.cluster_id,
+            "fire_time": _iso(self.fire_time),
+            "start_at": _iso(self.start_at),
+            "lead_seconds": self.lead_seconds,
+            "job_ids": self.job_ids,
+        }
+
+
+def _iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat()
+
+
+class PrewarmScheduler:
+    """Start the clusters of the scheduled jobs ahead of their fire times."""
+
+    def __init__(
+        self,
+        api_client: Optional[ApiClient] = None,
+        lead_margin: float = 60.0,
+        default_start_seconds: float = 300.0,
+        start_percentile: float = 90.0,
+        history: int = 20,
+        refresh_seconds: float = 900.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Create a PrewarmScheduler.
+
+        Args:
+            api_client (Optional[ApiClient]):
+                The client to use, the default one if not provided.
+            lead_margin (float): Seconds added to the start-up time.
+            default_start_seconds (float):
+                The start-up time of a cluster without any measured start.
+            start_percentile (float): The percentile of the measured starts.
+            history (int): The last starts of a cluster taken into account.
+            refresh_seconds (float):
+                Seconds after which the schedules and the start-up times are
+                read again.
+            clock (Callable[[], float]): The time in seconds, like ``time.time``.
+        """
+        self.api_client = api_client
+        self.lead_margin = lead_margin
+        self.default_start_seconds = default_start_seconds
+        self.start_percentile = start_percentile
+        self.history = history
+        self.refresh_seconds = refresh_seconds
+        self.clock = clock
+        # cluster id -> [(job id, expression, timezone)]
+        self._schedules: Dict[str, List[Tuple[int, CronExpression, str]]] = {}
+        self._start_seconds: Dict[str, float] = {}
+        self._loaded_at: Optional[float] = None
+        # (cluster id, fire time) already handled
+        self._done: Set[Tuple[str, float]] = set()
+
+    def _client(self) -> ApiClient:
+        if self.api_client is None:
+            return get_databricks_client()
+        return self.api_client
+
+    ##################################################
+    #    Schedules and start-up times
+    ##################################################
+
+    def refresh(self) -> None:
+        """Read the schedules of the jobs, and forget the start-up times."""
+        schedules: Dict[str, List[Tuple[int, CronExpression, str]]] = {}
+        job_schedules = read_schedules(self._client())
+        for job in job_schedules:
+            cron = compile_cron(job.quartz_cron_expression)
+            for cluster_id in job.cluster_ids:
+                schedules.setdefault(cluster_id, []).append(
+                    (job.job_id, cron, job.timezone_id)
+                )
+        self._schedules = schedules
+        self._start_seconds = {}
+        self._loaded_at = self.clock()
+        lg.info("{} scheduled jobs on {} clusters", len(job_schedules), len(schedules))
+
+    def start_seconds(self, cluster_id: str) -> float:
+        """Get the start-up time of a cluster, a percentile of its last starts."""
+        if cluster_id not in self._start_seconds:
+            delays = self._measure_starts(cluster_id)
+            self._start_seconds[cluster_id] = (
+                percentile(sorted(delays), self.start_percentile)
+                if delays
+                else self.default_start_seconds
+            )
+        return self._start_seconds[cluster_id]
+
+    def _measure_starts(self, cluster_id: str) -> List[float]:
+        """The delays between the starts of a cluster and its next RUNNING."""
+        try:
+            response = self._client().perform_query(
+                "POST",
+                "/clusters/events",
+                data={
+                    "cluster_id": cluster_id,
+                    "event_types": [*START_EVENTS, RUNNING_EVENT],
+                    "order": "DESC",
+                    "limit": 2 * self.history,
+                },
+                version="2.0",
+            )
+        except HTTPError as e:
+            lg.warning("No events for cluster {}: {}", cluster_id, e)
+            return []
+        delays = []
+        started_at = None
+        for event in reversed(response.get("events", [])):
+            if event["type"] in START_EVENTS:
+                started_at = event["timestamp"]
+            elif started_at is not None:
+                delays.append((event["timestamp"] - started_at) / 1000)
+                started_at = None
+        return delays[-self.history :]
+
+    ##################################################
+    #    Planning
+    ##################################################
+
+    def plan(self, now: Optional[float] = None) -> List[Warmup]:
+        """Get the next start of each cluster, the earliest first.
+
+        Args:
+            now (Optional[float]): The time, the clock by default.
+        """
+        now = self.clock() if now is None else now
+        if self._loaded_at is None or now - self._loaded_at > self.refresh_seconds:
+            self.refresh()
+        after = datetime.fromtimestamp(now, timezone.utc)
+        warmups = []
+        for cluster_id, jobs in self._schedules.items():
+            fires: Dict[float, List[int]] = {}
+            for job_id, cron, timezone_id in jobs:
+                fire = cron.next_fire_time(after, timezone_id)
+                if fire is not None:
+                    fires.setdefault(fire.timestamp(), []).append(job_id)
+            if fires:
+                fire_time = min(fires)
+                lead = self.start_seconds(cluster_id) + self.lead_margin
+                warmups.append(Warmup(cluster_id, fire_time, lead, fires[fire_time]))
+        return sorted(warmups, key=lambda w: w.start_at)
+
+    def tick(self, now: Optional[float] = None) -> List[str]:
+        """Start the clusters due for a start.
+
+        Returns:
+            List[str]: The clusters started.
+        """
+        now = self.clock() if now is None else now
+        started = []
+        for warmup in self.plan(now):
+            if warmup.start_at > now:
+                break
+            key = (warmup.cluster_id, warmup.fire_time)
+            if key not in self._done and self._start(warmup):
+                started.append(warmup.cluster_id)
+                self._done.add(key)
+        # forget the fires gone by
+        self._done = {(c, fire) for c, fire in self._done if fire > now}
+        return started
+
+    def _start(self, warmup: Warmup) -> bool:
+        """Start the cluster if it is terminated.
+
+        Returns:
+            bool: The cluster needs nothing more before the fire time.
+        """
+        api_client = self._client()
+        try:
+            cluster = api_client.perform_query(
+                "GET",
+                "/clusters/get",
+                data={"cluster_id": warmup.cluster_id},
+                version="2.0",
+            )
+            if cluster["state"] == "TERMINATING":
+                # it can only be started once terminated, try again on next tick
+                return False
+            if cluster["state"] != "TERMINATED":
+                self._done.add((warmup.cluster_id, warmup.fire_time))
+                return False
+            api_client.perform_query(
+                "POST",
+                "/clusters/start",
+                data={"cluster_id": warmup.cluster_id},
+                version="2.0",
+            )
+        except HTTPError as e:
+            lg.warning("Cannot pre-warm cluster {}: {}", warmup.cluster_id, e)
+            return False
+        lg.info(
+            "Started cluster {} for jobs {} firing at {}",
+            warmup.cluster_id,
+            warmup.job_ids,
+            _iso(warmup.fire_time),
+        )
+        return True
+
+    def run(
+        self, stop: Optional[threading.Event] = None, max_wait: float = 60.0
+    ) -> None:
+        """Start the clusters on time, until ``stop`` is set.
+
+        Args:
+            stop (Optional[threading.Event]): Stops the loop once set.
+            max_wait (float): The longest sleep between two ticks.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.tick()
+            now = self.clock()
+            upcoming = [w.start_at for w in self.plan(now) if w.start_at > now]
+            wait = min([max_wait, *(start - now for start in upcoming)])
+            stop.wait(max(wait, 1.0))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=["plan", "run"])
+    parser.add_argument("--lead-margin", type=float, default=60.0)
+    parser.add_argument("--default-start-seconds", type=float, default=300.0)
+    args = parser.parse_args()
+
+    scheduler = PrewarmScheduler(
+        lead_margin=args.lead_margin,
+        default_start_seconds=args.default_start_seconds,
+    )
+    if args.command == "plan":
+        lg.info("Next starts:\n{}", jd([w.to_dict() for w in scheduler.plan()]))
+    else:
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            pass
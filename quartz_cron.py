@@ -0,0 +1,550 @@
+"""Quartz cron expressions, as used by ``CronSchedule``.
+
+A Quartz expression has six or seven fields::
+
+    seconds minutes hours day-of-month month day-of-week [year]
+    0       0       7     ?            *     MON-FRI
+
+* ``*`` any value, ``?`` no specific value, for one of the two day fields,
+* ``a-b`` a range, ``a/n`` or ``a-b/n`` every n values, ``a,b`` a list,
+* the months ``JAN``-``DEC`` and the days ``SUN``-``SAT``, sunday is 1,
+* ``L`` the last day of the month, ``L-3`` three days before it,
+  ``15W`` the weekday nearest to the 15th, ``LW`` the last weekday,
+* ``6L`` the last friday of the month, ``6#3`` its third friday.
+
+An expression is compiled once into bitsets: one int per field, bit n set
+for the value n, and, per year, one int with a bit per day of the year it
+fires on. The fire times are the sorted seconds of the day added to the
+local midnight of those days, converted with the UTC offset of the
+``timezone_id``, only the days of a DST change are converted time by time::
+
+    cron = compile_cron("0 0 7 * * ?")
+    cron.next_fire_times(datetime.now(timezone.utc), 5, "Europe/Amsterdam")
+
+Many schedules are evaluated in a batch, compiling each expression once::
+
+    fires = fire_times_between(
+        {job_id: (cron, tz) for job_id, cron, tz in schedules}, start, end
+    )
+"""
+
+from bisect import bisect_left, bisect_right
+import calendar
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # python 3.8
+    from backports.zoneinfo import ZoneInfo  # type: ignore[no-redef]
+
+MONTHS = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN"]
+MONTHS += ["JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+DAYS = ["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"]
+
+# the fields: (name, lowest value, highest value, names of the values)
+FIELDS: List[Tuple[str, int, int, List[str]]] = [
+    ("seconds", 0, 59, []),
+    ("minutes", 0, 59, []),
+    ("hours", 0, 23, []),
+    ("day-of-month", 1, 31, []),
+    ("month", 1, 12, MONTHS),
+    ("day-of-week", 1, 7, DAYS),
+    ("year", 1970, 2099, []),
+]
+FIRST_YEAR, LAST_YEAR = FIELDS[6][1], FIELDS[6][2]
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# (expression, timezone id)
+Schedule = Tuple[str, str]
+# the keys of the schedules of a batch, like job ids
+K = TypeVar("K", bound=Hashable)
+
+
+class CronError(ValueError):
+    """The expression is not a valid Quartz cron expression."""
+
+    def __init__(self, expression: str, reason: str) -> None:
+        self.expression = expression
+        self.reason = reason
+        super().__init__(f"Invalid cron expression {expression!r}: {reason}.")
+
+
+def _value(token: str, low: int, names: List[str]) -> int:
+    if token.upper() in names:
+        return names.index(token.upper()) + low
+    if not token.isdigit():
+        raise ValueError(f"unexpected {token!r}")
+    return int(token)
+
+
+def parse_field(text: str, low: int, high: int, names: List[str]) -> int:
+    """Get the bitset of a field made of ``*``, ranges, steps and lists.
+
+    The bit n is set for the value n, a range wraps around, like ``FRI-MON``.
+    """
+    mask = 0
+    size = high - low + 1
+    for item in text.split(","):
+        step = 1
+        stepped = "/" in item
+        if stepped:
+            item, step_text = item.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"step {step} is not positive")
+        if item in ("*", "?"):
+            start, end = low, high
+        elif "-" in item:
+            first, last = item.split("-", 1)
+            start, end = _value(first, low, names), _value(last, low, names)
+        else:
+            start = _value(item, low, names)
+            # ``a/n`` goes on to the end
+            end = high if stepped else start
+        for bound in (start, end):
+            if not low <= bound <= high:
+                raise ValueError(f"{bound} is not within {low}-{high}")
+        for i in range(0, (end - start) % size + 1, step):
+            mask |= 1 << (low + (start - low + i) % size)
+    return mask
+
+
+def bits(mask: int) -> List[int]:
+    """The positions of the bits set, in order."""
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(low.bit_length() - 1)
+        mask ^= low
+    return out
+
+
+class CronExpression:
+    """A Quartz cron expression compiled into bitsets."""
+
+    __slots__ = (
+        "expression",
+        "seconds",
+        "minutes",
+        "hours",
+        "days_of_month",
+        "months",
+        "days_of_week",
+        "years",
+        "by_day_of_week",
+        "last_day_offset",
+        "nearest_weekday",
+        "last_weekday",
+        "last_of_weekday",
+        "nth_weekday",
+        "seconds_of_day",
+        "_day_masks",
+        "_day_lists",
+    )
+
+    def __init__(self, expression: str) -> None:
+        """Parse and compile an expression.
+
+        Raises:
+            CronError: The expression is not valid.
+        """
+        self.expression = expression
+        fields = expression.split()
+        if len(fields) not in (6, 7):
+            raise CronError(expression, f"{len(fields)} fields instead of 6 or 7")
+        if len(fields) == 6:
+            fields.append("*")
+        dom, dow = fields[3], fields[5]
+        if (dom == "?") == (dow == "?"):
+            raise CronError(
+                expression, "one of day-of-month and day-of-week must be '?'"
+            )
+        self.by_day_of_week = dom == "?"
+        self.last_day_offset: Optional[int] = None
+        self.nearest_weekday: Optional[int] = None
+        self.last_weekday = False
+        self.last_of_weekday: Optional[int] = None
+        self.nth_weekday: Optional[Tuple[int, int]] = None
+        self.days_of_month = 0
+        self.days_of_week = 0
+        try:
+            self.seconds, self.minutes, self.hours, _, self.months, _, years = [
+                parse_field(text, low, high, names) if i not in (3, 5) else 0
+                for i, (text, (_, low, high, names)) in enumerate(zip(fields, FIELDS))
+            ]
+            if self.by_day_of_week:
+                self._parse_day_of_week(dow)
+            else:
+                self._parse_day_of_month(dom)
+        except ValueError as e:
+            raise CronError(expression, str(e)) from None
+        # the bit n is the year FIRST_YEAR + n
+        self.years = years >> FIRST_YEAR
+        self.seconds_of_day = [
+            3600 * h + 60 * m + s
+            for h in bits(self.hours)
+            for m in bits(self.minutes)
+            for s in bits(self.seconds)
+        ]
+        self._day_masks: Dict[int, int] = {}
+        self._day_lists: Dict[int, List[int]] = {}
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronExpression":
+        return cls(expression)
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+
+    def _parse_day_of_month(self, text: str) -> None:
+        if text == "LW":
+            self.last_weekday = True
+        elif text.startswith("L"):
+            self.last_day_offset = int(text[2:]) if text.startswith("L-") else 0
+            if text not in ("L", f"L-{self.last_day_offset}"):
+                raise ValueError(f"unexpected {text!r}")
+        elif text.endswith("W"):
+            self.nearest_weekday = int(text[:-1])
+            if not 1 <= self.nearest_weekday <= 31:
+                raise ValueError(f"{self.nearest_weekday} is not within 1-31")
+        else:
+            self.days_of_month = parse_field(text, 1, 31, [])
+
+    def _parse_day_of_week(self, text: str) -> None:
+        if text == "L":
+            # alone, L is the last day of the week
+            self.days_of_week = 1 << 7
+        elif text.endswith("L"):
+            self.last_of_weekday = _value(text[:-1], 1, DAYS)
+        elif "#" in text:
+            day, nth = text.split("#", 1)
+            self.nth_weekday = (_value(day, 1, DAYS), int(nth))
+            if not 1 <= self.nth_weekday[1] <= 5:
+                raise ValueError(f"#{nth} is not within 1-5")
+        else:
+            self.days_of_week = parse_field(text, 1, 7, DAYS)
+
+    ##################################################
+    #    Days
+    ##################################################
+
+    def month_mask(self, year: int, month: int) -> int:
+        """The days of a month the expression fires on, bit n for the day n."""
+        first_weekday, last = calendar.monthrange(year, month)
+        # quartz numbering, sunday is 1
+        first_weekday = (first_weekday + 1) % 7 + 1
+        if self.by_day_of_week:
+            if self.last_of_weekday is not None:
+                day = 1 + (self.last_of_weekday - first_weekday) % 7
+                return 1 << (day + 7 * ((last - day) // 7))
+            if self.nth_weekday is not None:
+                weekday, nth = self.nth_weekday
+                day = 1 + (weekday - first_weekday) % 7 + 7 * (nth - 1)
+                return 1 << day if day <= last else 0
+            mask = 0
+            for weekday in bits(self.days_of_week):
+                for day in range(1 + (weekday - first_weekday) % 7, last + 1, 7):
+                    mask |= 1 << day
+            return mask
+        if self.last_day_offset is not None:
+            day = last - self.last_day_offset
+            return 1 << day if day >= 1 else 0
+        if self.last_weekday:
+            return 1 << _nearest_weekday(year, month, last, last)
+        if self.nearest_weekday is not None:
+            target = min(self.nearest_weekday, last)
+            return 1 << _nearest_weekday(year, month, target, last)
+        return self.days_of_month & ((1 << (last + 1)) - 2)
+
+    def day_mask(self, year: int) -> int:
+        """The days of a year the expression fires on, bit n for the day n + 1."""
+        mask = self._day_masks.get(year)
+        if mask is None:
+            mask = 0
+            if (
+                FIRST_YEAR <= year <= LAST_YEAR
+                and self.years >> (year - FIRST_YEAR) & 1
+            ):
+                offset = 0
+                for month in range(1, 13):
+                    if self.months >> month & 1:
+                        mask |= self.month_mask(year, month) >> 1 << offset
+                    offset += calendar.monthrange(year, month)[1]
+            self._day_masks[year] = mask
+        return mask
+
+    def days(self, year: int) -> List[int]:
+        """The days of a year the expression fires on, from 0 for january 1st."""
+        days = self._day_lists.get(year)
+        if days is None:
+            days = self._day_lists[year] = bits(self.day_mask(year))
+        return days
+
+    def matches_day(self, day: date) -> bool:
+        """Tell if the expression fires on a day, whatever the time."""
+        return bool(self.day_mask(day.year) >> (day.timetuple().tm_yday - 1) & 1)
+
+    def last_year(self) -> int:
+        return FIRST_YEAR + self.years.bit_length() - 1
+
+    ##################################################
+    #    Fire times
+    ##################################################
+
+    def _years(
+        self, start: float, end: Optional[float]
+    ) -> Iterator[Tuple[int, List[int]]]:
+        """The years from ``start`` to ``end``, with the days to look at.
+
+        A day of a timezone lasts from 23 to 25 hours and starts up to 14 hours
+        away from UTC: a day before the start and a day after the end
+        cover all the fires in between.
+        """
+        first = datetime.fromtimestamp(start, timezone.utc).date() - timedelta(days=1)
+        last_year = self.last_year()
+        last = date(LAST_YEAR, 12, 31)
+        if end is not None:
+            last = datetime.fromtimestamp(end, timezone.utc).date() + timedelta(days=1)
+            last_year = min(last_year, last.year)
+        for year in range(max(first.year, FIRST_YEAR), last_year + 1):
+            days = self.days(year)
+            if year == first.year or year == last.year:
+                year_ordinal = date(year, 1, 1).toordinal()
+                low = first.toordinal() - year_ordinal if year == first.year else 0
+                high = last.toordinal() - year_ordinal if year == last.year else 366
+                days = days[bisect_left(days, low) : bisect_right(days, high)]
+            if days:
+                yield year, days
+
+    def _dst_fires(self, year: int, day: int, timezone_id: str) -> List[float]:
+        """The fire times of a day with a DST change.
+
+        A time skipped by the change fires after it, once, like Quartz.
+        """
+        local_day = date.fromordinal(date(year, 1, 1).toordinal() + day)
+        tz = ZoneInfo(timezone_id)
+        return sorted(
+            {
+                datetime.combine(local_day, _time(second), tz).timestamp()
+                for second in self.seconds_of_day
+            }
+        )
+
+    def fire_times(
+        self, start: float, end: Optional[float] = None, timezone_id: str = "UTC"
+    ) -> Iterator[float]:
+        """Iterate the fire times from ``start`` until before ``end``.
+
+        Args:
+            start (float): The first time, in epoch seconds, included.
+            end (Optional[float]): The last time, excluded, None for no end.
+            timezone_id (str): The timezone of the schedule, like ``Europe/Paris``.
+
+        Yields:
+            float: The fire times in epoch seconds, in order.
+        """
+        seconds_of_day = self.seconds_of_day
+        for year, days in self._years(start, end):
+            midnights, changes = local_midnights(timezone_id, year)
+            for day in days:
+                base = midnights[day]
+                if end is not None and base >= end:
+                    return
+                if day in changes:
+                    fires = self._dst_fires(year, day, timezone_id)
+                    fires = fires[bisect_left(fires, start) :]
+                else:
+                    i = bisect_left(seconds_of_day, start - base)
+                    fires = [base + second for second in seconds_of_day[i:]]
+                for fire in fires:
+                    if end is not None and fire >= end:
+                        return
+                    yield fire
+
+    def fire_list(
+        self, start: float, end: float, timezone_id: str = "UTC"
+    ) -> List[float]:
+        """Get the fire times from ``start`` until before ``end``, in order.
+
+        The same times as ``fire_times``, computed a year at a time.
+        """
+        seconds_of_day = self.seconds_of_day
+        fires: List[float] = []
+        for year, days in self._years(start, end):
+            midnights, changes = local_midnights(timezone_id, year)
+            if len(seconds_of_day) == 1:
+                # the usual daily schedule, a fire per day
+                second = seconds_of_day[0]
+                offset = len(fires)
+                fires.extend([midnights[day] + second for day in days])
+                for day in changes:
+                    i = bisect_left(days, day)
+                    if i < len(days) and days[i] == day:
+                        fires[offset + i] = self._dst_fires(year, day, timezone_id)[0]
+                continue
+            for day in days:
+                if day in changes:
+                    fires.extend(self._dst_fires(year, day, timezone_id))
+                else:
+                    base = midnights[day]
+                    fires.extend([base + second for second in seconds_of_day])
+        return fires[bisect_left(fires, start) : bisect_left(fires, end)]
+
+    def iter_fire_times(
+        self, after: datetime, timezone_id: str = "UTC"
+    ) -> Iterator[datetime]:
+        """Iterate the fire times strictly after a time, in the schedule timezone.
+
+        Args:
+            after (datetime): The start, a naive datetime is taken as UTC.
+            timezone_id (str): The timezone of the schedule, like ``Europe/Paris``.
+        """
+        tz = ZoneInfo(timezone_id)
+        if after.tzinfo is None:
+            after = after.replace(tzinfo=timezone.utc)
+        start = after.timestamp()
+        for fire in self.fire_times(start, None, timezone_id):
+            if fire > start:
+                yield datetime.fromtimestamp(fire, tz)
+
+    def next_fire_time(
+        self, after: datetime, timezone_id: str = "UTC"
+    ) -> Optional[datetime]:
+        """Get the first fire time after a time, None if it never fires again."""
+        return next(self.iter_fire_times(after, timezone_id), None)
+
+    def next_fire_times(
+        self, after: datetime, n: int, timezone_id: str = "UTC"
+    ) -> List[datetime]:
+        """Get the n first fire times after a time, fewer if it stops firing."""
+        return list(islice(self.iter_fire_times(after, timezone_id), n))
+
+
+def _time(second: int) -> time:
+    return time(second // 3600, second // 60 % 60, second % 60)
+
+
+def _nearest_weekday(year: int, month: int, day: int, last: int) -> int:
+    """The day of the weekday nearest to a day, without leaving the month."""
+    weekday = date(year, month, day).weekday()
+    if weekday == 5:  # saturday
+        return day - 1 if day > 1 else day + 2
+    if weekday == 6:  # sunday
+        return day + 1 if day < last else day - 2
+    return day
+
+
+@lru_cache(maxsize=1024)
+def local_midnights(timezone_id: str, year: int) -> Tuple[List[float], FrozenSet[int]]:
+    """The local midnights of the days of a year in a timezone.
+
+    Returns:
+        Tuple[List[float], FrozenSet[int]]: The epoch seconds of the midnight
+            of each day, from 0 for january 1st, and the days of a DST change.
+    """
+    tz = ZoneInfo(timezone_id)
+    year_ordinal = date(year, 1, 1).toordinal()
+    n_days = 366 if calendar.isleap(year) else 365
+    offsets = [
+        tz.utcoffset(datetime.fromordinal(year_ordinal + day)).total_seconds()  # type: ignore[union-attr]
+        for day in range(n_days + 1)
+    ]
+    midnights = [
+        (year_ordinal + day - EPOCH_ORDINAL) * 86400 - offsets[day]
+        for day in range(n_days)
+    ]
+    changes = frozenset(
+        day for day in range(n_days) if offsets[day] != offsets[day + 1]
+    )
+    return midnights, changes
+
+
+@lru_cache(maxsize=4096)
+def compile_cron(expression: str) -> CronExpression:
+    """Get the compiled expression, compiling each expression once."""
+    return CronExpression(expression)
+
+
+def next_fire_time(
+    quartz_cron_expression: str,
+    timezone_id: str = "UTC",
+    after: Optional[datetime] = None,
+) -> Optional[datetime]:
+    """Get the next fire time of a schedule, after now by default."""
+    if after is None:
+        after = datetime.now(timezone.utc)
+    return compile_cron(quartz_cron_expression).next_fire_time(after, timezone_id)
+
+
+##################################################
+#    Batches
+##################################################
+
+
+def next_fire_times(
+    schedules: Mapping[K, Schedule],
+    n: int = 1,
+    after: Optional[datetime] = None,
+) -> Dict[K, List[datetime]]:
+    """Get the n next fire times of many schedules.
+
+    Args:
+        schedules (Mapping[K, Schedule]):
+            The ``(quartz_cron_expression, timezone_id)`` of each key.
+        n (int): The fire times per schedule.
+        after (Optional[datetime]): The start, now by default.
+
+    Raises:
+        CronError: An expression is not valid.
+    """
+    if after is None:
+        after = datetime.now(timezone.utc)
+    return {
+        key: compile_cron(expression).next_fire_times(after, n, timezone_id)
+        for key, (expression, timezone_id) in schedules.items()
+    }
+
+
+def fire_times_between(
+    schedules: Mapping[K, Schedule], start: float, end: float
+) -> Dict[K, List[float]]:
+    """Get the fire times of many schedules from ``start`` until before ``end``.
+
+    Args:
+        schedules (Mapping[K, Schedule]):
+            The ``(quartz_cron_expression, timezone_id)`` of each key.
+        start (float): The first time, in epoch seconds, included.
+        end (float): The last time, excluded.
+
+    Returns:
+        Dict[K, List[float]]: The fire times of each key, the keys with
+            the same schedule share the same list.
+
+    Raises:
+        CronError: An expression is not valid.
+    """
+    # many jobs share a schedule, like every day at 07:00
+    fires: Dict[Schedule, List[float]] = {}
+    out: Dict[K, List[float]] = {}
+    for key, schedule in schedules.items():
+        if schedule not in fires:
+            expression, timezone_id = schedule
+            fires[schedule] = compile_cron(expression).fire_list(
+                start, end, timezone_id
+            )
+        out[key] = fires[schedule]
+    return out
@@ -0,0 +1,340 @@
+"""Bring the jobs of the workspace to a desired set, touching only what changed.
+
+Each job deployed by the reconciler carries, next to the idempotency key of
+``bulk_jobs``, two more tags: the namespace that manages it, and a short
+canonical hash of each top-level field of its settings.
+Reconciling lists the jobs once, matches them to the desired ones by
+idempotency key and compares the hashes:
+
+* a desired job without a match is created,
+* a job with different hashes gets a ``jobs/update`` with only the changed
+  top-level fields, and ``fields_to_remove`` for the fields it no longer has,
+* a job with the same hashes is left untouched,
+* a job of the namespace that is no longer desired is deleted, with ``prune``.
+
+The changes are planned first, ``dry_run`` only logs the plan::
+
+    reconciler = JobReconciler(namespace="projection")
+    plan = reconciler.reconcile(jobs, dry_run=True)
+    report = reconciler.reconcile(jobs)
+
+Changes made to the jobs outside the reconciler do not update the hashes,
+so they are not seen: use ``force`` to send all the fields again.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from loguru import logger as lg
+
+from bulk_jobs import (
+    IDEMPOTENCY_TAG,
+    BulkJobCreator,
+    BulkReport,
+    JobPayload,
+    JobResult,
+)
+from utils import get_databricks_client, iter_jobs
+
+# the tag with the namespace that manages the job
+MANAGED_TAG = "managed_by"
+# the tag with the hashes of the top-level fields of the settings
+HASH_TAG = "settings_hash"
+# the tags set by the reconciler, left out of the hash of the tags
+OWN_TAGS = (IDEMPOTENCY_TAG, MANAGED_TAG, HASH_TAG)
+# max length of a tag value
+MAX_TAG_LENGTH = 255
+
+
+def canonical(value: Any) -> Any:
+    """Get a canonical form of a payload, for hashing.
+
+    Nulls are dropped, and the lists of items keyed by ``task_key``,
+    like the tasks and their dependencies, are sorted by key,
+    since their order does not change the job.
+    """
+    if isinstance(value, dict):
+        return {k: canonical(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        items = [canonical(v) for v in value]
+        if items and all(isinstance(i, dict) and "task_key" in i for i in items):
+            items.sort(key=lambda i: i["task_key"])
+        return items
+    return value
+
+
+def field_hash(value: Any) -> str:
+    """Get the short canonical hash of the value of a field."""
+    data = json.dumps(canonical(value), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode()).hexdigest()[:8]
+
+
+def settings_hashes(payload: Dict[str, Any]) -> Dict[str, str]:
+    """Get the hash of each top-level field of the settings."""
+    hashes = {}
+    for field, value in payload.items():
+        if value is None:
+            continue
+        if field == "tags":
+            value = {k: v for k, v in value.items() if k not in OWN_TAGS}
+            if not value:
+                continue
+        hashes[field] = field_hash(value)
+    return hashes
+
+
+def encode_hashes(hashes: Dict[str, str]) -> str:
+    """Pack the field hashes in a tag value.
+
+    If they do not fit, a single hash of all of them is used instead:
+    any change then updates all the fields.
+    """
+    value = ",".join(f"{field}:{h}" for field, h in sorted(hashes.items()))
+    if len(value) > MAX_TAG_LENGTH:
+        value = f"*:{field_hash(hashes)}"
+    return value
+
+
+def decode_hashes(value: Optional[str]) -> Optional[Dict[str, str]]:
+    """Unpack the field hashes of a tag value, None if there are none."""
+    if not value:
+        return None
+    return dict(item.split(":", 1) for item in value.split(","))
+
+
+class JobChange:
+    """A change to bring a job to its desired settings."""
+
+    __slots__ = ("action", "name", "job_id", "payload", "fields", "fields_to_remove")
+
+    def __init__(
+        self,
+        action: str,
+        name: str,
+        job_id: Optional[int] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        fields_to_remove: Optional[List[str]] = None,
+    ) -> None:
+        """Create a JobChange.
+
+        Args:
+            action (str): ``create``, ``update``, ``delete`` or ``unchanged``.
+            name (str): The name of the job.
+            job_id (Optional[int]): The existing job, None for a create.
+            payload (Optional[Dict[str, Any]]): The desired settings.
+            fields (Optional[List[str]]): The top-level fields to update.
+            fields_to_remove (Optional[List[str]]): The top-level fields to remove.
+        """
+        self.action = action
+        self.name = name
+        self.job_id = job_id
+        self.payload = payload
+        self.fields = fields or []
+        self.fields_to_remove = fields_to_remove or []
+
+    def __repr__(self) -> str:
+        return f"JobChange({self.action}, {self.name!r}, job_id={self.job_id})"
+
+    def describe(self) -> str:
+        symbol = {"create": "+", "update": "~", "delete": "-", "unchanged": "="}
+        line = f"{symbol[self.action]} {self.action} {self.name}"
+        if self.job_id is not None:
+            line += f" ({self.job_id})"
+        if self.fields:
+            line += f": {', '.join(self.fields)}"
+        if self.fields_to_remove:
+            line += f", remove {', '.join(self.fields_to_remove)}"
+        return line
+
+
+class ReconcilePlan:
+    """The changes to bring the jobs to the desired set."""
+
+    def __init__(self, changes: List[JobChange], invalid: List[JobResult]) -> None:
+        """Create a ReconcilePlan.
+
+        Args:
+            changes (List[JobChange]): The change of each job.
+            invalid (List[JobResult]): The desired jobs that cannot be sent.
+        """
+        self.changes = changes
+        self.invalid = invalid
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for change in self.changes:
+            counts[change.action] = counts.get(change.action, 0) + 1
+        if self.invalid:
+            counts["invalid"] = len(self.invalid)
+        return counts
+
+    def describe(self, unchanged: bool = False) -> str:
+        """Describe the plan, one line per job.
+
+        Args:
+            unchanged (bool): Also list the jobs left untouched.
+        """
+        lines = [
+            change.describe()
+            for change in self.changes
+            if unchanged or change.action != "unchanged"
+        ]
+        lines.extend(f"! invalid {r.name}: {r.error}" for r in self.invalid)
+        counts = ", ".join(f"{n} {a}" for a, n in sorted(self.counts().items()))
+        lines.append(f"Plan: {counts or 'nothing to do'}")
+        return "\n".join(lines)
+
+
+class JobReconciler(BulkJobCreator):
+    """Create, update and delete the jobs of a namespace to match a desired set."""
+
+    def plan(
+        self, jobs: Iterable[JobPayload], prune: bool = True, force: bool = False
+    ) -> ReconcilePlan:
+        """Compare the desired jobs with the existing ones.
+
+        Args:
+            jobs (Iterable[JobPayload]): The desired ``JobSettings`` or payloads.
+            prune (bool): Delete the jobs of the namespace that are not desired.
+            force (bool): Update all the fields of the existing jobs.
+        """
+        if self.api_client is None:
+            self.api_client = get_databricks_client()
+        payloads = [self.prepare(job) for job in jobs]
+        results, todo = self.check(payloads)
+        invalid = [r for r in results if r is not None]
+
+        # list the jobs once, only their id and tags are needed
+        existing: Dict[str, Dict[str, Any]] = {}
+        for job in iter_jobs(api_client=self.api_client):
+            tags = job.get("settings", {}).get("tags") or {}
+            if IDEMPOTENCY_TAG in tags:
+                existing[tags[IDEMPOTENCY_TAG]] = job
+
+        changes = []
+        for i in todo:
+            payload = payloads[i]
+            key = payload["tags"][IDEMPOTENCY_TAG]
+            found = existing.pop(key, None)
+            if found is None:
+                changes.append(JobChange("create", payload["name"], payload=payload))
+                continue
+
+            tags = found["settings"].get("tags") or {}
+            desired = decode_hashes(payload["tags"][HASH_TAG])
+            current = None if force else decode_hashes(tags.get(HASH_TAG))
+            fields: List[str]
+            removed: List[str]
+            if desired == current:
+                action, fields, removed = "unchanged", [], []
+            elif desired is None or current is None or "*" in desired or "*" in current:
+                # nothing to compare with, send all the fields
+                action, fields, removed = "update", list(payload), []
+            else:
+                action = "update"
+                fields = [f for f, h in desired.items() if current.get(f) != h]
+                removed = [f for f in current if f not in desired and f != "tags"]
+                # the tags hold the hashes, they change with any field
+                if "tags" not in fields:
+                    fields.append("tags")
+            changes.append(
+                JobChange(
+                    action, payload["name"], found["job_id"], payload, fields, removed
+                )
+            )
+
+        if prune:
+            for job in existing.values():
+                tags = job["settings"].get("tags") or {}
+                if tags.get(MANAGED_TAG) == self.namespace:
+                    changes.append(
+                        JobChange("delete", job["settings"].get("name"), job["job_id"])
+                    )
+        return ReconcilePlan(changes, invalid)
+
+    def reconcile(
+        self,
+        jobs: Iterable[JobPayload],
+        dry_run: bool = False,
+        prune: bool = True,
+        force: bool = False,
+    ) -> Union[ReconcilePlan, BulkReport]:
+        """Plan the changes, and apply them unless ``dry_run``.
+
+        Args:
+            jobs (Iterable[JobPayload]): The desired ``JobSettings`` or payloads.
+            dry_run (bool): Only log the plan, and return it.
+            prune (bool): Delete the jobs of the namespace that are not desired.
+            force (bool): Update all the fields of the existing jobs.
+        """
+        plan = self.plan(jobs, prune=prune, force=force)
+        lg.info("Reconcile plan:\n{}", plan.describe())
+        if dry_run:
+            return plan
+        return self.apply(plan)
+
+    def apply(self, plan: ReconcilePlan) -> BulkReport:
+        """Apply the changes of a plan in parallel."""
+        t_start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="JobReconciler"
+        ) as executor:
+            results = list(executor.map(self._apply_change, plan.changes))
+        report = BulkReport(results + plan.invalid, time.perf_counter() - t_start)
+        lg.info(report.summary())
+        return report
+
+    def prepare(self, job: JobPayload) -> Dict[str, Any]:
+        """Get the payload of a job, tagged with its key, namespace and hashes."""
+        payload = super().prepare(job)
+        tags = payload["tags"]
+        tags[MANAGED_TAG] = self.namespace
+        tags[HASH_TAG] = encode_hashes(settings_hashes(payload))
+        return payload
+
+    def _apply_change(self, change: JobChange) -> JobResult:
+        """Apply a change, never raises."""
+        key = change.payload["tags"][IDEMPOTENCY_TAG] if change.payload else None
+        result = JobResult(change.name, key, job_id=change.job_id)
+        t_start = time.perf_counter()
+        try:
+            if change.action == "create":
+                result.job_id = self._create(change.payload, result)  # type: ignore[arg-type]
+            elif change.action == "update":
+                data: Dict[str, Any] = {
+                    "job_id": change.job_id,
+                    "new_settings": {
+                        f: change.payload[f] for f in change.fields  # type: ignore[index]
+                    },
+                }
+                if change.fields_to_remove:
+                    data["fields_to_remove"] = change.fields_to_remove
+                self._call(result, "POST", "/jobs/update", data)
+                result.action = "updated"
+            elif change.action == "delete":
+                self._call(result, "POST", "/jobs/delete", {"job_id": change.job_id})
+                result.action = "deleted"
+            else:
+                result.action = "unchanged"
+        except Exception as e:
+            result.action = "failed"
+            result.error = str(e)
+            lg.warning("{} of job {} failed: {}", change.action, change.name, e)
+        result.elapsed = time.perf_counter() - t_start
+        return result
+
+
+def reconcile_jobs(
+    jobs: Iterable[JobPayload],
+    namespace: str = "",
+    dry_run: bool = False,
+    prune: bool = True,
+    max_workers: int = 8,
+) -> Union[ReconcilePlan, BulkReport]:
+    """Reconcile the jobs of a namespace, see ``JobReconciler``."""
+    reconciler = JobReconciler(max_workers=max_workers, namespace=namespace)
+    return reconciler.reconcile(jobs, dry_run=dry_run, prune=prune)
@@ -0,0 +1,277 @@
+"""Cache of the read endpoints whose answers rarely change, in a SQLite file.
+
+The spark versions, the node types and the job definitions seldom change
+within a session, yet every run of a script fetches them again.
+With a ``ResponseCache`` on the pooled client, the GETs of the endpoints in
+``DEFAULT_TTLS`` are answered from a local SQLite file while they are fresh:
+
+* each endpoint has its own time to live, the others are never cached,
+* the clusters are cached for a couple of seconds only, their state changes
+  quickly and the waiters must see it,
+* the least recently used answers are evicted past ``max_entries`` or
+  ``max_bytes``,
+* a write to a job or a cluster, like ``jobs/reset`` or ``clusters/start``,
+  drops the cached answers about it and the cached lists of its kind.
+
+The file is shared by the processes using it, so a short command line run
+starts with the answers of the previous one::
+
+    api_client = get_pooled_client(response_cache=ResponseCache())
+    # or, for the default client
+    export DATABRICKS_RESPONSE_CACHE=~/.cache/databricks-api-sample/responses.sqlite
+
+The cache is opt-in: runs, outputs and everything not listed are always
+fetched, and an error of the cache only logs a warning.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger as lg
+
+# name of the environment variable with the file of the default clients
+ENV_RESPONSE_CACHE = "DATABRICKS_RESPONSE_CACHE"
+DEFAULT_PATH = Path.home() / ".cache" / "databricks-api-sample" / "responses.sqlite"
+
+# endpoint -> seconds an answer stays fresh
+DEFAULT_TTLS: Dict[str, float] = {
+    "/2.0/clusters/spark-versions": 24 * 3600,
+    "/2.0/clusters/list-node-types": 24 * 3600,
+    "/2.0/clusters/list": 2,
+    "/2.0/clusters/get": 2,
+    "/2.1/jobs/list": 60,
+    "/2.1/jobs/get": 300,
+}
+
+# the writes, endpoint -> the kind of resource they change
+WRITES: Dict[str, str] = {
+    "/2.1/jobs/create": "jobs",
+    "/2.1/jobs/reset": "jobs",
+    "/2.1/jobs/update": "jobs",
+    "/2.1/jobs/delete": "jobs",
+    "/2.0/clusters/create": "clusters",
+    "/2.0/clusters/edit": "clusters",
+    "/2.0/clusters/start": "clusters",
+    "/2.0/clusters/restart": "clusters",
+    "/2.0/clusters/resize": "clusters",
+    "/2.0/clusters/delete": "clusters",
+    "/2.0/clusters/permanent-delete": "clusters",
+    "/2.0/clusters/pin": "clusters",
+    "/2.0/clusters/unpin": "clusters",
+}
+
+# the field identifying the resource in the requests of each kind
+ID_FIELDS = {"jobs": "job_id", "clusters": "cluster_id"}
+
+# the endpoints not of the kind in their path, the catalog of the workspace
+# is not changed by the writes to the clusters
+KINDS: Dict[str, str] = {
+    "/2.0/clusters/spark-versions": "catalog",
+    "/2.0/clusters/list-node-types": "catalog",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    resource TEXT,
+    endpoint TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_resource ON responses (host, kind, resource);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+def resource_of(endpoint: str, data: Optional[Dict[str, Any]]) -> Tuple[str, Any]:
+    """Get the kind of resource of an endpoint, and the id in its request.
+
+    The id is None for the lists and the creates.
+    """
+    kind = KINDS.get(endpoint)
+    if kind is None:
+        kind = endpoint.split("/")[2] if endpoint.count("/") >= 2 else ""
+    field = ID_FIELDS.get(kind)
+    resource = (data or {}).get(field) if field else None
+    return kind, None if resource is None else str(resource)
+
+
+class ResponseCache:
+    """The answers of the read endpoints, in a SQLite file shared by processes."""
+
+    def __init__(
+        self,
+        path: Any = DEFAULT_PATH,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 2**20,
+    ) -> None:
+        """Open the cache, creating the file if needed.
+
+        Args:
+            path (Any): The SQLite file, ``:memory:`` for a cache of the process.
+            ttls (Optional[Dict[str, float]]):
+                The seconds an answer stays fresh by endpoint, like
+                ``/2.1/jobs/get``, ``DEFAULT_TTLS`` if None.
+            max_entries (int): The number of answers kept.
+            max_bytes (int): The total size of the answers kept.
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            self.path = str(Path(self.path).expanduser())
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # wait for the other processes instead of failing
+        self._conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def cacheable(self, endpoint: str) -> bool:
+        return endpoint in self.ttls
+
+    @staticmethod
+    def key(host: str, endpoint: str, data: Optional[Dict[str, Any]]) -> str:
+        query = json.dumps(data or {}, sort_keys=True, default=str)
+        return hashlib.sha256(f"{host}|{endpoint}|{query}".encode()).hexdigest()
+
+    def get(
+        self, host: str, endpoint: str, data: Optional[Dict[str, Any]]
+    ) -> Optional[Any]:
+        """Get the fresh cached answer of a GET, None if there is none."""
+        key = self.key(host, endpoint, data)
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT payload, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    self._conn.execute(
+                        "UPDATE responses SET last_used = ? WHERE key = ?", (now, key)
+                    )
+        except sqlite3.Error as e:
+            lg.warning("Response cache unavailable: {}", e)
+            return None
+        if row is None or row[1] <= now:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(
+        self, host: str, endpoint: str, data: Optional[Dict[str, Any]], payload: Any
+    ) -> None:
+        """Store the answer of a GET, evicting the least recently used ones."""
+        ttl = self.ttls.get(endpoint)
+        if ttl is None:
+            return
+        kind, resource = resource_of(endpoint, data)
+        text = json.dumps(payload)
+        if len(text) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self.key(host, endpoint, data),
+                        host,
+                        kind,
+                        resource,
+                        endpoint,
+                        text,
+                        len(text),
+                        now + ttl,
+                        now,
+                    ),
+                )
+                self._evict()
+        except sqlite3.Error as e:
+            lg.warning("Response cache unavailable: {}", e)
+
+    def _evict(self) -> None:
+        """Drop the expired answers, then the least recently used ones."""
+        count, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        self._conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+        )
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used DESC"
+        ).fetchall()
+        kept = 0
+        total = 0
+        drop = []
+        for key, row_size in rows:
+            if kept < self.max_entries and total + row_size <= self.max_bytes:
+                kept += 1
+                total += row_size
+            else:
+                drop.append((key,))
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", drop)
+
+    def invalidate(self, host: str, endpoint: str, data: Optional[Dict[str, Any]]):
+        """Drop the answers a write may have changed.
+
+        The answers about the written resource and the lists of its kind go,
+        a write without an id, like a create, drops all the lists of its kind.
+        """
+        kind = WRITES.get(endpoint)
+        if kind is None:
+            return
+        _, resource = resource_of(endpoint, data)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE host = ? AND kind = ? "
+                    "AND (resource IS NULL OR resource = ?)",
+                    (host, kind, resource),
+                )
+        except sqlite3.Error as e:
+            lg.warning("Response cache unavailable: {}", e)
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, int]:
+        """The hits and misses of this process, and the answers in the file."""
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": count,
+            "bytes": size,
+        }
@@ -0,0 +1,351 @@
+"""Download the outputs and the exported views of all the task runs of a run.
+
+``RunArtifactFetcher`` gets the tasks of a run with ``runs/get``, then
+downloads for each finished task, with a cap on the requests in flight:
+
+* the ``runs/get-output`` response, to ``<task_key>.output.json``,
+* the ``2.0/jobs/runs/export`` response, to ``<task_key>.export.json``.
+
+The responses are streamed to a temporary file renamed once complete, a
+response shorter than its ``Content-Length`` is dropped and fetched again.
+So a large notebook export is never held in memory, and a second fetch
+skips the files that are already there::
+
+    report = RunArtifactFetcher(max_in_flight=8).fetch(run_id, "artifacts/")
+    lg.info(report.summary())
+
+``extract_views`` writes the html of the views of an export next to it.
+From the command line::
+
+    python run_artifacts.py 455644833 --out-dir artifacts/
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+import random
+import re
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import RequestException
+
+from utils import get_databricks_client, http_status
+
+# the life cycle states a task run does not leave
+TERMINAL_STATES = ("TERMINATED", "SKIPPED", "INTERNAL_ERROR")
+# the kinds of artifacts: (endpoint, version, file suffix)
+ARTIFACTS = {
+    "output": ("/jobs/runs/get-output", "2.1", ".output.json"),
+    "export": ("/jobs/runs/export", "2.0", ".export.json"),
+}
+CHUNK_SIZE = 64 * 1024
+
+PathLike = Union[str, Path]
+
+
+def safe_name(task_key: str) -> str:
+    """Turn a task key into a file name."""
+    return re.sub(r"[^A-Za-z0-9._-]", "_", task_key) or "_"
+
+
+class ArtifactResult:
+    """The outcome of the download of an artifact of a task run."""
+
+    __slots__ = ("task_key", "run_id", "kind", "path", "status", "bytes", "error")
+
+    def __init__(
+        self,
+        task_key: str,
+        run_id: int,
+        kind: str,
+        path: Path,
+        status: str = "fetched",
+        size: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        """Create an ArtifactResult.
+
+        Args:
+            task_key (str): The task.
+            run_id (int): The run of the task.
+            kind (str): ``output`` or ``export``.
+            path (Path): The file of the artifact.
+            status (str): ``fetched``, ``skipped``, ``not_finished`` or ``failed``.
+            size (int): The bytes written.
+            error (Optional[str]): Why it failed.
+        """
+        self.task_key = task_key
+        self.run_id = run_id
+        self.kind = kind
+        self.path = path
+        self.status = status
+        self.bytes = size
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"ArtifactResult({self.task_key!r}, {self.kind}, {self.status})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "task_key": self.task_key,
+            "run_id": self.run_id,
+            "kind": self.kind,
+            "path": str(self.path),
+            "status": self.status,
+            "bytes": self.bytes,
+            "error": self.error,
+        }
+
+
+class FetchReport:
+    """The artifacts of a run, and the totals."""
+
+    def __init__(self, results: List[ArtifactResult], elapsed: float) -> None:
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def failed(self) -> List[ArtifactResult]:
+        return [r for r in self.results if r.status == "failed"]
+
+    @property
+    def bytes(self) -> int:
+        return sum(r.bytes for r in self.results)
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for result in self.results:
+            counts[result.status] = counts.get(result.status, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        counts = ", ".join(f"{n} {s}" for s, n in sorted(self.counts().items()))
+        return (
+            f"{len(self.results)} artifacts in {self.elapsed:.2f} s: {counts}, "
+            f"{self.bytes / 2**20:.1f} MiB written"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "elapsed": self.elapsed,
+            "bytes": self.bytes,
+            "counts": self.counts(),
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
+class RunArtifactFetcher:
+    """Download the artifacts of the task runs of runs, in parallel."""
+
+    def __init__(
+        self,
+        api_client: Optional[ApiClient] = None,
+        max_in_flight: int = 8,
+        views_to_export: str = "CODE",
+        max_retries: int = 4,
+        backoff: float = 0.5,
+    ) -> None:
+        """Create a RunArtifactFetcher.
+
+        Args:
+            api_client (Optional[ApiClient]):
+                The client to use, the default one if not provided.
+            max_in_flight (int): The downloads running at the same time.
+            views_to_export (str): ``CODE``, ``DASHBOARDS`` or ``ALL``.
+            max_retries (int): The retries of a download failing with a 5xx
+                or a lost connection, the 429 are retried by the client.
+            backoff (float): The first wait between retries, in seconds.
+        """
+        self.api_client = api_client
+        self.max_in_flight = max_in_flight
+        self.views_to_export = views_to_export
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    def task_runs(self, run_id: int) -> List[Dict[str, Any]]:
+        """Get the task runs of a run, the run itself if it has no tasks."""
+        if self.api_client is None:
+            self.api_client = get_databricks_client()
+        run = self.api_client.perform_query(
+            "GET", "/jobs/runs/get", data={"run_id": run_id}, version="2.1"
+        )
+        tasks = run.get("tasks")
+        if not tasks:
+            return [{**run, "task_key": run.get("run_name") or str(run_id)}]
+        return tasks
+
+    def fetch(
+        self,
+        run_id: int,
+        out_dir: PathLike,
+        outputs: bool = True,
+        exports: bool = True,
+    ) -> FetchReport:
+        """Download the artifacts of all the task runs of a run.
+
+        Args:
+            run_id (int): The parent run.
+            out_dir (PathLike): The directory of the files, created if needed.
+            outputs (bool): Download the ``runs/get-output`` responses.
+            exports (bool): Download the ``runs/export`` responses.
+        """
+        t_start = time.perf_counter()
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        kinds = [
+            k for k, wanted in (("output", outputs), ("export", exports)) if wanted
+        ]
+
+        results: List[ArtifactResult] = []
+        todo: List[ArtifactResult] = []
+        for task in self.task_runs(run_id):
+            finished = task.get("state", {}).get("life_cycle_state") in TERMINAL_STATES
+            for kind in kinds:
+                path = out_dir / (safe_name(task["task_key"]) + ARTIFACTS[kind][2])
+                result = ArtifactResult(task["task_key"], task["run_id"], kind, path)
+                if path.exists():
+                    result.status = "skipped"
+                elif not finished:
+                    result.status = "not_finished"
+                else:
+                    todo.append(result)
+                results.append(result)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="RunArtifactFetcher"
+        ) as executor:
+            list(executor.map(self._download, todo))
+        report = FetchReport(results, time.perf_counter() - t_start)
+        lg.info("Artifacts of run {}: {}", run_id, report.summary())
+        return report
+
+    def _download(self, result: ArtifactResult) -> None:
+        """Stream an artifact to its file, never raises."""
+        endpoint, version, _ = ARTIFACTS[result.kind]
+        query: Dict[str, Any] = {"run_id": result.run_id}
+        if result.kind == "export":
+            query["views_to_export"] = self.views_to_export
+        attempt = 0
+        while True:
+            try:
+                result.bytes = self._stream(endpoint, version, query, result.path)
+                result.status = "fetched"
+                return
+            except OSError as e:
+                # the requests errors, like a body cut short, are retried
+                # when the server may do better, not the errors of the disk
+                status = http_status(e)
+                retry = isinstance(e, RequestException) and (
+                    status is None or status >= 500
+                )
+                if attempt < self.max_retries and retry:
+                    attempt += 1
+                    time.sleep(
+                        self.backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1)
+                    )
+                    continue
+                result.status = "failed"
+                result.error = str(e).split("\n")[0]
+                lg.warning(
+                    "{} of task {} failed: {}",
+                    result.kind,
+                    result.task_key,
+                    result.error,
+                )
+                return
+
+    def _stream(
+        self, endpoint: str, version: str, query: Dict[str, Any], path: Path
+    ) -> int:
+        """Stream a GET response to a file, return the bytes written."""
+        api_client = self.api_client
+        response = api_client.session.get(  # type: ignore[union-attr]
+            api_client.get_url(endpoint, version=version),  # type: ignore[union-attr]
+            params=query,
+            headers=api_client.default_headers,  # type: ignore[union-attr]
+            verify=api_client.verify,  # type: ignore[union-attr]
+            stream=True,
+        )
+        with response:
+            response.raise_for_status()
+            part = path.with_name(path.name + ".part")
+            size = 0
+            try:
+                with open(part, "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        f.write(chunk)
+                        size += len(chunk)
+                # the body is decoded, the length is the one read on the wire
+                expected = response.headers.get("Content-Length")
+                received = response.raw.tell()
+                if expected is not None and received != int(expected):
+                    raise RequestsConnectionError(
+                        f"Connection closed after {received} of {expected} bytes."
+                    )
+            except BaseException:
+                part.unlink(missing_ok=True)
+                raise
+        # the file appears only once complete, a later fetch can trust it
+        os.replace(part, path)
+        return size
+
+
+def extract_views(export_path: PathLike) -> List[Path]:
+    """Write the html of each view of an export next to it.
+
+    Returns:
+        List[Path]: The html files, ``<task_key>.<view name>.html``.
+    """
+    export_path = Path(export_path)
+    with open(export_path) as f:
+        views = json.load(f).get("views", [])
+    stem = export_path.name[: -len(ARTIFACTS["export"][2])]
+    paths = []
+    for i, view in enumerate(views):
+        name = safe_name(view.get("name") or str(i))
+        path = export_path.with_name(f"{stem}.{name}.html")
+        path.write_text(view.get("content", ""))
+        paths.append(path)
+    return paths
+
+
+def fetch_run_artifacts(
+    run_id: int,
+    out_dir: PathLike,
+    max_in_flight: int = 8,
+    outputs: bool = True,
+    exports: bool = True,
+) -> FetchReport:
+    """Download the artifacts of a run with the default client."""
+    fetcher = RunArtifactFetcher(max_in_flight=max_in_flight)
+    return fetcher.fetch(run_id, out_dir, outputs=outputs, exports=exports)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("run_id", type=int)
+    parser.add_argument("--out-dir", default=".")
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--no-outputs", action="store_true")
+    parser.add_argument("--no-exports", action="store_true")
+    parser.add_argument(
+        "--views", default="CODE", choices=["CODE", "DASHBOARDS", "ALL"]
+    )
+    args = parser.parse_args()
+
+    fetcher = RunArtifactFetcher(
+        max_in_flight=args.max_in_flight, views_to_export=args.views
+    )
+    report = fetcher.fetch(
+        args.run_id,
+        args.out_dir,
+        outputs=not args.no_outputs,
+        exports=not args.no_exports,
+    )
+    print(json.dumps(report.to_dict(), indent=2))
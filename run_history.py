@@ -0,0 +1,435 @@
+"""Local mirror of the run history in SQLite.
+
+``sync`` copies the runs of ``/2.1/jobs/runs/list``, with their tasks, into a
+SQLite file. A sync only asks for the runs started after the high-water mark
+of the previous one: the start of the oldest run that was still active,
+or the start of the newest run if none was.
+The runs are upserted, so the overlap with the previous sync is harmless.
+
+The questions about the past runs are then answered offline::
+
+    history = RunHistory("runs.sqlite")
+    history.sync(job_id=11223344)
+    history.task_percentiles(job_id=11223344)["10W"]
+    # {50: 812.0, 90: 1103.5, 99: 1260.2}
+
+Or from the command line::
+
+    python run_history.py sync --job-id 11223344
+    python run_history.py percentiles --job-id 11223344
+"""
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+
+from utils import iter_runs, jd
+
+DEFAULT_DB = "run_history.sqlite"
+# the life cycle states a run does not leave
+TERMINAL_STATES = ("TERMINATED", "SKIPPED", "INTERNAL_ERROR")
+# the durations stored for runs and tasks, in milliseconds
+DURATIONS = (
+    "queue_duration",
+    "setup_duration",
+    "execution_duration",
+    "cleanup_duration",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    job_id INTEGER,
+    run_name TEXT,
+    life_cycle_state TEXT,
+    result_state TEXT,
+    trigger TEXT,
+    run_type TEXT,
+    attempt_number INTEGER,
+    start_time INTEGER,
+    end_time INTEGER,
+    setup_duration INTEGER,
+    execution_duration INTEGER,
+    cleanup_duration INTEGER,
+    payload TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_job_time ON runs (job_id, start_time);
+CREATE INDEX IF NOT EXISTS runs_state_time
+    ON runs (life_cycle_state, result_state, start_time);
+CREATE INDEX IF NOT EXISTS runs_time ON runs (start_time);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    task_run_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    job_id INTEGER,
+    task_key TEXT NOT NULL,
+    life_cycle_state TEXT,
+    result_state TEXT,
+    attempt_number INTEGER,
+    cluster_id TEXT,
+    start_time INTEGER,
+    end_time INTEGER,
+    queue_duration INTEGER,
+    setup_duration INTEGER,
+    execution_duration INTEGER,
+    cleanup_duration INTEGER
+);
+CREATE INDEX IF NOT EXISTS tasks_run ON tasks (run_id);
+CREATE INDEX IF NOT EXISTS tasks_key_state_time
+    ON tasks (task_key, result_state, start_time);
+CREATE INDEX IF NOT EXISTS tasks_job_key ON tasks (job_id, task_key, result_state);
+CREATE INDEX IF NOT EXISTS tasks_state_time ON tasks (result_state, start_time);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    job_id INTEGER PRIMARY KEY,
+    high_water INTEGER,
+    synced_at INTEGER
+);
+"""
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Get a percentile of sorted values, interpolating between the closest ones."""
+    if not values:
+        raise ValueError("No values.")
+    rank = (len(values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def _task_rows(run: Dict[str, Any]) -> List[Tuple[Any, ...]]:
+    """Build the rows of the tasks of a run.
+
+    The queue duration of a task is the time between the moment it could
+    start, when the run started or its last dependency ended, and its start.
+    """
+    tasks = run.get("tasks", [])
+    ends = {t["task_key"]: t.get("end_time") or 0 for t in tasks}
+    rows = []
+    for task in tasks:
+        start_time = task.get("start_time") or None
+        ready_at = max(
+            [run.get("start_time") or 0]
+            + [ends.get(d["task_key"], 0) for d in task.get("depends_on", [])]
+        )
+        queue = start_time - ready_at if start_time and ready_at else None
+        state = task.get("state", {})
+        rows.append(
+            (
+                task["run_id"],
+                run["run_id"],
+                run.get("job_id"),
+                task["task_key"],
+                state.get("life_cycle_state"),
+                state.get("result_state"),
+                task.get("attempt_number"),
+                task.get("existing_cluster_id")
+                or task.get("cluster_instance", {}).get("cluster_id"),
+                start_time,
+                task.get("end_time") or None,
+                max(queue, 0) if queue is not None else None,
+                task.get("setup_duration"),
+                task.get("execution_duration"),
+                task.get("cleanup_duration"),
+            )
+        )
+    return rows
+
+
+class RunHistory:
+    """The SQLite mirror of the runs and of their tasks."""
+
+    def __init__(self, path: str = DEFAULT_DB) -> None:
+        """Open the mirror, creating it if needed.
+
+        Args:
+            path (str): The SQLite file, ``:memory:`` for a throwaway mirror.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "RunHistory":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # keep the statistics of the query planner up to date
+        self._conn.execute("PRAGMA optimize")
+        self._conn.close()
+
+    ##################################################
+    #    Sync
+    ##################################################
+
+    def high_water(self, job_id: Optional[int] = None) -> Optional[int]:
+        """Get the start time the next sync of the job starts from."""
+        row = self._conn.execute(
+            "SELECT high_water FROM sync_state WHERE job_id = ?", (job_id or 0,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync(
+        self,
+        job_id: Optional[int] = None,
+        start_time_from: Optional[int] = None,
+        api_client: Optional[ApiClient] = None,
+    ) -> int:
+        """Copy the new runs of a job, or of all jobs, into the mirror.
+
+        Args:
+            job_id (Optional[int]): The job to sync, all the jobs if None.
+            start_time_from (Optional[int]):
+                Sync from this start time in epoch milliseconds,
+                instead of the high-water mark of the previous sync.
+            api_client (Optional[ApiClient]):
+                The client to use, the default one if not provided.
+
+        Returns:
+            int: The number of runs written.
+        """
+        if start_time_from is None:
+            start_time_from = self.high_water(job_id)
+        t_start = time.perf_counter()
+        runs = iter_runs(
+            job_id=job_id,
+            start_time_from=start_time_from,
+            expand_tasks=True,
+            api_client=api_client,
+        )
+        n_runs, high_water = self.add_runs(runs)
+        if high_water is None:
+            high_water = start_time_from
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (job_id or 0, high_water, int(time.time() * 1000)),
+            )
+        lg.info(
+            "Synced {} runs of job {} in {:.2f} s, high-water mark {}",
+            n_runs,
+            job_id or "all",
+            time.perf_counter() - t_start,
+            high_water,
+        )
+        return n_runs
+
+    def add_runs(self, runs: Iterable[Dict[str, Any]]) -> Tuple[int, Optional[int]]:
+        """Upsert runs with their tasks.
+
+        Returns:
+            Tuple[int, Optional[int]]:
+                The number of runs written, and the high-water mark:
+                the start of the oldest active run, or of the newest run.
+        """
+        n_runs = 0
+        newest: Optional[int] = None
+        oldest_active: Optional[int] = None
+        run_rows = []
+        task_rows = []
+        for run in runs:
+            n_runs += 1
+            state = run.get("state", {})
+            start_time = run.get("start_time")
+            if start_time:
+                newest = max(newest or start_time, start_time)
+                if state.get("life_cycle_state") not in TERMINAL_STATES:
+                    oldest_active = min(oldest_active or start_time, start_time)
+            run_rows.append(
+                (
+                    run["run_id"],
+                    run.get("job_id"),
+                    run.get("run_name"),
+                    state.get("life_cycle_state"),
+                    state.get("result_state"),
+                    run.get("trigger"),
+                    run.get("run_type"),
+                    run.get("attempt_number"),
+                    start_time,
+                    run.get("end_time") or None,
+                    run.get("setup_duration"),
+                    run.get("execution_duration"),
+                    run.get("cleanup_duration"),
+                    json.dumps(run),
+                )
+            )
+            task_rows.extend(_task_rows(run))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO runs VALUES ({', '.join('?' * 14)})",
+                run_rows,
+            )
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO tasks VALUES ({', '.join('?' * 14)})",
+                task_rows,
+            )
+        return n_runs, oldest_active if oldest_active is not None else newest
+
+    ##################################################
+    #    Queries
+    ##################################################
+
+    def _task_filter(
+        self,
+        job_id: Optional[int],
+        task_key: Optional[str],
+        since: Optional[int],
+        result_state: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        clauses = []
+        args: List[Any] = []
+        for column, value in (
+            ("job_id", job_id),
+            ("task_key", task_key),
+            ("result_state", result_state),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                args.append(value)
+        if since is not None:
+            clauses.append("start_time >= ?")
+            args.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, args
+
+    def task_percentiles(
+        self,
+        job_id: Optional[int] = None,
+        task_key: Optional[str] = None,
+        percentiles: Sequence[float] = (50, 90, 99),
+        duration: str = "execution_duration",
+        since: Optional[int] = None,
+        result_state: Optional[str] = "SUCCESS",
+    ) -> Dict[str, Dict[float, float]]:
+        """Get the percentiles of a duration of each task, in seconds.
+
+        Args:
+            job_id (Optional[int]): Only the tasks of this job.
+            task_key (Optional[str]): Only this task.
+            percentiles (Sequence[float]): The percentiles, between 0 and 100.
+            duration (str):
+                ``queue_duration``, ``setup_duration``, ``execution_duration``
+                or ``cleanup_duration``.
+            since (Optional[int]): Only the tasks started after, in epoch ms.
+            result_state (Optional[str]): Only the tasks that ended so, all if None.
+
+        Returns:
+            Dict[str, Dict[float, float]]: task key -> percentile -> seconds.
+        """
+        if duration not in DURATIONS:
+            raise ValueError(f"Unknown {duration=}, pick from {DURATIONS}.")
+        where, args = self._task_filter(job_id, task_key, since, result_state)
+        where = f"{where} AND" if where else "WHERE"
+        rows = self._conn.execute(
+            f"SELECT task_key, {duration} FROM tasks {where} {duration} IS NOT NULL "
+            f"ORDER BY task_key, {duration}",
+            args,
+        )
+        values: Dict[str, List[float]] = {}
+        for key, millis in rows:
+            values.setdefault(key, []).append(millis / 1000)
+        return {
+            key: {pct: percentile(durations, pct) for pct in percentiles}
+            for key, durations in values.items()
+        }
+
+    def task_breakdown(
+        self,
+        job_id: Optional[int] = None,
+        task_key: Optional[str] = None,
+        since: Optional[int] = None,
+        result_state: Optional[str] = "SUCCESS",
+    ) -> Dict[str, Dict[str, float]]:
+        """Get the mean queue, setup, execution and cleanup seconds of each task."""
+        where, args = self._task_filter(job_id, task_key, since, result_state)
+        columns = ", ".join(f"AVG({d}) / 1000.0" for d in DURATIONS)
+        rows = self._conn.execute(
+            f"SELECT task_key, COUNT(*), {columns} FROM tasks {where} GROUP BY task_key",
+            args,
+        )
+        return {
+            key: {"runs": count, **dict(zip(DURATIONS, means))}
+            for key, count, *means in rows
+        }
+
+    def task_costs(self, job_id: int, since: Optional[int] = None) -> Dict[str, float]:
+        """Get the median setup and execution seconds of each task of a job.
+
+        The costs of ``task_planner.plan_tasks``.
+        """
+        setup = self.task_percentiles(job_id, None, (50,), "setup_duration", since)
+        execution = self.task_percentiles(
+            job_id, None, (50,), "execution_duration", since
+        )
+        return {
+            key: pct[50] + setup.get(key, {}).get(50, 0.0)
+            for key, pct in execution.items()
+        }
+
+    def failed_runs(
+        self, job_id: Optional[int] = None, since: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get the runs that did not succeed, most recent first."""
+        clauses = ["life_cycle_state IN ('TERMINATED', 'INTERNAL_ERROR')"]
+        clauses.append("COALESCE(result_state, '') != 'SUCCESS'")
+        args: List[Any] = []
+        if job_id is not None:
+            clauses.append("job_id = ?")
+            args.append(job_id)
+        if since is not None:
+            clauses.append("start_time >= ?")
+            args.append(since)
+        rows = self._conn.execute(
+            "SELECT run_id, job_id, run_name, life_cycle_state, result_state, "
+            f"start_time, end_time FROM runs WHERE {' AND '.join(clauses)} "
+            "ORDER BY start_time DESC",
+            args,
+        )
+        columns = [c[0] for c in rows.description]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """Get the payload of a mirrored run."""
+        row = self._conn.execute(
+            "SELECT payload FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "command", choices=["sync", "percentiles", "breakdown", "failed"]
+    )
+    parser.add_argument("--db", default=DEFAULT_DB)
+    parser.add_argument("--job-id", type=int)
+    parser.add_argument("--task-key")
+    parser.add_argument("--since", type=int, help="epoch milliseconds")
+    args = parser.parse_args()
+
+    with RunHistory(args.db) as history:
+        if args.command == "sync":
+            history.sync(args.job_id, args.since)
+        elif args.command == "percentiles":
+            result: Any = history.task_percentiles(
+                args.job_id, args.task_key, since=args.since
+            )
+            lg.info("Execution seconds by task:\n{}", jd(result))
+        elif args.command == "breakdown":
+            result = history.task_breakdown(args.job_id, args.task_key, args.since)
+            lg.info("Mean seconds by task:\n{}", jd(result))
+        else:
+            lg.info(
+                "Failed runs:\n{}", jd(history.failed_runs(args.job_id, args.since))
+            )
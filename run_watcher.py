@@ -0,0 +1,489 @@
+"""Wait on many runs at once.
+
+A single ``RunWatcher`` tracks any number of run ids with one scheduler
+thread and a small pool of pollers.
+Each run is polled at a pace that follows its ``RunLifeCycleState``:
+often while it is pending or terminating, then less and less often while it
+keeps running.
+The runs of the same job are polled together with ``/2.1/jobs/runs/list``,
+a run alone with ``/2.1/jobs/runs/get``, like a completed run for the final
+payload with its tasks.
+
+The completion of a run is exposed as a ``Future`` resolving to its last
+payload, as callbacks, and as iterators in completion order::
+
+    with RunWatcher() as watcher:
+        futures = [watcher.watch(run_id) for run_id in run_ids]
+        for run in watcher.iter_completed():
+            lg.info("{} {}", run["run_id"], run["state"]["result_state"])
+
+    async for run in watcher.as_completed():
+        ...
+"""
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import as_completed as futures_as_completed
+import heapq
+import itertools
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+
+from utils import PAGE_LIMIT, get_databricks_client, http_status, iter_runs
+
+RunCallback = Callable[[Dict[str, Any]], None]
+# ("run", run_id) for a run with an unknown job, ("job", job_id) for the others
+PollKey = Tuple[str, int]
+
+# the life cycle states a run does not leave
+TERMINAL_STATES = frozenset({"TERMINATED", "SKIPPED", "INTERNAL_ERROR"})
+
+# seconds between two polls, by life cycle state,
+# None is a run that was not polled yet
+POLL_INTERVALS: Dict[Optional[str], float] = {
+    None: 1.0,
+    "PENDING": 2.0,
+    "RUNNING": 5.0,
+    "TERMINATING": 2.0,
+}
+
+
+class _Watch:
+    """A watched run."""
+
+    __slots__ = (
+        "run_id",
+        "job_id",
+        "future",
+        "callbacks",
+        "state",
+        "start_time",
+        "interval",
+        "errors",
+    )
+
+    def __init__(self, run_id: int, job_id: Optional[int]) -> None:
+        self.run_id = run_id
+        self.job_id = job_id
+        self.future: "Future[Dict[str, Any]]" = Future()
+        self.callbacks: List[RunCallback] = []
+        self.state: Optional[str] = None
+        self.start_time: Optional[int] = None
+        self.interval = POLL_INTERVALS[None]
+        self.errors = 0
+
+
+class RunWatcher:
+    """Track many runs until they complete, polling them adaptively."""
+
+    def __init__(
+        self,
+        api_client: Optional[ApiClient] = None,
+        max_in_flight: int = 4,
+        intervals: Optional[Dict[Optional[str], float]] = None,
+        backoff: float = 1.5,
+        max_interval: float = 60.0,
+        max_errors: int = 5,
+        on_complete: Optional[RunCallback] = None,
+    ) -> None:
+        """Create the watcher and start its scheduler.
+
+        Args:
+            api_client (Optional[ApiClient]):
+                The client to use, the default one if not provided.
+            max_in_flight (int): The maximum number of requests in flight.
+            intervals (Optional[Dict[Optional[str], float]]):
+                Seconds between two polls by life cycle state,
+                to override ``POLL_INTERVALS``.
+            backoff (float):
+                Factor applied to the interval of a run each time it is found
+                still running.
+            max_interval (float): Maximum seconds between two polls of a run.
+            max_errors (int):
+                Consecutive failed polls before the future of a run fails.
+            on_complete (Optional[RunCallback]): Called with every completed run.
+        """
+        self.api_client = api_client
+        self.intervals = {**POLL_INTERVALS, **(intervals or {})}
+        self.backoff = backoff
+        self.max_interval = max_interval
+        self.max_errors = max_errors
+        self.on_complete = on_complete
+        # number of requests sent, by endpoint
+        self.stats = {"runs_get": 0, "runs_list": 0}
+
+        self._runs: Dict[int, _Watch] = {}
+        self._by_job: Dict[int, Set[int]] = {}
+        # heap of (due, seq, key), entries not matching _due are stale
+        self._heap: List[Tuple[float, int, PollKey]] = []
+        self._due: Dict[PollKey, float] = {}
+        self._polling: Set[PollKey] = set()
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="RunWatcher"
+        )
+        self._thread = threading.Thread(
+            target=self._schedule_loop, name="RunWatcher-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "RunWatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """The number of runs still watched."""
+        return len(self._runs)
+
+    def watch(
+        self,
+        run_id: int,
+        job_id: Optional[int] = None,
+        callback: Optional[RunCallback] = None,
+    ) -> "Future[Dict[str, Any]]":
+        """Start watching a run.
+
+        Args:
+            run_id (int): The run, as returned by ``run-now`` or ``runs/submit``.
+            job_id (Optional[int]):
+                The job of the run, if known, so that it can be polled
+                together with the other runs of the job from the first poll.
+            callback (Optional[RunCallback]):
+                Called with the payload of the run once it completes.
+
+        Returns:
+            Future[Dict[str, Any]]:
+                Resolves to the last payload of the run once it completes.
+                Watching a run already watched returns the same future.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("The watcher is closed.")
+            watch = self._runs.get(run_id)
+            if watch is None:
+                watch = self._runs[run_id] = _Watch(run_id, job_id)
+                if job_id is not None:
+                    self._by_job.setdefault(job_id, set()).add(run_id)
+                self._schedule(self._key_of(watch), watch.interval)
+            if callback is not None:
+                watch.callbacks.append(callback)
+            return watch.future
+
+    def watch_many(
+        self, run_ids: Iterable[int], job_id: Optional[int] = None
+    ) -> List["Future[Dict[str, Any]]"]:
+        """Start watching several runs, see ``watch``."""
+        return [self.watch(run_id, job_id) for run_id in run_ids]
+
+    def unwatch(self, run_id: int) -> None:
+        """Stop watching a run, its future is cancelled."""
+        with self._cond:
+            watch = self._forget(run_id)
+        if watch is not None:
+            watch.future.cancel()
+
+    def futures(self) -> List["Future[Dict[str, Any]]"]:
+        """Get the futures of the runs still watched."""
+        with self._cond:
+            return [watch.future for watch in self._runs.values()]
+
+    def iter_completed(
+        self,
+        futures: Optional[Iterable["Future[Dict[str, Any]]"]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the runs as they complete.
+
+        Args:
+            futures (Optional[Iterable[Future]]):
+                The futures returned by ``watch``, all the watched runs if None.
+            timeout (Optional[float]): Seconds to wait for all of them.
+        """
+        if futures is None:
+            futures = self.futures()
+        for future in futures_as_completed(futures, timeout=timeout):
+            yield future.result()
+
+    async def as_completed(
+        self, futures: Optional[Iterable["Future[Dict[str, Any]]"]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the runs as they complete, from an event loop.
+
+        Args:
+            futures (Optional[Iterable[Future]]):
+                The futures returned by ``watch``, all the watched runs if None.
+        """
+        if futures is None:
+            futures = self.futures()
+        wrapped = [asyncio.wrap_future(future) for future in futures]
+        for next_done in asyncio.as_completed(wrapped):
+            yield await next_done
+
+    def close(self) -> None:
+        """Stop the scheduler, the futures of the runs still watched are cancelled."""
+        with self._cond:
+            self._closed = True
+            watches = list(self._runs.values())
+            self._runs.clear()
+            self._by_job.clear()
+            self._cond.notify_all()
+        for watch in watches:
+            watch.future.cancel()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    ##################################################
+    #    Scheduling, with the condition held
+    ##################################################
+
+    def _key_of(self, watch: _Watch) -> PollKey:
+        if watch.job_id is None:
+            return ("run", watch.run_id)
+        return ("job", watch.job_id)
+
+    def _schedule(self, key: PollKey, delay: float) -> None:
+        """Poll the key after delay seconds, or sooner if already scheduled."""
+        due = time.monotonic() + delay
+        current = self._due.get(key)
+        if current is not None and current <= due:
+            return
+        self._due[key] = due
+        heapq.heappush(self._heap, (due, next(self._seq), key))
+        self._cond.notify()
+
+    def _forget(self, run_id: int) -> Optional[_Watch]:
+        watch = self._runs.pop(run_id, None)
+        if watch is not None and watch.job_id is not None:
+            runs = self._by_job.get(watch.job_id)
+            if runs is not None:
+                runs.discard(run_id)
+                if not runs:
+                    del self._by_job[watch.job_id]
+        return watch
+
+    def _runs_of(self, key: PollKey) -> List[_Watch]:
+        kind, id_ = key
+        if kind == "run":
+            watch = self._runs.get(id_)
+            return [] if watch is None or watch.job_id is not None else [watch]
+        return [self._runs[i] for i in self._by_job.get(id_, ())]
+
+    def _schedule_loop(self) -> None:
+        with self._cond:
+            while not self._closed:
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    due, _, key = heapq.heappop(self._heap)
+                    if self._due.get(key) != due:
+                        continue
+                    del self._due[key]
+                    if key in self._polling:
+                        # rescheduled once the running poll is done
+                        continue
+                    watches = self._runs_of(key)
+                    if watches:
+                        self._polling.add(key)
+                        self._executor.submit(self._poll, key, watches)
+                timeout = self._heap[0][0] - now if self._heap else None
+                self._cond.wait(timeout)
+
+    ##################################################
+    #    Polling, in the pool
+    ##################################################
+
+    def _client(self) -> ApiClient:
+        if self.api_client is None:
+            return get_databricks_client()
+        return self.api_client
+
+    def _poll(self, key: PollKey, watches: List[_Watch]) -> None:
+        errors: Dict[int, Exception] = {}
+        try:
+            if len(watches) == 1:
+                payloads = {watches[0].run_id: self._get_run(watches[0].run_id)}
+            else:
+                payloads = self._list_runs(key[1], watches)
+        except Exception as e:
+            self._on_error(key, watches, e)
+            return
+        if len(watches) > 1:
+            # the runs not in the list, and the completed ones for their tasks,
+            # are fetched alone, an error there is only the error of that run
+            for watch in watches:
+                payload = payloads.get(watch.run_id)
+                if payload is not None and not _is_terminal(payload):
+                    continue
+                try:
+                    payloads[watch.run_id] = self._get_run(watch.run_id)
+                except Exception as e:
+                    payloads.pop(watch.run_id, None)
+                    errors[watch.run_id] = e
+
+        completed = []
+        failed = []
+        with self._cond:
+            self._polling.discard(key)
+            for watch in watches:
+                if self._runs.get(watch.run_id) is not watch:
+                    continue
+                if watch.run_id in errors:
+                    error = errors[watch.run_id]
+                    lg.warning("Polling run {} failed: {}", watch.run_id, error)
+                    if self._count_error(watch, error, alone=True):
+                        failed.append((watch, error))
+                    continue
+                payload = payloads[watch.run_id]
+                watch.errors = 0
+                if self._update(watch, payload):
+                    self._forget(watch.run_id)
+                    completed.append((watch, payload))
+            # reschedule what is left, the runs that learned their job move over
+            intervals: Dict[PollKey, float] = {}
+            for watch in self._runs_of(key) + watches:
+                if self._runs.get(watch.run_id) is watch:
+                    run_key = self._key_of(watch)
+                    interval = watch.interval
+                    if watch.run_id in errors:
+                        interval = self._retry_delay(watch)
+                    intervals[run_key] = min(interval, intervals.get(run_key, interval))
+            for run_key, interval in intervals.items():
+                self._schedule(run_key, interval)
+
+        for watch, payload in completed:
+            self._complete(watch, payload)
+        for watch, error in failed:
+            if not watch.future.cancelled():
+                watch.future.set_exception(error)
+
+    def _count(self, endpoint: str) -> None:
+        with self._cond:
+            self.stats[endpoint] += 1
+
+    def _get_run(self, run_id: int) -> Dict[str, Any]:
+        self._count("runs_get")
+        return self._client().perform_query(
+            "GET", "/jobs/runs/get", data={"run_id": run_id}, version="2.1"
+        )
+
+    def _list_runs(self, job_id: int, watches: List[_Watch]) -> Dict[int, Any]:
+        """Get the runs of a job from runs/list, stop once all of them are found."""
+        wanted = {watch.run_id for watch in watches}
+        start_times = [watch.start_time for watch in watches]
+        start_time_from = None if None in start_times else min(start_times)  # type: ignore[type-var]
+        found: Dict[int, Any] = {}
+        pages = iter_runs(
+            job_id=job_id,
+            start_time_from=start_time_from,
+            api_client=self._client(),
+            read_ahead=1,
+        )
+        for i, run in enumerate(pages):
+            if i % PAGE_LIMIT == 0:
+                self._count("runs_list")
+            if run["run_id"] in wanted:
+                found[run["run_id"]] = run
+                if len(found) == len(wanted):
+                    break
+        return found
+
+    def _update(self, watch: _Watch, payload: Dict[str, Any]) -> bool:
+        """Update a run from its payload, return whether it completed."""
+        state = payload.get("state", {}).get("life_cycle_state")
+        if watch.job_id is None and payload.get("job_id") is not None:
+            watch.job_id = payload["job_id"]
+            self._by_job.setdefault(watch.job_id, set()).add(watch.run_id)  # type: ignore[arg-type]
+        watch.start_time = payload.get("start_time") or watch.start_time
+        if state in TERMINAL_STATES:
+            watch.state = state
+            return True
+
+        base = self.intervals.get(state, self.intervals[None])
+        if state == watch.state:
+            # still in the same state, wait longer each time
+            watch.interval = min(watch.interval * self.backoff, self.max_interval)
+        else:
+            watch.interval = base
+        watch.state = state
+        return False
+
+    def _complete(self, watch: _Watch, payload: Dict[str, Any]) -> None:
+        for callback in watch.callbacks + (
+            [self.on_complete] if self.on_complete else []
+        ):
+            try:
+                callback(payload)
+            except Exception:
+                lg.exception("Callback of run {} failed", watch.run_id)
+        if not watch.future.cancelled():
+            watch.future.set_result(payload)
+
+    def _on_error(self, key: PollKey, watches: List[_Watch], error: Exception) -> None:
+        """Retry later, fail the runs that keep failing or that do not exist."""
+        lg.warning("Polling {} failed: {}", key, error)
+        failed = []
+        with self._cond:
+            self._polling.discard(key)
+            for watch in watches:
+                if self._runs.get(watch.run_id) is not watch:
+                    continue
+                if self._count_error(watch, error, alone=len(watches) == 1):
+                    failed.append(watch)
+                else:
+                    self._schedule(self._key_of(watch), self._retry_delay(watch))
+        for watch in failed:
+            if not watch.future.cancelled():
+                watch.future.set_exception(error)
+
+    def _count_error(self, watch: _Watch, error: Exception, alone: bool) -> bool:
+        """Count a failed poll of a run, forget it and return True if it fails.
+
+        Args:
+            watch (_Watch): The run.
+            error (Exception): The error of the poll.
+            alone (bool): Whether the request was about this run only, so that
+                a 400 or 404 means the run does not exist.
+        """
+        watch.errors += 1
+        if (alone and http_status(error) in (400, 404)) or (
+            watch.errors >= self.max_errors
+        ):
+            self._forget(watch.run_id)
+            return True
+        return False
+
+    def _retry_delay(self, watch: _Watch) -> float:
+        return min(watch.interval * 2**watch.errors, self.max_interval)
+
+
+def _is_terminal(payload: Dict[str, Any]) -> bool:
+    return payload.get("state", {}).get("life_cycle_state") in TERMINAL_STATES
+
+
+def wait_for_runs(
+    run_ids: Iterable[int],
+    api_client: Optional[ApiClient] = None,
+    timeout: Optional[float] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """Wait for the runs to complete, get their last payload by run id."""
+    with RunWatcher(api_client) as watcher:
+        futures = watcher.watch_many(run_ids)
+        return {run["run_id"]: run for run in watcher.iter_completed(futures, timeout)}
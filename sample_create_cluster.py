@@ -10,40 +10,9 @@ from databricks_cli.clusters.api import ClusterApi
 from loguru import logger as lg
 from requests import Response
 
+from databricks_api import single_node_cluster
 from utils import get_databricks_client, jd
 
-# TODO
-# the keys
-# "single_user_name": "mail@customer.eu",
-# "data_security_mode": "LEGACY_SINGLE_USER_STANDARD",
-# are missing in the API, do we need them? what do they do?
-
-CREATE_CLUSTER_TEMPLATE = """{{
-    "num_workers": 0,
-    "cluster_name": "{cluster_name}",
-    "spark_version": "10.4.x-scala2.12",
-    "spark_conf": {{
-        "spark.master": "local[*, 4]",
-        "spark.databricks.cluster.profile": "singleNode"
-    }},
-    "azure_attributes": {{
-        "first_on_demand": 1,
-        "availability": "ON_DEMAND_AZURE",
-        "spot_bid_max_price": -1
-    }},
-    "node_type_id": "Standard_DS3_v2",
-    "custom_tags": {{
-        "ResourceClass": "SingleNode"
-    }},
-    "spark_env_vars": {{
-        "PYSPARK_PYTHON": "/databricks/python3/bin/python3"
-    }},
-    "autotermination_minutes": {autotermination_minutes},
-    "enable_elastic_disk": true,
-    "runtime_engine": "STANDARD"
-}}
-"""
-
 
 def sample_create_cluster(
     cluster_name: str,
@@ -56,17 +25,13 @@ def sample_create_cluster(
     api_client = get_databricks_client()
     cluster_api = ClusterApi(api_client)
 
-    # build the string and get a dict from it
-    json_conf_str = CREATE_CLUSTER_TEMPLATE.format(
-        cluster_name=cluster_name,
-        autotermination_minutes=autotermination_minutes,
-    )
-    lg.info("Will create cluster with conf string:\n{}", json_conf_str)
-    json_conf = json.loads(json_conf_str)
+    # build the typed spec and get a dict from it
+    cluster_spec = single_node_cluster(cluster_name, autotermination_minutes)
 
     # add a idempotency token so we can spam this request
     if idempotency_token != "":
-        json_conf.update({"idempotency_token": idempotency_token})
+        cluster_spec.idempotency_token = idempotency_token
+    json_conf = cluster_spec.to_dict()
 
     lg.info("Will create cluster with conf:\n{}", jd(json_conf))
 
@@ -1,6 +1,8 @@
 """Sample interface with databricks API."""
+from typing import Optional
+
 from databricks_cli.jobs.api import JobsApi
-import jsons
+from databricks_cli.sdk.api_client import ApiClient
 from loguru import logger as lg
 
 from databricks_api import (
@@ -12,7 +14,9 @@ from databricks_api import (
     NotebookTask,
     TaskDependency,
 )
-from utils import get_databricks_client, jd
+from job_graph import check_job_graph
+from task_planner import plan_tasks
+from utils import get_databricks_client, invalidate_token_on_auth_error, jd
 
 
 def sample_create_job_auto_task() -> None:
@@ -30,73 +34,40 @@ def sample_create_job_auto_task() -> None:
     notebook_path = "/the/path"
     source = "WORKSPACE"
 
-    params_by_cluster = {
-        "cluster_1": [
-            {"line": 10, "gender": "W"},
-            {"line": 10, "gender": "M"},
-        ],
-        "cluster_2": [
-            {"line": 30, "gender": "G"},
-            {"line": 30, "gender": "B"},
-        ],
-        # "cluster_3": [
-        #     {"line": 15, "gender": "W"},
-        #     {"line": 15, "gender": "M"},
-        #     {"line": 16, "gender": "W"},
-        #     {"line": 16, "gender": "M"},
-        # ],
-    }
+    params = [
+        {"line": 10, "gender": "W"},
+        {"line": 10, "gender": "M"},
+        {"line": 30, "gender": "G"},
+        {"line": 30, "gender": "B"},
+        # {"line": 15, "gender": "W"},
+        # {"line": 15, "gender": "M"},
+    ]
     shared_params = {"season": "2023-3"}
-
-    tasks = []
-    for cluster_id, params in params_by_cluster.items():
-
-        # new cluster, reset state
-        is_first_task_for_cluster = True
-        last_task_key = ""
-
-        for p in params:
-
-            # build the task name
-            task_key = f"{p['line']}{p['gender']}"
-
-            # add the season to the params
-            # which is modifying the list so I kinda hate it
-            p.update(shared_params)
-
-            # build the task
-            notebook_task = NotebookTask(
-                notebook_path=notebook_path,
-                source=source,
-                base_parameters=p,
-            )
-
-            # build the libraries if needed
-            # and the depends on object
-            if is_first_task_for_cluster:
-                # first task must wait for this libraries
-                lib = libraries
-                # first task depends on nothing
-                do = None
-                is_first_task_for_cluster = False
-            else:
-                # arguably other tasks should require libraries
-                # even if those are already installed on the cluster by now
-                lib = None
-                # other tasks depend on the previous
-                do = [TaskDependency(last_task_key)]
-
-            # build the task
-            task = JobTaskSettings(
-                task_key=task_key,
-                depends_on=do,
-                notebook_task=notebook_task,
-                existing_cluster_id=cluster_id,
-                libraries=lib,
-            )
-            tasks.append(task)
-
-            last_task_key = task_key
+    cluster_ids = ["cluster_1", "cluster_2"]
+
+    # expected seconds of each task, from past runs if the job exists
+    # costs = fetch_task_costs(job_id)
+    costs = {"10W": 1200, "10M": 900, "30G": 600, "30B": 300}
+
+    # place the tasks on the clusters, balancing the expected durations
+    # the params dicts are not modified
+    plan = plan_tasks(
+        params,
+        cluster_ids,
+        costs,
+        lanes_per_cluster=1,
+        shared_params=shared_params,
+        task_key=lambda p: f"{p['line']}{p['gender']}",
+    )
+    lg.info(plan.summary())
+
+    # the first task of each chain must wait for the libraries,
+    # the others depend on the previous one
+    tasks = plan.tasks(
+        notebook_path=notebook_path,
+        source=source,
+        libraries=libraries,
+    )
 
     #######
     # JOB #
@@ -121,7 +92,7 @@ def sample_create_job_auto_task() -> None:
     )
 
     # dump the result
-    lg.info("job: \n{}", jd(jsons.dump(job, strip_privates=True)))
+    lg.info("job: \n{}", jd(job.to_dict()))
 
 
 def sample_create_job_manual() -> None:
@@ -183,20 +154,36 @@ def sample_create_job_manual() -> None:
     )
 
     # dump the result
-    lg.info("job: \n{}", jd(jsons.dump(job, strip_privates=True)))
+    lg.info("job: \n{}", jd(job.to_dict()))
 
 
 def create_job(
     job: JobSettings,
     dry_run: bool = False,
+    api_client: Optional[ApiClient] = None,
 ) -> str:
-    """Create the requested job."""
+    """Create the requested job.
+
+    Args:
+        job (JobSettings): The job to create.
+        dry_run (bool): Only log the payload.
+        api_client (Optional[ApiClient]):
+            The client to use, like a ``SyncApiClient``.
+            The default one if not provided.
+
+    Raises:
+        JobGraphError: If the dependencies of the tasks are broken.
+    """
+    # catch the broken depends_on before databricks does
+    check_job_graph(job)
+
     # turn the JobSettings into a dict
-    json_payload = jsons.dump(job, strip_privates=True)
+    json_payload = job.to_dict()
     lg.info("Will create job with payload {}", jd(json_payload))
 
     # get the main API client
-    api_client = get_databricks_client()
+    if api_client is None:
+        api_client = get_databricks_client()
     # create the job API interface
     jobs_api = JobsApi(api_client)
 
@@ -204,7 +191,8 @@ def create_job(
         return "dry_run"
 
     # create the actual job
-    job_create_response = jobs_api.create_job(json=json_payload)
+    with invalidate_token_on_auth_error():
+        job_create_response = jobs_api.create_job(json=json_payload)
 
     return job_create_response["job_id"]
 
@@ -1,18 +1,10 @@
 """Create the task kinda like the customer projection would need."""
-from databricks_cli.clusters.api import ClusterApi
 from databricks_cli.jobs.api import JobsApi
-import jsons
 from loguru import logger as lg
 
-from databricks_api import (
-    CronSchedule,
-    JobEmailNotifications,
-    JobSettings,
-    JobTaskSettings,
-    Library,
-    NotebookTask,
-    TaskDependency,
-)
+from cluster_index import get_cluster_index
+from databricks_api import CronSchedule, JobEmailNotifications, JobSettings, Library
+from task_planner import plan_tasks
 from utils import get_databricks_client, jd
 
 
@@ -23,18 +15,13 @@ def sample_customer_projection_tasks() -> None:
     api_client = get_databricks_client()
 
     ####################################################################
-    # get the cluster interface and get the cluster id
-    cluster_api = ClusterApi(api_client)
+    # get the cluster id from the cached cluster index
+    cluster_index = get_cluster_index(api_client)
 
     cluster_name = "test_databricks_api_01"
 
-    # # this actually returns a list of cluster info
-    # # cluster_ids = cluster_api.get_cluster_ids_by_name(cluster_name)
-    # clusters = cluster_api.get_cluster_ids_by_name(cluster_name)
-    # for cluster in clusters:
-    #     lg.info("{}: {}", cluster_name, cluster["cluster_id"])
-
-    cluster_id = cluster_api.get_cluster_id_for_name(cluster_name)
+    # raises if several clusters share the name
+    cluster_id = cluster_index.get_id(cluster_name)
     lg.info("{}: {}", cluster_name, cluster_id)
 
     ####################################################################
@@ -51,70 +38,30 @@ def sample_customer_projection_tasks() -> None:
     ]
     source = "WORKSPACE"
 
-    params_by_cluster = {
-        cluster_id: [
-            {"line": 10, "gender": "W"},
-            {"line": 10, "gender": "M"},
-        ],
-        # "cluster_2": [
-        #     {"line": 30, "gender": "G"},
-        #     {"line": 30, "gender": "B"},
-        # ],
-    }
+    params = [
+        {"line": 10, "gender": "W"},
+        {"line": 10, "gender": "M"},
+    ]
     shared_params = {
         "season": "2023-3",
         "actual_day_from_camp_start": 15,
     }
 
-    tasks = []
-    for cluster_id, params in params_by_cluster.items():
-
-        # new cluster, reset state
-        is_first_task_for_cluster = True
-        last_task_key = ""
-
-        for p in params:
-
-            # build the task name
-            task_key = f"automatic_{p['line']}{p['gender']}"
-
-            # add the season to the params
-            # which is modifying the list so I kinda hate it
-            p.update(shared_params)
-
-            # build the task
-            notebook_task = NotebookTask(
-                notebook_path=notebook_path,
-                source=source,
-                base_parameters=p,
-            )
-
-            # build the libraries if needed
-            # and the depends on object
-            if is_first_task_for_cluster:
-                # first task must wait for this libraries
-                lib = libraries
-                # first task depends on nothing
-                do = None
-                is_first_task_for_cluster = False
-            else:
-                # arguably other tasks should require libraries
-                # even if those are already installed on the cluster by now
-                lib = None
-                # other tasks depend on the previous
-                do = [TaskDependency(last_task_key)]
-
-            # build the task
-            task = JobTaskSettings(
-                task_key=task_key,
-                depends_on=do,
-                notebook_task=notebook_task,
-                existing_cluster_id=cluster_id,
-                libraries=lib,
-            )
-            tasks.append(task)
-
-            last_task_key = task_key
+    # no past runs yet: every task is expected to take the same time
+    plan = plan_tasks(
+        params,
+        [cluster_id],
+        cost={},
+        lanes_per_cluster=1,
+        shared_params=shared_params,
+        task_key=lambda p: f"automatic_{p['line']}{p['gender']}",
+    )
+    lg.info(plan.summary())
+    tasks = plan.tasks(
+        notebook_path=notebook_path,
+        source=source,
+        libraries=libraries,
+    )
 
     #######
     # JOB #
@@ -138,7 +85,7 @@ def sample_customer_projection_tasks() -> None:
         max_concurrent_runs=1,
     )
 
-    json_payload = jsons.dump(job, strip_privates=True)
+    json_payload = job.to_dict()
 
     # dump the result
     lg.info("job: \n{}", jd(json_payload))
@@ -4,10 +4,13 @@ https://docs.databricks.com/dev-tools/python-api.html
 """
 
 import json
+from typing import Optional
 
 from databricks_cli.clusters.api import ClusterApi
+from databricks_cli.sdk.api_client import ApiClient
 from loguru import logger as lg
 
+from cluster_index import get_cluster_index
 from utils import get_databricks_client
 
 
@@ -39,35 +42,31 @@ def sample_list_cluster():
 
 def get_cluster_id_by_name(
     cluster_name: str,
+    api_client: Optional[ApiClient] = None,
+    on_duplicate: str = "error",
 ) -> str:
-    """A wrapper for cluster_api.get_cluster_ids_by_name.
+    """Get the id of the cluster with this name, from the cluster index.
 
-    We assume there is a single cluster by that name.
+    The clusters are listed once and cached, see ``get_cluster_index``.
+
+    Args:
+        cluster_name (str): The name of the cluster.
+        api_client (Optional[ApiClient]):
+            The client to use, like a ``SyncApiClient``.
+            The default one if not provided.
+        on_duplicate (str):
+            What to do if several clusters have the name,
+            see ``ClusterIndex.get_id``.
 
     Raises:
         KeyError: If there are no cluster by that name.
+        DuplicateClusterNameError: If several clusters have the name.
 
     Returns:
         str: The cluster id.
     """
-    api_client = get_databricks_client()
-    cluster_api = ClusterApi(api_client)
-
-    # this actually returns a list of cluster info
-    clusters = cluster_api.get_cluster_ids_by_name(cluster_name)
-    # for cluster in clusters:
-    #     lg.info("{}: {}", cluster_name, cluster["cluster_id"])
-
-    if len(clusters) == 0:
-        raise KeyError(f"There are {len(clusters)} cluster named {cluster_name}.")
-
-    if len(clusters) != 1:
-        lg.warning("There are {} cluster named {}.", len(clusters), cluster_name)
-
-    # we still return the first
-    cluster = clusters[0]
-
-    return cluster["cluster_id"]
+    index = get_cluster_index(api_client)
+    return index.get_id(cluster_name, on_duplicate=on_duplicate)
 
 
 if __name__ == "__main__":
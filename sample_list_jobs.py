@@ -0,0 +1,37 @@
+"""Sample listing of jobs and runs, walking all the pages.
+
+https://docs.databricks.com/dev-tools/api/latest/jobs.html#operation/JobsList
+"""
+from datetime import datetime, timedelta
+from itertools import islice
+
+from loguru import logger as lg
+
+from utils import iter_jobs, iter_runs
+
+
+def sample_list_jobs() -> None:
+    """Log the id and name of every job in the workspace."""
+    lg.info("Job ID, job name")
+    for job in iter_jobs():
+        lg.info("{}, {}", job["job_id"], job["settings"]["name"])
+
+
+def sample_list_runs(job_id: int, days: int = 7, max_runs: int = 100) -> None:
+    """Log the state of the most recent runs of a job.
+
+    Stopping early with ``islice`` cancels the pages still being fetched.
+    """
+    start_time_from = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
+    runs = iter_runs(job_id=job_id, start_time_from=start_time_from)
+    for run in islice(runs, max_runs):
+        lg.info(
+            "{}: {} {}",
+            run["run_id"],
+            run["state"]["life_cycle_state"],
+            run["state"].get("result_state", ""),
+        )
+
+
+if __name__ == "__main__":
+    sample_list_jobs()
@@ -0,0 +1,306 @@
+"""When the scheduled jobs fire, and how much they overlap on each cluster.
+
+The ``CronSchedule`` of every unpaused job is read once and compiled with
+``quartz_cron``, then the fire times of all the jobs over a period are
+computed in a batch to answer:
+
+* which jobs fire in a window, like tomorrow between 06:00 and 08:00,
+* per cluster, a histogram of the runs started or active in each bucket
+  of time, and the peak of concurrent runs, with the jobs making it.
+
+A run lasts the duration given for its job, like the medians of
+``RunHistory``, and an instant otherwise, so the peak is then the number of
+jobs firing at the same time::
+
+    schedules = read_schedules()
+    report = load_report(schedules, start, start + 365 * 86400)
+    for load in report.values():
+        lg.info("{}", load)
+
+From the command line::
+
+    python schedule_report.py --days 365 --bucket 3600
+    python schedule_report.py --window 2026-10-19T06:00+02:00 2026-10-19T08:00+02:00
+"""
+
+import argparse
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+import heapq
+from itertools import repeat
+from math import ceil
+from operator import sub
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from databricks_cli.sdk.api_client import ApiClient
+from loguru import logger as lg
+
+from quartz_cron import CronError, compile_cron, fire_times_between
+from utils import get_databricks_client, iter_jobs, jd
+
+# the jobs without a cluster of their own, like the job clusters
+NO_CLUSTER = ""
+# the duration of a run of a job without one
+INSTANT = 1e-3
+
+
+class JobSchedule:
+    """The schedule of a job, and the clusters its tasks run on."""
+
+    __slots__ = (
+        "job_id",
+        "name",
+        "quartz_cron_expression",
+        "timezone_id",
+        "cluster_ids",
+    )
+
+    def __init__(
+        self,
+        job_id: int,
+        name: str,
+        quartz_cron_expression: str,
+        timezone_id: str,
+        cluster_ids: List[str],
+    ) -> None:
+        """Create a JobSchedule.
+
+        Args:
+            job_id (int): The job.
+            name (str): The name of the job.
+            quartz_cron_expression (str): When it fires.
+            timezone_id (str): The timezone of the expression.
+            cluster_ids (List[str]): The ``existing_cluster_id`` of its tasks.
+        """
+        self.job_id = job_id
+        self.name = name
+        self.quartz_cron_expression = quartz_cron_expression
+        self.timezone_id = timezone_id
+        self.cluster_ids = cluster_ids
+
+    def __repr__(self) -> str:
+        return (
+            f"JobSchedule({self.job_id}, {self.quartz_cron_expression!r}, "
+            f"{self.timezone_id})"
+        )
+
+
+def read_schedules(api_client: Optional[ApiClient] = None) -> List[JobSchedule]:
+    """Read the schedules of the unpaused jobs.
+
+    The jobs with an invalid expression are left out with a warning.
+    """
+    api_client = api_client or get_databricks_client()
+    schedules = []
+    for job in iter_jobs(expand_tasks=True, api_client=api_client):
+        settings = job.get("settings", {})
+        schedule = settings.get("schedule")
+        if not schedule or schedule.get("pause_status") == "PAUSED":
+            continue
+        try:
+            compile_cron(schedule["quartz_cron_expression"])
+        except CronError as e:
+            lg.warning("Job {} left out: {}", job["job_id"], e)
+            continue
+        cluster_ids = sorted(
+            {
+                task["existing_cluster_id"]
+                for task in settings.get("tasks", [])
+                if task.get("existing_cluster_id")
+            }
+        )
+        schedules.append(
+            JobSchedule(
+                job["job_id"],
+                settings.get("name", ""),
+                schedule["quartz_cron_expression"],
+                schedule.get("timezone_id", "UTC"),
+                cluster_ids,
+            )
+        )
+    return schedules
+
+
+def job_fire_times(
+    schedules: Iterable[JobSchedule], start: float, end: float
+) -> Dict[int, List[float]]:
+    """Get the fire times of the jobs from ``start`` until before ``end``."""
+    return fire_times_between(
+        {s.job_id: (s.quartz_cron_expression, s.timezone_id) for s in schedules},
+        start,
+        end,
+    )
+
+
+def firing_between(
+    schedules: Iterable[JobSchedule], start: float, end: float
+) -> Dict[int, List[float]]:
+    """Get the jobs firing from ``start`` until before ``end``, with their times."""
+    return {
+        job_id: fires
+        for job_id, fires in job_fire_times(schedules, start, end).items()
+        if fires
+    }
+
+
+class ClusterLoad:
+    """The runs of the scheduled jobs on a cluster over a period."""
+
+    __slots__ = ("cluster_id", "fires", "buckets", "peak", "peak_at", "peak_jobs")
+
+    def __init__(self, cluster_id: str) -> None:
+        self.cluster_id = cluster_id
+        # the runs started in the period
+        self.fires = 0
+        # start of the bucket -> the runs active in it
+        self.buckets: Dict[float, int] = {}
+        # the most runs at the same time, when, and the jobs
+        self.peak = 0
+        self.peak_at: Optional[float] = None
+        self.peak_jobs: List[int] = []
+
+    def __repr__(self) -> str:
+        at = "" if self.peak_at is None else f" at {_iso(self.peak_at)}"
+        return (
+            f"ClusterLoad({self.cluster_id or 'no cluster'}: {self.fires} runs, "
+            f"peak {self.peak}{at}, jobs {self.peak_jobs})"
+        )
+
+    def top_buckets(self, n: int = 10) -> List[Tuple[float, int]]:
+        """The busiest buckets, the busiest first."""
+        return heapq.nlargest(n, self.buckets.items(), key=lambda kv: kv[1])
+
+    def to_dict(self, top: int = 10) -> Dict[str, Any]:
+        return {
+            "cluster_id": self.cluster_id,
+            "fires": self.fires,
+            "peak": self.peak,
+            "peak_at": None if self.peak_at is None else _iso(self.peak_at),
+            "peak_jobs": self.peak_jobs,
+            "top_buckets": [(_iso(t), n) for t, n in self.top_buckets(top)],
+        }
+
+
+def _iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat()
+
+
+def load_report(
+    schedules: Iterable[JobSchedule],
+    start: float,
+    end: float,
+    bucket_seconds: float = 3600.0,
+    durations: Optional[Mapping[int, float]] = None,
+) -> Dict[str, ClusterLoad]:
+    """Get the load of the scheduled jobs on each cluster.
+
+    The runs of a cluster are two sorted lists, of starts and of ends,
+    the runs active at a time are the starts before it minus the ends
+    before it, counted with bisections instead of walking every run.
+
+    Args:
+        schedules (Iterable[JobSchedule]): The jobs, like ``read_schedules()``.
+        start (float): The start of the period, in epoch seconds.
+        end (float): The end of the period, excluded.
+        bucket_seconds (float): The width of the buckets of the histograms.
+        durations (Optional[Mapping[int, float]]):
+            The seconds a run of each job lasts, an instant if missing.
+
+    Returns:
+        Dict[str, ClusterLoad]: By cluster id, ``NO_CLUSTER`` for the jobs
+            without an existing cluster.
+    """
+    schedules = list(schedules)
+    durations = durations or {}
+    fires = job_fire_times(schedules, start, end)
+    jobs_by_cluster: Dict[str, List[int]] = {}
+    for schedule in schedules:
+        for cluster_id in schedule.cluster_ids or [NO_CLUSTER]:
+            jobs_by_cluster.setdefault(cluster_id, []).append(schedule.job_id)
+
+    n_buckets = ceil((end - start) / bucket_seconds)
+    edges = [start + i * bucket_seconds for i in range(n_buckets + 1)]
+    report = {}
+    for cluster_id, job_ids in jobs_by_cluster.items():
+        load = report[cluster_id] = ClusterLoad(cluster_id)
+        starts: List[float] = []
+        ends: List[float] = []
+        for job_id in job_ids:
+            starts.extend(fires[job_id])
+            # a run of no duration is active at its start only
+            duration = durations.get(job_id) or INSTANT
+            ends.extend([fire + duration for fire in fires[job_id]])
+        load.fires = len(starts)
+        if not starts:
+            continue
+        starts.sort()
+        ends.sort()
+
+        # the runs active in a bucket started before its end, ended after its start
+        started = list(map(bisect_left, repeat(starts), edges))
+        ended = list(map(bisect_right, repeat(ends), edges))
+        load.buckets = {
+            edge: count
+            for edge, count in zip(edges, map(sub, started[1:], ended))
+            if count
+        }
+
+        # the peak is at a start, when the most runs started and did not end
+        times = sorted(set(starts))
+        active = list(
+            map(
+                sub,
+                map(bisect_right, repeat(starts), times),
+                map(bisect_right, repeat(ends), times),
+            )
+        )
+        load.peak = max(active)
+        i = active.index(load.peak)
+        load.peak_at = peak_at = times[i]
+        for job_id in job_ids:
+            job_fires = fires[job_id]
+            j = bisect_right(job_fires, peak_at)
+            duration = durations.get(job_id) or INSTANT
+            if j and job_fires[j - 1] + duration > peak_at:
+                load.peak_jobs.append(job_id)
+        load.peak_jobs.sort()
+    return report
+
+
+def _epoch(text: str) -> float:
+    moment = datetime.fromisoformat(text)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=float, default=7.0)
+    parser.add_argument("--bucket", type=float, default=3600.0, help="seconds")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--window", nargs=2, metavar=("START", "END"), help="ISO 8601 times"
+    )
+    args = parser.parse_args()
+
+    job_schedules = read_schedules()
+    if args.window:
+        names = {s.job_id: s.name for s in job_schedules}
+        firing = firing_between(job_schedules, *map(_epoch, args.window))
+        lg.info(
+            "Jobs firing in the window:\n{}",
+            jd({names[j]: [_iso(t) for t in fires] for j, fires in firing.items()}),
+        )
+    else:
+        now = time.time() // args.bucket * args.bucket
+        t_start = time.perf_counter()
+        loads = load_report(job_schedules, now, now + args.days * 86400, args.bucket)
+        lg.info(
+            "Load of {} jobs over {} days, in {:.3f} s:\n{}",
+            len(job_schedules),
+            args.days,
+            time.perf_counter() - t_start,
+            jd([load.to_dict(args.top) for load in loads.values()]),
+        )
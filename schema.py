@@ -0,0 +1,132 @@
+"""Slotted base class for the API schemas, with a compiled serializer.
+
+Each subclass lists its fields in ``__slots__``, in payload order.
+Fields holding another schema are listed in ``_objects``,
+fields holding a list of schemas in ``_lists``.
+When the subclass is created a ``to_dict`` specialized for its fields is
+compiled, so dumping a payload never reflects over the instance at runtime.
+
+Fields set to ``None`` are considered unset and are omitted from the payload.
+
+``from_dict`` is the reverse, compiled the first time it is used on a class,
+so that the nested schemas can be resolved by name in the module of the class.
+"""
+
+import json
+import sys
+from typing import Any, Callable, ClassVar, Dict, Tuple, Type, TypeVar
+
+S = TypeVar("S", bound="Schema")
+
+
+class Schema:
+    """Base class of the API schemas."""
+
+    __slots__ = ()
+
+    # name of the field -> name of the schema it holds
+    _objects: ClassVar[Dict[str, str]] = {}
+    # name of the field -> name of the schema held in the list
+    _lists: ClassVar[Dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "__slots__" not in cls.__dict__:
+            raise TypeError(f"Schema {cls.__name__} must define __slots__.")
+        cls.to_dict = _compile_to_dict(cls)  # type: ignore[assignment]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Build the API payload of this object."""
+        return {}
+
+    @classmethod
+    def from_dict(cls: Type[S], data: Dict[str, Any]) -> S:
+        """Build the object from an API payload.
+
+        Keys that are not fields of the schema are ignored.
+        """
+        from_dict = _compile_from_dict(cls)
+        cls.from_dict = classmethod(from_dict)  # type: ignore[assignment]
+        return from_dict(cls, data)
+
+    def to_json(self, **kwargs: Any) -> str:
+        """Build the API payload of this object as a json string.
+
+        Args:
+            kwargs: Forwarded to ``json.dumps``.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _compile_to_dict(cls: type) -> Callable[[Schema], Dict[str, Any]]:
+    """Compile the ``to_dict`` method for the fields of ``cls``.
+
+    Nested schemas are dumped with their own ``to_dict``,
+    plain dicts are accepted in their place and passed through as they are.
+    """
+    lines = ["def to_dict(self):", "    d = {}"]
+    for field in cls.__slots__:  # type: ignore[attr-defined]
+        lines.append(f"    v = self.{field}")
+        lines.append("    if v is not None:")
+        if field in cls._objects:  # type: ignore[attr-defined]
+            value = "v if v.__class__ is dict else v.to_dict()"
+        elif field in cls._lists:  # type: ignore[attr-defined]
+            value = "[x if x.__class__ is dict else x.to_dict() for x in v]"
+        else:
+            value = "v"
+        lines.append(f"        d[{field!r}] = {value}")
+    lines.append("    return d")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = Schema.to_dict.__doc__
+    return to_dict
+
+
+def resolve_schema(cls: type, name: str) -> Type[Schema]:
+    """Find the schema called ``name``, in the module where ``cls`` is defined."""
+    return getattr(sys.modules[cls.__module__], name)
+
+
+def _compile_from_dict(cls: Type[S]) -> Callable[[Type[S], Dict[str, Any]], S]:
+    """Compile the ``from_dict`` method for the fields of ``cls``.
+
+    The nested schemas are called through their class, so that they use their
+    own compiled ``from_dict`` once it exists.
+    """
+    namespace: Dict[str, Any] = {"new": object.__new__}
+    lines = ["def from_dict(cls, data):", "    self = new(cls)", "    g = data.get"]
+    fields: Tuple[str, ...] = cls.__slots__
+    for field in fields:
+        if field in cls._objects:
+            name = cls._objects[field]
+            namespace[f"c_{field}"] = resolve_schema(cls, name)
+            value = f"c_{field}.from_dict(v)"
+        elif field in cls._lists:
+            name = cls._lists[field]
+            namespace[f"c_{field}"] = resolve_schema(cls, name)
+            value = f"[c_{field}.from_dict(x) for x in v]"
+        else:
+            lines.append(f"    self.{field} = g({field!r})")
+            continue
+        lines.append(f"    v = g({field!r})")
+        lines.append(f"    self.{field} = None if v is None else {value}")
+    lines.append("    return self")
+
+    exec("\n".join(lines), namespace)
+    from_dict = namespace["from_dict"]
+    from_dict.__qualname__ = f"{cls.__qualname__}.from_dict"
+    from_dict.__doc__ = Schema.from_dict.__doc__
+    return from_dict
@@ -0,0 +1,202 @@
+"""In-process cache of the secrets read from the vault.
+
+Entries are keyed by (path, key), expire after a TTL and are evicted in LRU
+order past a maximum size.
+An entry read close to its expiry is refreshed in a background thread, so the
+callers keep getting the cached value without waiting for the vault.
+
+When the KV v2 version of the secret is known, a refresh first reads the
+metadata of the path: if the current version did not change, the entry is
+simply extended, if the current version was deleted the entry is dropped.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from loguru import logger as lg
+
+# read the data and the version of a path
+ReadSecret = Callable[[str], Tuple[Dict[str, Any], Optional[int]]]
+# read the metadata of a path: current version and whether it was deleted
+ReadVersion = Callable[[str], Tuple[Optional[int], bool]]
+
+CacheKey = Tuple[str, Optional[str]]
+
+
+class _Entry:
+    """A cached secret."""
+
+    __slots__ = ("value", "version", "expires_at", "refreshing")
+
+    def __init__(self, value: Any, version: Optional[int], expires_at: float) -> None:
+        self.value = value
+        self.version = version
+        self.expires_at = expires_at
+        self.refreshing = False
+
+
+class SecretCache:
+    """TTL and LRU cache of the secrets, refreshed ahead of expiry."""
+
+    def __init__(
+        self,
+        read_secret: ReadSecret,
+        read_version: Optional[ReadVersion] = None,
+        ttl: float = 300.0,
+        refresh_ahead: float = 60.0,
+        max_size: int = 128,
+        background_refresh: bool = True,
+    ) -> None:
+        """Create the cache.
+
+        Args:
+            read_secret (ReadSecret):
+                Read the data and the KV v2 version of a path.
+            read_version (Optional[ReadVersion]):
+                Read the current version of a path and whether it was deleted,
+                used to avoid reading the data again if it did not change.
+            ttl (float): Seconds a secret is cached.
+            refresh_ahead (float):
+                Seconds before the expiry when a read triggers a refresh.
+            max_size (int): Maximum number of cached secrets.
+            background_refresh (bool): Refresh ahead of expiry in a thread.
+        """
+        self.read_secret = read_secret
+        self.read_version = read_version
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.max_size = max_size
+        self.background_refresh = background_refresh
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        # bumped by invalidate, a refresh started before does not store its value
+        self._generation = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str, key: Optional[str] = None) -> Any:
+        """Get a secret, from the cache if still valid.
+
+        Args:
+            path (str): The path in the vault.
+            key (Optional[str]): The key at that path, all the data if None.
+
+        Raises:
+            KeyError: If the path or the key are missing in the vault.
+        """
+        cache_key = (path, key)
+        now = time.monotonic()
+        with self._lock:
+            generation = self._generation
+            entry = self._entries.get(cache_key)
+            if entry is not None and now < entry.expires_at:
+                self._entries.move_to_end(cache_key)
+                if (
+                    self.background_refresh
+                    and not entry.refreshing
+                    and entry.expires_at - now < self.refresh_ahead
+                ):
+                    entry.refreshing = True
+                    future = self._get_executor().submit(
+                        self._refresh, cache_key, entry, generation
+                    )
+                    future.add_done_callback(self._log_refresh_error)
+                return entry.value
+        # missing or expired, read it in the calling thread
+        return self._refresh(cache_key, entry, generation)
+
+    def invalidate(self, path: Optional[str] = None, key: Optional[str] = None) -> None:
+        """Drop cached secrets.
+
+        Args:
+            path (Optional[str]): The path to drop, all the paths if None.
+            key (Optional[str]): The key to drop, all the keys at path if None.
+        """
+        with self._lock:
+            self._generation += 1
+            if path is None:
+                self._entries.clear()
+                return
+            for cache_key in list(self._entries):
+                if cache_key[0] == path and (key is None or cache_key[1] == key):
+                    del self._entries[cache_key]
+        lg.debug("Invalidated secret {} {}", path, key)
+
+    def close(self) -> None:
+        """Stop the background refresh thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="SecretCache",
+            )
+        return self._executor
+
+    def _refresh(
+        self, cache_key: CacheKey, entry: Optional[_Entry], generation: int
+    ) -> Any:
+        """Refresh an entry, checking the version first if possible.
+
+        ``generation`` is the one of the cache when the entry was read, the
+        value is not cached if the cache was invalidated since.
+        """
+        path, key = cache_key
+        try:
+            if entry is not None and entry.version is not None and self.read_version:
+                current_version, deleted = self.read_version(path)
+                if deleted:
+                    self.invalidate(path)
+                    lg.error(f"Deleted {path=} in the vault.")
+                    raise KeyError(f"Deleted {path=} in the vault.")
+                if current_version == entry.version:
+                    return self._store(
+                        cache_key, entry.value, entry.version, generation
+                    )
+            data, version = self.read_secret(path)
+            if key is None:
+                value: Any = data
+            elif key not in data:
+                lg.error(f"Missing {key=} in the read data.")
+                raise KeyError(f"Missing {key=} in the read data.")
+            else:
+                value = data[key]
+            return self._store(cache_key, value, version, generation)
+        finally:
+            # a failed refresh is tried again on the next get
+            if entry is not None:
+                entry.refreshing = False
+
+    @staticmethod
+    def _log_refresh_error(future: "Future[Any]") -> None:
+        """Log the error of a background refresh, nobody waits for it."""
+        error = None if future.cancelled() else future.exception()
+        if error is not None:
+            lg.opt(exception=error).error("Background refresh failed: {}", error)
+
+    def _store(
+        self,
+        cache_key: CacheKey,
+        value: Any,
+        version: Optional[int],
+        generation: int,
+    ) -> Any:
+        """Cache a value read at a generation, unless invalidated since."""
+        entry = _Entry(value, version, time.monotonic() + self.ttl)
+        with self._lock:
+            if generation != self._generation:
+                # the read may predate the invalidation, like a rejected token
+                return value
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
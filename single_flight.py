@@ -0,0 +1,102 @@
+"""Merge identical concurrent calls into a single one.
+
+When several threads ask for the same thing at the same time, like the
+``clusters/get`` of the same cluster, only the first one makes the call.
+The others wait for it and get the same result, or the same error::
+
+    flight = SingleFlight()
+    payload = flight.do(("GET", "/clusters/get", cluster_id), fetch)
+
+Only the calls in flight are merged, nothing is cached:
+a call made after the previous one returned goes out again.
+"""
+
+from concurrent.futures import Future
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A call in flight, and the number of callers waiting for it."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self) -> None:
+        self.future: Future = Future()
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run at most one call per key at a time, sharing its outcome."""
+
+    def __init__(self, copy_result: bool = True) -> None:
+        """Create a SingleFlight.
+
+        Args:
+            copy_result (bool):
+                Give each caller its own deep copy of a shared result,
+                so a caller modifying it does not change it for the others.
+        """
+        self.copy_result = copy_result
+        self.calls = 0
+        self.saved = 0
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(
+        self,
+        key: Hashable,
+        call: Callable[[], T],
+        on_shared: Optional[Callable[[], Any]] = None,
+    ) -> T:
+        """Run the call, or wait for the same call already in flight.
+
+        Args:
+            key (Hashable): Identifies the call, the same key for the same call.
+            call (Callable[[], T]): Makes the call.
+            on_shared (Optional[Callable[[], Any]]):
+                Called when this caller waits instead of calling, for metrics.
+
+        Raises:
+            Exception: The error of the call, raised to every caller.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                leader = True
+                self.calls += 1
+            else:
+                flight.waiters += 1
+                leader = False
+                self.saved += 1
+
+        if not leader:
+            if on_shared is not None:
+                on_shared()
+            result = flight.future.result()
+            return copy.deepcopy(result) if self.copy_result else result
+
+        try:
+            result = call()
+        except BaseException as e:
+            with self._lock:
+                del self._flights[key]
+            flight.future.set_exception(e)
+            raise
+        with self._lock:
+            del self._flights[key]
+            shared = flight.waiters > 0
+        flight.future.set_result(result)
+        if shared and self.copy_result:
+            # the waiters copy the result, it must not change under them
+            return copy.deepcopy(result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """The calls made, and the calls saved by waiting for another one."""
+        with self._lock:
+            return {"calls": self.calls, "saved": self.saved}
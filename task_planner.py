@@ -0,0 +1,304 @@
+"""Spread the tasks of a job over clusters, balancing their expected durations.
+
+The samples assign the parameter sets to clusters by hand and chain all the
+tasks of a cluster, so the most loaded cluster sets the duration of the job.
+``plan_tasks`` takes the parameter sets, the clusters and a cost per task,
+and places the tasks with the longest processing time first rule:
+the tasks are sorted by decreasing cost and each one goes to the lane that
+would finish first.
+A cluster runs ``lanes_per_cluster`` chains of tasks in parallel, each lane is
+a chain of ``TaskDependency``::
+
+    plan = plan_tasks(params, ["cluster_1", "cluster_2"], cost, lanes_per_cluster=2)
+    lg.info(plan.summary())
+    tasks = plan.tasks(notebook_path="/the/path", libraries=libraries)
+
+The costs can come from the past runs of the job, see ``fetch_task_costs``.
+"""
+
+import heapq
+import statistics
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+from databricks_cli.sdk.api_client import ApiClient
+
+from databricks_api import JobTaskSettings, Library, NotebookTask, TaskDependency
+from utils import iter_runs
+
+# (task_key, params) -> expected seconds
+CostFunction = Callable[[str, Dict[str, Any]], float]
+TaskKeyFunction = Callable[[Dict[str, Any]], str]
+
+
+def default_task_key(params: Dict[str, Any]) -> str:
+    """Build the task key from the values of the params, like ``10W``."""
+    return "".join(str(v) for v in params.values())
+
+
+class PlannedTask:
+    """A task placed on a lane of a cluster."""
+
+    __slots__ = ("task_key", "params", "cost", "cluster_id", "lane", "start")
+
+    def __init__(
+        self,
+        task_key: str,
+        params: Dict[str, Any],
+        cost: float,
+        cluster_id: str,
+        lane: int,
+        start: float,
+    ) -> None:
+        """Create a PlannedTask.
+
+        Args:
+            task_key (str): The key of the task.
+            params (Dict[str, Any]): The base parameters of the notebook.
+            cost (float): The expected duration in seconds.
+            cluster_id (str): The cluster running the task.
+            lane (int): The chain of the cluster running the task.
+            start (float): The expected start, in seconds from the job start.
+        """
+        self.task_key = task_key
+        self.params = params
+        self.cost = cost
+        self.cluster_id = cluster_id
+        self.lane = lane
+        self.start = start
+
+    @property
+    def end(self) -> float:
+        return self.start + self.cost
+
+    def __repr__(self) -> str:
+        return (
+            f"PlannedTask({self.task_key!r}, {self.cluster_id}/{self.lane}, "
+            f"{self.start:.0f}-{self.end:.0f} s)"
+        )
+
+
+class TaskPlan:
+    """The tasks placed on the lanes of each cluster."""
+
+    def __init__(self, lanes: Dict[str, List[List[PlannedTask]]]) -> None:
+        """Create a TaskPlan.
+
+        Args:
+            lanes (Dict[str, List[List[PlannedTask]]]):
+                cluster id -> lanes -> tasks of the lane, in execution order.
+        """
+        self.lanes = lanes
+
+    def __iter__(self):
+        for cluster_lanes in self.lanes.values():
+            for lane in cluster_lanes:
+                yield from lane
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lanes in self.lanes.values() for lane in lanes)
+
+    @property
+    def makespan(self) -> float:
+        """The expected duration of the job, in seconds."""
+        return max((task.end for task in self), default=0.0)
+
+    @property
+    def lower_bound(self) -> float:
+        """No placement can run the job faster than this, in seconds."""
+        n_lanes = sum(len(lanes) for lanes in self.lanes.values())
+        costs = [task.cost for task in self]
+        if not costs:
+            return 0.0
+        return max(sum(costs) / n_lanes, max(costs))
+
+    def cluster_loads(self) -> Dict[str, float]:
+        """The expected busy time of the lanes of each cluster, in seconds."""
+        return {
+            cluster_id: max((lane[-1].end for lane in lanes if lane), default=0.0)
+            for cluster_id, lanes in self.lanes.items()
+        }
+
+    def summary(self) -> str:
+        loads = ", ".join(
+            f"{c}: {load:.0f} s" for c, load in self.cluster_loads().items()
+        )
+        return (
+            f"{len(self)} tasks, predicted makespan {self.makespan:.0f} s "
+            f"(lower bound {self.lower_bound:.0f} s), {loads}"
+        )
+
+    def tasks(
+        self,
+        notebook_path: str,
+        source: Optional[str] = "WORKSPACE",
+        libraries: Optional[List[Library]] = None,
+        max_retries: Optional[int] = None,
+    ) -> List[JobTaskSettings]:
+        """Build the tasks of the job.
+
+        The first task of each lane installs the libraries,
+        the others depend on the previous task of their lane.
+
+        Args:
+            notebook_path (str): The notebook run by every task.
+            source (Optional[str]): Where the notebook is.
+            libraries (Optional[List[Library]]): The libraries of the tasks.
+            max_retries (Optional[int]): The retries of each task.
+        """
+        tasks = []
+        for cluster_id, cluster_lanes in self.lanes.items():
+            for lane in cluster_lanes:
+                previous: Optional[PlannedTask] = None
+                for planned in lane:
+                    tasks.append(
+                        JobTaskSettings(
+                            task_key=planned.task_key,
+                            depends_on=(
+                                None
+                                if previous is None
+                                else [TaskDependency(previous.task_key)]
+                            ),
+                            notebook_task=NotebookTask(
+                                notebook_path=notebook_path,
+                                source=source,
+                                base_parameters=planned.params,
+                            ),
+                            existing_cluster_id=cluster_id,
+                            libraries=libraries if previous is None else None,
+                            max_retries=max_retries,
+                        )
+                    )
+                    previous = planned
+        return tasks
+
+
+def plan_tasks(
+    params: Iterable[Dict[str, Any]],
+    cluster_ids: List[str],
+    cost: Union[CostFunction, Mapping[str, float]],
+    lanes_per_cluster: int = 1,
+    shared_params: Optional[Dict[str, Any]] = None,
+    task_key: TaskKeyFunction = default_task_key,
+) -> TaskPlan:
+    """Place the tasks on the clusters, minimizing the expected job duration.
+
+    The dicts in ``params`` and ``shared_params`` are not modified,
+    each task gets a new dict with both.
+
+    Args:
+        params (Iterable[Dict[str, Any]]): The parameter sets, one per task.
+        cluster_ids (List[str]): The existing clusters to use.
+        cost (Union[CostFunction, Mapping[str, float]]):
+            The expected seconds of a task, as a function of its key and params,
+            or as a mapping by task key, see ``cost_lookup``.
+        lanes_per_cluster (int): The number of tasks a cluster runs at once.
+        shared_params (Optional[Dict[str, Any]]):
+            Parameters added to every task, winning over the task ones.
+        task_key (TaskKeyFunction): Build the key of a task from its params.
+
+    Raises:
+        ValueError: If there are no clusters, or two tasks have the same key.
+    """
+    if not cluster_ids:
+        raise ValueError("There are no clusters to place the tasks on.")
+    if lanes_per_cluster < 1:
+        raise ValueError(f"Invalid {lanes_per_cluster=}.")
+    if isinstance(cost, Mapping):
+        cost = cost_lookup(cost)
+    shared_params = shared_params or {}
+
+    items = []
+    seen = set()
+    for p in params:
+        key = task_key(p)
+        if key in seen:
+            raise ValueError(f"Two tasks have the key {key}.")
+        seen.add(key)
+        items.append((key, {**p, **shared_params}, cost(key, p)))
+    # longest first, the input order breaks the ties
+    items.sort(key=lambda item: -item[2])
+
+    lanes: Dict[str, List[List[PlannedTask]]] = {
+        cluster_id: [[] for _ in range(lanes_per_cluster)] for cluster_id in cluster_ids
+    }
+    # (busy until, lane index, cluster index): on ties the first lane of
+    # every cluster is used before the second lane of any, the lanes of a
+    # cluster share its compute
+    free_at = [
+        (0.0, l, c) for c in range(len(cluster_ids)) for l in range(lanes_per_cluster)
+    ]
+    heapq.heapify(free_at)
+    for key, task_params, task_cost in items:
+        start, l, c = heapq.heappop(free_at)
+        cluster_id = cluster_ids[c]
+        lanes[cluster_id][l].append(
+            PlannedTask(key, task_params, task_cost, cluster_id, l, start)
+        )
+        heapq.heappush(free_at, (start + task_cost, l, c))
+
+    # drop the lanes left empty, when there are fewer tasks than lanes
+    return TaskPlan(
+        {
+            cluster_id: [lane for lane in cluster_lanes if lane]
+            for cluster_id, cluster_lanes in lanes.items()
+        }
+    )
+
+
+def cost_lookup(
+    costs: Mapping[str, float], default: Optional[float] = None
+) -> CostFunction:
+    """Build a cost function from the known costs by task key.
+
+    Args:
+        costs (Mapping[str, float]): The expected seconds by task key.
+        default (Optional[float]):
+            The cost of the unknown tasks, the median of the known ones if None.
+    """
+    if default is None:
+        default = statistics.median(costs.values()) if costs else 1.0
+
+    def cost(task_key: str, params: Dict[str, Any]) -> float:
+        return costs.get(task_key, default)  # type: ignore[return-value]
+
+    return cost
+
+
+def costs_from_runs(runs: Iterable[Dict[str, Any]]) -> Dict[str, float]:
+    """Get the median duration in seconds of each task key in the runs.
+
+    Args:
+        runs (Iterable[Dict[str, Any]]):
+            Payloads of completed runs, with their tasks expanded.
+    """
+    durations: Dict[str, List[float]] = {}
+    for run in runs:
+        for task in run.get("tasks", []):
+            if task.get("state", {}).get("result_state") != "SUCCESS":
+                continue
+            millis = task.get("setup_duration", 0) + task.get("execution_duration", 0)
+            durations.setdefault(task["task_key"], []).append(millis / 1000)
+    return {key: statistics.median(values) for key, values in durations.items()}
+
+
+def fetch_task_costs(
+    job_id: int,
+    max_runs: int = 20,
+    api_client: Optional[ApiClient] = None,
+) -> Dict[str, float]:
+    """Get the median duration of each task from the last runs of a job.
+
+    Args:
+        job_id (int): The job.
+        max_runs (int): How many of the last completed runs to use.
+        api_client (Optional[ApiClient]):
+            The client to use, the default one if not provided.
+    """
+    runs = []
+    for run in iter_runs(
+        job_id=job_id, completed_only=True, expand_tasks=True, api_client=api_client
+    ):
+        runs.append(run)
+        if len(runs) >= max_runs:
+            break
+    return costs_from_runs(runs)
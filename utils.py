@@ -1,19 +1,40 @@
 """Utilities to interact with the API."""
-from databricks_cli.sdk.api_client import ApiClient
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from databricks_cli.sdk.api_client import ApiClient, TlsV1HttpAdapter
+import hashlib
 import json
 import os
-from typing import Any, Dict, Optional
+import socket
+import ssl
+import threading
+import time
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple, Type, Union
+from urllib.parse import urlparse
 
 import hvac
 from hvac.api.secrets_engines.kv_v2 import KvV2
 from hvac.exceptions import InvalidPath
 from hvac.v1 import Client
 from loguru import logger as lg
+from requests.exceptions import HTTPError
+from urllib3 import PoolManager
+from urllib3.connection import HTTPConnection
+
+from async_client import AsyncApiClient, SyncApiClient
+from metrics import METRICS, api_endpoint
+from response_cache import ENV_RESPONSE_CACHE, ResponseCache
+from secret_cache import SecretCache
+from single_flight import SingleFlight
 
 # databricks host
 HOST = "https://adb-8552426296089162.2.azuredatabricks.net/"
 
-# name of the environment variable
+# name of the environment variables,
+# they point the default clients at another workspace, like a mock server
+ENV_DATABRICKS_HOST = "DATABRICKS_HOST"
 ENV_DATABRICKS_TOKEN = "DATABRICKS_TOKEN"
 
 # path in the vault
@@ -21,6 +42,23 @@ HC_DATABRICKS_PATH = "databricks"
 # key in the vault, at that path
 HC_DATABRICKS_TOKEN = "TOKEN"
 
+# page size of jobs/list and runs/list, the max allowed by the API
+PAGE_LIMIT = 25
+
+# the headers of a GET that skips the response cache, like a poll of a state
+NO_CACHE = {"Cache-Control": "no-cache"}
+
+# connection pool of the shared clients
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 32
+# timeouts in seconds of the shared clients
+CONNECT_TIMEOUT = 10.0
+READ_TIMEOUT = 60.0
+
+# (host, sha256 of the token) -> client shared by the process
+_POOLED_CLIENTS: Dict[Tuple[str, str], ApiClient] = {}
+_POOLED_CLIENTS_LOCK = threading.Lock()
+
 
 ##################################################
 #    Get secret from environment
@@ -50,13 +88,422 @@ def get_env(env_var_name):
 ##################################################
 
 
+class PooledHTTPAdapter(TlsV1HttpAdapter):
+    """The adapter of the ``ApiClient``, with default timeouts and TCP keep-alive."""
+
+    def __init__(
+        self,
+        timeout: Tuple[float, float],
+        keep_alive: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """Create the adapter.
+
+        Args:
+            timeout (Tuple[float, float]):
+                The connect and read timeouts of the requests that do not set one.
+            keep_alive (bool): Enable TCP keep-alive on the pooled sockets.
+            kwargs: Forwarded to ``HTTPAdapter``, like the pool sizes.
+        """
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        socket_options = list(HTTPConnection.default_socket_options)
+        if self.keep_alive:
+            socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        self.poolmanager = PoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            ssl_version=ssl.PROTOCOL_TLSv1_2,
+            socket_options=socket_options,
+            **pool_kwargs,
+        )
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        if not METRICS.enabled:
+            return super().send(request, **kwargs)
+        return self._send_measured(request, **kwargs)
+
+    def _send_measured(self, request, **kwargs):
+        """Send the request, recording its latency, status and sizes."""
+        endpoint = api_endpoint(request.url)
+        body = request.body
+        request_bytes = len(body) if body is not None else 0
+        METRICS.start("databricks", request.method, endpoint)
+        t_start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception as e:
+            METRICS.finish(
+                "databricks",
+                request.method,
+                endpoint,
+                time.perf_counter() - t_start,
+                type(e).__name__,
+                request_bytes,
+            )
+            raise
+        elapsed = time.perf_counter() - t_start
+        length = response.headers.get("Content-Length")
+        if length is not None:
+            response_bytes: Optional[int] = int(length)
+        elif not kwargs.get("stream"):
+            response_bytes = len(response.content)
+        else:
+            response_bytes = None
+        # the retries of urllib3 happen inside the send
+        retry = getattr(response.raw, "retries", None)
+        METRICS.finish(
+            "databricks",
+            request.method,
+            endpoint,
+            elapsed,
+            response.status_code,
+            request_bytes,
+            response_bytes,
+            retries=len(retry.history) if retry is not None else 0,
+        )
+        return response
+
+
+class PooledApiClient(ApiClient):
+    """The ``ApiClient`` of ``get_pooled_client``.
+
+    The identical GETs in flight at the same time from several threads
+    are sent once, see ``SingleFlight``: every caller gets its own copy of
+    the response, or the same error.
+    With a ``ResponseCache``, the GETs of the slowly changing endpoints are
+    answered from it while fresh, and the writes invalidate it.
+    A GET with the ``NO_CACHE`` headers is always sent.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # None sends every GET
+        self.single_flight: Optional[SingleFlight] = SingleFlight()
+        self.response_cache: Optional[ResponseCache] = None
+        # the cached answers are per host and token
+        self.cache_scope = ""
+
+    def perform_query(
+        self, method, path, data={}, headers=None, files=None, version=None
+    ):
+        cache = self.response_cache
+        # a poll of a state must see it now, the fresh answer is still kept
+        fresh = (headers or {}).get("Cache-Control") == "no-cache"
+        endpoint = api_endpoint(self.get_url(path, version=version)) if cache else ""
+        if method != "GET":
+            try:
+                return super().perform_query(
+                    method, path, data, headers, files, version
+                )
+            finally:
+                # a failed write may have been applied anyway
+                if cache is not None:
+                    cache.invalidate(self.cache_scope, endpoint, data)
+
+        if cache is not None and cache.cacheable(endpoint):
+            payload = None if fresh else cache.get(self.cache_scope, endpoint, data)
+            if payload is None:
+                payload = self._get(path, data, headers, version)
+                cache.put(self.cache_scope, endpoint, data, payload)
+            return payload
+        return self._get(path, data, headers, version)
+
+    def _get(self, path, data, headers, version):
+        """Send a GET, or wait for the same one in flight."""
+        if self.single_flight is None:
+            return super().perform_query("GET", path, data, headers, None, version)
+        key = (
+            path,
+            version,
+            json.dumps(data, sort_keys=True, default=str),
+            json.dumps(headers, sort_keys=True) if headers else None,
+        )
+
+        def on_shared() -> None:
+            if METRICS.enabled:
+                url = self.get_url(path, version=version)
+                METRICS.record_coalesced("databricks", "GET", api_endpoint(url))
+
+        return self.single_flight.do(
+            key,
+            lambda: super(PooledApiClient, self).perform_query(
+                "GET", path, data, headers, None, version
+            ),
+            on_shared,
+        )
+
+
+def make_api_client(
+    host: str, token: str, client_class: Type[ApiClient] = ApiClient
+) -> ApiClient:
+    """Build a new ApiClient.
+
+    Unlike the plain ``ApiClient``, the port of the host is kept,
+    so the client can also talk to a local server.
+    """
+    api_client = client_class(host=host, token=token)
+    parsed = urlparse(host)
+    api_client.url = f"{parsed.scheme}://{parsed.netloc}/api/"
+    return api_client
+
+
+def get_pooled_client(
+    host: str = HOST,
+    token: Optional[str] = None,
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_timeout: float = READ_TIMEOUT,
+    keep_alive: bool = True,
+    coalesce_gets: bool = True,
+    response_cache: Optional[ResponseCache] = None,
+) -> ApiClient:
+    """Get the ApiClient shared by the whole process for this host and token.
+
+    The first call for a host and token builds the client and its connection
+    pool, the next ones reuse it, so the TCP and TLS setup is paid once.
+    The pool and GET settings are used only when the client is built.
+
+    Args:
+        host (str): The workspace url.
+        token (Optional[str]): The token, the default secret if not provided.
+        pool_connections (int): The number of hosts to keep a pool for.
+        pool_maxsize (int):
+            The number of connections kept per host,
+            set it to the number of threads sharing the client.
+        connect_timeout (float): Seconds to wait to open a connection.
+        read_timeout (float): Seconds to wait for the response.
+        keep_alive (bool): Enable TCP keep-alive on the pooled sockets.
+        coalesce_gets (bool):
+            Send the identical GETs in flight at the same time once,
+            see ``PooledApiClient``.
+        response_cache (Optional[ResponseCache]):
+            Answer the slowly changing GETs from this cache, from a
+            cache in the file of ``DATABRICKS_RESPONSE_CACHE`` if it is set,
+            or never if None.
+    """
+    if token is None:
+        token = get_databricks_token()
+    key = (host.rstrip("/"), hashlib.sha256(token.encode()).hexdigest())
+    with _POOLED_CLIENTS_LOCK:
+        api_client = _POOLED_CLIENTS.get(key)
+        if api_client is not None:
+            return api_client
+
+        api_client = make_api_client(host, token, PooledApiClient)
+        if not coalesce_gets:
+            api_client.single_flight = None  # type: ignore[attr-defined]
+        if response_cache is None and os.getenv(ENV_RESPONSE_CACHE):
+            response_cache = ResponseCache(os.environ[ENV_RESPONSE_CACHE])
+        api_client.response_cache = response_cache  # type: ignore[attr-defined]
+        api_client.cache_scope = f"{key[0]}|{key[1][:16]}"  # type: ignore[attr-defined]
+        # keep the retry policy of databricks_cli
+        retries = api_client.session.get_adapter("https://").max_retries
+        adapter = PooledHTTPAdapter(
+            timeout=(connect_timeout, read_timeout),
+            keep_alive=keep_alive,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retries,
+        )
+        api_client.session.mount("https://", adapter)
+        api_client.session.mount("http://", adapter)
+        _POOLED_CLIENTS[key] = api_client
+        lg.debug("New pooled client for {}", key[0])
+        return api_client
+
+
+def close_pooled_clients() -> None:
+    """Close the shared clients and their connections."""
+    with _POOLED_CLIENTS_LOCK:
+        for api_client in _POOLED_CLIENTS.values():
+            api_client.session.close()
+        _POOLED_CLIENTS.clear()
+
+
+def get_databricks_host() -> str:
+    """Get the default host, ``HOST`` unless ``DATABRICKS_HOST`` is set."""
+    return os.getenv(ENV_DATABRICKS_HOST) or HOST
+
+
 def get_databricks_client() -> ApiClient:
-    """Get the ApiClient with default host/secret."""
-    api_client = ApiClient(
-        host=HOST,
-        token=get_secret_from_hc(HC_DATABRICKS_PATH, HC_DATABRICKS_TOKEN),
+    """Get the ApiClient with default host/secret.
+
+    The token is read through the secret cache, see ``get_databricks_token``.
+    The client is the one shared by the process, see ``get_pooled_client``.
+    """
+    return get_pooled_client(get_databricks_host(), get_databricks_token())
+
+
+def get_databricks_async_client(**kwargs: Any) -> AsyncApiClient:
+    """Get the asyncio client with default host/secret.
+
+    Args:
+        kwargs: Forwarded to ``AsyncApiClient``, like the pool settings.
+    """
+    return AsyncApiClient(
+        host=get_databricks_host(),
+        token=get_databricks_token(),
+        **kwargs,
     )
-    return api_client
+
+
+def get_databricks_sync_client(**kwargs: Any) -> SyncApiClient:
+    """Get the blocking wrapper of the asyncio client with default host/secret.
+
+    It can be used in place of ``get_databricks_client()``.
+
+    Args:
+        kwargs: Forwarded to ``AsyncApiClient``, like the pool settings.
+    """
+    return SyncApiClient(
+        host=get_databricks_host(),
+        token=get_databricks_token(),
+        **kwargs,
+    )
+
+
+##################################################
+#    Pagination utils
+##################################################
+
+
+def iter_pages(
+    path: str,
+    items_key: str,
+    query: Optional[Dict[str, Any]] = None,
+    api_client: Optional[ApiClient] = None,
+    read_ahead: int = 2,
+    limit: int = PAGE_LIMIT,
+    version: str = "2.1",
+) -> Iterator[Dict[str, Any]]:
+    """Stream the items of an endpoint paginated with offset/limit/has_more.
+
+    The next ``read_ahead`` pages are fetched in background threads while the
+    current one is consumed, so at most ``read_ahead + 1`` pages are in memory.
+    The pages past the last one are fetched speculatively and dropped.
+    If the consumer stops early, the pending fetches are cancelled.
+
+    Args:
+        path (str): The path of the endpoint, like ``/jobs/list``.
+        items_key (str): The key of the items in the page, like ``jobs``.
+        query (Optional[Dict[str, Any]]): The other query parameters.
+        api_client (Optional[ApiClient]):
+            The client to use, the default one if not provided.
+        read_ahead (int): The number of pages to fetch in advance.
+        limit (int): The number of items per page.
+        version (str): The API version of the endpoint.
+    """
+    if api_client is None:
+        api_client = get_databricks_client()
+    if query is None:
+        query = {}
+    read_ahead = max(read_ahead, 1)
+
+    executor = ThreadPoolExecutor(
+        max_workers=read_ahead,
+        thread_name_prefix=f"iter_pages{path.replace('/', '_')}",
+    )
+    pending: Deque[Future] = deque()
+    next_offset = 0
+
+    def fetch_next() -> None:
+        nonlocal next_offset
+        page_query = {**query, "offset": next_offset, "limit": limit}
+        pending.append(
+            executor.submit(
+                api_client.perform_query,  # type: ignore[union-attr]
+                "GET",
+                path,
+                data=page_query,
+                version=version,
+            )
+        )
+        next_offset += limit
+
+    try:
+        for _ in range(read_ahead):
+            fetch_next()
+        while pending:
+            page = pending.popleft().result()
+            has_more = page.get("has_more", False)
+            # keep the read ahead full while this page is consumed
+            if has_more:
+                fetch_next()
+            yield from page.get(items_key, [])
+            if not has_more:
+                break
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_jobs(
+    name: Optional[str] = None,
+    expand_tasks: bool = False,
+    api_client: Optional[ApiClient] = None,
+    read_ahead: int = 2,
+) -> Iterator[Dict[str, Any]]:
+    """Stream all the jobs in the workspace, from ``/2.1/jobs/list``.
+
+    Args:
+        name (Optional[str]): Only the jobs with this exact name.
+        expand_tasks (bool): Include the task and cluster details.
+        api_client (Optional[ApiClient]):
+            The client to use, the default one if not provided.
+        read_ahead (int): The number of pages to fetch in advance.
+    """
+    query: Dict[str, Any] = {"expand_tasks": expand_tasks}
+    if name is not None:
+        query["name"] = name
+    return iter_pages("/jobs/list", "jobs", query, api_client, read_ahead)
+
+
+def iter_runs(
+    job_id: Optional[int] = None,
+    start_time_from: Optional[int] = None,
+    start_time_to: Optional[int] = None,
+    active_only: bool = False,
+    completed_only: bool = False,
+    expand_tasks: bool = False,
+    api_client: Optional[ApiClient] = None,
+    read_ahead: int = 2,
+) -> Iterator[Dict[str, Any]]:
+    """Stream the runs, most recent first, from ``/2.1/jobs/runs/list``.
+
+    Args:
+        job_id (Optional[int]): Only the runs of this job.
+        start_time_from (Optional[int]):
+            Only the runs started at or after this time, in epoch milliseconds.
+        start_time_to (Optional[int]):
+            Only the runs started at or before this time, in epoch milliseconds.
+        active_only (bool): Only the active runs.
+        completed_only (bool): Only the completed runs.
+        expand_tasks (bool): Include the task and cluster details.
+        api_client (Optional[ApiClient]):
+            The client to use, the default one if not provided.
+        read_ahead (int): The number of pages to fetch in advance.
+    """
+    query: Dict[str, Any] = {
+        "active_only": active_only,
+        "completed_only": completed_only,
+        "expand_tasks": expand_tasks,
+    }
+    if job_id is not None:
+        query["job_id"] = job_id
+    if start_time_from is not None:
+        query["start_time_from"] = start_time_from
+    if start_time_to is not None:
+        query["start_time_to"] = start_time_to
+    return iter_pages("/jobs/runs/list", "runs", query, api_client, read_ahead)
 
 
 ##################################################
@@ -88,17 +535,45 @@ def get_kvv2(client: Optional[Client] = None) -> KvV2:
     return kvv2
 
 
-def get_secret_from_hc(path: str, key: Optional[str] = None) -> Dict[str, str]:
-    """Get the requested secret from the active vault."""
+def read_secret_from_hc(path: str) -> Tuple[Dict[str, str], Optional[int]]:
+    """Read the data at a path of the active vault, and its KV v2 version."""
     kvv2 = get_kvv2()
     # get the path
     try:
-        read_response: Dict = kvv2.read_secret_version(path=path)
+        with METRICS.timed("vault", "read_secret", path):
+            read_response: Dict = kvv2.read_secret_version(path=path)
     except InvalidPath as e:
         lg.error(f"Missing {path=} in the vault.")
         raise KeyError(f"Missing {path=} in the vault.")
-    # grab the data from the response dict
-    data = read_response["data"]
+    # the KV v2 response has the secret and its metadata
+    # under the data of the response
+    response_data = read_response["data"]
+    data = response_data["data"]
+    version = response_data.get("metadata", {}).get("version")
+    return data, version
+
+
+def read_secret_version_from_hc(path: str) -> Tuple[Optional[int], bool]:
+    """Read the current KV v2 version of a path, and whether it was deleted."""
+    kvv2 = get_kvv2()
+    try:
+        with METRICS.timed("vault", "read_secret_metadata", path):
+            metadata: Dict = kvv2.read_secret_metadata(path=path)["data"]
+    except InvalidPath:
+        return None, True
+    current_version = metadata.get("current_version")
+    version_info = metadata.get("versions", {}).get(str(current_version), {})
+    deleted = bool(version_info.get("deletion_time")) or version_info.get(
+        "destroyed", False
+    )
+    return current_version, deleted
+
+
+def get_secret_from_hc(
+    path: str, key: Optional[str] = None
+) -> Union[Dict[str, str], str]:
+    """Get the requested secret from the active vault."""
+    data, _ = read_secret_from_hc(path)
     # if we have no key return the whole path
     if key is None:
         return data
@@ -107,3 +582,53 @@ def get_secret_from_hc(path: str, key: Optional[str] = None) -> Dict[str, str]:
         lg.error(f"Missing {key=} in the read data.")
         raise KeyError(f"Missing {key=} in the read data.")
     return data[key]
+
+
+# cache in front of the vault, shared by the whole process
+SECRET_CACHE = SecretCache(
+    read_secret=read_secret_from_hc,
+    read_version=read_secret_version_from_hc,
+)
+
+
+def get_cached_secret(path: str, key: Optional[str] = None) -> Any:
+    """Get the requested secret, from the cache in front of the vault."""
+    return SECRET_CACHE.get(path, key)
+
+
+def get_databricks_token() -> str:
+    """Get the Databricks token, from the cache in front of the vault.
+
+    ``DATABRICKS_TOKEN`` wins over the vault when it is set.
+    """
+    token = os.getenv(ENV_DATABRICKS_TOKEN)
+    if token:
+        return token
+    return get_cached_secret(HC_DATABRICKS_PATH, HC_DATABRICKS_TOKEN)
+
+
+def http_status(error: Exception) -> Optional[int]:
+    """Get the status code of an HTTP error of any of the clients."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    return status
+
+
+@contextmanager
+def invalidate_token_on_auth_error() -> Iterator[None]:
+    """Drop the cached Databricks token if Databricks refuses it.
+
+    The error is raised again, the next client gets a fresh token::
+
+        with invalidate_token_on_auth_error():
+            jobs_api.create_job(json=json_payload)
+    """
+    try:
+        yield
+    except HTTPError as e:
+        if http_status(e) in (401, 403):
+            lg.warning("Databricks refused the token, dropping it from the cache.")
+            SECRET_CACHE.invalidate(HC_DATABRICKS_PATH, HC_DATABRICKS_TOKEN)
+        raise